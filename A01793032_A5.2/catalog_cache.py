@@ -0,0 +1,218 @@
+"""
+Catalog Snapshot Cache
+
+This module keeps a compact binary snapshot of the indexed product
+catalog so repeated runs of compute_sales.py against the same catalog
+do not pay the JSON parse and index build every time.
+
+A snapshot is stored per catalog path and is only reused when the
+catalog's size, modification time and content hash all match the ones
+recorded in the snapshot. Any mismatch, unreadable snapshot or version
+change silently falls back to parsing the catalog again.
+
+Usage:
+    from catalog_cache import load_catalog_index
+    index = load_catalog_index("catalog.json")
+    index, digest = load_catalog("catalog.json")
+
+Environment:
+    - COMPUTE_SALES_CACHE_DIR: Directory where snapshots are written.
+    Defaults to ".compute_sales_cache" in the current directory.
+
+Author: Alejandra Mendoza Flores
+Date: October 19, 2026
+"""
+
+import os
+import json
+import marshal
+import hashlib
+
+SNAPSHOT_VERSION = 1
+DEFAULT_CACHE_DIR = ".compute_sales_cache"
+
+
+def build_product_index(products):
+    """
+    Builds a lookup of product prices keyed by product title.
+
+    The first product with a valid price wins, matching the order in
+    which compute_sales used to scan the catalog. Titles whose every
+    entry has an invalid price are kept with a None price so callers
+    can still report them.
+
+    Parameters:
+    - products (list): A list of dictionaries representing
+    product information.
+
+    Returns:
+    - dict: A dictionary mapping product titles to prices (float or None).
+    """
+    index = {}
+    for product in products:
+        title = product["title"]
+        if index.get(title) is not None:
+            continue
+        try:
+            index[title] = float(product["price"])
+        except (TypeError, ValueError):
+            index[title] = None
+    return index
+
+
+def file_digest(path):
+    """
+    Computes the BLAKE2b digest of a file's content.
+
+    Parameters:
+    - path (str): The path of the file to hash.
+
+    Returns:
+    - str: The hexadecimal digest of the file content.
+    """
+    digest = hashlib.blake2b(digest_size=20)
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def snapshot_path(catalog_json, cache_dir=None):
+    """
+    Returns the snapshot file used for a given catalog path.
+
+    Parameters:
+    - catalog_json (str): The path to the catalog JSON file.
+    - cache_dir (str, optional): The snapshot directory.
+
+    Returns:
+    - str: The path of the snapshot file.
+    """
+    if cache_dir is None:
+        cache_dir = os.environ.get("COMPUTE_SALES_CACHE_DIR",
+                                   DEFAULT_CACHE_DIR)
+    real_path = os.path.realpath(catalog_json)
+    name = hashlib.blake2b(real_path.encode("utf-8"),
+                           digest_size=12).hexdigest()
+    return os.path.join(cache_dir, f"catalog-{name}.snapshot")
+
+
+def read_snapshot(catalog_json, cache_dir=None, digest=None):
+    """
+    Loads the cached index for a catalog if the snapshot is still valid.
+
+    Parameters:
+    - catalog_json (str): The path to the catalog JSON file.
+    - cache_dir (str, optional): The snapshot directory.
+    - digest (str, optional): The catalog hash, if the caller already
+    computed it. Otherwise it is computed when size and mtime match.
+
+    Returns:
+    - dict or None: The cached index, or None if there is no valid
+    snapshot for the catalog's current content.
+    """
+    path = snapshot_path(catalog_json, cache_dir)
+    try:
+        with open(path, "rb") as file:
+            snapshot = marshal.load(file)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+    if not isinstance(snapshot, dict) or \
+            snapshot.get("version") != SNAPSHOT_VERSION:
+        return None
+
+    stat = os.stat(catalog_json)
+    if snapshot.get("path") != os.path.realpath(catalog_json) or \
+            snapshot.get("size") != stat.st_size or \
+            snapshot.get("mtime_ns") != stat.st_mtime_ns:
+        return None
+
+    if digest is None:
+        digest = file_digest(catalog_json)
+    if snapshot.get("digest") != digest:
+        return None
+    return snapshot.get("index")
+
+
+def write_snapshot(catalog_json, index, stat, digest, cache_dir=None):
+    """
+    Persists the catalog index as a marshal snapshot.
+
+    The snapshot is written to a temporary file and renamed into place,
+    so a concurrent run never sees a half-written snapshot.
+
+    Parameters:
+    - catalog_json (str): The path to the catalog JSON file.
+    - index (dict): The product index built from the catalog.
+    - stat (os.stat_result): The catalog stat taken before parsing it.
+    - digest (str): The catalog hash taken before parsing it.
+    - cache_dir (str, optional): The snapshot directory.
+
+    Returns:
+    - None
+    """
+    path = snapshot_path(catalog_json, cache_dir)
+    snapshot = {
+        "version": SNAPSHOT_VERSION,
+        "path": os.path.realpath(catalog_json),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "digest": digest,
+        "index": index,
+    }
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as file:
+            marshal.dump(snapshot, file)
+        os.replace(temp_path, path)
+    except OSError as error:
+        print(f"Could not write catalog snapshot: {error}")
+
+
+def load_catalog_index(catalog_json, use_cache=True, cache_dir=None):
+    """
+    Returns the product index for a catalog, using the snapshot if valid.
+
+    Parameters:
+    - catalog_json (str): The path to the catalog JSON file.
+    - use_cache (bool): Whether snapshots are read and written.
+    - cache_dir (str, optional): The snapshot directory.
+
+    Returns:
+    - dict: A dictionary mapping product titles to prices.
+    """
+    if not use_cache:
+        with open(catalog_json, "r", encoding="utf-8") as file:
+            return build_product_index(json.load(file))
+
+    return load_catalog(catalog_json, cache_dir=cache_dir)[0]
+
+
+def load_catalog(catalog_json, use_cache=True, cache_dir=None):
+    """
+    Returns the product index for a catalog together with the catalog
+    hash, hashing the catalog only once.
+
+    Parameters:
+    - catalog_json (str): The path to the catalog JSON file.
+    - use_cache (bool): Whether snapshots are read and written.
+    - cache_dir (str, optional): The snapshot directory.
+
+    Returns:
+    - tuple: (index, digest), the product index and the hexadecimal
+    hash of the catalog content it was built from.
+    """
+    stat = os.stat(catalog_json)
+    digest = file_digest(catalog_json)
+    index = read_snapshot(catalog_json, cache_dir, digest) \
+        if use_cache else None
+    if index is not None:
+        return index, digest
+
+    with open(catalog_json, "r", encoding="utf-8") as file:
+        index = build_product_index(json.load(file))
+    if use_cache:
+        write_snapshot(catalog_json, index, stat, digest, cache_dir)
+    return index, digest
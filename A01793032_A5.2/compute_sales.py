@@ -5,22 +5,38 @@ This script reads product catalog and sales information from JSON files,
 calculates the total sales amount, and writes the results to a text file.
 
 Usage:
-    python compute_sales.py catalog_json sales_json
+    python compute_sales.py [--no-cache] catalog_json sales_json
+    python compute_sales.py --batch [--workers N] [--manifest FILE]
+        [--output FILE] [--no-cache] catalog_json [sales_json ...]
+    python compute_sales.py --checkpoint FILE [--full] [--no-cache]
+        catalog_json sales_log
 
 Dependencies:
     - Python 3
-    - Required Python modules: json, time, sys
+    - Required Python modules: json, time, sys, glob, argparse,
+    concurrent.futures
+    - catalog_cache.py (same directory) for the catalog snapshot cache
 
 Input:
     - catalog_json (str): Path to the JSON file
     containing product catalog information.
     - sales_json (str): Path to the JSON file
     containing sales information.
+    - --no-cache: Parse the catalog without reading or writing
+    its cached snapshot.
+    - --batch: Process many sales files (paths, glob patterns or a
+    --manifest file) with one catalog load, optionally in --workers
+    parallel processes.
+    - --checkpoint FILE: Incrementally total an append-only sales log
+    (JSON Lines or JSON array), pricing only records added since the
+    last run.
 
 Output:
     - Prints total sales amount and elapsed time.
     - Writes total sales and elapsed time information
     to "sales_results.txt" file.
+    - In batch mode, writes per-file totals, timings and error counts
+    to "sales_batch_results.json" instead.
 
 Example:
     python3 compute_sales.py catalog.json sales.json
@@ -31,10 +47,17 @@ Date: February 7, 2024
 """
 
 import sys
+import glob
 import json
 import time
+import argparse
 
 from os.path import exists
+from concurrent.futures import ProcessPoolExecutor
+
+from catalog_cache import (build_product_index, load_catalog,
+                           load_catalog_index)
+from sales_checkpoint import update_checkpoint
 
 
 def read_products(catolog_json):
@@ -82,25 +105,64 @@ def compute_sales(products, sales):
     - float: The total sales amount calculated from the product prices
     and sales quantities.
     """
+    return compute_sales_indexed(build_product_index(products), sales)
+
+
+def compute_sales_indexed(index, sales):
+    """
+    Calculates the total sales amount using a prebuilt product index.
+
+    Parameters:
+    - index (dict): A dictionary mapping product titles to prices,
+    as built by catalog_cache.build_product_index.
+    - sales (list): A list of dictionaries representing sales data,
+    including product names and quantities.
+
+    Returns:
+    - float: The total sales amount calculated from the product prices
+    and sales quantities.
+    """
+    total_sales, _ = price_sales(index, sales)
+    return total_sales
+
+
+def price_sales(index, sales, verbose=True):
+    """
+    Prices sales against a product index and counts the bad records.
+
+    Parameters:
+    - index (dict): A dictionary mapping product titles to prices.
+    - sales (list): A list of dictionaries representing sales data.
+    - verbose (bool): Whether invalid records are printed.
+
+    Returns:
+    - tuple: (total_sales, errors) where errors is a dictionary with the
+    number of invalid quantities, invalid prices and unknown products.
+    """
+    errors = {"invalid_quantity": 0, "invalid_price": 0,
+              "unknown_product": 0}
     total_sales = 0
     for sale in sales:
         name = sale["Product"]
         try:
             quantity = int(sale["Quantity"])
         except ValueError:
-            print(f"Invalid quantity: {sale['sale']}")
+            errors["invalid_quantity"] += 1
+            if verbose:
+                print(f"Invalid quantity: {sale['Quantity']}")
             continue
 
-        for product in products:
-            if product["title"] == name:
-                try:
-                    price = float(product["price"])
-                except ValueError:
-                    print(f"Invalid price: {name}")
-                    continue
-                total_sales += price * quantity
-                break
-    return total_sales
+        if name not in index:
+            errors["unknown_product"] += 1
+            continue
+        price = index[name]
+        if price is None:
+            errors["invalid_price"] += 1
+            if verbose:
+                print(f"Invalid price: {name}")
+            continue
+        total_sales += price * quantity
+    return total_sales, errors
 
 
 def write_results(total_sales, elapsed):
@@ -123,18 +185,218 @@ def write_results(total_sales, elapsed):
         file.write(f"Time:\t\t{elapsed:.5f} sec\n\n")
 
 
+_WORKER_INDEX = {}
+
+
+def _init_worker(index):
+    """
+    Stores the product index in a batch worker process.
+
+    Parameters:
+    - index (dict): The product index shared by every sales file.
+
+    Returns:
+    - None
+    """
+    _WORKER_INDEX.clear()
+    _WORKER_INDEX.update(index)
+
+
+def process_sales_file(sales_json, index=None):
+    """
+    Prices one sales file for batch mode.
+
+    Parameters:
+    - sales_json (str): The path to the sales JSON file.
+    - index (dict, optional): The product index. Batch workers use the
+    index installed by _init_worker when it is not given.
+
+    Returns:
+    - dict: The file name, total, sale count, error counts, elapsed time
+    and, if the file could not be read, the error message.
+    """
+    start = time.perf_counter()
+    result = {"file": sales_json, "total": 0.0, "sales": 0,
+              "errors": {}, "error": None}
+    try:
+        sales = read_sales(sales_json)
+        total_sales, errors = price_sales(
+            _WORKER_INDEX if index is None else index, sales, verbose=False)
+        result.update(total=round(total_sales, 2), sales=len(sales),
+                      errors=errors)
+    except (OSError, ValueError, KeyError, TypeError) as error:
+        result["error"] = f"{type(error).__name__}: {error}"
+    result["elapsed"] = round(time.perf_counter() - start, 6)
+    return result
+
+
+def expand_sales_files(patterns, manifest=None):
+    """
+    Expands sales file arguments and an optional manifest into paths.
+
+    Parameters:
+    - patterns (list): File paths or glob patterns.
+    - manifest (str, optional): A text file listing one path or glob
+    pattern per line. Blank lines and lines starting with # are ignored.
+
+    Returns:
+    - list: The sales file paths, in order and without duplicates.
+    """
+    patterns = list(patterns)
+    if manifest:
+        with open(manifest, "r", encoding="utf-8") as file:
+            patterns.extend(line.strip() for line in file
+                            if line.strip() and
+                            not line.lstrip().startswith("#"))
+
+    files = []
+    for pattern in patterns:
+        matches = sorted(glob.glob(pattern)) if glob.has_magic(pattern) \
+            else [pattern]
+        files.extend(match for match in matches if match not in files)
+    return files
+
+
+def run_batch(index, sales_files, workers=1):
+    """
+    Prices many sales files against one product index.
+
+    Parameters:
+    - index (dict): The product index built once for the whole batch.
+    - sales_files (list): The sales file paths.
+    - workers (int): Number of worker processes. 1 runs in-process.
+
+    Returns:
+    - list: One result dictionary per sales file, in input order.
+    """
+    if workers <= 1 or len(sales_files) <= 1:
+        return [process_sales_file(path, index) for path in sales_files]
+
+    with ProcessPoolExecutor(max_workers=workers,
+                             initializer=_init_worker,
+                             initargs=(index,)) as executor:
+        return list(executor.map(process_sales_file, sales_files,
+                                 chunksize=max(1, len(sales_files) //
+                                               (workers * 4))))
+
+
+def write_batch_results(catalog_json, results, elapsed,
+                        output="sales_batch_results.json"):
+    """
+    Writes the batch results to a JSON file.
+
+    Parameters:
+    - catalog_json (str): The path of the catalog used for the batch.
+    - results (list): The per-file results returned by run_batch.
+    - elapsed (float): The total elapsed time of the batch in seconds.
+    - output (str): The path of the results file.
+
+    Returns:
+    - None
+    """
+    summary = {
+        "catalog": catalog_json,
+        "files": results,
+        "total": round(sum(result["total"] for result in results), 2),
+        "failed_files": sum(1 for result in results if result["error"]),
+        "elapsed": round(elapsed, 6),
+    }
+    with open(output, "w", encoding="utf-8") as file:
+        json.dump(summary, file, indent=2)
+
+
+def parse_args(argv):
+    """
+    Parses the command line arguments.
+
+    Parameters:
+    - argv (list): The arguments after the script name.
+
+    Returns:
+    - argparse.Namespace: The parsed arguments.
+    """
+    parser = argparse.ArgumentParser(
+        prog="compute_sales.py",
+        description="Compute total sales from a catalog and sales files.")
+    parser.add_argument("catalog_json")
+    parser.add_argument("sales_json", nargs="*")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="do not use the catalog snapshot cache")
+    parser.add_argument("--batch", action="store_true",
+                        help="price many sales files with one catalog load")
+    parser.add_argument("--manifest",
+                        help="file listing sales files, one per line")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="worker processes for batch mode")
+    parser.add_argument("--output", default="sales_batch_results.json",
+                        help="results file for batch mode")
+    parser.add_argument("--checkpoint",
+                        help="checkpoint file for incremental totals over "
+                             "an append-only sales log")
+    parser.add_argument("--full", action="store_true",
+                        help="recompute the checkpoint from scratch")
+    args = parser.parse_args(argv)
+    if not args.batch and (len(args.sales_json) != 1 or args.manifest):
+        parser.error("exactly one sales_json is required without --batch")
+    if args.batch and args.checkpoint:
+        parser.error("--checkpoint cannot be combined with --batch")
+    return args
+
+
+def main_batch(args):
+    """
+    Runs batch mode and writes its structured results file.
+
+    Parameters:
+    - args (argparse.Namespace): The parsed command line arguments.
+
+    Returns:
+    - None
+    """
+    start = time.time()
+    sales_files = expand_sales_files(args.sales_json, args.manifest)
+    if not sales_files:
+        print("No sales files given.")
+        sys.exit(1)
+
+    index = load_catalog_index(args.catalog_json,
+                               use_cache=not args.no_cache)
+    results = run_batch(index, sales_files, args.workers)
+    elapsed = time.time() - start
+    write_batch_results(args.catalog_json, results, elapsed, args.output)
+
+    for result in results:
+        if result["error"]:
+            print(f"{result['file']}:\t{result['error']}")
+        else:
+            print(f"{result['file']}:\t{result['total']:.2f}")
+    print(f"Time:\t\t{elapsed:.5f} sec")
+
+
 def main():
     """
     Main function to compute and write sales information
     based on input JSON files.
 
     Usage:
-    - python compute_sales.py catalog_json sales_json
+    - python compute_sales.py [--no-cache] catalog_json sales_json
+    - python compute_sales.py --batch [--workers N] [--manifest FILE]
+      [--output FILE] [--no-cache] catalog_json [sales_json ...]
+    - python compute_sales.py --checkpoint FILE [--full] [--no-cache]
+      catalog_json sales_log
 
     Parameters:
     - catalog_json (str): Path to the JSON file containing
     product catalog information.
     - sales_json (str): Path to the JSON file containing sales information.
+    In batch mode, any number of paths or glob patterns.
+    - --no-cache: Skip the catalog snapshot cache.
+    - --batch: Price every sales file with a single catalog load and
+    write per-file totals, timings and error counts to --output
+    (default "sales_batch_results.json").
+    - --checkpoint FILE: Treat sales_json as an append-only log and only
+    price the records added since the checkpoint (see
+    sales_checkpoint.py). --full discards the checkpoint first.
 
     Prints:
     - Total sales amount.
@@ -144,27 +406,36 @@ def main():
     - Total sales and elapsed time information
     in a text file named "sales_results.txt".
     """
-    if len(sys.argv) != 3:
-        print("Usage: python compute_sales.py catalog_json sales_json")
-        sys.exit(1)
-
-    start = time.time()
-
-    catolog_json = sys.argv[1]
-    sales_json = sys.argv[2]
+    args = parse_args(sys.argv[1:])
+    catolog_json = args.catalog_json
 
     if not exists(catolog_json):
         print("File not found: ", catolog_json)
         sys.exit(1)
 
+    if args.batch:
+        main_batch(args)
+        return
+
+    start = time.time()
+
+    sales_json = args.sales_json[0]
+
     if not exists(sales_json):
         print("File not found: ", sales_json)
         sys.exit(1)
 
-    products = read_products(catolog_json)
-    sales = read_sales(sales_json)
-
-    total_sales = compute_sales(products, sales)
+    if args.checkpoint:
+        index, digest = load_catalog(catolog_json,
+                                     use_cache=not args.no_cache)
+        total_sales = update_checkpoint(digest, index, sales_json,
+                                        args.checkpoint,
+                                        full=args.full)["total"]
+    else:
+        index = load_catalog_index(catolog_json,
+                                   use_cache=not args.no_cache)
+        sales = read_sales(sales_json)
+        total_sales = compute_sales_indexed(index, sales)
 
     end = time.time()
     elapsed = end - start
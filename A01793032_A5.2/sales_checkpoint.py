@@ -0,0 +1,286 @@
+"""
+Incremental Sales Checkpoints
+
+This module computes sales totals over an append-only sales log without
+repricing the whole history on every run. A checkpoint file keeps the
+running aggregate per product together with how much of the log has
+already been processed and the version (content hash) of the catalog
+used to price it.
+
+Supported logs:
+    - JSON Lines: one sale object per line. The checkpoint stores the
+    byte offset after the last complete line, so a run only reads the
+    bytes appended since then. A trailing line without a newline is
+    treated as still being written and left for the next run.
+    - JSON array: the format used by compute_sales.py. The file still
+    has to be parsed, but only records past the stored record count
+    are priced. The stored offset is the length of the array up to its
+    closing bracket, which appending records leaves unchanged.
+
+When the catalog changes, only the products whose price changed are
+repriced from the stored per-product quantities. If the log shrank or
+was replaced (detected in both formats by a hash of its first bytes),
+or a full recompute is requested, the checkpoint is rebuilt from the
+start of the log.
+
+Usage:
+    python compute_sales.py --checkpoint sales.ckpt catalog.json sales.jsonl
+
+Author: Alejandra Mendoza Flores
+Date: October 19, 2026
+"""
+
+import os
+import json
+import hashlib
+
+CHECKPOINT_VERSION = 1
+
+
+def new_checkpoint(sales_log):
+    """
+    Returns an empty checkpoint for a sales log.
+
+    Parameters:
+    - sales_log (str): The path to the sales log.
+
+    Returns:
+    - dict: A checkpoint with nothing processed yet.
+    """
+    return {
+        "version": CHECKPOINT_VERSION,
+        "log": os.path.realpath(sales_log),
+        "offset": 0,
+        "records": 0,
+        "head": None,
+        "catalog_digest": None,
+        "total": 0.0,
+        "invalid_quantity": 0,
+        "invalid_record": 0,
+        "products": {},
+        "prices": {},
+    }
+
+
+def read_checkpoint(checkpoint_path, sales_log):
+    """
+    Loads a checkpoint, or returns an empty one if it is missing or stale.
+
+    Parameters:
+    - checkpoint_path (str): The path to the checkpoint file.
+    - sales_log (str): The path to the sales log it must belong to.
+
+    Returns:
+    - dict: The checkpoint to continue from.
+    """
+    try:
+        with open(checkpoint_path, "r", encoding="utf-8") as file:
+            checkpoint = json.load(file)
+    except (OSError, ValueError):
+        return new_checkpoint(sales_log)
+
+    if not isinstance(checkpoint, dict) or \
+            checkpoint.get("version") != CHECKPOINT_VERSION or \
+            checkpoint.get("log") != os.path.realpath(sales_log) or \
+            checkpoint.get("offset", 0) > os.path.getsize(sales_log):
+        return new_checkpoint(sales_log)
+    return checkpoint
+
+
+def write_checkpoint(checkpoint_path, checkpoint):
+    """
+    Atomically writes a checkpoint file.
+
+    Parameters:
+    - checkpoint_path (str): The path to the checkpoint file.
+    - checkpoint (dict): The checkpoint to persist.
+
+    Returns:
+    - None
+    """
+    temp_path = f"{checkpoint_path}.{os.getpid()}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as file:
+        json.dump(checkpoint, file)
+    os.replace(temp_path, checkpoint_path)
+
+
+def reprice(checkpoint, index):
+    """
+    Brings a checkpoint's total in line with a new catalog index.
+
+    Only products whose price differs from the one recorded in the
+    checkpoint are touched, so the cost is proportional to the number
+    of changed products rather than the size of the log.
+
+    Parameters:
+    - checkpoint (dict): The checkpoint to update in place.
+    - index (dict): The new product index.
+
+    Returns:
+    - int: The number of products that were repriced.
+    """
+    prices = checkpoint["prices"]
+    changed = 0
+    for name, (quantity, _) in checkpoint["products"].items():
+        old_price = prices.get(name)
+        new_price = index.get(name)
+        if old_price == new_price:
+            continue
+        checkpoint["total"] += (new_price or 0) * quantity - \
+            (old_price or 0) * quantity
+        prices[name] = new_price
+        changed += 1
+    return changed
+
+
+def add_sales(checkpoint, index, sales):
+    """
+    Prices new sales and adds them to a checkpoint's aggregate.
+
+    Parameters:
+    - checkpoint (dict): The checkpoint to update in place.
+    - index (dict): The product index.
+    - sales (iterable): The new sale records.
+
+    Returns:
+    - None
+    """
+    products = checkpoint["products"]
+    prices = checkpoint["prices"]
+    for sale in sales:
+        checkpoint["records"] += 1
+        try:
+            name = sale["Product"]
+            quantity = int(sale["Quantity"])
+        except (KeyError, TypeError, ValueError):
+            checkpoint["invalid_quantity"] += 1
+            continue
+
+        entry = products.setdefault(name, [0, 0])
+        entry[0] += quantity
+        entry[1] += 1
+        price = index.get(name)
+        prices[name] = price
+        if price is not None:
+            checkpoint["total"] += price * quantity
+
+
+def _read_new_lines(sales_log, checkpoint):
+    """
+    Reads the complete JSON Lines records appended since the checkpoint.
+
+    Parameters:
+    - sales_log (str): The path to the JSON Lines sales log.
+    - checkpoint (dict): The checkpoint; its offset is advanced.
+
+    Returns:
+    - list: The newly appended sale records.
+    """
+    with open(sales_log, "rb") as file:
+        file.seek(checkpoint["offset"])
+        data = file.read()
+
+    end = data.rfind(b"\n") + 1
+    sales = []
+    for line in data[:end].splitlines():
+        if not line.strip():
+            continue
+        try:
+            sales.append(json.loads(line))
+        except ValueError:
+            checkpoint["invalid_record"] += 1
+    checkpoint["offset"] += end
+    return sales
+
+
+def _read_new_records(sales_log, checkpoint):
+    """
+    Returns the JSON array records past the checkpoint's record count.
+
+    Parameters:
+    - sales_log (str): The path to the JSON array sales file.
+    - checkpoint (dict): The checkpoint to continue from; its offset is
+    set to the length of the array before its closing bracket.
+
+    Returns:
+    - list or None: The sale records not yet processed, or None if the
+    file now holds fewer records than were already processed.
+    """
+    with open(sales_log, "rb") as file:
+        data = file.read()
+    sales = json.loads(data)
+    if len(sales) < checkpoint["records"]:
+        return None
+    checkpoint["offset"] = len(data[:data.rfind(b"]")].rstrip())
+    return sales[checkpoint["records"]:]
+
+
+def _head_digest(sales_log, size):
+    """
+    Hashes the start of a sales log to detect a replaced file.
+
+    Parameters:
+    - sales_log (str): The path to the sales log.
+    - size (int): How many leading bytes to hash, at most 4096.
+
+    Returns:
+    - str: The hexadecimal digest of the leading bytes.
+    """
+    with open(sales_log, "rb") as file:
+        head = file.read(min(size, 4096))
+    return hashlib.blake2b(head, digest_size=16).hexdigest()
+
+
+def _is_json_array(sales_log):
+    """
+    Tells whether a sales log is a JSON array rather than JSON Lines.
+
+    Parameters:
+    - sales_log (str): The path to the sales log.
+
+    Returns:
+    - bool: True if the first non-blank character is "[".
+    """
+    with open(sales_log, "rb") as file:
+        return file.read(4096).lstrip()[:1] == b"["
+
+
+def update_checkpoint(catalog_digest, index, sales_log,
+                      checkpoint_path, full=False):
+    """
+    Brings a sales log's checkpoint up to date and persists it.
+
+    Parameters:
+    - catalog_digest (str): The hash of the catalog content, as
+    returned by catalog_cache.load_catalog.
+    - index (dict): The product index built from that catalog.
+    - sales_log (str): The path to the append-only sales log.
+    - checkpoint_path (str): The path to the checkpoint file.
+    - full (bool): Whether to ignore the checkpoint and start over.
+
+    Returns:
+    - dict: The updated checkpoint.
+    """
+    checkpoint = new_checkpoint(sales_log) if full else \
+        read_checkpoint(checkpoint_path, sales_log)
+    if checkpoint["offset"] and checkpoint.get("head") != \
+            _head_digest(sales_log, checkpoint["offset"]):
+        checkpoint = new_checkpoint(sales_log)
+
+    if checkpoint["catalog_digest"] != catalog_digest:
+        reprice(checkpoint, index)
+        checkpoint["catalog_digest"] = catalog_digest
+
+    if _is_json_array(sales_log):
+        sales = _read_new_records(sales_log, checkpoint)
+        if sales is None:
+            checkpoint = new_checkpoint(sales_log)
+            checkpoint["catalog_digest"] = catalog_digest
+            sales = _read_new_records(sales_log, checkpoint)
+    else:
+        sales = _read_new_lines(sales_log, checkpoint)
+    checkpoint["head"] = _head_digest(sales_log, checkpoint["offset"])
+
+    add_sales(checkpoint, index, sales)
+    write_checkpoint(checkpoint_path, checkpoint)
+    return checkpoint
@@ -0,0 +1,304 @@
+"""
+Columnar Sales Representation
+
+This module turns a list of sale records into parallel packed arrays so
+totals and per-product group-bys run as a single gather-multiply-sum
+instead of a per-record Python loop with dictionary lookups.
+
+Layout:
+    - titles (list): Product titles, dictionary-encoded. Codes follow
+    the catalog order; titles missing from the catalog are appended.
+    - prices (array('d')): Price per code. Unknown products and invalid
+    prices are stored as 0.0 so they do not add to the total.
+    - codes (array('I')): Product code of each sale.
+    - quantities (array('q')): Quantity of each sale.
+
+NumPy is used for the vectorized kernels when it is installed; otherwise
+the same operations run on the arrays with a pure-Python fallback.
+
+Columns can be saved to a single binary file whose arrays are 8-byte
+aligned and little-endian, so SalesColumns.load can memory-map them
+without copying. Big-endian machines byteswap on save and load, which
+costs a copy of each array.
+
+Usage:
+    python sales_columnar.py catalog.json sales.json [--save FILE]
+    python sales_columnar.py --load FILE [--by-product]
+
+Author: Alejandra Mendoza Flores
+Date: October 19, 2026
+"""
+
+import sys
+import json
+import mmap
+import struct
+import argparse
+
+from array import array
+from operator import mul
+
+from catalog_cache import load_catalog_index
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+MAGIC = b"SALESCOL"
+HEADER = struct.Struct("<8sIIQQ")
+
+
+def _padding(size):
+    """
+    Returns the padding needed to keep the next array 8-byte aligned.
+
+    Parameters:
+    - size (int): The number of bytes written so far.
+
+    Returns:
+    - bytes: Zero bytes to append.
+    """
+    return b"\0" * (-size % 8)
+
+
+def _to_little_endian(values, typecode):
+    """
+    Returns the bytes of an array in little-endian order.
+
+    Parameters:
+    - values (sequence): The array to write.
+    - typecode (str): Its array typecode.
+
+    Returns:
+    - bytes: The packed values.
+    """
+    if sys.byteorder == "little":
+        return bytes(values)
+    swapped = array(typecode, values)
+    swapped.byteswap()
+    return bytes(swapped)
+
+
+def _from_little_endian(view, typecode):
+    """
+    Returns an array over little-endian bytes of a saved file.
+
+    Parameters:
+    - view (memoryview): The bytes of the array in the file.
+    - typecode (str): Its array typecode.
+
+    Returns:
+    - sequence: A view over the bytes, or a byteswapped copy on
+    big-endian machines.
+    """
+    if sys.byteorder == "little":
+        return view.cast(typecode)
+    values = array(typecode, bytes(view))
+    values.byteswap()
+    return values
+
+
+class SalesColumns:
+    """
+    Sales stored as parallel packed arrays.
+
+    Attributes:
+        titles (list): Dictionary of product titles indexed by code.
+        prices (sequence): Price per product code.
+        codes (sequence): Product code per sale.
+        quantities (sequence): Quantity per sale.
+        invalid_quantity (int): Sales skipped for a non-integer quantity.
+    """
+
+    def __init__(self, titles, prices, codes, quantities,
+                 invalid_quantity=0, buffer=None):
+        self.titles = titles
+        self.prices = prices
+        self.codes = codes
+        self.quantities = quantities
+        self.invalid_quantity = invalid_quantity
+        self._buffer = buffer
+
+    def __len__(self):
+        return len(self.codes)
+
+    @staticmethod
+    def from_sales(index, sales):
+        """
+        Builds the columns from sale records and a product index.
+
+        Parameters:
+        - index (dict): A dictionary mapping product titles to prices.
+        - sales (list): A list of dictionaries representing sales data.
+
+        Returns:
+        - SalesColumns: The dictionary-encoded columns.
+        """
+        titles = list(index)
+        lookup = {title: code for code, title in enumerate(titles)}
+        prices = array("d", (price or 0.0 for price in index.values()))
+        codes = array("I")
+        quantities = array("q")
+        invalid_quantity = 0
+        for sale in sales:
+            try:
+                quantity = int(sale["Quantity"])
+            except ValueError:
+                invalid_quantity += 1
+                continue
+            name = sale["Product"]
+            code = lookup.get(name)
+            if code is None:
+                code = lookup[name] = len(titles)
+                titles.append(name)
+                prices.append(0.0)
+            codes.append(code)
+            quantities.append(quantity)
+        return SalesColumns(titles, prices, codes, quantities,
+                            invalid_quantity)
+
+    def total(self):
+        """
+        Computes the total sales amount.
+
+        Returns:
+        - float: The sum of price times quantity over every sale.
+        """
+        if np is not None:
+            prices = np.frombuffer(self.prices, dtype=np.float64)
+            codes = np.frombuffer(self.codes, dtype=np.uint32)
+            quantities = np.frombuffer(self.quantities, dtype=np.int64)
+            return float(np.dot(prices[codes], quantities))
+        return sum(map(mul, map(self.prices.__getitem__, self.codes),
+                       self.quantities))
+
+    def quantities_by_product(self):
+        """
+        Sums the sold quantity per product.
+
+        Returns:
+        - dict: A dictionary mapping product titles to total quantity.
+        """
+        if np is not None:
+            sums = np.bincount(
+                np.frombuffer(self.codes, dtype=np.uint32),
+                weights=np.frombuffer(self.quantities, dtype=np.int64),
+                minlength=len(self.titles))
+            sums = sums.astype(np.int64).tolist()
+        else:
+            sums = [0] * len(self.titles)
+            for code, quantity in zip(self.codes, self.quantities):
+                sums[code] += quantity
+        return {title: total for title, total in zip(self.titles, sums)
+                if total}
+
+    def totals_by_product(self):
+        """
+        Sums the sales amount per product.
+
+        Returns:
+        - dict: A dictionary mapping product titles to sales amount.
+        """
+        quantities = self.quantities_by_product()
+        lookup = {title: code for code, title in enumerate(self.titles)}
+        return {title: self.prices[lookup[title]] * quantity
+                for title, quantity in quantities.items()}
+
+    def save(self, path):
+        """
+        Writes the columns to a memory-mappable binary file.
+
+        Parameters:
+        - path (str): The output file path.
+
+        Returns:
+        - None
+        """
+        titles = json.dumps(self.titles).encode("utf-8")
+        with open(path, "wb") as file:
+            file.write(HEADER.pack(MAGIC, len(self.titles), len(titles),
+                                   len(self.codes), self.invalid_quantity))
+            file.write(titles + _padding(HEADER.size + len(titles)))
+            file.write(_to_little_endian(self.prices, "d"))
+            file.write(_to_little_endian(self.codes, "I") +
+                       _padding(4 * len(self.codes)))
+            file.write(_to_little_endian(self.quantities, "q"))
+
+    @staticmethod
+    def load(path):
+        """
+        Memory-maps columns previously written with save.
+
+        The arrays are views over the mapped file, so reopening a large
+        sales history costs only the title dictionary decode.
+
+        Parameters:
+        - path (str): The file path.
+
+        Returns:
+        - SalesColumns: The columns backed by the mapped file.
+        """
+        with open(path, "rb") as file:
+            buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, n_titles, titles_size, n_sales, invalid_quantity = \
+            HEADER.unpack_from(buffer)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a sales columns file")
+
+        view = memoryview(buffer)
+        offset = HEADER.size
+        titles = json.loads(bytes(view[offset:offset + titles_size]))
+        offset += titles_size + len(_padding(offset + titles_size))
+        prices = _from_little_endian(view[offset:offset + 8 * n_titles],
+                                     "d")
+        offset += 8 * n_titles
+        codes = _from_little_endian(view[offset:offset + 4 * n_sales], "I")
+        offset += 4 * n_sales + len(_padding(4 * n_sales))
+        quantities = _from_little_endian(
+            view[offset:offset + 8 * n_sales], "q")
+
+        return SalesColumns(titles, prices, codes, quantities,
+                            invalid_quantity, buffer)
+
+
+def main():
+    """
+    Builds, saves or reloads sales columns and prints their totals.
+
+    Usage:
+    - python sales_columnar.py catalog_json sales_json [--save FILE]
+    - python sales_columnar.py --load FILE [--by-product]
+
+    Prints:
+    - Total sales amount and, with --by-product, the amount per product.
+    """
+    parser = argparse.ArgumentParser(prog="sales_columnar.py")
+    parser.add_argument("catalog_json", nargs="?")
+    parser.add_argument("sales_json", nargs="?")
+    parser.add_argument("--save", help="write the columns to this file")
+    parser.add_argument("--load", help="memory-map a saved columns file")
+    parser.add_argument("--by-product", action="store_true",
+                        help="print the sales amount per product")
+    args = parser.parse_args(sys.argv[1:])
+
+    if args.load:
+        columns = SalesColumns.load(args.load)
+    elif args.catalog_json and args.sales_json:
+        with open(args.sales_json, "r", encoding="utf-8") as file:
+            sales = json.load(file)
+        columns = SalesColumns.from_sales(
+            load_catalog_index(args.catalog_json), sales)
+        if args.save:
+            columns.save(args.save)
+    else:
+        parser.error("catalog_json and sales_json, or --load, are required")
+
+    if args.by_product:
+        for title, amount in sorted(columns.totals_by_product().items()):
+            print(f"{title}:\t{amount:.2f}")
+    print(f"Total sales:\t{columns.total():.2f}")
+
+
+if __name__ == "__main__":
+    main()
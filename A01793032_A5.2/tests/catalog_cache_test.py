@@ -0,0 +1,126 @@
+"""
+catalog_cache_test.py - Unit Tests for the Catalog Snapshot Cache
+
+This module contains unit tests for catalog_cache.py.
+
+Test Cases:
+    - test_snapshot_reused: A second load reads the snapshot instead of
+    parsing the catalog.
+    - test_invalidated_on_size_change: A catalog that grew is parsed
+    again.
+    - test_invalidated_on_mtime_change: A touched catalog is parsed
+    again even with the same content.
+    - test_invalidated_on_content_change: A catalog rewritten with the
+    same size and modification time is caught by its hash.
+    - test_unreadable_snapshot: A corrupt snapshot falls back to the
+    catalog.
+
+To run the tests, execute the script using the following command:
+    python3 -m unittest tests/catalog_cache_test.py
+
+Author: Alejandra Mendoza Flores
+Date: October 19, 2026
+"""
+import os
+import json
+import tempfile
+import unittest
+from unittest.mock import patch
+# pylint: disable=wrong-import-position, import-error
+from catalog_cache import (load_catalog_index, read_snapshot,
+                           snapshot_path)
+# pylint: enable=wrong-import-position, import-error
+
+CATALOG = [{"title": "Pen", "price": 1.5},
+           {"title": "Ink", "price": 3.0}]
+
+
+class CatalogCacheTest(unittest.TestCase):
+    """
+    Unit tests for the catalog snapshot cache.
+    """
+    def setUp(self):
+        # pylint: disable=consider-using-with
+        self.directory = tempfile.TemporaryDirectory()
+        self.catalog = os.path.join(self.directory.name, "catalog.json")
+        self.cache_dir = os.path.join(self.directory.name, "cache")
+        self.write_catalog(CATALOG)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write_catalog(self, products):
+        """
+        Writes the catalog file.
+        """
+        with open(self.catalog, "w", encoding="utf-8") as file:
+            json.dump(products, file)
+
+    def load(self):
+        """
+        Loads the catalog index through the cache.
+        """
+        return load_catalog_index(self.catalog, cache_dir=self.cache_dir)
+
+    def test_snapshot_reused(self):
+        """
+        Test case verifying that a valid snapshot skips the parse.
+        """
+        self.assertEqual(self.load(), {"Pen": 1.5, "Ink": 3.0})
+        self.assertTrue(os.path.exists(
+            snapshot_path(self.catalog, self.cache_dir)))
+        with patch("catalog_cache.json.load",
+                   side_effect=AssertionError("catalog parsed")):
+            self.assertEqual(self.load(), {"Pen": 1.5, "Ink": 3.0})
+        self.assertEqual(load_catalog_index(self.catalog, use_cache=False),
+                         {"Pen": 1.5, "Ink": 3.0})
+
+    def test_invalidated_on_size_change(self):
+        """
+        Test case for a catalog that changed size.
+        """
+        self.load()
+        self.write_catalog(CATALOG + [{"title": "Pad", "price": 2}])
+        self.assertIsNone(read_snapshot(self.catalog, self.cache_dir))
+        self.assertEqual(self.load()["Pad"], 2.0)
+        self.assertEqual(read_snapshot(self.catalog, self.cache_dir)["Pad"],
+                         2.0)
+
+    def test_invalidated_on_mtime_change(self):
+        """
+        Test case for a catalog touched without changing its content.
+        """
+        self.load()
+        stat = os.stat(self.catalog)
+        os.utime(self.catalog, ns=(stat.st_atime_ns,
+                                   stat.st_mtime_ns + 1_000_000_000))
+        self.assertIsNone(read_snapshot(self.catalog, self.cache_dir))
+        self.load()
+        self.assertIsNotNone(read_snapshot(self.catalog, self.cache_dir))
+
+    def test_invalidated_on_content_change(self):
+        """
+        Test case for a same-size rewrite that keeps the mtime.
+        """
+        self.load()
+        stat = os.stat(self.catalog)
+        self.write_catalog([{"title": "Pen", "price": 2.5},
+                            {"title": "Ink", "price": 3.0}])
+        os.utime(self.catalog, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        self.assertEqual(os.stat(self.catalog).st_size, stat.st_size)
+        self.assertIsNone(read_snapshot(self.catalog, self.cache_dir))
+        self.assertEqual(self.load()["Pen"], 2.5)
+
+    def test_unreadable_snapshot(self):
+        """
+        Test case for a corrupt snapshot file.
+        """
+        self.load()
+        with open(snapshot_path(self.catalog, self.cache_dir), "wb") as file:
+            file.write(b"\x00not marshal")
+        self.assertIsNone(read_snapshot(self.catalog, self.cache_dir))
+        self.assertEqual(self.load(), {"Pen": 1.5, "Ink": 3.0})
+
+
+if __name__ == '__main__':
+    unittest.main()
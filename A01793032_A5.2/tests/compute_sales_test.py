@@ -0,0 +1,126 @@
+"""
+compute_sales_test.py - Unit Tests for the Batch Mode of compute_sales
+
+This module contains unit tests for run_batch and main_batch in
+compute_sales.py.
+
+Test Cases:
+    - test_run_batch_order_and_errors: Results come back in input
+    order, in-process and with worker processes, and a bad file only
+    fails its own entry.
+    - test_main_batch_results_file: The results file lists every file
+    with its total or error, and the batch total.
+    - test_main_batch_without_files: An empty batch exits with an
+    error.
+
+To run the tests, execute the script using the following command:
+    python3 -m unittest tests/compute_sales_test.py
+
+Author: Alejandra Mendoza Flores
+Date: October 19, 2026
+"""
+import os
+import io
+import json
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+# pylint: disable=wrong-import-position, import-error
+from compute_sales import main_batch, parse_args, run_batch
+# pylint: enable=wrong-import-position, import-error
+
+INDEX = {"Pen": 1.5, "Ink": 3.0, "Box": None}
+
+
+class BatchTest(unittest.TestCase):
+    """
+    Unit tests for the batch mode.
+    """
+    def setUp(self):
+        # pylint: disable=consider-using-with
+        self.directory = tempfile.TemporaryDirectory()
+        self.catalog = self.write("catalog.json", [
+            {"title": "Pen", "price": 1.5}, {"title": "Ink", "price": 3},
+            {"title": "Box", "price": "n/a"}])
+        self.files = [
+            self.write("a.json", [{"Product": "Pen", "Quantity": 2},
+                                  {"Product": "Ink", "Quantity": "x"}]),
+            os.path.join(self.directory.name, "missing.json"),
+            self.write("b.json", [{"Product": "Ink", "Quantity": 1},
+                                  {"Product": "Box", "Quantity": 1},
+                                  {"Product": "Cup", "Quantity": 1}]),
+            self.write("c.json", [{"Quantity": 1}]),
+            os.path.join(self.directory.name, "d.json"),
+        ]
+        with open(self.files[-1], "w", encoding="utf-8") as file:
+            file.write("[{")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, name, data):
+        """
+        Writes a JSON file in the test directory and returns its path.
+        """
+        path = os.path.join(self.directory.name, name)
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(data, file)
+        return path
+
+    def check_results(self, results):
+        """
+        Checks the results of the batch of setUp.
+        """
+        self.assertEqual([result["file"] for result in results],
+                         self.files)
+        self.assertEqual(results[0]["total"], 3.0)
+        self.assertEqual(results[0]["errors"]["invalid_quantity"], 1)
+        self.assertIsNone(results[0]["error"])
+        self.assertTrue(results[1]["error"].startswith(
+            "FileNotFoundError"))
+        self.assertEqual(results[2]["total"], 3.0)
+        self.assertEqual(results[2]["errors"],
+                         {"invalid_quantity": 0, "invalid_price": 1,
+                          "unknown_product": 1})
+        self.assertTrue(results[3]["error"].startswith("KeyError"))
+        self.assertTrue(results[4]["error"].startswith("JSONDecodeError"))
+
+    def test_run_batch_order_and_errors(self):
+        """
+        Test case for per-file errors and result order.
+        """
+        self.check_results(run_batch(INDEX, self.files))
+        self.check_results(run_batch(INDEX, self.files, workers=2))
+
+    def test_main_batch_results_file(self):
+        """
+        Test case for the results file written by main_batch.
+        """
+        output = os.path.join(self.directory.name, "results.json")
+        args = parse_args(["--batch", "--no-cache", "--output", output,
+                           self.catalog] + self.files)
+        printed = io.StringIO()
+        with redirect_stdout(printed):
+            main_batch(args)
+        with open(output, "r", encoding="utf-8") as file:
+            summary = json.load(file)
+        self.check_results(summary["files"])
+        self.assertEqual(summary["total"], 6.0)
+        self.assertEqual(summary["failed_files"], 3)
+        lines = printed.getvalue().splitlines()
+        self.assertEqual(lines[0], f"{self.files[0]}:\t3.00")
+        self.assertIn("FileNotFoundError", lines[1])
+
+    def test_main_batch_without_files(self):
+        """
+        Test case for a batch whose patterns match nothing.
+        """
+        args = parse_args(["--batch", "--no-cache", self.catalog,
+                           os.path.join(self.directory.name, "*.csv")])
+        with redirect_stdout(io.StringIO()), \
+                self.assertRaises(SystemExit):
+            main_batch(args)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,142 @@
+"""
+sales_checkpoint_test.py - Unit Tests for the Incremental Sales Totals
+
+This module contains unit tests for sales_checkpoint.py.
+
+Test Cases:
+    - test_resume_from_offset: A JSON Lines run only reads the bytes
+    appended since the checkpoint and leaves a partial line for later.
+    - test_truncated_or_replaced_log: A shorter or rewritten JSON Lines
+    log is totaled again from the start.
+    - test_json_array_append_and_replace: Appending to a JSON array only
+    prices the new records, and a rewritten array is detected.
+    - test_reprice: A new catalog only reprices the changed products.
+
+To run the tests, execute the script using the following command:
+    python3 -m unittest tests/sales_checkpoint_test.py
+
+Author: Alejandra Mendoza Flores
+Date: October 19, 2026
+"""
+import os
+import json
+import tempfile
+import unittest
+from unittest.mock import patch
+# pylint: disable=wrong-import-position, import-error
+import sales_checkpoint
+from sales_checkpoint import reprice, update_checkpoint
+# pylint: enable=wrong-import-position, import-error
+
+INDEX = {"Pen": 1.5, "Ink": 3.0}
+
+
+def _line(product, quantity):
+    return json.dumps({"Product": product, "Quantity": quantity}) + "\n"
+
+
+class SalesCheckpointTest(unittest.TestCase):
+    """
+    Unit tests for the sales checkpoints.
+    """
+    def setUp(self):
+        # pylint: disable=consider-using-with
+        self.directory = tempfile.TemporaryDirectory()
+        self.log = os.path.join(self.directory.name, "sales.jsonl")
+        self.checkpoint = os.path.join(self.directory.name, "sales.ckpt")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, text, mode="w"):
+        """
+        Writes or appends to the sales log.
+        """
+        with open(self.log, mode, encoding="utf-8") as file:
+            file.write(text)
+
+    def update(self, index=None, digest="catalog-1"):
+        """
+        Updates the checkpoint of the sales log.
+        """
+        return update_checkpoint(digest, INDEX if index is None else index,
+                                 self.log, self.checkpoint)
+
+    def test_resume_from_offset(self):
+        """
+        Test case for resuming a JSON Lines log from the stored offset.
+        """
+        self.write(_line("Pen", 2) + _line("Ink", 1))
+        self.assertEqual(self.update()["total"], 6.0)
+        offset = os.path.getsize(self.log)
+        self.write(_line("Pen", 4) + '{"Product": "Ink"', mode="a")
+        with patch.object(sales_checkpoint, "add_sales",
+                          wraps=sales_checkpoint.add_sales) as added:
+            checkpoint = self.update()
+        self.assertEqual(len(added.call_args.args[2]), 1)
+        self.assertEqual(checkpoint["total"], 12.0)
+        self.assertEqual(checkpoint["offset"],
+                         offset + len(_line("Pen", 4)))
+        self.write(', "Quantity": 1}\n', mode="a")
+        checkpoint = self.update()
+        self.assertEqual(checkpoint["total"], 15.0)
+        self.assertEqual(checkpoint["records"], 4)
+
+    def test_truncated_or_replaced_log(self):
+        """
+        Test case for logs that shrank or were rewritten.
+        """
+        self.write(_line("Pen", 2) + _line("Ink", 1))
+        self.update()
+        self.write(_line("Ink", 2))
+        checkpoint = self.update()
+        self.assertEqual(checkpoint["total"], 6.0)
+        self.assertEqual(checkpoint["records"], 1)
+        self.write(_line("Pen", 2) + _line("Pen", 8))
+        checkpoint = self.update()
+        self.assertEqual(checkpoint["total"], 15.0)
+        self.assertEqual(checkpoint["records"], 2)
+
+    def test_json_array_append_and_replace(self):
+        """
+        Test case for JSON array logs.
+        """
+        sales = [{"Product": "Pen", "Quantity": 2}]
+        self.write(json.dumps(sales, indent=2) + "\n")
+        self.assertEqual(self.update()["total"], 3.0)
+        sales.append({"Product": "Ink", "Quantity": 1})
+        self.write(json.dumps(sales, indent=2) + "\n")
+        checkpoint = self.update()
+        self.assertEqual(checkpoint["total"], 6.0)
+        self.assertEqual(checkpoint["records"], 2)
+
+        self.write(json.dumps([{"Product": "Ink", "Quantity": 5},
+                               {"Product": "Pen", "Quantity": 2},
+                               {"Product": "Pen", "Quantity": 2}],
+                              indent=2))
+        checkpoint = self.update()
+        self.assertEqual(checkpoint["total"], 21.0)
+        self.assertEqual(checkpoint["records"], 3)
+
+    def test_reprice(self):
+        """
+        Test case for a catalog change.
+        """
+        self.write(_line("Pen", 2) + _line("Ink", 1) + _line("Cup", 1))
+        self.assertEqual(self.update()["total"], 6.0)
+        new_index = {"Pen": 2.0, "Ink": 3.0, "Cup": 10.0}
+        with patch.object(sales_checkpoint, "reprice",
+                          wraps=reprice) as repriced:
+            self.assertEqual(self.update()["total"], 6.0)
+            self.assertEqual(repriced.call_count, 0)
+            checkpoint = self.update(new_index, "catalog-2")
+        self.assertEqual(checkpoint["total"], 17.0)
+        self.assertEqual(checkpoint["prices"]["Pen"], 2.0)
+        checkpoint["prices"]["Pen"] = 1.5
+        checkpoint["total"] = 6.0
+        self.assertEqual(reprice(checkpoint, new_index), 1)
+        self.assertEqual(checkpoint["total"], 7.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+"""
+sales_columnar_test.py - Unit Tests for the Columnar Sales Representation
+
+This module contains unit tests for sales_columnar.py.
+
+Test Cases:
+    - test_round_trip: Saved columns load back with the same totals,
+    with the pure-Python kernels and, when installed, with NumPy.
+    - test_file_is_little_endian: The arrays are written little-endian,
+    also from a (simulated) big-endian machine, and read back there.
+
+To run the tests, execute the script using the following command:
+    python3 -m unittest tests/sales_columnar_test.py
+
+Author: Alejandra Mendoza Flores
+Date: October 19, 2026
+"""
+import os
+import struct
+import tempfile
+import unittest
+from array import array
+from unittest.mock import patch
+# pylint: disable=wrong-import-position, import-error
+import sales_columnar
+from sales_columnar import HEADER, SalesColumns
+# pylint: enable=wrong-import-position, import-error
+
+INDEX = {"Pen": 1.5, "Ink": 3.0, "Box": None}
+SALES = [{"Product": "Pen", "Quantity": 2},
+         {"Product": "Ink", "Quantity": "1"},
+         {"Product": "Cup", "Quantity": 4},
+         {"Product": "Pen", "Quantity": "x"},
+         {"Product": "Ink", "Quantity": 3}]
+
+
+class SalesColumnsTest(unittest.TestCase):
+    """
+    Unit tests for the SalesColumns class.
+    """
+    def setUp(self):
+        # pylint: disable=consider-using-with
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "sales.col")
+        self.columns = SalesColumns.from_sales(INDEX, SALES)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def check_round_trip(self):
+        """
+        Saves and reloads the columns and compares their results.
+        """
+        self.columns.save(self.path)
+        loaded = SalesColumns.load(self.path)
+        self.assertEqual(loaded.titles, ["Pen", "Ink", "Box", "Cup"])
+        self.assertEqual(list(loaded.codes), [0, 1, 3, 1])
+        self.assertEqual(list(loaded.quantities), [2, 1, 4, 3])
+        self.assertEqual(list(loaded.prices), [1.5, 3.0, 0.0, 0.0])
+        self.assertEqual(loaded.invalid_quantity, 1)
+        self.assertEqual(loaded.total(), 15.0)
+        self.assertEqual(loaded.quantities_by_product(),
+                         {"Pen": 2, "Ink": 4, "Cup": 4})
+        self.assertEqual(loaded.totals_by_product(),
+                         {"Pen": 3.0, "Ink": 12.0, "Cup": 0.0})
+
+    def test_round_trip(self):
+        """
+        Test case for saving and loading with and without NumPy.
+        """
+        with patch.object(sales_columnar, "np", None):
+            self.assertEqual(self.columns.total(), 15.0)
+            self.check_round_trip()
+        if sales_columnar.np is None:
+            self.skipTest("NumPy is not installed")
+        self.assertEqual(self.columns.total(), 15.0)
+        self.check_round_trip()
+
+    def test_file_is_little_endian(self):
+        """
+        Test case for the byte order of the saved arrays.
+        """
+        self.columns.save(self.path)
+        with open(self.path, "rb") as file:
+            data = file.read()
+        _, _, titles_size, _, _ = HEADER.unpack_from(data)
+        offset = HEADER.size + titles_size
+        offset += -offset % 8
+        self.assertEqual(struct.unpack_from("<4d", data, offset),
+                         (1.5, 3.0, 0.0, 0.0))
+        self.assertEqual(struct.unpack_from("<4I", data, offset + 32),
+                         (0, 1, 3, 1))
+        self.assertEqual(struct.unpack_from("<4q", data, offset + 48),
+                         (2, 1, 4, 3))
+
+        # The arrays as a big-endian machine holds them in memory.
+        native = [array(values.typecode, values)
+                  for values in (self.columns.prices, self.columns.codes,
+                                 self.columns.quantities)]
+        for values in native:
+            values.byteswap()
+        big_endian = SalesColumns(self.columns.titles, *native,
+                                  invalid_quantity=1)
+        path = os.path.join(self.directory.name, "big.col")
+        with patch("sys.byteorder", "big"):
+            big_endian.save(path)
+            loaded = SalesColumns.load(path)
+        with open(path, "rb") as file:
+            self.assertEqual(file.read(), data)
+        self.assertEqual([bytes(values) for values in
+                          (loaded.prices, loaded.codes, loaded.quantities)],
+                         [bytes(values) for values in native])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,182 @@
+"""
+offload.py - Thread Offloading for the asyncio API
+
+This module runs the blocking methods of Customer, Hotel and
+Reservation on worker threads so that coroutines awaiting them never
+block the event loop. It backs the "a"-prefixed async counterparts of
+those methods (acreate_reservation, adelete_customer, ...), which stay
+thin wrappers around the synchronous API.
+
+Two lanes are used:
+
+    - run_blocking: A shared thread pool for plain reads (loading or
+    searching a storage backend).
+    - run_serialized: A single writer thread for mutations and for
+    reads that use the in-memory indexes, so that read-modify-write
+    cycles and index updates never interleave within the process.
+    The call is shielded from cancellation: once queued, a write
+    always completes even if the awaiting coroutine is cancelled.
+
+Both lanes share a per-event-loop semaphore that caps the number of
+calls in flight (MAX_CONCURRENCY by default). A call holds its slot
+until its thread is done with it, not until the awaiting coroutine
+stops waiting, so cancelled calls still count against the limit while
+they run.
+
+Reads run concurrently with the writer thread, so the storage backends
+that keep parsed state in memory (JournalStorage, WalStorage,
+RecordFileStorage) guard it with a lock of their own.
+
+Functions:
+    - run_blocking(func, *args, **kwargs): Awaits func on the pool.
+    - run_serialized(func, *args, **kwargs): Awaits func on the writer
+    thread.
+    - set_concurrency(limit): Changes the in-flight limit.
+    - shutdown(): Waits for queued calls and stops the threads.
+
+Author: Alejandra Mendoza Flores
+Date: October 19, 2026
+"""
+import asyncio
+import functools
+import threading
+import weakref
+
+from concurrent.futures import ThreadPoolExecutor
+
+MAX_CONCURRENCY = 64
+MAX_READERS = 8
+
+_executors = {}
+_executors_lock = threading.Lock()
+_semaphores = weakref.WeakKeyDictionary()
+_limit = {"value": MAX_CONCURRENCY}
+
+
+def _executor(lane):
+    """
+    Returns the executor of a lane, creating it on first use.
+
+    Args:
+        lane (str): "read" or "write".
+
+    Returns:
+        ThreadPoolExecutor: The executor.
+    """
+    with _executors_lock:
+        executor = _executors.get(lane)
+        if executor is None:
+            workers = MAX_READERS if lane == "read" else 1
+            executor = ThreadPoolExecutor(max_workers=workers,
+                                          thread_name_prefix=f"hotel-{lane}")
+            _executors[lane] = executor
+        return executor
+
+
+def _semaphore():
+    """
+    Returns the in-flight semaphore of the running event loop.
+
+    Returns:
+        asyncio.Semaphore: The semaphore.
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _semaphores[loop] = asyncio.Semaphore(_limit["value"])
+    return semaphore
+
+
+def set_concurrency(limit):
+    """
+    Changes the number of calls each event loop may have in flight.
+
+    Only loops that have not made a call yet are affected.
+
+    Args:
+        limit (int): The new limit.
+    """
+    _limit["value"] = limit
+    _semaphores.clear()
+
+
+async def _submit(lane, func, args, kwargs):
+    """
+    Queues a call on a lane once the semaphore lets it in.
+
+    The semaphore is released by the call's done-callback, which runs
+    when the thread finished the call or when it was cancelled before
+    it started.
+
+    Args:
+        lane (str): "read" or "write".
+        func (callable): The function to run.
+        args (tuple): Positional arguments for func.
+        kwargs (dict): Keyword arguments for func.
+
+    Returns:
+        asyncio.Future: The result of the call.
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphore()
+    await semaphore.acquire()
+    try:
+        future = _executor(lane).submit(functools.partial(func, *args,
+                                                          **kwargs))
+    except BaseException:
+        semaphore.release()
+        raise
+
+    def release(_):
+        try:
+            loop.call_soon_threadsafe(semaphore.release)
+        except RuntimeError:
+            pass  # The event loop is closed.
+
+    future.add_done_callback(release)
+    return asyncio.wrap_future(future, loop=loop)
+
+
+async def run_blocking(func, *args, **kwargs):
+    """
+    Runs a blocking read on the shared thread pool.
+
+    Args:
+        func (callable): The function to run.
+        *args: Positional arguments for func.
+        **kwargs: Keyword arguments for func.
+
+    Returns:
+        object: What func returns.
+    """
+    future = await _submit("read", func, args, kwargs)
+    return await future
+
+
+async def run_serialized(func, *args, **kwargs):
+    """
+    Runs a blocking call on the writer thread, shielded from
+    cancellation.
+
+    Args:
+        func (callable): The function to run.
+        *args: Positional arguments for func.
+        **kwargs: Keyword arguments for func.
+
+    Returns:
+        object: What func returns.
+    """
+    future = await _submit("write", func, args, kwargs)
+    return await asyncio.shield(future)
+
+
+def shutdown():
+    """
+    Waits for every queued call and stops the worker threads. They are
+    started again on the next call.
+    """
+    with _executors_lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=True)
@@ -0,0 +1,424 @@
+"""
+harness.py - Load Generator and Latency Benchmark for the Hotel System
+
+This module drives a mixed workload against the Customer, Hotel and
+Reservation classes from several threads and processes, and reports
+per-operation latencies and throughput as JSON.
+
+A run generates a data set (see workload.py), writes it to a data
+directory with the chosen storage backend, points the three classes
+at it and starts processes x threads workers. Every worker runs the
+same number of operations, drawn from a weighted mix of:
+
+    - create: Books a new one-night reservation on a date no other
+    worker uses, so creates never conflict.
+    - cancel: Cancels a reservation the worker created earlier (or
+    creates one when it has none left).
+    - lookup: Finds an existing reservation by its key.
+    - customer: Lists the reservations of a customer.
+    - available: Lists the free rooms of a hotel for a stay.
+
+The report holds the configuration, the latency statistics per
+operation (mean, p50, p95, p99 in milliseconds), the overall
+throughput, the size of every data file and the peak resident memory.
+Given a baseline report, compare() adds the ratio of each statistic to
+the baseline and lists the operations whose p95 latency regressed by
+more than a tolerance; the command line then exits with status 1.
+
+Functions:
+    - parse_mix(text): Parses "create=1,lookup=4" into weights.
+    - run_workload(...): Runs the workload and returns a report.
+    - compare(report, baseline, tolerance): Compares two reports.
+    - main(argv): Command line entry point.
+
+Usage:
+    python -m src.bench.harness --reservations 100000 --threads 4 \
+--processes 2 --output run.json
+    python -m src.bench.harness --backend wal --baseline run.json
+
+Author: Alejandra Mendoza Flores
+Date: October 19, 2026
+"""
+import os
+import sys
+import json
+import time
+import random
+import argparse
+import tempfile
+import threading
+
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timedelta
+
+from src.bench.workload import (SLOT_NIGHTS, START_DATE, BACKENDS,
+                                generate, open_storages, populate)
+from src.customer.customer import Customer
+from src.hotel.hotel import Hotel
+from src.reservation.reservation import RESERVATION_KEY, Reservation
+from src.service.benchmark import summarize
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+OPERATIONS = ("create", "cancel", "lookup", "customer", "available")
+DEFAULT_MIX = "create=2,cancel=1,lookup=4,customer=2,available=1"
+SAMPLE_SIZE = 1000
+
+
+def parse_mix(text):
+    """
+    Parses an operation mix.
+
+    Args:
+        text (str): Comma separated operation=weight pairs.
+
+    Returns:
+        dict: Weight per operation.
+
+    Raises:
+        ValueError: If an operation is unknown or a weight is invalid.
+    """
+    mix = {}
+    for item in text.split(","):
+        name, _, weight = item.strip().partition("=")
+        if name not in OPERATIONS:
+            raise ValueError(f"Unknown operation: {name}")
+        mix[name] = float(weight or 1)
+        if mix[name] < 0:
+            raise ValueError(f"Negative weight for {name}")
+    if not any(mix.values()):
+        raise ValueError("The operation mix is empty")
+    return mix
+
+
+def _peak_memory_kb():
+    """
+    Returns the peak resident memory of the process.
+
+    Returns:
+        int: Kilobytes, or None where it cannot be measured.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak
+
+
+class _Worker:
+    """
+    Runs the operations of one worker thread.
+
+    Attributes:
+        worker (int): The worker number, unique across processes.
+        info (dict): What the workers know about the data set.
+        latencies (dict): Seconds taken per operation.
+    """
+
+    def __init__(self, worker, info, seed):
+        self.worker = worker
+        self.info = info
+        self.latencies = {name: [] for name in OPERATIONS}
+        self._random = random.Random(seed * 7919 + worker)
+        self._created = []
+        self._next_day = 0
+
+    def create(self):
+        """
+        Books a reservation on a date only this worker uses.
+        """
+        day = self.info["first_free_day"] + \
+            self.worker * self.info["operations"] + self._next_day
+        self._next_day += 1
+        check_in = START_DATE + timedelta(days=day)
+        record = {
+            "customer_name": f"bench-{self.worker}-{self._next_day}",
+            "hotel_name": self._random.choice(self.info["hotels"]),
+            "room_number": self._random.randint(1, self.info["rooms"]),
+            "check_in_date": check_in.isoformat(),
+            "check_out_date": (check_in + timedelta(days=1)).isoformat()}
+        if Reservation.create_reservation(**record) is not None:
+            self._created.append(record)
+
+    def cancel(self):
+        """
+        Cancels a reservation this worker created.
+        """
+        record = self._created.pop()
+        Reservation.cancel_reservation(
+            *(record[field] for field in RESERVATION_KEY))
+
+    def lookup(self):
+        """
+        Finds an existing reservation by its key.
+        """
+        Reservation.find_reservation(
+            *self._random.choice(self.info["reservation_keys"]))
+
+    def customer(self):
+        """
+        Lists the reservations of a customer.
+        """
+        Reservation.reservations_for_customer(
+            self._random.choice(self.info["customers"]))
+
+    def available(self):
+        """
+        Lists the free rooms of a hotel for a stay.
+        """
+        check_in = START_DATE + timedelta(
+            days=self._random.randrange(self.info["first_free_day"]))
+        Reservation.available_rooms(
+            self._random.choice(self.info["hotels"]), check_in.isoformat(),
+            (check_in + timedelta(days=2)).isoformat(),
+            rooms=range(1, self.info["rooms"] + 1))
+
+    def run(self, mix):
+        """
+        Runs the worker's share of the operations.
+
+        Args:
+            mix (dict): Weight per operation.
+        """
+        names = list(mix)
+        weights = [mix[name] for name in names]
+        for _ in range(self.info["operations"]):
+            name = self._random.choices(names, weights)[0]
+            if name == "cancel" and not self._created:
+                name = "create"
+            start = time.perf_counter()
+            getattr(self, name)()
+            self.latencies[name].append(time.perf_counter() - start)
+
+
+def _run_process(data_dir, backend, process, threads, info, mix, seed):
+    """
+    Runs the worker threads of one process.
+
+    Args:
+        data_dir (str): The data directory.
+        backend (str): The storage backend name.
+        process (int): The process number.
+        threads (int): The number of worker threads.
+        info (dict): What the workers know about the data set.
+        mix (dict): Weight per operation.
+        seed (int): The random seed.
+
+    Returns:
+        tuple: (latencies in seconds per operation, peak memory in KB).
+    """
+    storages = open_storages(data_dir, backend)
+    previous = (Customer.storage, Hotel.storage, Reservation.storage)
+    Customer.storage = storages["customers"]
+    Hotel.storage = storages["hotels"]
+    Reservation.storage = storages["reservations"]
+    try:
+        workers = [_Worker(process * threads + number, info, seed)
+                   for number in range(threads)]
+        pool = [threading.Thread(target=worker.run, args=(mix,))
+                for worker in workers]
+        for thread in pool:
+            thread.start()
+        for thread in pool:
+            thread.join()
+    finally:
+        Customer.storage, Hotel.storage, Reservation.storage = previous
+    latencies = {}
+    for worker in workers:
+        for name, values in worker.latencies.items():
+            if values:
+                latencies.setdefault(name, []).extend(values)
+    return latencies, _peak_memory_kb()
+
+
+def _file_sizes(data_dir):
+    """
+    Returns the size of every file in the data directory.
+
+    Args:
+        data_dir (str): The data directory.
+
+    Returns:
+        dict: Bytes per file name.
+    """
+    return {name: os.path.getsize(os.path.join(data_dir, name))
+            for name in sorted(os.listdir(data_dir))
+            if os.path.isfile(os.path.join(data_dir, name))}
+
+
+def run_workload(data_dir, customers=1000, hotels=20, reservations=10000,
+                 rooms=100, operations=1000, threads=4, processes=1,
+                 mix=DEFAULT_MIX, backend="json", seed=0):
+    """
+    Generates a data set, runs the workload on it and reports.
+
+    Args:
+        data_dir (str): The directory the data set is written to.
+        customers (int, optional): Customers in the data set.
+        hotels (int, optional): Hotels in the data set.
+        reservations (int, optional): Reservations in the data set.
+        rooms (int, optional): Rooms of every hotel.
+        operations (int, optional): Operations per worker.
+        threads (int, optional): Worker threads per process.
+        processes (int, optional): Worker processes; 1 runs the
+        threads in the calling process.
+        mix (str, optional): The operation mix, see parse_mix().
+        backend (str, optional): A storage backend name.
+        seed (int, optional): The random seed.
+
+    Returns:
+        dict: The report.
+    """
+    weights = parse_mix(mix)
+    dataset = generate(customers, hotels, reservations, rooms, seed)
+    start = time.perf_counter()
+    populate(data_dir, dataset, backend)
+    populate_seconds = time.perf_counter() - start
+
+    sample = random.Random(seed).sample(
+        dataset["reservations"], min(SAMPLE_SIZE, reservations))
+    info = {"operations": operations, "rooms": rooms,
+            "hotels": [record["name"] for record in dataset["hotels"]],
+            "customers": [record["name"] for record in random.Random(
+                seed).sample(dataset["customers"],
+                             min(SAMPLE_SIZE, customers))],
+            "reservation_keys": [[record[field]
+                                  for field in RESERVATION_KEY]
+                                 for record in sample],
+            "first_free_day": (reservations // max(hotels * rooms, 1) + 1)
+            * SLOT_NIGHTS}
+    if not info["reservation_keys"]:
+        weights.pop("lookup", None)
+    del dataset
+
+    start = time.perf_counter()
+    if processes == 1:
+        results = [_run_process(data_dir, backend, 0, threads, info,
+                                weights, seed)]
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            results = list(executor.map(
+                _run_process, [data_dir] * processes, [backend] * processes,
+                range(processes), [threads] * processes,
+                [info] * processes, [weights] * processes,
+                [seed] * processes))
+    elapsed = time.perf_counter() - start
+
+    latencies = {}
+    for process_latencies, _ in results:
+        for name, values in process_latencies.items():
+            latencies.setdefault(name, []).extend(values)
+    summary = summarize(latencies, elapsed)
+    total = summary.pop("requests")
+    throughput = summary.pop("requests_per_second")
+    memory = [peak for _, peak in results if peak is not None]
+    return {
+        "config": {"customers": customers, "hotels": hotels,
+                   "reservations": reservations, "rooms": rooms,
+                   "operations": operations, "threads": threads,
+                   "processes": processes, "mix": weights,
+                   "backend": backend, "seed": seed},
+        "populate_seconds": round(populate_seconds, 3),
+        "elapsed_seconds": round(elapsed, 3),
+        "operations": total,
+        "operations_per_second": throughput,
+        "latency": summary,
+        "files": _file_sizes(data_dir),
+        "peak_memory_kb": max(memory + [_peak_memory_kb() or 0]) or None}
+
+
+def compare(report, baseline, tolerance=0.2):
+    """
+    Compares a report with a baseline report.
+
+    Args:
+        report (dict): The new report.
+        baseline (dict): The report to compare with.
+        tolerance (float, optional): The p95 latency increase, as a
+        fraction, above which an operation counts as regressed.
+
+    Returns:
+        dict: Ratios (new / baseline) of the throughput and of every
+        latency statistic, and the list of regressed operations.
+    """
+    def ratio(new, old):
+        return round(new / old, 3) if old else None
+
+    latency = {}
+    regressions = []
+    for name, stats in report["latency"].items():
+        old = baseline.get("latency", {}).get(name)
+        if old is None:
+            continue
+        latency[name] = {key: ratio(stats[key], old[key])
+                         for key in ("mean_ms", "p50_ms", "p95_ms",
+                                     "p99_ms")}
+        if latency[name]["p95_ms"] is not None and \
+                latency[name]["p95_ms"] > 1 + tolerance:
+            regressions.append(name)
+    return {"operations_per_second": ratio(
+                report["operations_per_second"],
+                baseline.get("operations_per_second")),
+            "latency": latency, "regressions": regressions}
+
+
+def main(argv=None):
+    """
+    Runs the benchmark and prints the report as JSON.
+
+    Args:
+        argv (list, optional): Command line arguments.
+
+    Returns:
+        int: 1 if an operation regressed against the baseline, else 0.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--customers", type=int, default=1000)
+    parser.add_argument("--hotels", type=int, default=20)
+    parser.add_argument("--reservations", type=int, default=10000)
+    parser.add_argument("--rooms", type=int, default=100)
+    parser.add_argument("--operations", type=int, default=1000,
+                        help="operations per worker thread")
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--processes", type=int, default=1)
+    parser.add_argument("--mix", default=DEFAULT_MIX)
+    parser.add_argument("--backend", default="json",
+                        choices=sorted(BACKENDS))
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--data-dir", default=None,
+                        help="keep the data files here instead of a "
+                             "temporary directory")
+    parser.add_argument("--output", default=None,
+                        help="also write the report to this file")
+    parser.add_argument("--baseline", default=None,
+                        help="report of an earlier run to compare with")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    options = {"customers": args.customers, "hotels": args.hotels,
+               "reservations": args.reservations, "rooms": args.rooms,
+               "operations": args.operations, "threads": args.threads,
+               "processes": args.processes, "mix": args.mix,
+               "backend": args.backend, "seed": args.seed}
+    if args.data_dir is None:
+        with tempfile.TemporaryDirectory() as data_dir:
+            report = run_workload(data_dir, **options)
+    else:
+        os.makedirs(args.data_dir, exist_ok=True)
+        report = run_workload(args.data_dir, **options)
+    if args.baseline is not None:
+        with open(args.baseline, "r", encoding="utf-8") as file:
+            report["baseline"] = compare(report, json.load(file),
+                                         args.tolerance)
+    text = json.dumps(report, indent=2)
+    if args.output is not None:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(text + "\n")
+    print(text)
+    return 1 if report.get("baseline", {}).get("regressions") else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,155 @@
+"""
+workload.py - Synthetic Data Sets for the Benchmark Harness
+
+This module generates customers, hotels and reservations at any scale
+and writes them to a data directory through one of the storage
+backends, so the harness in harness.py can measure the hotel system on
+realistic files without going through the create methods one record at
+a time.
+
+The generated reservations never overlap: hotel and room are assigned
+round-robin and every room gets consecutive three-night slots, so the
+data set can be loaded into the availability index as is.
+
+Functions:
+    - generate(customers, hotels, reservations, rooms, seed): Returns a
+    data set.
+    - open_storages(data_dir, backend): Returns the customer, hotel and
+    reservation backends for a data directory.
+    - populate(data_dir, dataset, backend): Writes a data set.
+
+Author: Alejandra Mendoza Flores
+Date: October 19, 2026
+"""
+import os
+import random
+
+from datetime import date, timedelta
+
+from src.storage.journal import JournalStorage
+from src.storage.records import RecordFileStorage
+from src.storage.sqlite_storage import SqliteDatabase
+from src.storage.storage import JsonFileStorage
+from src.storage.wal import WalStorage
+
+START_DATE = date(2030, 1, 1)
+SLOT_NIGHTS = 3
+KEY_FIELDS = {"customers": ("name",), "hotels": ("name",),
+              "reservations": ("customer_name", "hotel_name",
+                               "room_number", "check_in_date")}
+
+
+def _file_backend(factory, extension=".json"):
+    """
+    Returns a backend opener storing each kind in its own file.
+
+    Args:
+        factory (callable): Builds a backend from (path, key fields).
+        extension (str, optional): The data file extension.
+
+    Returns:
+        callable: Takes (data_dir) and returns the backends by kind.
+    """
+    def opener(data_dir):
+        return {kind: factory(os.path.join(data_dir, kind + extension),
+                              key_fields)
+                for kind, key_fields in KEY_FIELDS.items()}
+    return opener
+
+
+def _sqlite_backend(data_dir):
+    """
+    Returns the SQLite backends of a data directory.
+
+    Args:
+        data_dir (str): The data directory.
+
+    Returns:
+        dict: The backends by kind.
+    """
+    database = SqliteDatabase(os.path.join(data_dir, "hotel.db"))
+    return {kind: database.storage(kind) for kind in KEY_FIELDS}
+
+
+BACKENDS = {
+    "json": _file_backend(lambda path, _: JsonFileStorage(path)),
+    "journal": _file_backend(lambda path, _: JournalStorage(path)),
+    "wal": _file_backend(lambda path, _: WalStorage(path)),
+    "records": _file_backend(RecordFileStorage, ".rec"),
+    "sqlite": _sqlite_backend,
+}
+
+
+def generate(customers=1000, hotels=20, reservations=10000, rooms=100,
+             seed=0):
+    """
+    Generates a synthetic data set.
+
+    Args:
+        customers (int, optional): The number of customers.
+        hotels (int, optional): The number of hotels.
+        reservations (int, optional): The number of reservations.
+        rooms (int, optional): The rooms of every hotel.
+        seed (int, optional): The random seed.
+
+    Returns:
+        dict: "customers", "hotels" and "reservations" record lists.
+    """
+    generator = random.Random(seed)
+    customer_records = [{"name": f"Customer {number}",
+                         "email": f"customer{number}@example.com",
+                         "phone": f"555-{number:07d}"}
+                        for number in range(customers)]
+    hotel_records = [{"name": f"Hotel {number}",
+                      "location": f"City {number % 50}", "rooms": rooms}
+                     for number in range(hotels)]
+    reservation_records = []
+    for number in range(reservations):
+        room = number // hotels
+        check_in = START_DATE + timedelta(
+            days=room // rooms * SLOT_NIGHTS)
+        nights = generator.randint(1, SLOT_NIGHTS)
+        reservation_records.append({
+            "customer_name": customer_records[
+                generator.randrange(customers)]["name"],
+            "hotel_name": hotel_records[number % hotels]["name"],
+            "room_number": room % rooms + 1,
+            "check_in_date": check_in.isoformat(),
+            "check_out_date": (check_in +
+                               timedelta(days=nights)).isoformat()})
+    return {"customers": customer_records, "hotels": hotel_records,
+            "reservations": reservation_records}
+
+
+def open_storages(data_dir, backend="json"):
+    """
+    Returns the storage backends of a data directory.
+
+    Args:
+        data_dir (str): The data directory.
+        backend (str, optional): A name from BACKENDS.
+
+    Returns:
+        dict: The "customers", "hotels" and "reservations" backends.
+
+    Raises:
+        ValueError: If the backend name is unknown.
+    """
+    try:
+        opener = BACKENDS[backend]
+    except KeyError:
+        raise ValueError(f"Unknown backend: {backend}") from None
+    return opener(data_dir)
+
+
+def populate(data_dir, dataset, backend="json"):
+    """
+    Writes a data set to a data directory, replacing its records.
+
+    Args:
+        data_dir (str): The data directory.
+        dataset (dict): The records by kind, as returned by generate().
+        backend (str, optional): A name from BACKENDS.
+    """
+    for kind, storage in open_storages(data_dir, backend).items():
+        storage.save(dataset[kind])
@@ -7,6 +7,10 @@ Customer Management System.
 It provides methods for creating, deleting,
 displaying information, and modifying customer details.
 Customer data is stored in a JSON file ('customers.json').
+The storage backend can be replaced through the Customer.storage
+class attribute (see src/storage).
+Calls to the public methods are counted and timed in the metrics
+registry (see src/metrics).
 
 Classes:
     - Customer: Represents a customer and provides methods
@@ -17,11 +21,19 @@ Methods:
     and saves it to 'customers.json'.
     - delete_customer(name): Deletes a customer from 'customers.json'
     based on the given name.
+    - create_customers(customers), delete_customers_many(names_or_predicate):
+    Bulk variants that apply the whole batch with one write.
     - display_customer_info(name): Displays information about a customer.
     - modify_customer_info(name, email=None, phone=None):
     Modifies customer information.
     - load_customers_data(): Loads customer data
     from 'customers.json'.
+    - check_storage(): Checks that the customer storage exists.
+    - keys(): Returns the cached customer names.
+    - acreate_customer, acreate_customers, adelete_customer,
+    adelete_customers_many, adisplay_customer_info,
+    amodify_customer_info, aload_customers_data: asyncio counterparts
+    that run the methods above on worker threads (see src/aio).
 
 Usage:
     - To use this module, create an instance of the Customer class
@@ -39,9 +51,14 @@ Example:
 Author: Alejandra Mendoza Flores
 Date: February 13, 2024
 """
-import os
-import json
 import logging
+import threading
+
+from src.aio.offload import run_blocking, run_serialized
+from src.metrics.metrics import timed
+from src.reservation.integrity import KeyIndex, guarded_remove
+from src.storage.storage import (JsonFileStorage, data_path,
+                                 normalize_records, write_lock)
 
 
 class Customer:
@@ -52,14 +69,36 @@ class Customer:
         name (str): The name of the customer.
         email (str): The email of the customer.
         phone (str): The phone number of the customer.
+        storage (JsonFileStorage): Class-wide backend where customer
+        records are persisted. Defaults to 'customers.json' in the
+        HOTEL_DATA_DIR directory (see data_path in src/storage).
+        delete_guards (list): Functions called with the names about to
+        be deleted, returning the names that must be kept (see
+        Reservation.set_integrity).
     """
 
+    __slots__ = ("name", "email", "phone")
+    storage = JsonFileStorage(data_path("customers.json"))
+    delete_guards = []
+    _keys = None
+    _lock = threading.Lock()
+
     def __init__(self, name, email, phone):
         self.name = name
         self.email = email
         self.phone = phone
 
+    def to_dict(self):
+        """
+        Returns the customer in its customers.json form.
+
+        Returns:
+            dict: The customer record.
+        """
+        return {"name": self.name, "email": self.email, "phone": self.phone}
+
     @staticmethod
+    @timed
     def create_customer(name, email, phone):
         """
         Creates a new customer and saves it to the customers.json file.
@@ -73,19 +112,76 @@ class Customer:
             Customer: The newly created customer.
         """
         new_customer = Customer(name, email, phone)
-        customers_data = []
-        if os.path.exists("customers.json"):
-            with open("customers.json", "r", encoding="utf-8") as file:
-                customers_data = json.load(file)
-        customers_data.append({
-            "name": new_customer.name, "email": new_customer.email,
-            "phone": new_customer.phone})
-        with open("customers.json", "w", encoding="utf-8") as file:
-            json.dump(customers_data, file)
+        record = new_customer.to_dict()
+        with write_lock(Customer.storage):
+            keys = Customer.keys()
+            keys.begin_write()
+            Customer.storage.add(record)
+            keys.end_write(added=[record])
 
         return new_customer
 
     @staticmethod
+    @timed
+    def create_customers(customers):
+        """
+        Creates many customers with a single write to customers.json.
+
+        Args:
+            customers (iterable): (name, email, phone) tuples or
+            dictionaries with those keys.
+
+        Returns:
+            list: The created Customer for each entry, or None for
+            entries that are missing fields.
+        """
+        records = normalize_records(customers, ("name", "email", "phone"))
+        with write_lock(Customer.storage):
+            keys = Customer.keys()
+            keys.begin_write()
+            Customer.storage.apply_many([{"op": "add", "record": record}
+                                         for record in records if record])
+            keys.end_write(added=[record for record in records if record])
+        for position, record in enumerate(records):
+            if record is None:
+                logging.warning("Invalid customer at position %s.",
+                                position)
+        return [Customer(**record) if record else None
+                for record in records]
+
+    @staticmethod
+    @timed
+    def delete_customers_many(names_or_predicate):
+        """
+        Deletes many customers with a single write to customers.json.
+
+        Args:
+            names_or_predicate (iterable or callable): The names of the
+            customers to delete, or a function taking a customer record
+            and returning True for the customers to delete.
+
+        Returns:
+            list: (name, number of customers deleted) pairs. Customers
+            kept by a delete guard count as 0.
+        """
+        Customer.check_storage()
+        with write_lock(Customer.storage):
+            keys = Customer.keys()
+            keys.begin_write()
+            outcomes, kept = guarded_remove(Customer.delete_guards,
+                                            Customer.storage,
+                                            names_or_predicate)
+            keys.end_write(removed=[name for name, count in outcomes
+                                    if count])
+        for name in kept:
+            logging.warning("Customer %s not deleted: it has "
+                            "reservations.", name)
+        logging.info("%s customers deleted.",
+                     sum(count for _, count in outcomes))
+        return outcomes
+
+    @staticmethod
+    @timed
     def delete_customer(name):
         """
         Deletes a customer from the customers.json file.
@@ -96,18 +192,24 @@ class Customer:
         Returns:
             None
         """
-        customers_data = Customer.load_customers_data()
-        filtered_customers = [
-            customer for customer in customers_data if customer["name"] != name
-            ]
-        if len(filtered_customers) < len(customers_data):
-            with open("customers.json", "w", encoding="utf-8") as file:
-                json.dump(filtered_customers, file)
+        Customer.check_storage()
+        with write_lock(Customer.storage):
+            keys = Customer.keys()
+            keys.begin_write()
+            outcomes, kept = guarded_remove(Customer.delete_guards,
+                                            Customer.storage, [name])
+            deleted = outcomes[0][1]
+            keys.end_write(removed=[name] if deleted else ())
+        if kept:
+            logging.warning("Customer %s not deleted: it has "
+                            "reservations.", name)
+        elif deleted:
             logging.info("Customer %s deleted successfully.", name)
         else:
             logging.info("Customer %s not found.", name)
 
     @staticmethod
+    @timed
     def display_customer_info(name):
         """
         Displays the information of a customer.
@@ -118,11 +220,8 @@ class Customer:
         Returns:
             None
         """
-        customers_data = Customer.load_customers_data()
-        customer = next(
-            (customer for customer in customers_data
-             if customer["name"] == name),
-            None)
+        Customer.check_storage()
+        customer = next(iter(Customer.storage.find({"name": name})), None)
         if customer:
             logging.info("Customer Name: %s", customer['name'])
             logging.info("Email: %s", customer['email'])
@@ -131,6 +230,7 @@ class Customer:
             logging.info("Customer %s not found.", name)
 
     @staticmethod
+    @timed
     def modify_customer_info(name, email=None, phone=None):
         """
         Modifies the information of a customer.
@@ -148,23 +248,19 @@ class Customer:
         Raises:
             None
         """
-        customers_data = Customer.load_customers_data()
-        customer = next(
-            (customer for customer in customers_data
-             if customer["name"] == name),
-            None)
-        if customer:
-            if email:
-                customer["email"] = email
-            if phone:
-                customer["phone"] = phone
-            with open("customers.json", "w", encoding="utf-8") as file:
-                json.dump(customers_data, file)
+        Customer.check_storage()
+        changes = {}
+        if email:
+            changes["email"] = email
+        if phone:
+            changes["phone"] = phone
+        if Customer.storage.update({"name": name}, changes):
             print(f"Customer {name} information modified successfully.")
         else:
             print(f"Customer {name} not found.")
 
     @staticmethod
+    @timed
     def load_customers_data():
         """
         Load customer data from a JSON file.
@@ -175,7 +271,97 @@ class Customer:
         Raises:
             FileNotFoundError: If the customers.json file does not exist.
         """
-        if os.path.exists("customers.json"):
-            with open("customers.json", "r", encoding="utf-8") as file:
-                return json.load(file)
-        raise FileNotFoundError("The customers.json file does not exist.")
+        Customer.check_storage()
+        return Customer.storage.load()
+
+    @staticmethod
+    def keys():
+        """
+        Returns the index of customer names of the current storage
+        backend, used to check reservations (see src/reservation).
+
+        Returns:
+            KeyIndex: The index.
+        """
+        with Customer._lock:
+            Customer._keys = KeyIndex.bind(Customer._keys, Customer.storage)
+            return Customer._keys
+
+    @staticmethod
+    def check_storage():
+        """
+        Checks that the customer storage has been created.
+
+        Raises:
+            FileNotFoundError: If the customers.json file does not exist.
+        """
+        if not Customer.storage.exists():
+            raise FileNotFoundError("The customers.json file does not exist.")
+
+    @staticmethod
+    async def acreate_customer(name, email, phone):
+        """
+        Async counterpart of create_customer, run off the event loop.
+
+        Returns:
+            Customer: The newly created customer.
+        """
+        return await run_serialized(Customer.create_customer,
+                                    name, email, phone)
+
+    @staticmethod
+    async def acreate_customers(customers):
+        """
+        Async counterpart of create_customers, run off the event loop.
+
+        Returns:
+            list: The created Customer (or None) for each entry.
+        """
+        return await run_serialized(Customer.create_customers,
+                                    list(customers))
+
+    @staticmethod
+    async def adelete_customer(name):
+        """
+        Async counterpart of delete_customer, run off the event loop.
+        """
+        await run_serialized(Customer.delete_customer, name)
+
+    @staticmethod
+    async def adelete_customers_many(names_or_predicate):
+        """
+        Async counterpart of delete_customers_many, run off the event
+        loop.
+
+        Returns:
+            list: (name, number of customers deleted) pairs.
+        """
+        return await run_serialized(Customer.delete_customers_many,
+                                    names_or_predicate)
+
+    @staticmethod
+    async def adisplay_customer_info(name):
+        """
+        Async counterpart of display_customer_info, run off the event
+        loop.
+        """
+        await run_blocking(Customer.display_customer_info, name)
+
+    @staticmethod
+    async def amodify_customer_info(name, email=None, phone=None):
+        """
+        Async counterpart of modify_customer_info, run off the event
+        loop.
+        """
+        await run_serialized(Customer.modify_customer_info, name,
+                             email=email, phone=phone)
+
+    @staticmethod
+    async def aload_customers_data():
+        """
+        Async counterpart of load_customers_data, run off the event loop.
+
+        Returns:
+            list: A list of customer data.
+        """
+        return await run_blocking(Customer.load_customers_data)
@@ -0,0 +1,292 @@
+"""
+repository.py - In-Memory Customer Repository
+
+This module defines the CustomerRepository class, which serves customer
+lookups from memory instead of parsing customers.json on every call.
+
+The repository loads the customer records once and keeps dictionary
+indexes by name, email and phone. Writes go through to the underlying
+storage backend (Customer.storage by default) and update the indexes in
+place. Before every operation the repository compares the storage
+signature with the one it loaded; if the file was changed by someone
+else, the indexes are rebuilt from storage. Writes hold the storage's
+write lock from that check to the write, so a write made elsewhere in
+between cannot be mistaken for our own.
+
+Classes:
+    - CustomerRepository: Indexed customer lookups with write-through.
+
+Example:
+    repository = CustomerRepository()
+    repository.create("Jane Smith", "jane@example.com", "987-654-3210")
+    repository.get("Jane Smith")
+    repository.find_by_email("jane@example.com")
+
+Author: Alejandra Mendoza Flores
+Date: October 19, 2026
+"""
+import logging
+
+from src.customer.customer import Customer
+from src.reservation.integrity import guarded_remove
+from src.storage.storage import write_lock
+
+
+class CustomerRepository:
+    """
+    Keeps customer records in memory with hash indexes.
+
+    Attributes:
+        storage (JsonFileStorage): The backend the repository reads and
+        writes. Defaults to Customer.storage.
+        unique_fields (tuple): Fields that must not be shared by two
+        customers when creating or modifying through the repository.
+    """
+
+    def __init__(self, storage=None, unique_fields=("email", "phone")):
+        self.storage = storage or Customer.storage
+        self.unique_fields = unique_fields
+        self._by_name = {}
+        self._by_field = {"email": {}, "phone": {}}
+        self._signature = None
+        self._loaded = False
+
+    def invalidate(self):
+        """
+        Drops the in-memory indexes so the next call reloads storage.
+        """
+        self._loaded = False
+
+    def _index(self, record):
+        """
+        Adds one record to the indexes.
+
+        Args:
+            record (dict): The customer record.
+        """
+        self._by_name.setdefault(record["name"], []).append(record)
+        self._index_fields(record)
+
+    def _index_fields(self, record):
+        """
+        Adds one record's email and phone to the indexes.
+
+        Args:
+            record (dict): The customer record.
+        """
+        for field, index in self._by_field.items():
+            if record.get(field):
+                index.setdefault(record[field], record["name"])
+
+    def _unindex(self, record):
+        """
+        Removes one record's email and phone from the indexes.
+
+        Args:
+            record (dict): The customer record.
+        """
+        for field, index in self._by_field.items():
+            if index.get(record.get(field)) == record["name"]:
+                del index[record[field]]
+
+    def refresh(self):
+        """
+        Reloads the indexes if the storage changed since the last load.
+        """
+        signature = self.storage.signature()
+        if self._loaded and signature == self._signature:
+            return
+        self._by_name = {}
+        self._by_field = {"email": {}, "phone": {}}
+        for record in self.storage.load():
+            self._index(record)
+        self._signature = signature
+        self._loaded = True
+
+    def _written(self):
+        """
+        Records the storage signature after one of our own writes.
+        """
+        self._signature = self.storage.signature()
+
+    def __len__(self):
+        self.refresh()
+        return sum(len(records) for records in self._by_name.values())
+
+    def __contains__(self, name):
+        self.refresh()
+        return name in self._by_name
+
+    def get(self, name):
+        """
+        Returns the first customer record with the given name.
+
+        Args:
+            name (str): The name of the customer.
+
+        Returns:
+            dict: A copy of the record, or None if it does not exist.
+        """
+        self.refresh()
+        records = self._by_name.get(name)
+        return dict(records[0]) if records else None
+
+    def find_by_email(self, email):
+        """
+        Returns the customer record with the given email.
+
+        Args:
+            email (str): The email of the customer.
+
+        Returns:
+            dict: A copy of the record, or None if it does not exist.
+        """
+        self.refresh()
+        name = self._by_field["email"].get(email)
+        return self.get(name) if name is not None else None
+
+    def find_by_phone(self, phone):
+        """
+        Returns the customer record with the given phone number.
+
+        Args:
+            phone (str): The phone number of the customer.
+
+        Returns:
+            dict: A copy of the record, or None if it does not exist.
+        """
+        self.refresh()
+        name = self._by_field["phone"].get(phone)
+        return self.get(name) if name is not None else None
+
+    def _conflict(self, name, values):
+        """
+        Returns the first unique field already used by another customer.
+
+        Args:
+            name (str): The customer the values belong to.
+            values (dict): The field values to check.
+
+        Returns:
+            str: The conflicting field name, or None.
+        """
+        for field in self.unique_fields:
+            owner = self._by_field[field].get(values.get(field))
+            if values.get(field) and owner is not None and owner != name:
+                return field
+        return None
+
+    def create(self, name, email, phone):
+        """
+        Creates a customer and writes it through to storage.
+
+        Args:
+            name (str): The name of the customer.
+            email (str): The email of the customer.
+            phone (str): The phone number of the customer.
+
+        Returns:
+            Customer: The new customer, or None if the email or phone
+            already belongs to another customer.
+        """
+        with write_lock(self.storage):
+            self.refresh()
+            record = {"name": name, "email": email, "phone": phone}
+            field = self._conflict(name, record)
+            if field:
+                logging.warning("Customer %s not created: %s already in "
+                                "use.", name, field)
+                return None
+            self.storage.add(record)
+            self._index(record)
+            self._written()
+        return Customer(name, email, phone)
+
+    def modify(self, name, email=None, phone=None):
+        """
+        Modifies a customer and writes the change through to storage.
+
+        Args:
+            name (str): The name of the customer to modify.
+            email (str, optional): The new email. Defaults to None.
+            phone (str, optional): The new phone number. Defaults to None.
+
+        Returns:
+            bool: True if the customer was modified.
+        """
+        with write_lock(self.storage):
+            self.refresh()
+            records = self._by_name.get(name)
+            if not records:
+                logging.info("Customer %s not found.", name)
+                return False
+            changes = {field: value for field, value
+                       in (("email", email), ("phone", phone)) if value}
+            field = self._conflict(name, changes)
+            if field:
+                logging.warning("Customer %s not modified: %s already in "
+                                "use.", name, field)
+                return False
+            self.storage.update({"name": name}, changes)
+            self._unindex(records[0])
+            records[0].update(changes)
+            for other in records:
+                self._index_fields(other)
+            self._written()
+        return True
+
+    def delete(self, name):
+        """
+        Deletes every customer with the given name, unless one of
+        Customer.delete_guards keeps it.
+
+        Args:
+            name (str): The name of the customer to delete.
+
+        Returns:
+            bool: True if a customer was deleted.
+        """
+        with write_lock(self.storage):
+            self.refresh()
+            if name not in self._by_name:
+                logging.info("Customer %s not found.", name)
+                return False
+            keys = Customer.keys()
+            if keys.storage is not self.storage:
+                keys = None
+            if keys is not None:
+                keys.begin_write()
+            outcomes, kept = guarded_remove(Customer.delete_guards,
+                                            self.storage, [name])
+            deleted = outcomes[0][1]
+            if keys is not None:
+                keys.end_write(removed=[name] if deleted else ())
+            if deleted:
+                for record in self._by_name.pop(name):
+                    self._unindex(record)
+                self._written()
+        if kept:
+            logging.warning("Customer %s not deleted: it has "
+                            "reservations.", name)
+            return False
+        if not deleted:
+            logging.info("Customer %s not found.", name)
+            return False
+        logging.info("Customer %s deleted successfully.", name)
+        return True
+
+    def display(self, name):
+        """
+        Logs the information of a customer, like
+        Customer.display_customer_info, without reading storage.
+
+        Args:
+            name (str): The name of the customer to display.
+        """
+        customer = self.get(name)
+        if customer:
+            logging.info("Customer Name: %s", customer['name'])
+            logging.info("Email: %s", customer['email'])
+            logging.info("Phone: %s", customer['phone'])
+        else:
+            logging.info("Customer %s not found.", name)
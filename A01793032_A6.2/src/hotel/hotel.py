@@ -14,6 +14,12 @@ Methods:
       saves it to a JSON file, and returns the created hotel.
     - delete_hotel(name): Deletes a hotel from the hotels.json file based
     on the given name.
+    - create_hotels(hotels), delete_hotels_many(names_or_predicate):
+    Bulk variants that apply the whole batch with one write.
+    - keys(): Returns the cached hotel names and room counts.
+    - acreate_hotel, acreate_hotels, adelete_hotel, adelete_hotels_many:
+    asyncio counterparts that run the methods above on a worker thread
+    (see src/aio).
     - display_info(): Displays information about the hotel, including
     its name, location, number of rooms, and reservations.
     - modify_info(name=None, location=None, rooms=None):
@@ -21,6 +27,13 @@ Methods:
     - reserve_room(reservation):
     Reserves a room and adds the reservation to the list.
     - cancel_reservation(reservation): Cancels an existing reservation.
+    - load_inventory(reservations_storage): Loads the room inventory of
+    the hotel's stored reservations.
+
+Hotel records are persisted through the Hotel.storage class attribute
+(see src/storage), which defaults to 'hotels.json'.
+Calls to the public methods are counted and timed in the metrics
+registry (see src/metrics).
 
 Usage:
     - To use this module, create an instance of the
@@ -32,9 +45,16 @@ Example:
     hotel_instance.display_info()
 
 """
-import os
-import json
 import logging
+import threading
+
+from src.aio.offload import run_serialized
+from src.hotel.inventory import RoomInventory, load_inventories, sidecar_path
+from src.metrics.metrics import timed
+from src.reservation.index import ReservationSet, reservation_key
+from src.reservation.integrity import KeyIndex, guarded_remove
+from src.storage.storage import (JsonFileStorage, data_path,
+                                 normalize_records, write_lock)
 
 
 class Hotel:
@@ -45,7 +65,17 @@ class Hotel:
     - name (str): The name of the hotel.
     - location (str): The location of the hotel.
     - rooms (int): The number of rooms in the hotel.
-    - reservations (list): A list of reservations made for the hotel.
+    - reservations (ReservationSet): The reservations made for the hotel,
+    indexed by (customer_name, hotel_name, room_number, check_in_date)
+    and by customer.
+    - inventory (RoomInventory): Nightly occupancy bitmaps of the rooms,
+    kept in sync by reserve_room and cancel_reservation.
+    - storage (JsonFileStorage): Class-wide backend where hotel records
+    are persisted. Defaults to 'hotels.json' in the HOTEL_DATA_DIR
+    directory (see data_path in src/storage).
+    - delete_guards (list): Functions called with the names about to be
+    deleted, returning the names that must be kept (see
+    Reservation.set_integrity).
 
     Methods:
     - create_hotel(name, location, rooms):
@@ -59,17 +89,37 @@ class Hotel:
     - reserve_room(reservation):
     Reserves a room and adds it to the list of reservations.
     - cancel_reservation(reservation): Cancels an existing reservation.
+    - load_inventory(reservations_storage): Loads the room inventory of
+    the hotel's stored reservations.
 
     Author: Alejandra Mendoza Flores
     Date: February 13, 2024
     """
+    __slots__ = ("name", "location", "rooms", "reservations", "inventory")
+    storage = JsonFileStorage(data_path("hotels.json"))
+    delete_guards = []
+    _keys = None
+    _lock = threading.Lock()
+
     def __init__(self, name, location, rooms):
         self.name = name
         self.location = location
         self.rooms = rooms
-        self.reservations = []
+        self.reservations = ReservationSet()
+        self.inventory = RoomInventory(rooms)
+
+    def to_dict(self):
+        """
+        Returns the hotel in its hotels.json form.
+
+        Returns:
+            dict: The hotel record.
+        """
+        return {"name": self.name, "location": self.location,
+                "rooms": self.rooms}
 
     @staticmethod
+    @timed
     def create_hotel(name, location, rooms):
         """
         Creates a new hotel object and saves it to a JSON file.
@@ -83,22 +133,76 @@ class Hotel:
         Hotel: The newly created hotel object.
         """
         new_hotel = Hotel(name, location, rooms)
-        hotels_data = []
+        record = new_hotel.to_dict()
+        with write_lock(Hotel.storage):
+            keys = Hotel.keys()
+            keys.begin_write()
+            Hotel.storage.add(record)
+            keys.end_write(added=[record])
 
-        if os.path.exists("hotels.json"):
-            with open("hotels.json", "r", encoding="utf-8") as file:
-                hotels_data = json.load(file)
+        return new_hotel
 
-        hotels_data.append({"name": new_hotel.name,
-                            "location": new_hotel.location,
-                            "rooms": new_hotel.rooms})
+    @staticmethod
+    @timed
+    def create_hotels(hotels):
+        """
+        Creates many hotels with a single write to hotels.json.
 
-        with open("hotels.json", "w", encoding="utf-8") as file:
-            json.dump(hotels_data, file)
+        Args:
+            hotels (iterable): (name, location, rooms) tuples or
+            dictionaries with those keys.
 
-        return new_hotel
+        Returns:
+            list: The created Hotel for each entry, or None for entries
+            that are missing fields.
+        """
+        records = normalize_records(hotels, ("name", "location", "rooms"))
+        with write_lock(Hotel.storage):
+            keys = Hotel.keys()
+            keys.begin_write()
+            Hotel.storage.apply_many([{"op": "add", "record": record}
+                                      for record in records if record])
+            keys.end_write(added=[record for record in records if record])
+        for position, record in enumerate(records):
+            if record is None:
+                logging.warning("Invalid hotel at position %s.", position)
+        return [Hotel(**record) if record else None for record in records]
+
+    @staticmethod
+    @timed
+    def delete_hotels_many(names_or_predicate):
+        """
+        Deletes many hotels with a single write to hotels.json.
+
+        Args:
+            names_or_predicate (iterable or callable): The names of the
+            hotels to delete, or a function taking a hotel record and
+            returning True for the hotels to delete.
+
+        Returns:
+            list: (name, number of hotels deleted) pairs. Hotels kept by
+            a delete guard count as 0.
+        """
+        if not Hotel.storage.exists():
+            logging.info("No hotels found.")
+            return []
+        with write_lock(Hotel.storage):
+            keys = Hotel.keys()
+            keys.begin_write()
+            outcomes, kept = guarded_remove(Hotel.delete_guards,
+                                            Hotel.storage,
+                                            names_or_predicate)
+            keys.end_write(removed=[name for name, count in outcomes
+                                    if count])
+        for name in kept:
+            logging.warning("Hotel %s not deleted: it has reservations.",
+                            name)
+        logging.info("%s hotels deleted.",
+                     sum(count for _, count in outcomes))
+        return outcomes
 
     @staticmethod
+    @timed
     def delete_hotel(name):
         """
         Deletes a hotel from the hotels.json file based on the given name.
@@ -107,25 +211,85 @@ class Hotel:
             name (str): The name of the hotel to be deleted.
 
         Returns:
-            None
-        """
-        if os.path.exists("hotels.json"):
-            with open("hotels.json", "r", encoding="utf-8") as file:
-                hotels_data = json.load(file)
-
-            filtered_hotels = [
-                hotel for hotel in hotels_data if hotel["name"] != name
-                ]
-
-            if len(filtered_hotels) < len(hotels_data):
-                with open("hotels.json", "w", encoding="utf-8") as file:
-                    json.dump(filtered_hotels, file)
-                logging.info("Hotel %s deleted successfully.", name)
-            else:
-                logging.info("Hotel %s not found for deletion.", name)
-        else:
+            bool: True if the hotel was deleted, False if it was not
+            found or a delete guard kept it.
+        """
+        if not Hotel.storage.exists():
             logging.info("No hotels found.")
+            return False
+        with write_lock(Hotel.storage):
+            keys = Hotel.keys()
+            keys.begin_write()
+            outcomes, kept = guarded_remove(Hotel.delete_guards,
+                                            Hotel.storage, [name])
+            deleted = outcomes[0][1]
+            keys.end_write(removed=[name] if deleted else ())
+        if kept:
+            logging.warning("Hotel %s not deleted: it has reservations.",
+                            name)
+        elif deleted:
+            logging.info("Hotel %s deleted successfully.", name)
+        else:
+            logging.info("Hotel %s not found for deletion.", name)
+        return bool(deleted)
+
+    @staticmethod
+    def keys():
+        """
+        Returns the index of hotel names and room counts of the current
+        storage backend, used to check reservations (see
+        src/reservation).
 
+        Returns:
+            KeyIndex: The index.
+        """
+        with Hotel._lock:
+            Hotel._keys = KeyIndex.bind(Hotel._keys, Hotel.storage, "rooms")
+            return Hotel._keys
+
+    @staticmethod
+    async def acreate_hotel(name, location, rooms):
+        """
+        Async counterpart of create_hotel, run off the event loop.
+
+        Returns:
+            Hotel: The newly created hotel object.
+        """
+        return await run_serialized(Hotel.create_hotel, name, location,
+                                    rooms)
+
+    @staticmethod
+    async def acreate_hotels(hotels):
+        """
+        Async counterpart of create_hotels, run off the event loop.
+
+        Returns:
+            list: The created Hotel (or None) for each entry.
+        """
+        return await run_serialized(Hotel.create_hotels, list(hotels))
+
+    @staticmethod
+    async def adelete_hotel(name):
+        """
+        Async counterpart of delete_hotel, run off the event loop.
+
+        Returns:
+            bool: True if the hotel was deleted.
+        """
+        return await run_serialized(Hotel.delete_hotel, name)
+
+    @staticmethod
+    async def adelete_hotels_many(names_or_predicate):
+        """
+        Async counterpart of delete_hotels_many, run off the event loop.
+
+        Returns:
+            list: (name, number of hotels deleted) pairs.
+        """
+        return await run_serialized(Hotel.delete_hotels_many,
+                                    names_or_predicate)
+
+    @timed
     def display_info(self):
         """
         Displays information about the hotel, including its name, location,
@@ -138,6 +302,7 @@ class Hotel:
         for reservation in self.reservations:
             logging.info(reservation)
 
+    @timed
     def modify_info(self, name=None, location=None, rooms=None):
         """
         Modifies the information of the hotel.
@@ -155,19 +320,41 @@ class Hotel:
             self.location = location
         if rooms:
             self.rooms = rooms
+            self.inventory.rooms = rooms
 
+    @timed
     def reserve_room(self, reservation):
         """
         Reserva una habitación y la agrega a la lista de reservaciones.
 
+        La reserva se rechaza si la habitación ya está ocupada alguna
+        noche de la estancia.
+
+        La reserva también se rechaza si sus fechas no son válidas.
+
         Args:
             reservation (objeto): La reserva de habitación a agregar.
 
         Returns:
-            None
+            bool: True si la habitación quedó reservada.
         """
-        self.reservations.append(reservation)
+        if self.reservations.get(*reservation_key(reservation)):
+            print("Room not available.")
+            return False
+        try:
+            reserved = self.inventory.reserve(reservation.room_number,
+                                              reservation.check_in_date,
+                                              reservation.check_out_date)
+        except ValueError:
+            print("Invalid reservation dates.")
+            return False
+        if reserved:
+            self.reservations.add(reservation)
+        else:
+            print("Room not available.")
+        return reserved
 
+    @timed
     def cancel_reservation(self, reservation):
         """
         Cancela una reserva existente.
@@ -180,5 +367,33 @@ class Hotel:
         """
         if reservation in self.reservations:
             self.reservations.remove(reservation)
+            try:
+                self.inventory.cancel(reservation.room_number,
+                                      reservation.check_in_date,
+                                      reservation.check_out_date)
+            except ValueError:
+                pass
         else:
             print("Reservation not found.")
+
+    @timed
+    def load_inventory(self, reservations_storage):
+        """
+        Replaces the inventory of the hotel with the bitmaps of its
+        stored reservations, read from the sidecar kept next to the
+        reservations (see src/hotel/inventory.py) or rebuilt and saved
+        there if the reservations or hotels changed.
+
+        Args:
+            reservations_storage (JsonFileStorage): The reservations
+            backend, usually Reservation.storage.
+
+        Returns:
+            RoomInventory: The loaded inventory.
+        """
+        inventories = load_inventories(reservations_storage, Hotel.storage,
+                                       sidecar_path(reservations_storage))
+        self.inventory = inventories.get(self.name,
+                                         RoomInventory(self.rooms))
+        self.inventory.rooms = self.rooms
+        return self.inventory
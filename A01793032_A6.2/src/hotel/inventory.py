@@ -0,0 +1,317 @@
+"""
+inventory.py - Per-Day Room Inventory Bitmaps
+
+This module keeps, for every hotel, one bitmap per night with a bit set
+for each occupied room. Python integers are used as bitsets, so:
+
+    - Checking one room on one night is a single bit test.
+    - Counting free rooms on a night is a population count against the
+    hotel's number of rooms.
+    - Checking a stay ORs the nightly bitmaps together (the rooms free
+    for the whole stay are the complement, i.e. the AND of the free
+    bitmaps).
+
+Room numbers are mapped to bit positions in the order they are first
+seen, so labels such as 101 or "A-3" work as well as 1..rooms.
+
+The bitmaps of every hotel can be rebuilt from reservations.json and
+are persisted next to it in a sidecar file (reservations.inventory.json
+by default) together with the signatures of the reservations and hotels
+storage they were built from. load_inventories only reuses the sidecar
+while both signatures match, so a change to the room count of a hotel
+rebuilds it too. Hotel.load_inventory uses it to give a Hotel the
+bitmaps of its stored reservations.
+
+Classes:
+    - RoomInventory: Nightly occupancy bitmaps of one hotel.
+
+Functions:
+    - build_inventories(reservations, hotels): Builds the bitmaps of
+    every hotel from records.
+    - save_inventories(path, inventories, signature): Writes the sidecar.
+    - sidecar_path(reservations_storage): The sidecar file of a
+    reservations backend.
+    - load_inventories(reservations_storage, hotels_storage, path):
+    Loads the sidecar or rebuilds it.
+
+Author: Alejandra Mendoza Flores
+Date: October 19, 2026
+"""
+import os
+import json
+
+from src.reservation.availability import stay_interval
+
+DEFAULT_INVENTORY_PATH = "reservations.inventory.json"
+
+
+class RoomInventory:
+    """
+    Nightly occupancy bitmaps of one hotel.
+
+    Attributes:
+        rooms (int): The number of rooms of the hotel, or None if
+        unknown (then only rooms seen in reservations are counted).
+        days (dict): Bitmap of occupied rooms per night ordinal.
+    """
+
+    def __init__(self, rooms=None):
+        self.rooms = rooms
+        self.days = {}
+        self._bits = {}
+        self._labels = []
+
+    def _bit(self, room_number):
+        """
+        Returns the bit mask of a room, assigning one if needed.
+
+        Args:
+            room_number (int or str): The room.
+
+        Returns:
+            int: A mask with only the room's bit set.
+        """
+        position = self._bits.get(room_number)
+        if position is None:
+            position = self._bits[room_number] = len(self._labels)
+            self._labels.append(room_number)
+        return 1 << position
+
+    def occupied(self, check_in_date, check_out_date=None):
+        """
+        Returns the rooms occupied on any night of a stay.
+
+        Args:
+            check_in_date (str): The date of check-in.
+            check_out_date (str, optional): The date of check-out.
+
+        Returns:
+            int: The OR of the nightly bitmaps.
+        """
+        start, end = stay_interval(check_in_date, check_out_date)
+        mask = 0
+        days = self.days
+        for night in range(start, end):
+            mask |= days.get(night, 0)
+        return mask
+
+    def is_free(self, room_number, check_in_date, check_out_date=None):
+        """
+        Tells whether a room is free for a whole stay.
+
+        Args:
+            room_number (int or str): The room.
+            check_in_date (str): The date of check-in.
+            check_out_date (str, optional): The date of check-out.
+
+        Returns:
+            bool: True if the room is free every night of the stay.
+        """
+        position = self._bits.get(room_number)
+        if position is None:
+            return True
+        return not self.occupied(check_in_date, check_out_date) >> \
+            position & 1
+
+    def free_count(self, night_date):
+        """
+        Counts the free rooms on one night.
+
+        Args:
+            night_date (str): The night.
+
+        Returns:
+            int: The number of free rooms.
+        """
+        start, _ = stay_interval(night_date)
+        capacity = len(self._labels) if self.rooms is None else self.rooms
+        return max(capacity - self.days.get(start, 0).bit_count(), 0)
+
+    def free_rooms(self, check_in_date, check_out_date=None, rooms=None):
+        """
+        Lists the rooms free for a whole stay.
+
+        Args:
+            check_in_date (str): The date of check-in.
+            check_out_date (str, optional): The date of check-out.
+            rooms (iterable, optional): The room numbers to consider.
+            Defaults to every room seen in a reservation.
+
+        Returns:
+            list: The free room numbers.
+        """
+        occupied = self.occupied(check_in_date, check_out_date)
+        if rooms is None:
+            rooms = self._labels
+        return [room for room in rooms
+                if room not in self._bits or
+                not occupied >> self._bits[room] & 1]
+
+    def reserve(self, room_number, check_in_date, check_out_date=None):
+        """
+        Marks a room as occupied for a stay if it is free.
+
+        Args:
+            room_number (int or str): The room.
+            check_in_date (str): The date of check-in.
+            check_out_date (str, optional): The date of check-out.
+
+        Returns:
+            bool: True if the room was free and is now reserved.
+        """
+        bit = self._bit(room_number)
+        if self.occupied(check_in_date, check_out_date) & bit:
+            return False
+        start, end = stay_interval(check_in_date, check_out_date)
+        days = self.days
+        for night in range(start, end):
+            days[night] = days.get(night, 0) | bit
+        return True
+
+    def cancel(self, room_number, check_in_date, check_out_date=None):
+        """
+        Marks a room as free for a stay.
+
+        Args:
+            room_number (int or str): The room.
+            check_in_date (str): The date of check-in.
+            check_out_date (str, optional): The date of check-out.
+        """
+        if room_number not in self._bits:
+            return
+        bit = self._bit(room_number)
+        start, end = stay_interval(check_in_date, check_out_date)
+        days = self.days
+        for night in range(start, end):
+            mask = days.get(night, 0) & ~bit
+            if mask:
+                days[night] = mask
+            else:
+                days.pop(night, None)
+
+    def to_dict(self):
+        """
+        Returns the inventory in a JSON friendly form.
+
+        Returns:
+            dict: The rooms count, room labels and hex bitmaps.
+        """
+        return {"rooms": self.rooms, "labels": self._labels,
+                "days": {str(night): format(mask, "x")
+                         for night, mask in self.days.items()}}
+
+    @staticmethod
+    def from_dict(data):
+        """
+        Rebuilds an inventory from to_dict output.
+
+        Args:
+            data (dict): The serialized inventory.
+
+        Returns:
+            RoomInventory: The inventory.
+        """
+        inventory = RoomInventory(data["rooms"])
+        for label in data["labels"]:
+            inventory._bit(label)  # pylint: disable=protected-access
+        inventory.days = {int(night): int(mask, 16)
+                          for night, mask in data["days"].items()}
+        return inventory
+
+
+def build_inventories(reservations, hotels=()):
+    """
+    Builds the bitmaps of every hotel from records.
+
+    Reservations whose dates cannot be parsed are skipped.
+
+    Args:
+        reservations (iterable): Reservation records.
+        hotels (iterable, optional): Hotel records, used for the number
+        of rooms of each hotel.
+
+    Returns:
+        dict: RoomInventory per hotel name.
+    """
+    inventories = {hotel["name"]: RoomInventory(hotel.get("rooms"))
+                   for hotel in hotels}
+    for record in reservations:
+        inventory = inventories.setdefault(record["hotel_name"],
+                                           RoomInventory())
+        try:
+            inventory.reserve(record["room_number"], record["check_in_date"],
+                              record.get("check_out_date"))
+        except ValueError:
+            continue
+    return inventories
+
+
+def save_inventories(path, inventories, signature=None):
+    """
+    Atomically writes the inventories to a sidecar file.
+
+    Args:
+        path (str): The sidecar file path.
+        inventories (dict): RoomInventory per hotel name.
+        signature (dict, optional): The signatures of the reservations
+        and hotels storage the inventories were built from.
+    """
+    data = {"signature": signature,
+            "hotels": {name: inventory.to_dict()
+                       for name, inventory in inventories.items()}}
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as file:
+        json.dump(data, file)
+    os.replace(temp_path, path)
+
+
+def sidecar_path(reservations_storage):
+    """
+    Returns the sidecar file kept next to a reservations backend.
+
+    Args:
+        reservations_storage (JsonFileStorage): The reservations backend.
+
+    Returns:
+        str: "<name>.inventory.json" next to the backend's file, or
+        None if the backend has no file (see MemoryStorage).
+    """
+    path = getattr(reservations_storage, "path", None)
+    if path is None:
+        return None
+    return f"{os.path.splitext(path)[0]}.inventory.json"
+
+
+def load_inventories(reservations_storage, hotels_storage=None,
+                     path=DEFAULT_INVENTORY_PATH):
+    """
+    Loads the inventories from the sidecar, or rebuilds and saves them
+    if the reservations or hotels changed since the sidecar was written.
+
+    Args:
+        reservations_storage (JsonFileStorage): The reservations backend.
+        hotels_storage (JsonFileStorage, optional): The hotels backend.
+        path (str, optional): The sidecar file path, or None to rebuild
+        without a sidecar.
+
+    Returns:
+        dict: RoomInventory per hotel name.
+    """
+    signature = json.loads(json.dumps({
+        "reservations": reservations_storage.signature(),
+        "hotels": hotels_storage.signature() if hotels_storage else None}))
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            data = json.load(file)
+        if signature["reservations"] is not None and \
+                data.get("signature") == signature:
+            return {name: RoomInventory.from_dict(inventory)
+                    for name, inventory in data["hotels"].items()}
+    except (OSError, TypeError, ValueError, KeyError):
+        pass
+
+    hotels = hotels_storage.load() if hotels_storage else ()
+    inventories = build_inventories(reservations_storage.load(), hotels)
+    if path is not None:
+        save_inventories(path, inventories, signature)
+    return inventories
@@ -0,0 +1,437 @@
+"""
+metrics.py - Operation Metrics and Tracing Hooks
+
+This module is the instrumentation surface of the hotel system. The
+Customer, Hotel and Reservation methods and the storage backends
+report to the current registry (SQLite tables report time and records
+but no bytes, since SQLite does its own page I/O):
+
+    - hotel_operations_total{operation, outcome}: Calls per public
+    method, with outcome "ok" or "error".
+    - hotel_operation_seconds{operation}: Latency of those calls.
+    - hotel_storage_seconds{file, phase}: Time spent per storage phase:
+    "load" (reading the file), "parse" (decoding it), "scan" (matching
+    records), "serialize" (encoding into the temporary file) and
+    "write" (fsync and rename).
+    - hotel_storage_read_bytes_total{file} and
+    hotel_storage_written_bytes_total{file}: Bytes read and written.
+    - hotel_storage_scanned_records{file}: Records scanned per call.
+
+The default registry is a NullRegistry, whose methods do nothing, so
+uninstrumented use pays one attribute check per call. Installing a
+Registry with set_registry() starts collecting counters and
+histograms in process; hooks added to it see every observation as it
+happens, which is how traces are taken. The collected values can be
+exported in the Prometheus text format or as JSON.
+
+Classes:
+    - NullRegistry: The do-nothing default registry.
+    - Registry: Counters and histograms kept in process.
+    - PrometheusExporter: Writes a registry in the Prometheus text
+    exposition format.
+    - JsonExporter: Writes a registry as JSON.
+
+Functions:
+    - get_registry(): Returns the current registry.
+    - set_registry(registry): Replaces the current registry.
+    - timed(function): Decorator recording calls and latency.
+
+Example:
+    registry = Registry()
+    set_registry(registry)
+    registry.add_hook(lambda name, labels, value: print(name, value))
+    Customer.create_customer("Ana", "ana@example.com", "555-0101")
+    PrometheusExporter("metrics.prom").export(registry)
+
+Author: Alejandra Mendoza Flores
+Date: October 19, 2026
+"""
+import os
+import json
+import time
+import bisect
+import functools
+import threading
+
+OPERATIONS_TOTAL = "hotel_operations_total"
+OPERATION_SECONDS = "hotel_operation_seconds"
+STORAGE_SECONDS = "hotel_storage_seconds"
+READ_BYTES = "hotel_storage_read_bytes_total"
+WRITTEN_BYTES = "hotel_storage_written_bytes_total"
+SCANNED_RECORDS = "hotel_storage_scanned_records"
+
+LATENCY_BUCKETS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5,
+                   1.0, 5.0)
+COUNT_BUCKETS = (1, 10, 100, 1000, 10000, 100000, 1000000)
+
+
+class _NullTimer:
+    """
+    A context manager that does nothing.
+    """
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class _Timer:
+    """
+    Observes the time spent in a block.
+
+    Attributes:
+        registry (Registry): Where the time is observed.
+        name (str): The histogram name.
+        labels (dict): The histogram labels.
+    """
+
+    __slots__ = ("registry", "name", "labels", "_start")
+
+    def __init__(self, registry, name, labels):
+        self.registry = registry
+        self.name = name
+        self.labels = labels
+        self._start = None
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.registry.observe(self.name, time.perf_counter() - self._start,
+                              **self.labels)
+        return False
+
+
+class NullRegistry:
+    """
+    A registry that ignores everything it is given.
+
+    Attributes:
+        enabled (bool): Always False; instrumented code may skip
+        computing values when it is.
+    """
+
+    enabled = False
+
+    def count(self, name, value=1, **labels):
+        """
+        Adds to a counter.
+
+        Args:
+            name (str): The counter name.
+            value (float, optional): The amount to add. Defaults to 1.
+            **labels: The label values of the counter.
+        """
+
+    def observe(self, name, value, **labels):
+        """
+        Records a value in a histogram.
+
+        Args:
+            name (str): The histogram name.
+            value (float): The observed value.
+            **labels: The label values of the histogram.
+        """
+
+    def timer(self, name, **labels):
+        """
+        Returns a context manager observing the time spent in it.
+
+        Args:
+            name (str): The histogram name.
+            **labels: The label values of the histogram.
+
+        Returns:
+            object: The context manager.
+        """
+        return _NULL_TIMER
+
+
+class Registry(NullRegistry):
+    """
+    Counters and histograms kept in memory.
+
+    Histograms count observations in cumulative buckets, like
+    Prometheus histograms. SCANNED_RECORDS uses COUNT_BUCKETS and every
+    other histogram the given latency buckets.
+
+    Attributes:
+        buckets (dict): The bucket upper bounds per histogram name, with
+        None for the default.
+    """
+
+    enabled = True
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = {None: tuple(buckets),
+                        SCANNED_RECORDS: COUNT_BUCKETS}
+        self._counters = {}
+        self._histograms = {}
+        self._hooks = []
+        self._lock = threading.Lock()
+
+    def add_hook(self, hook):
+        """
+        Calls a function with every histogram observation.
+
+        Args:
+            hook (callable): Called with (name, labels, value) in the
+            thread that made the observation.
+        """
+        self._hooks.append(hook)
+
+    def count(self, name, value=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name, value, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        bounds = self.buckets.get(name, self.buckets[None])
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = \
+                    {"buckets": [0] * (len(bounds) + 1), "sum": 0.0,
+                     "count": 0}
+            histogram["buckets"][bisect.bisect_left(bounds, value)] += 1
+            histogram["sum"] += value
+            histogram["count"] += 1
+        for hook in self._hooks:
+            hook(name, labels, value)
+
+    def timer(self, name, **labels):
+        return _Timer(self, name, labels)
+
+    def snapshot(self):
+        """
+        Returns the current values.
+
+        Returns:
+            dict: "counters", a list of {name, labels, value}, and
+            "histograms", a list of {name, labels, buckets, sum, count}
+            where buckets maps each upper bound ("+Inf" last) to the
+            cumulative count.
+        """
+        with self._lock:
+            counters = [{"name": name, "labels": dict(labels),
+                         "value": value}
+                        for (name, labels), value
+                        in sorted(self._counters.items())]
+            histograms = []
+            for (name, labels), histogram in \
+                    sorted(self._histograms.items()):
+                bounds = self.buckets.get(name, self.buckets[None])
+                cumulative = 0
+                buckets = {}
+                for bound, number in zip(
+                        [str(bound) for bound in bounds] + ["+Inf"],
+                        histogram["buckets"]):
+                    cumulative += number
+                    buckets[bound] = cumulative
+                histograms.append({"name": name, "labels": dict(labels),
+                                   "buckets": buckets,
+                                   "sum": histogram["sum"],
+                                   "count": histogram["count"]})
+        return {"counters": counters, "histograms": histograms}
+
+    def reset(self):
+        """
+        Forgets every value.
+        """
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+
+def _write_text(path, text):
+    """
+    Replaces a file atomically, so scrapers never read half of it.
+
+    Args:
+        path (str): The file path.
+        text (str): The new content.
+    """
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as file:
+        file.write(text)
+    os.replace(temp_path, path)
+
+
+def _format_labels(labels, extra=None):
+    """
+    Formats labels in the Prometheus text format.
+
+    Args:
+        labels (dict): The label values.
+        extra (tuple, optional): One more (name, value) label.
+
+    Returns:
+        str: The label set, or "" when there are no labels.
+    """
+    items = list(labels.items()) + ([extra] if extra else [])
+    if not items:
+        return ""
+    escaped = (str(value).replace("\\", "\\\\").replace('"', '\\"')
+               .replace("\n", "\\n") for _, value in items)
+    return "{" + ",".join(f'{name}="{value}"' for (name, _), value
+                          in zip(items, escaped)) + "}"
+
+
+class PrometheusExporter:
+    """
+    Writes a registry in the Prometheus text exposition format, for the
+    node exporter's textfile collector or any other scraper.
+
+    Attributes:
+        path (str): The file written by export().
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    @staticmethod
+    def render(registry):
+        """
+        Formats the values of a registry.
+
+        Args:
+            registry (Registry): The registry.
+
+        Returns:
+            str: The Prometheus text.
+        """
+        snapshot = registry.snapshot()
+        lines = []
+        typed = set()
+        for counter in snapshot["counters"]:
+            if counter["name"] not in typed:
+                typed.add(counter["name"])
+                lines.append(f"# TYPE {counter['name']} counter")
+            lines.append(f"{counter['name']}"
+                         f"{_format_labels(counter['labels'])} "
+                         f"{counter['value']}")
+        for histogram in snapshot["histograms"]:
+            name = histogram["name"]
+            if name not in typed:
+                typed.add(name)
+                lines.append(f"# TYPE {name} histogram")
+            for bound, number in histogram["buckets"].items():
+                labels = _format_labels(histogram["labels"], ("le", bound))
+                lines.append(f"{name}_bucket{labels} {number}")
+            labels = _format_labels(histogram["labels"])
+            lines.append(f"{name}_sum{labels} {histogram['sum']}")
+            lines.append(f"{name}_count{labels} {histogram['count']}")
+        return "\n".join(lines) + "\n"
+
+    def export(self, registry):
+        """
+        Writes the values of a registry to the file.
+
+        Args:
+            registry (Registry): The registry.
+        """
+        _write_text(self.path, self.render(registry))
+
+
+class JsonExporter:
+    """
+    Writes a registry as JSON.
+
+    Attributes:
+        path (str): The file written by export().
+    """
+
+    def __init__(self, path):
+        self.path = path
+
+    @staticmethod
+    def render(registry):
+        """
+        Formats the values of a registry.
+
+        Args:
+            registry (Registry): The registry.
+
+        Returns:
+            str: The snapshot() of the registry as JSON.
+        """
+        return json.dumps(registry.snapshot(), indent=2) + "\n"
+
+    def export(self, registry):
+        """
+        Writes the values of a registry to the file.
+
+        Args:
+            registry (Registry): The registry.
+        """
+        _write_text(self.path, self.render(registry))
+
+
+_REGISTRY = NullRegistry()
+
+
+def get_registry():
+    """
+    Returns the registry instrumented code reports to.
+
+    Returns:
+        NullRegistry: The current registry.
+    """
+    return _REGISTRY
+
+
+def set_registry(registry):
+    """
+    Replaces the registry instrumented code reports to.
+
+    Args:
+        registry (NullRegistry): The new registry, or None for the
+        do-nothing default.
+
+    Returns:
+        NullRegistry: The previous registry.
+    """
+    global _REGISTRY  # pylint: disable=global-statement
+    previous = _REGISTRY
+    _REGISTRY = registry if registry is not None else NullRegistry()
+    return previous
+
+
+def timed(function):
+    """
+    Records the calls and latency of a function in OPERATIONS_TOTAL and
+    OPERATION_SECONDS, labelled with its qualified name.
+
+    Args:
+        function (callable): The function to instrument.
+
+    Returns:
+        callable: The instrumented function.
+    """
+    operation = function.__qualname__
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        registry = _REGISTRY
+        if not registry.enabled:
+            return function(*args, **kwargs)
+        outcome = "error"
+        start = time.perf_counter()
+        try:
+            result = function(*args, **kwargs)
+            outcome = "ok"
+            return result
+        finally:
+            registry.observe(OPERATION_SECONDS,
+                             time.perf_counter() - start,
+                             operation=operation)
+            registry.count(OPERATIONS_TOTAL, operation=operation,
+                           outcome=outcome)
+    return wrapper
@@ -0,0 +1,296 @@
+"""
+availability.py - Interval Index for Room Availability
+
+This module keeps, for every (hotel, room) pair, the booked stays as a
+sorted list of half-open day intervals [check-in, check-out). Dates are
+parsed once into day ordinals, so checking a new booking for overlaps
+is a binary search over the room's stays instead of a scan of
+reservations.json.
+
+A reservation without a check-out date is treated as a one-night stay.
+
+Classes:
+    - RoomIntervals: Sorted stays of one room.
+    - AvailabilityIndex: Stays of every room, optionally kept in sync
+    with a storage backend.
+
+Functions:
+    - to_ordinal(date): Parses a "YYYY-MM-DD" date into a day ordinal.
+    - stay_interval(check_in_date, check_out_date): Returns the stay as
+    a half-open ordinal interval.
+
+Example:
+    index = AvailabilityIndex(Reservation.storage)
+    index.conflicts("Sample Hotel", 101, "2024-02-14", "2024-02-18")
+    index.free_rooms("Sample Hotel", range(1, 11), "2024-02-14",
+                     "2024-02-18")
+
+Author: Alejandra Mendoza Flores
+Date: October 19, 2026
+"""
+from bisect import bisect_left, bisect_right
+from datetime import date
+
+
+def to_ordinal(value):
+    """
+    Parses a date into a day ordinal.
+
+    Args:
+        value (str or int): A "YYYY-MM-DD" date, or an ordinal.
+
+    Returns:
+        int: The proleptic Gregorian ordinal of the date.
+
+    Raises:
+        ValueError: If the date is not a string or an int, or cannot be
+        parsed.
+    """
+    if isinstance(value, int):
+        return value
+    if not isinstance(value, str):
+        raise ValueError(f"Invalid date: {value!r}")
+    return date.fromisoformat(value).toordinal()
+
+
+def stay_interval(check_in_date, check_out_date=None):
+    """
+    Returns a stay as a half-open interval of day ordinals.
+
+    Args:
+        check_in_date (str): The date of check-in.
+        check_out_date (str, optional): The date of check-out. Defaults
+        to None, meaning a one-night stay.
+
+    Returns:
+        tuple: (first night, check-out day).
+
+    Raises:
+        ValueError: If a date cannot be parsed or the check-out is not
+        after the check-in.
+    """
+    start = to_ordinal(check_in_date)
+    end = start + 1 if check_out_date is None else to_ordinal(check_out_date)
+    if end <= start:
+        raise ValueError("check-out must be after check-in")
+    return start, end
+
+
+class RoomIntervals:
+    """
+    The booked stays of one room, sorted by check-in.
+
+    The stays may overlap each other (a file edited by hand, or written
+    before the overlap check existed), so the largest check-out of every
+    prefix is kept as well: a stay that starts early and ends late is
+    then still found by the binary search.
+
+    Attributes:
+        starts (list): Check-in ordinals, sorted.
+        ends (list): Check-out ordinals, aligned with starts.
+        max_ends (list): max(ends[:i + 1]) for every position i.
+    """
+
+    def __init__(self):
+        self.starts = []
+        self.ends = []
+        self.max_ends = []
+
+    def __len__(self):
+        return len(self.starts)
+
+    def overlaps(self, start, end):
+        """
+        Tells whether [start, end) overlaps a booked stay.
+
+        Args:
+            start (int): First night ordinal.
+            end (int): Check-out ordinal.
+
+        Returns:
+            bool: True if the stay conflicts with a booking.
+        """
+        position = bisect_left(self.starts, end)
+        return position > 0 and self.max_ends[position - 1] > start
+
+    def _rebuild_max_ends(self, position):
+        """
+        Recomputes the prefix maxima from a position onwards.
+
+        Args:
+            position (int): The first position whose stay changed.
+        """
+        del self.max_ends[position:]
+        highest = self.max_ends[-1] if self.max_ends else None
+        for end in self.ends[position:]:
+            highest = end if highest is None else max(highest, end)
+            self.max_ends.append(highest)
+
+    def add(self, start, end):
+        """
+        Records a stay.
+
+        Args:
+            start (int): First night ordinal.
+            end (int): Check-out ordinal.
+        """
+        position = bisect_right(self.starts, start)
+        self.starts.insert(position, start)
+        self.ends.insert(position, end)
+        self._rebuild_max_ends(position)
+
+    def remove(self, start):
+        """
+        Forgets the stay that starts on the given night.
+
+        Args:
+            start (int): First night ordinal.
+
+        Returns:
+            bool: True if a stay was removed.
+        """
+        position = bisect_left(self.starts, start)
+        if position < len(self.starts) and self.starts[position] == start:
+            del self.starts[position]
+            del self.ends[position]
+            self._rebuild_max_ends(position)
+            return True
+        return False
+
+
+class AvailabilityIndex:
+    """
+    Booked stays of every (hotel, room) pair.
+
+    When a storage backend is given, the index is rebuilt from it
+    whenever its signature changes because of a write made elsewhere.
+
+    Attributes:
+        storage (JsonFileStorage): The reservations backend, or None.
+    """
+
+    def __init__(self, storage=None):
+        self.storage = storage
+        self._rooms = {}
+        self._signature = None
+        self._loaded = storage is None
+
+    def build(self, records):
+        """
+        Replaces the index content with the given reservations.
+
+        Records that are not reservations, or whose dates cannot be
+        parsed, are skipped; a missing check-out is one night.
+
+        Args:
+            records (iterable): Reservation records.
+        """
+        self._rooms = {}
+        for record in records:
+            try:
+                self.add(record)
+            except (AttributeError, KeyError, TypeError, ValueError):
+                continue
+
+    def invalidate(self):
+        """
+        Forces a rebuild from storage on the next call.
+        """
+        self._loaded = self.storage is None
+
+    def refresh(self):
+        """
+        Rebuilds the index if the storage changed since the last build.
+        """
+        if self.storage is None:
+            return
+        signature = self.storage.signature()
+        if self._loaded and signature == self._signature:
+            return
+        self.build(self.storage.load())
+        self._signature = signature
+        self._loaded = True
+
+    def mark_written(self):
+        """
+        Records the storage signature after a write that was already
+        applied to the index.
+        """
+        if self.storage is not None:
+            self._signature = self.storage.signature()
+
+    def conflicts(self, hotel_name, room_number, check_in_date,
+                  check_out_date=None):
+        """
+        Tells whether a stay overlaps a booking of the same room.
+
+        Args:
+            hotel_name (str): The name of the hotel.
+            room_number (int or str): The room.
+            check_in_date (str): The date of check-in.
+            check_out_date (str, optional): The date of check-out.
+
+        Returns:
+            bool: True if the room is already booked for part of the stay.
+        """
+        self.refresh()
+        start, end = stay_interval(check_in_date, check_out_date)
+        intervals = self._rooms.get((hotel_name, room_number))
+        return intervals is not None and intervals.overlaps(start, end)
+
+    def add(self, record):
+        """
+        Records a reservation.
+
+        Args:
+            record (dict): The reservation record.
+        """
+        start, end = stay_interval(record["check_in_date"],
+                                   record.get("check_out_date"))
+        key = (record["hotel_name"], record["room_number"])
+        self._rooms.setdefault(key, RoomIntervals()).add(start, end)
+
+    def remove(self, hotel_name, room_number, check_in_date):
+        """
+        Forgets a reservation.
+
+        Args:
+            hotel_name (str): The name of the hotel.
+            room_number (int or str): The room.
+            check_in_date (str): The date of check-in.
+
+        Returns:
+            bool: True if a stay was removed.
+        """
+        intervals = self._rooms.get((hotel_name, room_number))
+        try:
+            start = to_ordinal(check_in_date)
+        except ValueError:
+            return False
+        return intervals is not None and intervals.remove(start)
+
+    def free_rooms(self, hotel_name, rooms, check_in_date,
+                   check_out_date=None):
+        """
+        Lists the rooms of a hotel that are free for a whole stay.
+
+        The index only knows rooms that have bookings, so the rooms of
+        the hotel must be given.
+
+        Args:
+            hotel_name (str): The name of the hotel.
+            rooms (iterable): The room numbers to consider.
+            check_in_date (str): The date of check-in.
+            check_out_date (str, optional): The date of check-out.
+
+        Returns:
+            list: The free room numbers, in the order given.
+        """
+        self.refresh()
+        start, end = stay_interval(check_in_date, check_out_date)
+        free = []
+        for room in rooms:
+            intervals = self._rooms.get((hotel_name, room))
+            if intervals is None or not intervals.overlaps(start, end):
+                free.append(room)
+        return free
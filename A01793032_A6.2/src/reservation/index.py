@@ -0,0 +1,297 @@
+"""
+index.py - Hash Indexes for Reservation Lookup
+
+This module indexes reservations by their composite key
+(customer_name, hotel_name, room_number, check_in_date), with secondary
+indexes by customer and by hotel, so finding or canceling a reservation
+and listing the reservations of one customer or hotel are dictionary
+lookups instead of scans of reservations.json.
+
+Secondary indexes map a name to an insertion-ordered dict of keys, so
+entries are removed in constant time and listings keep booking order.
+
+Classes:
+    - ReservationIndex: Reservation records by key, customer and hotel,
+    optionally kept in sync with a storage backend.
+    - ReservationSet: Reservation objects of one hotel by key and
+    customer.
+
+Functions:
+    - reservation_key(reservation): Returns the composite key of a
+    record or Reservation.
+
+Author: Alejandra Mendoza Flores
+Date: October 19, 2026
+"""
+
+KEY_FIELDS = ("customer_name", "hotel_name", "room_number",
+              "check_in_date")
+
+
+def reservation_key(reservation):
+    """
+    Returns the composite key of a reservation.
+
+    Args:
+        reservation (dict or Reservation): A reservation record or
+        object.
+
+    Returns:
+        tuple: (customer_name, hotel_name, room_number, check_in_date).
+    """
+    if isinstance(reservation, dict):
+        return tuple(reservation[field] for field in KEY_FIELDS)
+    return tuple(getattr(reservation, field) for field in KEY_FIELDS)
+
+
+class ReservationIndex:
+    """
+    Reservation records by composite key, customer and hotel.
+
+    When a storage backend is given, the index is rebuilt from it
+    whenever its signature changes because of a write made elsewhere.
+
+    Attributes:
+        storage (JsonFileStorage): The reservations backend, or None.
+    """
+
+    def __init__(self, storage=None):
+        self.storage = storage
+        self._records = {}
+        self._by_customer = {}
+        self._by_hotel = {}
+        self._signature = None
+        self._loaded = storage is None
+
+    def __len__(self):
+        self.refresh()
+        return sum(len(records) for records in self._records.values())
+
+    def build(self, records):
+        """
+        Replaces the index content with the given reservations.
+
+        Args:
+            records (iterable): Reservation records.
+        """
+        self._records = {}
+        self._by_customer = {}
+        self._by_hotel = {}
+        for record in records:
+            self.add(record)
+
+    def invalidate(self):
+        """
+        Forces a rebuild from storage on the next call.
+        """
+        self._loaded = self.storage is None
+
+    def refresh(self):
+        """
+        Rebuilds the index if the storage changed since the last build.
+        """
+        if self.storage is None:
+            return
+        signature = self.storage.signature()
+        if self._loaded and signature == self._signature:
+            return
+        self.build(self.storage.load())
+        self._signature = signature
+        self._loaded = True
+
+    def mark_written(self):
+        """
+        Records the storage signature after a write that was already
+        applied to the index.
+        """
+        if self.storage is not None:
+            self._signature = self.storage.signature()
+
+    def add(self, record):
+        """
+        Records a reservation.
+
+        Args:
+            record (dict): The reservation record.
+        """
+        key = reservation_key(record)
+        self._records.setdefault(key, []).append(record)
+        self._by_customer.setdefault(key[0], {})[key] = None
+        self._by_hotel.setdefault(key[1], {})[key] = None
+
+    def remove(self, key):
+        """
+        Forgets one reservation with the given key.
+
+        Args:
+            key (tuple): The composite key.
+
+        Returns:
+            dict: The removed record, or None if there was none.
+        """
+        records = self._records.get(key)
+        if not records:
+            return None
+        record = records.pop(0)
+        if not records:
+            del self._records[key]
+            for names, name in ((self._by_customer, key[0]),
+                                (self._by_hotel, key[1])):
+                keys = names[name]
+                del keys[key]
+                if not keys:
+                    del names[name]
+        return record
+
+    def get(self, customer_name, hotel_name, room_number, check_in_date):
+        """
+        Looks up a reservation by its composite key.
+
+        Args:
+            customer_name (str): The name of the customer.
+            hotel_name (str): The name of the hotel.
+            room_number (int or str): The room.
+            check_in_date (str): The date of check-in.
+
+        Returns:
+            dict: The reservation record, or None if there is none.
+        """
+        self.refresh()
+        records = self._records.get(
+            (customer_name, hotel_name, room_number, check_in_date))
+        return records[0] if records else None
+
+    def _listing(self, names, name):
+        """
+        Returns the records whose keys are listed under a name.
+
+        Args:
+            names (dict): A secondary index.
+            name (str): The customer or hotel name.
+
+        Returns:
+            list: The records in booking order.
+        """
+        return [record for key in names.get(name, ())
+                for record in self._records[key]]
+
+    def for_customer(self, customer_name):
+        """
+        Lists the reservations of a customer.
+
+        Args:
+            customer_name (str): The name of the customer.
+
+        Returns:
+            list: The reservation records.
+        """
+        self.refresh()
+        return self._listing(self._by_customer, customer_name)
+
+    def for_hotel(self, hotel_name):
+        """
+        Lists the reservations of a hotel.
+
+        Args:
+            hotel_name (str): The name of the hotel.
+
+        Returns:
+            list: The reservation records.
+        """
+        self.refresh()
+        return self._listing(self._by_hotel, hotel_name)
+
+
+class ReservationSet:
+    """
+    The Reservation objects of one hotel, by composite key and by
+    customer, in booking order.
+    """
+
+    def __init__(self, reservations=()):
+        self._items = {}
+        self._by_customer = {}
+        for reservation in reservations:
+            self.add(reservation)
+
+    def __contains__(self, reservation):
+        try:
+            key = reservation_key(reservation)
+        except (AttributeError, KeyError):
+            return False
+        return self._items.get(key) is reservation
+
+    def __iter__(self):
+        return iter(list(self._items.values()))
+
+    def __len__(self):
+        return len(self._items)
+
+    def __repr__(self):
+        return f"ReservationSet({list(self._items.values())!r})"
+
+    def add(self, reservation):
+        """
+        Adds a reservation.
+
+        Args:
+            reservation (Reservation): The reservation to add.
+
+        Returns:
+            bool: False if a reservation with the same key is already
+            in the set.
+        """
+        key = reservation_key(reservation)
+        if key in self._items:
+            return False
+        self._items[key] = reservation
+        self._by_customer.setdefault(key[0], {})[key] = None
+        return True
+
+    def remove(self, reservation):
+        """
+        Removes a reservation.
+
+        Args:
+            reservation (Reservation): The reservation to remove.
+
+        Raises:
+            ValueError: If the reservation is not in the set.
+        """
+        if reservation not in self:
+            raise ValueError("reservation not in set")
+        key = reservation_key(reservation)
+        del self._items[key]
+        keys = self._by_customer[key[0]]
+        del keys[key]
+        if not keys:
+            del self._by_customer[key[0]]
+
+    def get(self, customer_name, hotel_name, room_number, check_in_date):
+        """
+        Looks up a reservation by its composite key.
+
+        Args:
+            customer_name (str): The name of the customer.
+            hotel_name (str): The name of the hotel.
+            room_number (int or str): The room.
+            check_in_date (str): The date of check-in.
+
+        Returns:
+            Reservation: The reservation, or None if there is none.
+        """
+        return self._items.get(
+            (customer_name, hotel_name, room_number, check_in_date))
+
+    def for_customer(self, customer_name):
+        """
+        Lists the reservations of a customer.
+
+        Args:
+            customer_name (str): The name of the customer.
+
+        Returns:
+            list: The reservations in booking order.
+        """
+        return [self._items[key]
+                for key in self._by_customer.get(customer_name, ())]
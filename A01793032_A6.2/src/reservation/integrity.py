@@ -0,0 +1,215 @@
+"""
+integrity.py - Referential Integrity for Reservations
+
+This module keeps the names of the customers and hotels in memory so
+that a reservation can be checked against them in constant time,
+instead of loading customers.json and hotels.json for every booking.
+
+A KeyIndex holds the names found in one storage backend (with the room
+count of each hotel). The classes that own the records keep it
+current: a write made through them is applied to the index directly,
+while a write made anywhere else changes the storage signature and
+makes the next lookup rebuild the index.
+
+Deleting a customer or hotel that still has reservations is decided by
+the delete guards of the Customer and Hotel classes, which Reservation
+registers (see Reservation.integrity): the delete is rejected, or the
+reservations are canceled first.
+
+Classes:
+    - KeyIndex: The names of the records of one storage backend.
+
+Functions:
+    - reference_problem(customers, hotels, record): Explains why a
+    reservation refers to a missing customer, hotel or room.
+    - guarded_remove(guards, storage, names_or_predicate): Deletes
+    records by name, except those a delete guard keeps.
+
+Attributes:
+    - ON_DELETE: The policies for deleting referenced records.
+
+Author: Alejandra Mendoza Flores
+Date: October 19, 2026
+"""
+import threading
+
+from src.storage.storage import bulk_remove
+
+ON_DELETE = ("reject", "cascade")
+
+
+class KeyIndex:
+    """
+    The names of the records of one storage backend.
+
+    Attributes:
+        storage (JsonFileStorage): The backend the names come from.
+        value_field (str): A field kept for every name (the first
+        record's value wins), or None.
+    """
+
+    def __init__(self, storage, value_field=None):
+        self.storage = storage
+        self.value_field = value_field
+        self._values = {}
+        self._signature = None
+        self._loaded = False
+        self._fresh = False
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def bind(index, storage, value_field=None):
+        """
+        Returns an index of a storage backend, reusing the given one if
+        it already belongs to that backend.
+
+        Args:
+            index (KeyIndex): The current index, or None.
+            storage (JsonFileStorage): The backend.
+            value_field (str, optional): See KeyIndex.
+
+        Returns:
+            KeyIndex: The index of the backend.
+        """
+        if index is not None and index.storage is storage:
+            return index
+        return KeyIndex(storage, value_field)
+
+    def _add(self, record):
+        """
+        Records the name of one record.
+
+        Args:
+            record (dict): The record.
+        """
+        self._values.setdefault(
+            record.get("name"),
+            record.get(self.value_field) if self.value_field else None)
+
+    def refresh(self):
+        """
+        Rebuilds the index if the storage changed since the last build.
+        """
+        with self._lock:
+            signature = self.storage.signature()
+            if self._loaded and signature == self._signature:
+                return
+            self._values = {}
+            for record in self.storage.load():
+                self._add(record)
+            self._signature = signature
+            self._loaded = True
+
+    def begin_write(self):
+        """
+        Notes whether the index is current before a write through the
+        owning class. Call it while holding the storage's write lock.
+        """
+        with self._lock:
+            self._fresh = self._loaded and \
+                self.storage.signature() == self._signature
+
+    def end_write(self, added=(), removed=()):
+        """
+        Applies a write through the owning class to the index.
+
+        If the index was not current before the write, nothing is done
+        and the next lookup rebuilds it, so a write never costs a load.
+
+        Args:
+            added (iterable): The records added.
+            removed (iterable): The names whose records were all
+            deleted.
+        """
+        with self._lock:
+            if not self._fresh:
+                return
+            for record in added:
+                self._add(record)
+            for name in removed:
+                self._values.pop(name, None)
+            self._signature = self.storage.signature()
+            self._fresh = False
+
+    def __contains__(self, name):
+        with self._lock:
+            self.refresh()
+            return name in self._values
+
+    def get(self, name):
+        """
+        Returns the value kept for a name.
+
+        Args:
+            name (str): The name.
+
+        Returns:
+            object: The value of value_field, or None.
+        """
+        with self._lock:
+            self.refresh()
+            return self._values.get(name)
+
+
+def reference_problem(customers, hotels, record):
+    """
+    Explains why a reservation refers to something that does not exist.
+
+    Args:
+        customers (KeyIndex): The customer names.
+        hotels (KeyIndex): The hotel names, with their room counts.
+        record (dict): The reservation record.
+
+    Returns:
+        str: The reason the reservation is rejected, or None if the
+        customer and hotel exist and the room is between 1 and the
+        hotel's number of rooms.
+    """
+    if record["customer_name"] not in customers:
+        return f"customer {record['customer_name']} does not exist"
+    if record["hotel_name"] not in hotels:
+        return f"hotel {record['hotel_name']} does not exist"
+    rooms = hotels.get(record["hotel_name"])
+    room = record["room_number"]
+    if isinstance(rooms, int) and not (
+            isinstance(room, int) and not isinstance(room, bool) and
+            1 <= room <= rooms):
+        return f"room {room} is not between 1 and {rooms}"
+    return None
+
+
+def guarded_remove(guards, storage, names_or_predicate):
+    """
+    Deletes records by name, except the names a delete guard keeps.
+
+    Args:
+        guards (list): Functions taking a list of names and returning
+        the names that must not be deleted.
+        storage (JsonFileStorage): The backend to delete from.
+        names_or_predicate (iterable or callable): The names to delete,
+        or a function taking a record and returning True to delete it.
+
+    Returns:
+        tuple: The (name, number of records deleted) pairs, as returned
+        by bulk_remove with 0 for every kept name given, and the set of
+        kept names.
+    """
+    if not guards:
+        return bulk_remove(storage, ("name",), names_or_predicate), set()
+    if callable(names_or_predicate):
+        names = [record.get("name") for record in storage.load()
+                 if names_or_predicate(record)]
+    else:
+        names = list(names_or_predicate)
+    kept = set()
+    for guard in guards:
+        kept.update(guard(names))
+    if callable(names_or_predicate):
+        return bulk_remove(storage, ("name",), lambda record: (
+            names_or_predicate(record) and
+            record.get("name") not in kept)), kept
+    outcomes = iter(bulk_remove(storage, ("name",),
+                                [name for name in names
+                                 if name not in kept]))
+    return [(name, 0) if name in kept else next(outcomes)
+            for name in names], kept
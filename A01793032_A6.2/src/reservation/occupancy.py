@@ -0,0 +1,236 @@
+"""
+occupancy.py - Occupancy Reporting over Reservations
+
+This module answers "how many rooms of each hotel are occupied on each
+night of a period" without visiting every night of every stay. Each
+reservation adds +1 to its hotel's difference array at its first night
+and -1 at its check-out day (both clipped to the period), and a prefix
+sum over the array yields the occupied rooms per night. The cost is
+O(reservations + hotels x days).
+
+The reservations are read from a ReservationTable, whose dates are
+already day ordinals. When NumPy is installed, the difference arrays
+are built with np.add.at and summed with np.cumsum over the table
+columns without copying them; otherwise plain Python loops are used.
+
+Functions:
+    - occupancy(table, start, days, hotels): Occupied rooms per hotel
+    per night.
+    - occupancy_rates(counts, rooms): Occupied share of the rooms.
+    - revenue(counts, rates): Room revenue per night from nightly rates.
+    - summarize(counts, rooms, start): Peak night and average rate per
+    hotel.
+    - main(argv): Prints a report for reservations.json and hotels.json.
+
+Usage:
+    python -m src.reservation.occupancy --start 2024-01-01 --days 365
+
+Author: Alejandra Mendoza Flores
+Date: October 19, 2026
+"""
+import sys
+import json
+import argparse
+
+from datetime import date
+from itertools import accumulate
+
+from src.reservation.availability import to_ordinal
+from src.reservation.table import ReservationTable
+from src.storage.storage import JsonFileStorage
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on the environment
+    np = None
+
+
+def _hotel_rows(table, hotels):
+    """
+    Maps the name ids of the reported hotels to output rows.
+
+    Args:
+        table (ReservationTable): The reservations.
+        hotels (iterable): The hotel names, or None for every hotel in
+        the table.
+
+    Returns:
+        tuple: (list of hotel names, dict of name id to row).
+    """
+    if hotels is None:
+        ids = sorted(set(table.hotel_ids))
+        hotels = [table.names[hotel_id] for hotel_id in ids]
+    else:
+        hotels = list(hotels)
+        ids = [table.find_name_id(name) for name in hotels]
+    return hotels, {hotel_id: row for row, hotel_id in enumerate(ids)
+                    if hotel_id is not None}
+
+
+def _occupancy_numpy(table, start, days, rows, size):
+    """
+    Builds and sums the difference arrays with NumPy.
+
+    Returns:
+        list: The occupied rooms per night of each row.
+    """
+    lookup = np.full(len(table.names) + 1, -1, dtype=np.int64)
+    lookup[list(rows)] = list(rows.values())
+    hotel_rows = lookup[np.frombuffer(table.hotel_ids, dtype=np.intc)]
+    check_ins = np.frombuffer(table.check_ins, dtype=np.intc)
+    check_outs = np.frombuffer(table.check_outs, dtype=np.intc)
+    ends = np.where(check_outs == 0, check_ins + 1, check_outs)
+    first = np.clip(check_ins.astype(np.int64) - start, 0, days)
+    last = np.clip(ends.astype(np.int64) - start, 0, days)
+    keep = (hotel_rows >= 0) & (first < last)
+    diff = np.zeros((size, days + 1), dtype=np.int64)
+    np.add.at(diff, (hotel_rows[keep], first[keep]), 1)
+    np.add.at(diff, (hotel_rows[keep], last[keep]), -1)
+    return np.cumsum(diff[:, :days], axis=1).tolist()
+
+
+def _occupancy_python(table, start, days, rows, size):
+    """
+    Builds and sums the difference arrays with plain loops.
+
+    Returns:
+        list: The occupied rooms per night of each row.
+    """
+    diffs = [[0] * (days + 1) for _ in range(size)]
+    for hotel_id, check_in, check_out in zip(
+            table.hotel_ids, table.check_ins, table.check_outs):
+        row = rows.get(hotel_id)
+        if row is None:
+            continue
+        first = max(check_in - start, 0)
+        last = min((check_out or check_in + 1) - start, days)
+        if first < last:
+            diff = diffs[row]
+            diff[first] += 1
+            diff[last] -= 1
+    return [list(accumulate(diff[:days])) for diff in diffs]
+
+
+def occupancy(table, start, days=365, hotels=None):
+    """
+    Counts the occupied rooms of each hotel on each night of a period.
+
+    Args:
+        table (ReservationTable or iterable): The reservations, as a
+        table or as reservation records.
+        start (str or int): The first night, as "YYYY-MM-DD" or ordinal.
+        days (int, optional): The number of nights. Defaults to 365.
+        hotels (iterable, optional): The hotel names to report.
+        Defaults to every hotel with a reservation.
+
+    Returns:
+        dict: Hotel name to a list with the occupied rooms per night.
+    """
+    if not isinstance(table, ReservationTable):
+        table = ReservationTable.from_records(table)
+    start = to_ordinal(start)
+    hotels, rows = _hotel_rows(table, hotels)
+    build = _occupancy_numpy if np is not None else _occupancy_python
+    counts = build(table, start, days, rows, len(hotels)) if hotels else []
+    return dict(zip(hotels, counts))
+
+
+def occupancy_rates(counts, rooms):
+    """
+    Divides the occupied rooms by the rooms of each hotel.
+
+    Args:
+        counts (dict): The output of occupancy.
+        rooms (dict): Hotel name to its number of rooms.
+
+    Returns:
+        dict: Hotel name to a list with the occupied share per night,
+        or None for hotels whose number of rooms is unknown.
+    """
+    rates = {}
+    for hotel, nightly in counts.items():
+        total = rooms.get(hotel)
+        rates[hotel] = [count / total for count in nightly] \
+            if total else None
+    return rates
+
+
+def revenue(counts, rates):
+    """
+    Computes the room revenue per night.
+
+    Args:
+        counts (dict): The output of occupancy.
+        rates (dict): Hotel name to its nightly room rate.
+
+    Returns:
+        dict: Hotel name to a list with the revenue per night, for the
+        hotels with a rate.
+    """
+    return {hotel: [count * rates[hotel] for count in nightly]
+            for hotel, nightly in counts.items() if hotel in rates}
+
+
+def summarize(counts, rooms, start):
+    """
+    Summarizes the occupancy of each hotel.
+
+    Args:
+        counts (dict): The output of occupancy.
+        rooms (dict): Hotel name to its number of rooms.
+        start (str or int): The first night of counts.
+
+    Returns:
+        dict: Hotel name to its rooms, peak night, occupied rooms on
+        that night, peak and mean occupancy rates, and the number of
+        nights at full capacity. Rates are None when the number of
+        rooms is unknown.
+    """
+    start = to_ordinal(start)
+    summary = {}
+    for hotel, nightly in counts.items():
+        if not nightly:
+            continue
+        peak = max(nightly)
+        total = rooms.get(hotel)
+        summary[hotel] = {
+            "rooms": total,
+            "peak_night": date.fromordinal(
+                start + nightly.index(peak)).isoformat(),
+            "peak_occupied": peak,
+            "peak_rate": peak / total if total else None,
+            "mean_rate": sum(nightly) / len(nightly) / total
+            if total else None,
+            "full_nights": sum(count >= total for count in nightly)
+            if total else None}
+    return summary
+
+
+def main(argv=None):
+    """
+    Prints the occupancy summary of reservations.json as JSON.
+
+    Args:
+        argv (list, optional): Command line arguments.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--reservations", default="reservations.json")
+    parser.add_argument("--hotels", default="hotels.json")
+    parser.add_argument("--start", default=date.today().isoformat())
+    parser.add_argument("--days", type=int, default=365)
+    args = parser.parse_args(argv)
+
+    table = ReservationTable()
+    for record in JsonFileStorage(args.reservations).load():
+        try:
+            table.append(record)
+        except (KeyError, TypeError, ValueError):
+            continue
+    rooms = {record["name"]: record.get("rooms")
+             for record in JsonFileStorage(args.hotels).load()}
+    counts = occupancy(table, args.start, args.days)
+    print(json.dumps(summarize(counts, rooms, args.start), indent=2))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -21,6 +21,52 @@ Methods:
       Cancels a hotel reservation for a specific customer.
     - load_reservations_data(): Loads reservation data
     from 'reservations.json'.
+    - available_rooms(hotel_name, check_in_date, check_out_date, rooms):
+    Lists the rooms free for a whole stay.
+    - create_reservations(reservations),
+    cancel_reservations_many(keys_or_predicate): Bulk variants that
+    apply the whole batch with one write.
+    - find_reservation(customer_name, hotel_name, room_number,
+    check_in_date): Looks up one reservation.
+    - reservations_for_customer(customer_name),
+    reservations_for_hotel(hotel_name): List the reservations of a
+    customer or hotel.
+    - set_integrity(on_delete): Checks that new reservations refer to
+    existing customers, hotels and rooms.
+    - acreate_reservation, acreate_reservations, acancel_reservation,
+    acancel_reservations_many, aload_reservations_data,
+    afind_reservation, areservations_for_customer,
+    areservations_for_hotel, aavailable_rooms: asyncio counterparts
+    that run the methods above on worker threads (see src/aio).
+
+Reservation records are persisted through the Reservation.storage
+class attribute (see src/storage), which defaults to
+'reservations.json'.
+Calls to the public methods are counted and timed in the metrics
+registry (see src/metrics).
+
+New reservations are rejected when they overlap another booking of the
+same hotel and room. The check uses an interval index (see
+availability.py) that is kept in memory and rebuilt only when the
+storage is changed elsewhere. Lookups and cancellations go through a
+hash index on (customer_name, hotel_name, room_number, check_in_date)
+with secondary indexes by customer and hotel (see index.py), kept in
+sync the same way.
+
+The indexes are shared by every thread, so the methods that read or
+change them hold Reservation._lock. Creates and cancellations also hold
+the storage's write lock (see write_lock in src/storage/storage.py)
+from the overlap check to the write, so bookings made concurrently by
+other threads or processes cannot both take the same room.
+
+Referential integrity is off by default. Reservation.set_integrity()
+turns it on: every new reservation must then name an existing customer
+and hotel and a room between 1 and the hotel's number of rooms. The
+names are checked against in-memory indexes that Customer and Hotel
+keep current (see integrity.py), so the check costs the same whatever
+the number of customers and hotels. Deleting a customer or hotel that
+still has reservations is then rejected, or cascades to the
+reservations, depending on the chosen policy.
 
 Usage:
     - To use this module, create an instance of the
@@ -37,9 +83,45 @@ Example:
 Author: Alejandra Mendoza Flores
 Date: February 13, 2024
 """
-import os
-import json
 import logging
+import threading
+
+from src.aio.offload import run_blocking, run_serialized
+from src.customer.customer import Customer
+from src.hotel.hotel import Hotel
+from src.metrics.metrics import timed
+from src.reservation.availability import AvailabilityIndex
+from src.reservation.index import ReservationIndex, reservation_key
+from src.reservation.integrity import ON_DELETE, reference_problem
+from src.storage.storage import (JsonFileStorage, bulk_remove, data_path,
+                                 normalize_records, write_lock)
+
+RESERVATION_FIELDS = ("customer_name", "hotel_name", "room_number",
+                      "check_in_date", "check_out_date")
+RESERVATION_KEY = RESERVATION_FIELDS[:4]
+
+
+def _booking_problem(index, record):
+    """
+    Explains why a reservation record cannot be booked.
+
+    Args:
+        index (AvailabilityIndex): The availability index.
+        record (dict): The reservation record.
+
+    Returns:
+        str: The reason the booking is rejected, or None if the room is
+        free for the whole stay.
+    """
+    try:
+        conflict = index.conflicts(
+            record["hotel_name"], record["room_number"],
+            record["check_in_date"], record["check_out_date"])
+    except (TypeError, ValueError):
+        return "invalid dates"
+    if conflict:
+        return "room already booked for those dates"
+    return None
 
 
 class Reservation:
@@ -52,8 +134,21 @@ class Reservation:
         room_number (str): The number of the room reserved.
         check_in_date (str): The date of check-in for the reservation.
         check_out_date (str): The date of check-out for the reservation.
+        storage (JsonFileStorage): Class-wide backend where reservation
+        records are persisted. Defaults to 'reservations.json' in the
+        HOTEL_DATA_DIR directory (see data_path in src/storage).
+        integrity (str): What happens when a customer or hotel with
+        reservations is deleted, "reject" or "cascade", or None (the
+        default) when references are not checked at all.
     """
 
+    __slots__ = RESERVATION_FIELDS
+    storage = JsonFileStorage(data_path("reservations.json"))
+    integrity = None
+    _availability = None
+    _lookup = None
+    _lock = threading.RLock()
+
     def __init__(self, customer_name, hotel_name, room_number,
                  check_in_date, check_out_date=None):
         self.customer_name = customer_name
@@ -62,7 +157,17 @@ class Reservation:
         self.check_in_date = check_in_date
         self.check_out_date = check_out_date
 
+    def to_dict(self):
+        """
+        Returns the reservation in its reservations.json form.
+
+        Returns:
+            dict: The reservation record.
+        """
+        return {field: getattr(self, field) for field in RESERVATION_FIELDS}
+
     @staticmethod
+    @timed
     def create_reservation(customer_name, hotel_name, room_number,
                            check_in_date, check_out_date=None):
         """
@@ -78,26 +183,103 @@ class Reservation:
             check_out_date (str): The date of check-out for the reservation.
 
         Returns:
-            Reservation: The newly created reservation object.
+            Reservation: The newly created reservation object, or None if
+            the dates are invalid or the room is already booked for part
+            of the stay.
         """
         new_reservation = Reservation(customer_name, hotel_name, room_number,
                                       check_in_date, check_out_date)
-        reservations_data = []
-        if os.path.exists("reservations.json"):
-            with open("reservations.json", "r", encoding="utf-8") as file:
-                reservations_data = json.load(file)
-        reservations_data.append({
-            "customer_name": new_reservation.customer_name,
-            "hotel_name": new_reservation.hotel_name,
-            "room_number": new_reservation.room_number,
-            "check_in_date": new_reservation.check_in_date,
-            "check_out_date": new_reservation.check_out_date
-            })
-        with open("reservations.json", "w", encoding="utf-8") as file:
-            json.dump(reservations_data, file)
+        record = new_reservation.to_dict()
+        with Reservation._lock, write_lock(Reservation.storage):
+            index = Reservation.availability()
+            problem = Reservation._reference_problem(record) or \
+                _booking_problem(index, record)
+            if problem:
+                logging.warning("Reservation not created: %s.", problem)
+                return None
+            lookup = Reservation.lookup()
+            lookup.refresh()
+            Reservation.storage.add(record)
+            index.add(record)
+            lookup.add(record)
+            index.mark_written()
+            lookup.mark_written()
         return new_reservation
 
     @staticmethod
+    @timed
+    def create_reservations(reservations):
+        """
+        Creates many reservations with a single write to
+        reservations.json.
+
+        Args:
+            reservations (iterable): (customer_name, hotel_name,
+            room_number, check_in_date[, check_out_date]) tuples or
+            dictionaries with those keys.
+
+        Returns:
+            list: The created Reservation for each entry, or None for
+            entries that are missing fields, have invalid dates or
+            overlap an existing booking (or an earlier entry).
+        """
+        records = normalize_records(reservations, RESERVATION_FIELDS, 4)
+        with Reservation._lock, write_lock(Reservation.storage):
+            index = Reservation.availability()
+            for position, record in enumerate(records):
+                problem = (Reservation._reference_problem(record) or
+                           _booking_problem(index, record)) if record \
+                    else "missing fields"
+                if problem:
+                    logging.warning("Reservation at position %s not "
+                                    "created: %s.", position, problem)
+                    records[position] = None
+                else:
+                    index.add(record)
+            lookup = Reservation.lookup()
+            lookup.refresh()
+            try:
+                Reservation.storage.apply_many(
+                    [{"op": "add", "record": record}
+                     for record in records if record])
+            except (OSError, ValueError):
+                index.invalidate()
+                raise
+            for record in records:
+                if record:
+                    lookup.add(record)
+            index.mark_written()
+            lookup.mark_written()
+        return [Reservation(**record) if record else None
+                for record in records]
+
+    @staticmethod
+    @timed
+    def cancel_reservations_many(keys_or_predicate):
+        """
+        Cancels many reservations with a single write to
+        reservations.json.
+
+        Args:
+            keys_or_predicate (iterable or callable):
+            (customer_name, hotel_name, room_number, check_in_date)
+            tuples, or a function taking a reservation record and
+            returning True for the reservations to cancel.
+
+        Returns:
+            list: (key, number of reservations canceled) pairs.
+        """
+        with Reservation._lock, write_lock(Reservation.storage):
+            outcomes = bulk_remove(Reservation.storage, RESERVATION_KEY,
+                                   keys_or_predicate, limit=1)
+            Reservation.availability().invalidate()
+            Reservation.lookup().invalidate()
+        logging.info("%s reservations canceled.",
+                     sum(count for _, count in outcomes))
+        return outcomes
+
+    @staticmethod
+    @timed
     def cancel_reservation(customer_name, hotel_name,
                            room_number, check_in_date):
         """
@@ -110,23 +292,32 @@ class Reservation:
         - room_number (int): Número de habitación.
         - check_in_date (str): Fecha de entrada en formato "YYYY-MM-DD".
         """
-        reservations_data = Reservation.load_reservations_data()
-        reservation_to_cancel = next(
-            (reservation for reservation in reservations_data
-                if reservation["customer_name"] == customer_name
-                and reservation["hotel_name"] == hotel_name
-                and reservation["room_number"] == room_number
-                and reservation["check_in_date"] == check_in_date), None)
+        key = (customer_name, hotel_name, room_number, check_in_date)
+        with Reservation._lock, write_lock(Reservation.storage):
+            lookup = Reservation.lookup()
+            if lookup.get(*key) is None:
+                logging.warning("Reservation not found.")
+                return
+            index = Reservation.availability()
+            index.refresh()
+            canceled = Reservation.storage.remove({
+                "customer_name": customer_name,
+                "hotel_name": hotel_name,
+                "room_number": room_number,
+                "check_in_date": check_in_date}, limit=1)
 
-        if reservation_to_cancel:
-            reservations_data.remove(reservation_to_cancel)
-            with open("reservations.json", "w", encoding="utf-8") as file:
-                json.dump(reservations_data, file)
-            logging.info("Reservation canceled successfully.")
-        else:
-            logging.warning("Reservation not found.")
+            if canceled:
+                lookup.remove(key)
+                index.remove(hotel_name, room_number, check_in_date)
+                lookup.mark_written()
+                index.mark_written()
+                logging.info("Reservation canceled successfully.")
+            else:
+                lookup.invalidate()
+                logging.warning("Reservation not found.")
 
     @staticmethod
+    @timed
     def load_reservations_data():
         """
         Load reservations data from reservations.json file.
@@ -134,7 +325,321 @@ class Reservation:
         Returns:
             list: A list of reservations data.
         """
-        if os.path.exists("reservations.json"):
-            with open("reservations.json", "r", encoding="utf-8") as file:
-                return json.load(file)
-        return []
+        return Reservation.storage.load()
+
+    @staticmethod
+    def set_integrity(on_delete="reject"):
+        """
+        Turns the referential integrity checks on or off.
+
+        Args:
+            on_delete (str, optional): "reject" to refuse deleting a
+            customer or hotel that has reservations, "cascade" to
+            cancel its reservations first, or None to stop checking.
+            Defaults to "reject".
+
+        Raises:
+            ValueError: If the policy is unknown.
+        """
+        if on_delete is not None and on_delete not in ON_DELETE:
+            raise ValueError(f"Unknown on_delete policy: {on_delete}")
+        with Reservation._lock:
+            Reservation.integrity = on_delete
+            for cls, guard in ((Customer, _customer_guard),
+                               (Hotel, _hotel_guard)):
+                if guard in cls.delete_guards:
+                    cls.delete_guards.remove(guard)
+                if on_delete is not None:
+                    cls.delete_guards.append(guard)
+
+    @staticmethod
+    def _reference_problem(record):
+        """
+        Explains why a reservation refers to a missing customer, hotel
+        or room, when integrity checks are on.
+
+        Args:
+            record (dict): The reservation record.
+
+        Returns:
+            str: The reason the booking is rejected, or None.
+        """
+        if Reservation.integrity is None:
+            return None
+        return reference_problem(Customer.keys(), Hotel.keys(), record)
+
+    @staticmethod
+    def _referenced(field, names):
+        """
+        Applies the on_delete policy to customers or hotels about to be
+        deleted.
+
+        Args:
+            field (str): "customer_name" or "hotel_name".
+            names (list): The names about to be deleted.
+
+        Returns:
+            set: The names that must not be deleted because they still
+            have reservations (always empty when cascading).
+        """
+        with Reservation._lock:
+            lookup = Reservation.lookup()
+            listing = lookup.for_customer if field == "customer_name" \
+                else lookup.for_hotel
+            referenced = {}
+            for name in set(names):
+                records = listing(name)
+                if records:
+                    referenced[name] = records
+            if referenced and Reservation.integrity == "cascade":
+                Reservation.cancel_reservations_many(
+                    [reservation_key(record)
+                     for records in referenced.values()
+                     for record in records])
+                return set()
+            return set(referenced)
+
+    @staticmethod
+    def availability():
+        """
+        Returns the availability index of the current storage backend.
+
+        The index is built on first use and rebuilt whenever the
+        storage is changed by something other than this class.
+
+        Returns:
+            AvailabilityIndex: The index.
+        """
+        with Reservation._lock:
+            index = Reservation._availability
+            if index is None or index.storage is not Reservation.storage:
+                index = AvailabilityIndex(Reservation.storage)
+                Reservation._availability = index
+            return index
+
+    @staticmethod
+    def lookup():
+        """
+        Returns the lookup index of the current storage backend.
+
+        The index is built on first use and rebuilt whenever the
+        storage is changed by something other than this class.
+
+        Returns:
+            ReservationIndex: The index.
+        """
+        with Reservation._lock:
+            index = Reservation._lookup
+            if index is None or index.storage is not Reservation.storage:
+                index = ReservationIndex(Reservation.storage)
+                Reservation._lookup = index
+            return index
+
+    @staticmethod
+    @timed
+    def find_reservation(customer_name, hotel_name, room_number,
+                         check_in_date):
+        """
+        Looks up a reservation by customer, hotel, room and check-in.
+
+        Args:
+            customer_name (str): The name of the customer.
+            hotel_name (str): The name of the hotel.
+            room_number (int): The number of the room.
+            check_in_date (str): The date of check-in.
+
+        Returns:
+            dict: The reservation record, or None if there is none.
+        """
+        with Reservation._lock:
+            return Reservation.lookup().get(customer_name, hotel_name,
+                                            room_number, check_in_date)
+
+    @staticmethod
+    @timed
+    def reservations_for_customer(customer_name):
+        """
+        Lists the reservations of a customer.
+
+        Args:
+            customer_name (str): The name of the customer.
+
+        Returns:
+            list: The reservation records, in booking order.
+        """
+        with Reservation._lock:
+            return Reservation.lookup().for_customer(customer_name)
+
+    @staticmethod
+    @timed
+    def reservations_for_hotel(hotel_name):
+        """
+        Lists the reservations of a hotel.
+
+        Args:
+            hotel_name (str): The name of the hotel.
+
+        Returns:
+            list: The reservation records, in booking order.
+        """
+        with Reservation._lock:
+            return Reservation.lookup().for_hotel(hotel_name)
+
+    @staticmethod
+    @timed
+    def available_rooms(hotel_name, check_in_date, check_out_date=None,
+                        rooms=None):
+        """
+        Lists the rooms of a hotel that are free for a whole stay.
+
+        Args:
+            hotel_name (str): The name of the hotel.
+            check_in_date (str): The date of check-in.
+            check_out_date (str, optional): The date of check-out.
+            rooms (iterable, optional): The room numbers to consider.
+            Defaults to rooms 1 to the number of rooms of the hotel
+            record, or no rooms if there is no such hotel.
+
+        Returns:
+            list: The free room numbers.
+        """
+        if rooms is None:
+            count = Hotel.keys().get(hotel_name)
+            rooms = range(1, count + 1) if isinstance(count, int) and \
+                not isinstance(count, bool) else ()
+        with Reservation._lock:
+            return Reservation.availability().free_rooms(
+                hotel_name, rooms, check_in_date, check_out_date)
+
+    @staticmethod
+    async def acreate_reservation(customer_name, hotel_name, room_number,
+                                  check_in_date, check_out_date=None):
+        """
+        Async counterpart of create_reservation, run off the event loop.
+
+        Returns:
+            Reservation: The new reservation, or None if it was rejected.
+        """
+        return await run_serialized(
+            Reservation.create_reservation, customer_name, hotel_name,
+            room_number, check_in_date, check_out_date)
+
+    @staticmethod
+    async def acreate_reservations(reservations):
+        """
+        Async counterpart of create_reservations, run off the event loop.
+
+        Returns:
+            list: The created Reservation (or None) for each entry.
+        """
+        return await run_serialized(Reservation.create_reservations,
+                                    list(reservations))
+
+    @staticmethod
+    async def acancel_reservation(customer_name, hotel_name, room_number,
+                                  check_in_date):
+        """
+        Async counterpart of cancel_reservation, run off the event loop.
+        """
+        await run_serialized(Reservation.cancel_reservation, customer_name,
+                             hotel_name, room_number, check_in_date)
+
+    @staticmethod
+    async def acancel_reservations_many(keys_or_predicate):
+        """
+        Async counterpart of cancel_reservations_many, run off the event
+        loop.
+
+        Returns:
+            list: (key, number of reservations canceled) pairs.
+        """
+        return await run_serialized(Reservation.cancel_reservations_many,
+                                    keys_or_predicate)
+
+    @staticmethod
+    async def aload_reservations_data():
+        """
+        Async counterpart of load_reservations_data, run off the event
+        loop.
+
+        Returns:
+            list: A list of reservations data.
+        """
+        return await run_blocking(Reservation.load_reservations_data)
+
+    @staticmethod
+    async def afind_reservation(customer_name, hotel_name, room_number,
+                                check_in_date):
+        """
+        Async counterpart of find_reservation, run off the event loop.
+
+        Returns:
+            dict: The reservation record, or None if there is none.
+        """
+        return await run_serialized(Reservation.find_reservation,
+                                    customer_name, hotel_name, room_number,
+                                    check_in_date)
+
+    @staticmethod
+    async def areservations_for_customer(customer_name):
+        """
+        Async counterpart of reservations_for_customer, run off the
+        event loop.
+
+        Returns:
+            list: The reservation records, in booking order.
+        """
+        return await run_serialized(Reservation.reservations_for_customer,
+                                    customer_name)
+
+    @staticmethod
+    async def areservations_for_hotel(hotel_name):
+        """
+        Async counterpart of reservations_for_hotel, run off the event
+        loop.
+
+        Returns:
+            list: The reservation records, in booking order.
+        """
+        return await run_serialized(Reservation.reservations_for_hotel,
+                                    hotel_name)
+
+    @staticmethod
+    async def aavailable_rooms(hotel_name, check_in_date,
+                               check_out_date=None, rooms=None):
+        """
+        Async counterpart of available_rooms, run off the event loop.
+
+        Returns:
+            list: The free room numbers.
+        """
+        return await run_serialized(Reservation.available_rooms, hotel_name,
+                                    check_in_date, check_out_date, rooms)
+
+
+def _customer_guard(names):
+    """
+    Delete guard of the Customer class (see Reservation.set_integrity).
+
+    Args:
+        names (list): The customer names about to be deleted.
+
+    Returns:
+        set: The names that must be kept.
+    """
+    return Reservation._referenced(  # pylint: disable=protected-access
+        "customer_name", names)
+
+
+def _hotel_guard(names):
+    """
+    Delete guard of the Hotel class (see Reservation.set_integrity).
+
+    Args:
+        names (list): The hotel names about to be deleted.
+
+    Returns:
+        set: The names that must be kept.
+    """
+    return Reservation._referenced(  # pylint: disable=protected-access
+        "hotel_name", names)
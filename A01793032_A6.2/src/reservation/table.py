@@ -0,0 +1,230 @@
+"""
+table.py - Columnar Reservation Table
+
+This module stores large numbers of reservations as a struct of arrays
+instead of one dictionary (or one object) per reservation:
+
+    - Customer and hotel names are interned into string tables and
+    stored as int ids.
+    - Room numbers are stored as ints.
+    - Check-in and check-out dates are stored as int day ordinals
+    (0 for a missing check-out date), so date comparisons never parse
+    strings.
+
+Every column is an array('i'), i.e. 4 bytes per reservation, so a
+table of 10 million reservations takes about 200 MB instead of several
+GB of dictionaries. Rows convert back to the JSON dict form of
+reservations.json on demand, one at a time, without materializing the
+whole list.
+
+Classes:
+    - ReservationTable: Reservations as parallel int columns.
+
+Example:
+    table = ReservationTable.from_records(Reservation.storage.load())
+    table.rows_for_hotel("Sample Hotel")
+    table.to_records()
+
+Author: Alejandra Mendoza Flores
+Date: October 19, 2026
+"""
+import sys
+
+from array import array
+from datetime import date
+
+from src.reservation.availability import to_ordinal
+
+COLUMNS = ("customer_ids", "hotel_ids", "rooms", "check_ins", "check_outs")
+
+
+class ReservationTable:
+    """
+    Reservations stored as parallel int columns.
+
+    Attributes:
+        names (list): The interned customer and hotel names, indexed by
+        the ids stored in customer_ids and hotel_ids.
+        customer_ids (array): Customer name id per reservation.
+        hotel_ids (array): Hotel name id per reservation.
+        rooms (array): Room number per reservation.
+        check_ins (array): Check-in day ordinal per reservation.
+        check_outs (array): Check-out day ordinal per reservation, or 0.
+    """
+
+    def __init__(self):
+        self.names = []
+        self._ids = {}
+        self.customer_ids = array("i")
+        self.hotel_ids = array("i")
+        self.rooms = array("i")
+        self.check_ins = array("i")
+        self.check_outs = array("i")
+
+    def __len__(self):
+        return len(self.rooms)
+
+    def __getitem__(self, position):
+        return self.record(position)
+
+    def __iter__(self):
+        for position in range(len(self)):
+            yield self.record(position)
+
+    def name_id(self, name):
+        """
+        Returns the id of a name, interning it if needed.
+
+        Args:
+            name (str): A customer or hotel name.
+
+        Returns:
+            int: The id.
+        """
+        name_id = self._ids.get(name)
+        if name_id is None:
+            interned = sys.intern(name)
+            name_id = self._ids[interned] = len(self.names)
+            self.names.append(interned)
+        return name_id
+
+    def find_name_id(self, name):
+        """
+        Returns the id of a name without interning it.
+
+        Args:
+            name (str): A customer or hotel name.
+
+        Returns:
+            int: The id, or None if the name is not in the table.
+        """
+        return self._ids.get(name)
+
+    def append(self, record):
+        """
+        Appends a reservation record.
+
+        The record is validated before any column changes, so a rejected
+        record leaves the table as it was.
+
+        Args:
+            record (dict): The reservation in its JSON dict form.
+
+        Raises:
+            ValueError: If a name is not a string, the room number is
+            not an integer or a date cannot be parsed.
+        """
+        customer_name = record["customer_name"]
+        hotel_name = record["hotel_name"]
+        for name in (customer_name, hotel_name):
+            if not isinstance(name, str):
+                raise ValueError(f"name must be a str: {name!r}")
+        room = record["room_number"]
+        if isinstance(room, bool) or not isinstance(room, int) or \
+                not -2 ** 31 <= room < 2 ** 31:
+            raise ValueError(f"room number must be an int: {room!r}")
+        check_out = record.get("check_out_date")
+        check_in = to_ordinal(record["check_in_date"])
+        check_out = 0 if check_out is None else to_ordinal(check_out)
+        customer_id = self.name_id(customer_name)
+        hotel_id = self.name_id(hotel_name)
+        self.customer_ids.append(customer_id)
+        self.hotel_ids.append(hotel_id)
+        self.rooms.append(room)
+        self.check_ins.append(check_in)
+        self.check_outs.append(check_out)
+
+    def extend(self, records):
+        """
+        Appends reservation records.
+
+        Args:
+            records (iterable): Reservations in their JSON dict form.
+        """
+        for record in records:
+            self.append(record)
+
+    @staticmethod
+    def from_records(records):
+        """
+        Builds a table from reservation records.
+
+        Args:
+            records (iterable): Reservations in their JSON dict form.
+
+        Returns:
+            ReservationTable: The table.
+        """
+        table = ReservationTable()
+        table.extend(records)
+        return table
+
+    def record(self, position):
+        """
+        Returns one reservation in its JSON dict form.
+
+        Args:
+            position (int): The row.
+
+        Returns:
+            dict: The reservation record.
+        """
+        check_out = self.check_outs[position]
+        return {
+            "customer_name": self.names[self.customer_ids[position]],
+            "hotel_name": self.names[self.hotel_ids[position]],
+            "room_number": self.rooms[position],
+            "check_in_date":
+                date.fromordinal(self.check_ins[position]).isoformat(),
+            "check_out_date":
+                date.fromordinal(check_out).isoformat() if check_out
+                else None}
+
+    def to_records(self):
+        """
+        Returns every reservation in its JSON dict form.
+
+        Returns:
+            list: The reservation records, in table order.
+        """
+        return list(self)
+
+    def rows_for_hotel(self, hotel_name):
+        """
+        Lists the rows of a hotel's reservations.
+
+        Args:
+            hotel_name (str): The name of the hotel.
+
+        Returns:
+            list: The row positions.
+        """
+        hotel_id = self.find_name_id(hotel_name)
+        if hotel_id is None:
+            return []
+        hotel_ids = self.hotel_ids
+        return [position for position in range(len(hotel_ids))
+                if hotel_ids[position] == hotel_id]
+
+    def nights(self, position):
+        """
+        Returns the number of nights of a reservation.
+
+        Args:
+            position (int): The row.
+
+        Returns:
+            int: The nights, 1 when there is no check-out date.
+        """
+        check_out = self.check_outs[position]
+        return check_out - self.check_ins[position] if check_out else 1
+
+    def nbytes(self):
+        """
+        Returns the memory taken by the columns.
+
+        Returns:
+            int: The size of the column buffers in bytes.
+        """
+        return sum(len(getattr(self, column)) *
+                   getattr(self, column).itemsize for column in COLUMNS)
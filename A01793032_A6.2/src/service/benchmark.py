@@ -0,0 +1,218 @@
+"""
+benchmark.py - Latency Benchmark Client for the HTTP Service
+
+This module measures the request latency of the service in server.py.
+Each client thread keeps one HTTP/1.1 connection alive and runs, for
+its share of the requests, a booking cycle: create a customer, look it
+up, book a room, list the customer's reservations and cancel the
+booking. The latency of every request is recorded and summarized per
+endpoint (mean, p50, p95, p99) together with the overall throughput.
+
+By default the benchmark starts its own server on a free port over a
+temporary data directory, so it can be run with no set-up at all.
+
+Functions:
+    - run_benchmark(host, port, cycles, concurrency): Runs the cycles
+    and returns the latencies per endpoint.
+    - summarize(latencies, elapsed): Turns latencies into statistics.
+    - main(argv): Command line entry point.
+
+Usage:
+    python -m src.service.benchmark --cycles 500 --concurrency 8
+    python -m src.service.benchmark --host 127.0.0.1 --port 8080
+
+Author: Alejandra Mendoza Flores
+Date: October 19, 2026
+"""
+import sys
+import json
+import time
+import argparse
+import tempfile
+import threading
+import http.client
+
+from urllib.parse import quote, urlencode
+
+from src.service.server import make_server
+
+
+def _request(connection, method, path, body=None):
+    """
+    Sends one request on a kept-alive connection and times it.
+
+    Args:
+        connection (http.client.HTTPConnection): The connection.
+        method (str): The HTTP method.
+        path (str): The request path and query.
+        body (dict, optional): The JSON body.
+
+    Returns:
+        tuple: (HTTP status, seconds taken).
+    """
+    data = None if body is None else json.dumps(body)
+    headers = {"Content-Type": "application/json"} if data else {}
+    start = time.perf_counter()
+    connection.request(method, path, body=data, headers=headers)
+    response = connection.getresponse()
+    response.read()
+    return response.status, time.perf_counter() - start
+
+
+def _client(host, port, worker, cycles, latencies, lock):
+    """
+    Runs the booking cycles of one client thread.
+
+    Args:
+        host (str): The server address.
+        port (int): The server port.
+        worker (int): The client number, used to make names unique.
+        cycles (int): The number of booking cycles to run.
+        latencies (dict): Shared latencies per endpoint.
+        lock (threading.Lock): Guards latencies.
+    """
+    connection = http.client.HTTPConnection(host, port)
+    timings = {}
+    for cycle in range(cycles):
+        name = f"bench-{worker}-{cycle}"
+        check_in = f"2030-{cycle % 12 + 1:02d}-{cycle % 28 + 1:02d}"
+        key = {"customer": name, "hotel": "Bench Hotel",
+               "room": worker * cycles + cycle + 1, "check_in": check_in}
+        steps = (
+            ("POST /customers", "POST", "/customers",
+             {"name": name, "email": f"{name}@example.com",
+              "phone": name}),
+            ("GET /customers/<name>", "GET", f"/customers/{quote(name)}",
+             None),
+            ("POST /reservations", "POST", "/reservations",
+             {"customer_name": name, "hotel_name": "Bench Hotel",
+              "room_number": key["room"], "check_in_date": check_in,
+              "check_out_date": None}),
+            ("GET /reservations", "GET",
+             "/reservations?" + urlencode({"customer": name}), None),
+            ("DELETE /reservations", "DELETE",
+             "/reservations?" + urlencode(key), None),
+        )
+        for label, method, path, body in steps:
+            _, seconds = _request(connection, method, path, body)
+            timings.setdefault(label, []).append(seconds)
+    connection.close()
+    with lock:
+        for label, values in timings.items():
+            latencies.setdefault(label, []).extend(values)
+
+
+def run_benchmark(host, port, cycles=200, concurrency=4):
+    """
+    Runs booking cycles from several kept-alive clients.
+
+    Args:
+        host (str): The server address.
+        port (int): The server port.
+        cycles (int, optional): Booking cycles per client.
+        concurrency (int, optional): The number of clients.
+
+    Returns:
+        tuple: (latencies in seconds per endpoint, elapsed seconds).
+    """
+    latencies = {}
+    lock = threading.Lock()
+    threads = [threading.Thread(target=_client,
+                                args=(host, port, worker, cycles,
+                                      latencies, lock))
+               for worker in range(concurrency)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies, time.perf_counter() - start
+
+
+def _percentile(values, fraction):
+    """
+    Returns a percentile of sorted values (nearest rank).
+
+    Args:
+        values (list): The sorted values.
+        fraction (float): The percentile, between 0 and 1.
+
+    Returns:
+        float: The value at that rank.
+    """
+    return values[min(int(fraction * len(values)), len(values) - 1)]
+
+
+def summarize(latencies, elapsed):
+    """
+    Turns the latencies into statistics in milliseconds.
+
+    Args:
+        latencies (dict): Latencies in seconds per endpoint.
+        elapsed (float): The wall time of the run in seconds.
+
+    Returns:
+        dict: Statistics per endpoint, plus "requests" and
+        "requests_per_second" totals.
+    """
+    summary = {}
+    total = 0
+    for label, values in latencies.items():
+        values = sorted(values)
+        total += len(values)
+        summary[label] = {
+            "count": len(values),
+            "mean_ms": round(sum(values) / len(values) * 1000, 3),
+            "p50_ms": round(_percentile(values, 0.50) * 1000, 3),
+            "p95_ms": round(_percentile(values, 0.95) * 1000, 3),
+            "p99_ms": round(_percentile(values, 0.99) * 1000, 3)}
+    summary["requests"] = total
+    summary["requests_per_second"] = round(total / elapsed, 1) \
+        if elapsed else 0.0
+    return summary
+
+
+def main(argv=None):
+    """
+    Runs the benchmark and prints the statistics as JSON.
+
+    Args:
+        argv (list, optional): Command line arguments.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=None,
+                        help="port of a running service; by default a "
+                             "service is started on a temporary directory")
+    parser.add_argument("--cycles", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args(argv)
+
+    server = None
+    directory = None
+    port = args.port
+    if port is None:
+        # pylint: disable=consider-using-with
+        directory = tempfile.TemporaryDirectory()
+        server = make_server(directory.name, args.host, 0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        port = server.server_address[1]
+    try:
+        connection = http.client.HTTPConnection(args.host, port)
+        _request(connection, "POST", "/hotels",
+                 {"name": "Bench Hotel", "location": "Benchmark",
+                  "rooms": args.cycles * args.concurrency})
+        connection.close()
+        latencies, elapsed = run_benchmark(args.host, port, args.cycles,
+                                           args.concurrency)
+    finally:
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+            server.service.close()
+            directory.cleanup()
+    print(json.dumps(summarize(latencies, elapsed), indent=2))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
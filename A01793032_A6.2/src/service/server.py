@@ -0,0 +1,432 @@
+"""
+server.py - Local HTTP Service for the Hotel Management System
+
+This module runs the Customer, Hotel and Reservation operations inside
+one long-running process and exposes them as JSON endpoints over HTTP,
+using only the standard library (http.server.ThreadingHTTPServer).
+
+The data is parsed once at start-up and then served from the in-memory
+indexes the classes already keep: CustomerRepository for customers,
+the lookup and availability indexes of Reservation for reservations,
+and a dictionary of hotels kept here. Every class is switched to a
+JournalStorage backend, so each mutation is one append to a .jsonl
+journal next to its JSON file and the JSON snapshots are rewritten only
+when a journal is compacted (and when the service stops).
+
+The journal is write-through, not write-behind: the append happens
+synchronously inside the request, and the response is only sent once
+it is done, so every acknowledged change is in the journal. What is
+deferred is the rewrite of the JSON snapshots, not the write itself.
+
+Responses always carry a Content-Length and the server speaks
+HTTP/1.1, so clients can keep their connection alive across requests.
+Malformed requests (a bad Content-Length, JSON body, field type or
+date) are answered with 400 instead of dropping the connection; after
+a bad Content-Length the connection is closed once the response is
+sent, since the body cannot be skipped.
+
+Endpoints:
+    - POST /customers {"name", "email", "phone"}: 201, 409 if the
+    email or phone is taken.
+    - GET, PATCH {"email", "phone"}, DELETE /customers/<name>.
+    - POST /hotels {"name", "location", "rooms"}: 201.
+    - GET, DELETE /hotels/<name>.
+    - GET /hotels/<name>/rooms?check_in=...&check_out=...: the free
+    rooms, numbered 1..rooms.
+    - POST /reservations {"customer_name", "hotel_name", "room_number",
+    "check_in_date", "check_out_date"}: 201, 400 if the dates are
+    invalid, 409 if the room is taken.
+    - GET /reservations?customer=... or ?hotel=...: the reservations.
+    - DELETE /reservations?customer=...&hotel=...&room=...&check_in=...
+
+Classes:
+    - HotelService: The in-memory data model and its operations.
+    - ServiceHandler: Maps HTTP requests to HotelService calls.
+
+Functions:
+    - make_server(data_dir, host, port): Builds a ready to run server.
+    - main(argv): Command line entry point.
+
+Usage:
+    python -m src.service.server --data-dir . --port 8080
+
+Author: Alejandra Mendoza Flores
+Date: October 19, 2026
+"""
+import os
+import sys
+import json
+import argparse
+import logging
+import threading
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from src.customer.customer import Customer
+from src.customer.repository import CustomerRepository
+from src.hotel.hotel import Hotel
+from src.reservation.availability import stay_interval
+from src.reservation.reservation import Reservation
+from src.storage.journal import JournalStorage
+
+
+def _room(value):
+    """
+    Parses a room number from a query string.
+
+    Args:
+        value (str): The room number as text.
+
+    Returns:
+        int or str: The number, as an int when it is numeric.
+    """
+    return int(value) if value.isdigit() else value
+
+
+def _has_name(body, field="name"):
+    """
+    Tells whether a request body names something.
+
+    Args:
+        body (dict): The decoded JSON body.
+        field (str, optional): The field holding the name.
+
+    Returns:
+        bool: True if the field is a non-empty string.
+    """
+    return isinstance(body.get(field), str) and bool(body[field])
+
+
+def _valid_stay(check_in_date, check_out_date):
+    """
+    Tells whether a request gives a valid stay.
+
+    Args:
+        check_in_date (object): The check-in date from the body.
+        check_out_date (object): The check-out date, or None.
+
+    Returns:
+        bool: True if both are "YYYY-MM-DD" strings (or the check-out
+        is missing) and the check-out is after the check-in.
+    """
+    if not isinstance(check_in_date, str) or \
+            not isinstance(check_out_date, (str, type(None))):
+        return False
+    try:
+        stay_interval(check_in_date, check_out_date)
+    except ValueError:
+        return False
+    return True
+
+
+class HotelService:
+    """
+    The hotel system data model, held in memory for a long-running
+    process.
+
+    Every operation runs under one lock: the indexes make each of them
+    a handful of dictionary operations plus at most one journal append.
+
+    Attributes:
+        data_dir (str): The directory with the JSON files.
+        customers (CustomerRepository): Indexed customers.
+    """
+
+    def __init__(self, data_dir="."):
+        self.data_dir = data_dir
+        self._lock = threading.Lock()
+        self._previous = (Customer.storage, Hotel.storage,
+                          Reservation.storage)
+        Customer.storage = JournalStorage(
+            os.path.join(data_dir, "customers.json"))
+        Hotel.storage = JournalStorage(os.path.join(data_dir, "hotels.json"))
+        Reservation.storage = JournalStorage(
+            os.path.join(data_dir, "reservations.json"))
+        self.customers = CustomerRepository(Customer.storage)
+        self._hotel_records = {}
+        self._hotels_signature = None
+        with self._lock:
+            self.customers.refresh()
+            self._hotel_index()
+            Reservation.lookup().refresh()
+            Reservation.availability().refresh()
+
+    def close(self):
+        """
+        Folds the journals into the JSON files and restores the storage
+        backends the classes had before.
+        """
+        with self._lock:
+            for storage in (Customer.storage, Hotel.storage,
+                            Reservation.storage):
+                if storage.exists():
+                    storage.save(storage.load())
+            Customer.storage, Hotel.storage, Reservation.storage = \
+                self._previous
+
+    def _hotel_index(self):
+        """
+        Returns the hotels by name, reloading them if hotels.json was
+        changed by another process.
+
+        Returns:
+            dict: The hotel records by name.
+        """
+        signature = Hotel.storage.signature()
+        if signature != self._hotels_signature:
+            self._hotel_records = {record["name"]: record
+                                   for record in Hotel.storage.load()}
+            self._hotels_signature = signature
+        return self._hotel_records
+
+    def handle(self, method, path, query, body):
+        """
+        Runs one request.
+
+        Args:
+            method (str): The HTTP method.
+            path (list): The decoded path segments.
+            query (dict): The query parameters (first value of each).
+            body (dict): The decoded JSON body, or an empty dict.
+
+        Returns:
+            tuple: (HTTP status, JSON serializable payload or None).
+        """
+        routes = {"customers": self._customers, "hotels": self._hotels,
+                  "reservations": self._reservations}
+        if not path or path[0] not in routes:
+            return 404, {"error": "unknown resource"}
+        with self._lock:
+            return routes[path[0]](method, path[1:], query, body)
+
+    def _customers(self, method, path, _query, body):
+        """
+        Runs a /customers request (arguments as in handle).
+        """
+        if method == "POST" and not path:
+            if not _has_name(body):
+                return 400, {"error": "name required"}
+            customer = self.customers.create(body["name"],
+                                             body.get("email"),
+                                             body.get("phone"))
+            if customer is None:
+                return 409, {"error": "email or phone already in use"}
+            return 201, customer.to_dict()
+        if len(path) != 1:
+            return 404, {"error": "unknown resource"}
+        name = path[0]
+        if method == "GET":
+            record = self.customers.get(name)
+            return (200, record) if record else (404, None)
+        if method == "PATCH":
+            if name not in self.customers:
+                return 404, None
+            if not self.customers.modify(name, email=body.get("email"),
+                                         phone=body.get("phone")):
+                return 409, {"error": "email or phone already in use"}
+            return 200, self.customers.get(name)
+        if method == "DELETE":
+            if self.customers.delete(name):
+                return 204, None
+            if name in self.customers:
+                return 409, {"error": "customer has reservations"}
+            return 404, None
+        return 405, None
+
+    def _hotels(self, method, path, query, body):
+        """
+        Runs a /hotels request (arguments as in handle).
+        """
+        hotels = self._hotel_index()
+        if method == "POST" and not path:
+            if not _has_name(body):
+                return 400, {"error": "name required"}
+            hotel = Hotel.create_hotel(body["name"],
+                                       body.get("location"),
+                                       body.get("rooms"))
+            record = hotel.to_dict()
+            hotels.setdefault(hotel.name, record)
+            self._hotels_signature = Hotel.storage.signature()
+            return 201, record
+        if not path or path[0] not in hotels:
+            return 404, None
+        record = hotels[path[0]]
+        if method == "GET" and len(path) == 1:
+            return 200, record
+        if method == "DELETE" and len(path) == 1:
+            if not Hotel.delete_hotel(record["name"]):
+                if record["name"] in self._hotel_index():
+                    return 409, {"error": "hotel has reservations"}
+                return 404, None
+            del hotels[record["name"]]
+            self._hotels_signature = Hotel.storage.signature()
+            return 204, None
+        if method == "GET" and path[1:] == ["rooms"]:
+            try:
+                rooms = Reservation.available_rooms(
+                    record["name"], query["check_in"],
+                    query.get("check_out"),
+                    rooms=range(1, int(record["rooms"]) + 1))
+            except (KeyError, TypeError, ValueError):
+                return 400, {"error": "invalid dates"}
+            return 200, rooms
+        return 405, None
+
+    def _reservations(self, method, path, query, body):
+        """
+        Runs a /reservations request (arguments as in handle).
+        """
+        if path:
+            return 404, None
+        if method == "POST":
+            if any(body.get(field) is None for field in
+                   ("customer_name", "hotel_name", "room_number",
+                    "check_in_date")):
+                return 400, {"error": "missing reservation fields"}
+            if not _has_name(body, "customer_name") or \
+                    not _has_name(body, "hotel_name"):
+                return 400, {"error": "names must be strings"}
+            if not _valid_stay(body["check_in_date"],
+                               body.get("check_out_date")):
+                return 400, {"error": "invalid dates"}
+            reservation = Reservation.create_reservation(
+                body.get("customer_name"), body.get("hotel_name"),
+                body.get("room_number"), body.get("check_in_date"),
+                body.get("check_out_date"))
+            if reservation is None:
+                return 409, {"error": "room not available"}
+            return 201, reservation.to_dict()
+        if method == "GET":
+            if "customer" in query:
+                return 200, Reservation.reservations_for_customer(
+                    query["customer"])
+            if "hotel" in query:
+                return 200, Reservation.reservations_for_hotel(
+                    query["hotel"])
+            return 400, {"error": "customer or hotel required"}
+        if method == "DELETE":
+            try:
+                key = (query["customer"], query["hotel"],
+                       _room(query["room"]), query["check_in"])
+            except KeyError:
+                return 400, {"error": "customer, hotel, room and "
+                                      "check_in required"}
+            if Reservation.find_reservation(*key) is None:
+                return 404, None
+            Reservation.cancel_reservation(*key)
+            return 204, None
+        return 405, None
+
+
+class ServiceHandler(BaseHTTPRequestHandler):
+    """
+    Decodes HTTP requests for the HotelService of the server.
+    """
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def _dispatch(self):
+        """
+        Decodes the request, runs it and writes the JSON response.
+        """
+        url = urlsplit(self.path)
+        path = [unquote(segment) for segment in url.path.split("/")
+                if segment]
+        query = {name: values[0]
+                 for name, values in parse_qs(url.query).items()}
+        length = self.headers.get("Content-Length") or "0"
+        if not length.isdigit():
+            # The body cannot be skipped, so the connection is closed
+            # after the response.
+            self.close_connection = True
+            status, payload = 400, {"error": "invalid Content-Length"}
+        else:
+            status, payload = self._run(path, query, int(length))
+        data = b"" if payload is None else json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _run(self, path, query, length):
+        """
+        Reads the body and runs the request.
+
+        Args:
+            path (list): The decoded path segments.
+            query (dict): The query parameters.
+            length (int): The length of the body.
+
+        Returns:
+            tuple: (HTTP status, JSON serializable payload or None).
+        """
+        try:
+            body = json.loads(self.rfile.read(length)) if length else {}
+        except ValueError:
+            body = None
+        if not isinstance(body, dict):
+            return 400, {"error": "invalid JSON body"}
+        if not path:
+            return 404, {"error": "unknown resource"}
+        try:
+            return self.server.service.handle(self.command, path, query,
+                                              body)
+        except (TypeError, ValueError) as error:
+            logging.warning("Rejected %s %s: %s", self.command, self.path,
+                            error)
+            return 400, {"error": "invalid request"}
+
+    do_GET = do_POST = do_PATCH = do_DELETE = _dispatch
+
+    def log_message(self, *args):  # pylint: disable=arguments-differ
+        logging.debug("%s - %s", self.address_string(),
+                      args[0] % args[1:])
+
+
+def make_server(data_dir=".", host="127.0.0.1", port=8080):
+    """
+    Builds a server around a new HotelService.
+
+    Args:
+        data_dir (str, optional): The directory with the JSON files.
+        host (str, optional): The address to listen on.
+        port (int, optional): The port to listen on, 0 for any.
+
+    Returns:
+        ThreadingHTTPServer: The server, with the service as its
+        service attribute.
+    """
+    server = ThreadingHTTPServer((host, port), ServiceHandler)
+    server.daemon_threads = True
+    server.service = HotelService(data_dir)
+    return server
+
+
+def main(argv=None):
+    """
+    Runs the service until interrupted.
+
+    Args:
+        argv (list, optional): Command line arguments.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--data-dir", default=".")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.WARNING)
+    server = make_server(args.data_dir, args.host, args.port)
+    print(f"Serving on http://{args.host}:{server.server_address[1]}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        server.service.close()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,124 @@
+"""
+cache.py - Parsed-File Cache for JSON Storage Reads
+
+This module keeps the parsed content of recently read JSON files so
+that loading a file that has not changed since the last read does not
+parse it again. Entries are keyed by the file path and validated with
+the file signature (inode, size, mtime in nanoseconds) taken by the
+caller, so any rewrite, including an atomic rename by another process,
+is detected on the next read.
+
+Readers always get fresh copies of the cached records, so mutating a
+loaded list (as the storage operations do) never alters the cache.
+Writers store what they wrote under the new signature, so a read that
+follows one of our own writes is a hit as well.
+
+Classes:
+    - LoadCache: Parsed records per file, with hit and miss counters.
+
+Attributes:
+    - LOAD_CACHE: The cache shared by every JsonFileStorage.
+
+Author: Alejandra Mendoza Flores
+Date: October 19, 2026
+"""
+import threading
+
+
+def _copy(records):
+    """
+    Copies a list of flat records.
+
+    Args:
+        records (list): The records.
+
+    Returns:
+        list: A new list of new dictionaries.
+    """
+    return [dict(record) if isinstance(record, dict) else record
+            for record in records]
+
+
+class LoadCache:
+    """
+    Parsed records of recently read files.
+
+    Attributes:
+        max_entries (int): The number of files kept; the least recently
+        stored file is dropped first.
+        hits (int): Reads served from the cache.
+        misses (int): Reads that had to parse the file.
+    """
+
+    def __init__(self, max_entries=64):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def get(self, path, signature):
+        """
+        Returns a copy of the cached records of a file.
+
+        Args:
+            path (str): The file path.
+            signature (tuple): The current signature of the file.
+
+        Returns:
+            list: The records, or None (counted as a miss) if the file
+            is not cached under this signature.
+        """
+        with self._lock:
+            entry = self._entries.get(path)
+            if signature is None or entry is None or entry[0] != signature:
+                self.misses += 1
+                return None
+            self.hits += 1
+            records = entry[1]
+        return _copy(records)
+
+    def put(self, path, signature, records):
+        """
+        Caches the records of a file.
+
+        Args:
+            path (str): The file path.
+            signature (tuple): The signature of the file content the
+            records came from, or None to only drop the entry.
+            records (list): The parsed records.
+        """
+        with self._lock:
+            self._entries.pop(path, None)
+            if signature is None:
+                return
+            self._entries[path] = (signature, _copy(records))
+            while len(self._entries) > self.max_entries:
+                del self._entries[next(iter(self._entries))]
+
+    def invalidate(self, path=None):
+        """
+        Drops one file, or every file, from the cache.
+
+        Args:
+            path (str, optional): The file path. Defaults to None (all).
+        """
+        with self._lock:
+            if path is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(path, None)
+
+    def stats(self):
+        """
+        Returns the cache counters.
+
+        Returns:
+            dict: hits, misses and the number of cached files.
+        """
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses,
+                    "entries": len(self._entries)}
+
+
+LOAD_CACHE = LoadCache()
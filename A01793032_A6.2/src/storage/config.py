@@ -0,0 +1,112 @@
+"""
+config.py - Storage Configuration for the Hotel Management System
+
+This module points the Customer, Hotel and Reservation classes at their
+storage in one call, instead of assigning the three storage class
+attributes by hand.
+
+The location is either a data directory, holding customers.json,
+hotels.json and reservations.json, or a backend. A backend is a name
+from BACKENDS or a function taking the file path and returning a
+storage object; "memory" gives every class a fresh MemoryStorage, so
+nothing touches the disk. Without a data directory the files go where
+data_path() puts them: the HOTEL_DATA_DIR directory, or the working
+directory.
+
+Functions:
+    - configure_storage(data_dir, backend): Replaces the storage of the
+    three classes.
+    - restore_storage(previous): Puts back what configure_storage
+    replaced.
+    - storage_scope(data_dir, backend): Context manager doing both.
+
+Example:
+    with storage_scope(backend="memory"):
+        Customer.create_customer("Ana", "ana@example.com", "555-0101")
+
+Author: Alejandra Mendoza Flores
+Date: October 19, 2026
+"""
+import os
+
+from contextlib import contextmanager
+
+from src.customer.customer import Customer
+from src.hotel.hotel import Hotel
+from src.reservation.reservation import Reservation
+from src.storage.journal import JournalStorage
+from src.storage.memory import MemoryStorage
+from src.storage.storage import JsonFileStorage, data_path
+from src.storage.wal import WalStorage
+
+CLASSES = ((Customer, "customers.json"), (Hotel, "hotels.json"),
+           (Reservation, "reservations.json"))
+
+BACKENDS = {
+    "json": JsonFileStorage,
+    "journal": JournalStorage,
+    "wal": WalStorage,
+    "memory": lambda path: MemoryStorage(),
+}
+
+
+def configure_storage(data_dir=None, backend="json"):
+    """
+    Gives the Customer, Hotel and Reservation classes new storage.
+
+    Args:
+        data_dir (str, optional): The directory of the data files.
+        Defaults to data_path(), the HOTEL_DATA_DIR directory or the
+        working directory.
+        backend (str or callable, optional): A name from BACKENDS, or a
+        function taking a file path and returning a storage object.
+        Defaults to "json".
+
+    Returns:
+        tuple: The replaced storage of each class, for
+        restore_storage().
+
+    Raises:
+        ValueError: If the backend name is unknown.
+    """
+    if not callable(backend):
+        try:
+            backend = BACKENDS[backend]
+        except KeyError:
+            raise ValueError(f"Unknown storage backend: {backend}") \
+                from None
+    previous = tuple(cls.storage for cls, _ in CLASSES)
+    for cls, name in CLASSES:
+        cls.storage = backend(data_path(name) if data_dir is None
+                              else os.path.join(data_dir, name))
+    return previous
+
+
+def restore_storage(previous):
+    """
+    Gives the classes back the storage configure_storage replaced.
+
+    Args:
+        previous (tuple): The value returned by configure_storage().
+    """
+    for (cls, _), storage in zip(CLASSES, previous):
+        cls.storage = storage
+
+
+@contextmanager
+def storage_scope(data_dir=None, backend="json"):
+    """
+    Uses new storage for the classes for the duration of a block.
+
+    Args:
+        data_dir (str, optional): The directory of the data files.
+        backend (str or callable, optional): See configure_storage().
+
+    Yields:
+        None
+    """
+    previous = configure_storage(data_dir, backend)
+    try:
+        yield
+    finally:
+        restore_storage(previous)
@@ -0,0 +1,334 @@
+"""
+journal.py - Append-Only Journal Storage
+
+This module defines JournalStorage, a storage backend that never
+rewrites its data file on a single mutation. The records live in two
+files:
+
+    - The snapshot (for example customers.json): the records written
+    with the storage's serializer, in any format JsonFileStorage reads
+    (see src/storage/serializers.py).
+    - The journal (for example customers.jsonl): JSON Lines, one
+    operation per line, applied on top of the snapshot. Creates append
+    an "add" line, deletes a "remove" tombstone and modifications an
+    "update" patch.
+
+The first journal line records the digest of the snapshot it applies
+to. Once the journal reaches compact_threshold operations, the current
+records are written to a new snapshot (atomically, through a temporary
+file and a rename) and the journal is restarted with a header for the
+new snapshot. If the process dies between the two steps, or the
+snapshot is rewritten by something else, the digests no longer match
+and the stale journal is ignored instead of being applied twice.
+
+A line that was only partially written when the process died is
+ignored and truncated before the next append.
+
+The parsed records are kept in memory and refreshed incrementally from
+the journal tail, so a create costs one append regardless of how many
+records are stored. That state is guarded by a lock, so reads from a
+thread pool (see src/aio) can run while another thread writes.
+
+Reads, parses, scans and writes are reported to the metrics registry
+(see src/metrics) like JsonFileStorage does, labelled with the name of
+the snapshot or journal file.
+
+Classes:
+    - JournalStorage: Append-only journal backend.
+
+Example:
+    Customer.storage = JournalStorage("customers.json")
+
+Author: Alejandra Mendoza Flores
+Date: October 19, 2026
+"""
+import os
+import json
+import hashlib
+import threading
+
+from src.metrics.metrics import (READ_BYTES, SCANNED_RECORDS,
+                                 STORAGE_SECONDS, WRITTEN_BYTES,
+                                 get_registry)
+from src.storage.serializers import read_records
+from src.storage.storage import (JsonFileStorage, apply_operation,
+                                 file_signature)
+
+
+def _digest(data):
+    """
+    Hashes the content of a snapshot.
+
+    Args:
+        data (bytes): The snapshot content.
+
+    Returns:
+        str: The hexadecimal digest.
+    """
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+class JournalStorage(JsonFileStorage):
+    """
+    Stores records as a JSON snapshot plus an append-only journal.
+
+    Attributes:
+        path (str): The path of the snapshot file.
+        journal_path (str): The path of the journal file.
+        compact_threshold (int): Number of journal operations after
+        which the journal is folded into a new snapshot.
+        serializer (object): The format used to write the snapshot.
+        Defaults to the original JSON format.
+    """
+
+    def __init__(self, path, journal_path=None, compact_threshold=1000,
+                 serializer=None):
+        super().__init__(path, serializer=serializer)
+        self.journal_path = journal_path or \
+            os.path.splitext(path)[0] + ".jsonl"
+        self.compact_threshold = compact_threshold
+        self._records = []
+        self._snapshot_signature = None
+        self._journal_signature = None
+        self._digest = None
+        self._offset = 0
+        self._entries = 0
+        self._stale_journal = True
+        self._loaded = False
+        self._state_lock = threading.RLock()
+
+    def exists(self):
+        return os.path.exists(self.path) or \
+            os.path.exists(self.journal_path)
+
+    def signature(self):
+        return (file_signature(self.path),
+                file_signature(self.journal_path))
+
+    def _reload(self):
+        """
+        Reads the snapshot and replays the whole journal.
+        """
+        registry = get_registry()
+        name = os.path.basename(self.path)
+        self._snapshot_signature = file_signature(self.path)
+        data = b""
+        if self._snapshot_signature is not None:
+            with registry.timer(STORAGE_SECONDS, file=name, phase="load"):
+                with open(self.path, "rb") as file:
+                    data = file.read()
+            registry.count(READ_BYTES, len(data), file=name)
+        with registry.timer(STORAGE_SECONDS, file=name, phase="parse"):
+            self._records = read_records(data) if data.strip() else []
+        self._digest = _digest(data) if data else None
+        self._journal_signature = None
+        self._offset = 0
+        self._entries = 0
+        self._stale_journal = True
+        self._loaded = True
+        self._read_journal()
+
+    def _read_journal(self):
+        """
+        Applies the journal operations appended since the last read.
+        """
+        signature = file_signature(self.journal_path)
+        if signature is None:
+            self._journal_signature = None
+            return
+        if signature == self._journal_signature:
+            return
+
+        registry = get_registry()
+        name = os.path.basename(self.journal_path)
+        with registry.timer(STORAGE_SECONDS, file=name, phase="load"):
+            with open(self.journal_path, "rb") as file:
+                file.seek(self._offset)
+                data = file.read()
+        registry.count(READ_BYTES, len(data), file=name)
+        end = 0
+        lines = data[:data.rfind(b"\n") + 1].splitlines(keepends=True)
+        with registry.timer(STORAGE_SECONDS, file=name, phase="parse"):
+            for line in lines:
+                entry = self._decode_entry(line)
+                if entry is None:
+                    break
+                end += len(line)
+                if entry.get("op") == "base":
+                    self._stale_journal = \
+                        entry.get("digest") != self._digest
+                elif not self._stale_journal:
+                    apply_operation(self._records, entry)
+                    self._entries += 1
+        self._offset += end
+        self._journal_signature = signature
+
+    def _refresh(self):
+        """
+        Brings the in-memory records up to date with the files.
+        """
+        if not self._loaded or \
+                file_signature(self.path) != self._snapshot_signature:
+            self._reload()
+            return
+        journal_signature = file_signature(self.journal_path)
+        if self._journal_signature is not None and \
+                (journal_signature is None or
+                 journal_signature[0] != self._journal_signature[0] or
+                 journal_signature[1] < self._offset):
+            self._reload()
+            return
+        self._read_journal()
+
+    def _encode_entry(self, entry):
+        """
+        Encodes a journal entry as one line.
+
+        Args:
+            entry (dict): The operation or header.
+
+        Returns:
+            str: The line, without the newline.
+        """
+        return json.dumps(entry)
+
+    def _decode_entry(self, line):
+        """
+        Decodes one journal line.
+
+        Args:
+            line (bytes): The line, with its newline.
+
+        Returns:
+            dict: The entry, or None to stop reading at this line.
+        """
+        return json.loads(line)
+
+    def _write_file(self, path, data):
+        """
+        Atomically replaces a file through a temporary file.
+
+        Args:
+            path (str): The file to replace.
+            data (bytes): The new content.
+        """
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as file:
+            file.write(data)
+        os.replace(temp_path, path)
+
+    def _write_counted(self, path, data):
+        """
+        Replaces a file through _write_file, reporting the write to the
+        metrics registry.
+
+        Args:
+            path (str): The file to replace.
+            data (bytes): The new content.
+        """
+        registry = get_registry()
+        name = os.path.basename(path)
+        with registry.timer(STORAGE_SECONDS, file=name, phase="write"):
+            self._write_file(path, data)
+        registry.count(WRITTEN_BYTES, len(data), file=name)
+
+    def _start_journal(self, lines=()):
+        """
+        Atomically replaces the journal with a header and some lines.
+
+        Args:
+            lines (iterable): Encoded operations to follow the header.
+        """
+        header = self._encode_entry({"op": "base", "digest": self._digest})
+        data = "".join(f"{line}\n" for line in (header, *lines))
+        data = data.encode("utf-8")
+        self._write_counted(self.journal_path, data)
+        self._stale_journal = False
+        self._offset = len(data)
+        self._journal_signature = file_signature(self.journal_path)
+
+    def _append(self, lines):
+        """
+        Appends encoded operations to the journal with a single write.
+
+        Args:
+            lines (list): The encoded operations.
+        """
+        if self._stale_journal or self._journal_signature is None:
+            self._start_journal(lines)
+            return
+        if self._journal_signature[1] > self._offset:
+            os.truncate(self.journal_path, self._offset)
+        data = "".join(f"{line}\n" for line in lines).encode("utf-8")
+        registry = get_registry()
+        name = os.path.basename(self.journal_path)
+        with registry.timer(STORAGE_SECONDS, file=name, phase="write"):
+            descriptor = os.open(self.journal_path,
+                                 os.O_WRONLY | os.O_APPEND)
+            try:
+                os.write(descriptor, data)
+            finally:
+                os.close(descriptor)
+        registry.count(WRITTEN_BYTES, len(data), file=name)
+        self._offset += len(data)
+        self._journal_signature = file_signature(self.journal_path)
+
+    def load(self):
+        with self._state_lock:
+            self._refresh()
+            return [dict(record) for record in self._records]
+
+    def save(self, records):
+        with self._state_lock:
+            self._records = [dict(record) for record in records]
+            self.compact()
+
+    def compact(self):
+        """
+        Writes the current records to a new snapshot and empties the
+        journal.
+        """
+        with self._state_lock:
+            with get_registry().timer(STORAGE_SECONDS,
+                                      file=os.path.basename(self.path),
+                                      phase="serialize"):
+                data = self.serializer.dumps(self._records)
+            self._write_counted(self.path, data)
+            self._snapshot_signature = file_signature(self.path)
+            self._digest = _digest(data)
+            self._entries = 0
+            self._loaded = True
+            self._start_journal()
+
+    def apply(self, operation):
+        return self.apply_many([operation])[0]
+
+    def apply_many(self, operations):
+        with self._state_lock:
+            self._refresh()
+            registry = get_registry()
+            name = os.path.basename(self.path)
+            if registry.enabled:
+                registry.observe(SCANNED_RECORDS, len(self._records) * sum(
+                    operation["op"] != "add" for operation in operations),
+                    file=name)
+            try:
+                with registry.timer(STORAGE_SECONDS, file=name,
+                                    phase="serialize"):
+                    encoded = [self._encode_entry(operation)
+                               for operation in operations]
+                with registry.timer(STORAGE_SECONDS, file=name,
+                                    phase="scan"):
+                    counts = [apply_operation(self._records, operation)
+                              for operation in operations]
+                lines = [line for line, count in zip(encoded, counts)
+                         if count]
+                if lines:
+                    self._append(lines)
+                    self._entries += len(lines)
+            except BaseException:
+                self._loaded = False
+                raise
+            if self._entries >= self.compact_threshold:
+                self.compact()
+            return counts
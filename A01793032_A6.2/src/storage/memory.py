@@ -0,0 +1,189 @@
+"""
+memory.py - In-Memory Record Storage
+
+This module defines MemoryStorage, a backend that keeps the records in
+a Python list instead of a file. It has the semantics of
+JsonFileStorage without the disk I/O:
+
+    - exists() is False until the first write, like a missing file.
+    - load() and find() return copies, so callers may mutate them.
+    - apply_many() applies a whole batch or, if an operation fails,
+    none of it.
+    - signature() changes on every write, so the indexes built on top
+    of it (see src/reservation) notice changes made by other objects.
+    - exclusive() serializes writers the way the file lock does.
+
+Each instance is private to the process, so tests that give every
+class its own MemoryStorage (see config.py) can run in parallel without
+sharing files.
+
+Classes:
+    - MemoryStorage: Records kept in memory.
+
+Example:
+    Customer.storage = MemoryStorage()
+
+Author: Alejandra Mendoza Flores
+Date: October 19, 2026
+"""
+import threading
+
+from src.storage.storage import apply_operation, matches
+
+
+class MemoryStorage:
+    """
+    Stores records in memory.
+
+    The storage exists from the start when initial records are given,
+    even an empty list.
+
+    Attributes:
+        version (int): The number of writes so far.
+    """
+
+    def __init__(self, records=None):
+        self._records = [dict(record) for record in records or ()]
+        self._exists = records is not None
+        self._lock = threading.RLock()
+        self.version = 0
+
+    def exclusive(self):
+        """
+        Holds the storage's write lock, so that a caller can check the
+        stored records and write without anyone writing in between.
+
+        Returns:
+            threading.RLock: The lock, to be used in a with statement.
+        """
+        return self._lock
+
+    def exists(self):
+        """
+        Tells whether the storage has been created.
+
+        Returns:
+            bool: True once records were given or written.
+        """
+        return self._exists
+
+    def signature(self):
+        """
+        Returns a value that changes whenever the stored data changes.
+
+        Returns:
+            tuple: The identity of the storage and its version, or None
+            if it does not exist.
+        """
+        if not self._exists:
+            return None
+        return (id(self), self.version)
+
+    def load(self):
+        """
+        Loads every record.
+
+        Returns:
+            list: Copies of the stored records.
+        """
+        with self._lock:
+            return [dict(record) for record in self._records]
+
+    def save(self, records):
+        """
+        Replaces every stored record.
+
+        Args:
+            records (list): The records to store.
+        """
+        records = [dict(record) for record in records]
+        with self._lock:
+            self._records = records
+            self._exists = True
+            self.version += 1
+
+    def apply(self, operation):
+        """
+        Applies one operation.
+
+        Args:
+            operation (dict): The operation to apply.
+
+        Returns:
+            int: The number of records affected.
+        """
+        return self.apply_many([operation])[0]
+
+    def apply_many(self, operations):
+        """
+        Applies several operations as one batch.
+
+        Args:
+            operations (list): The operations to apply, in order.
+
+        Returns:
+            list: The number of records affected by each operation.
+        """
+        with self._lock:
+            records = [dict(record) for record in self._records]
+            counts = [apply_operation(records, operation)
+                      for operation in operations]
+            if any(counts):
+                self.save(records)
+        return counts
+
+    def find(self, match):
+        """
+        Returns the records matching the given fields.
+
+        Args:
+            match (dict): The field values to look for.
+
+        Returns:
+            list: Copies of the matching records, in storage order.
+        """
+        with self._lock:
+            return [dict(record) for record in self._records
+                    if matches(record, match)]
+
+    def add(self, record):
+        """
+        Adds a record.
+
+        Args:
+            record (dict): The record to add.
+
+        Returns:
+            int: Always 1.
+        """
+        return self.apply({"op": "add", "record": record})
+
+    def remove(self, match, limit=None):
+        """
+        Removes the records matching the given fields.
+
+        Args:
+            match (dict): The field values to look for.
+            limit (int, optional): The maximum number of records to
+            remove. Defaults to None (all matches).
+
+        Returns:
+            int: The number of records removed.
+        """
+        return self.apply({"op": "remove", "match": match, "limit": limit})
+
+    def update(self, match, changes, limit=1):
+        """
+        Updates the records matching the given fields.
+
+        Args:
+            match (dict): The field values to look for.
+            changes (dict): The fields to set.
+            limit (int, optional): The maximum number of records to
+            update. Defaults to 1.
+
+        Returns:
+            int: The number of records updated.
+        """
+        return self.apply({"op": "update", "match": match,
+                           "changes": changes, "limit": limit})
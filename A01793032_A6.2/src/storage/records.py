@@ -0,0 +1,707 @@
+"""
+records.py - Offset-Indexed Record File Storage
+
+This module defines RecordFileStorage, a storage backend that can read,
+update or remove one record without parsing the rest of the file. The
+records live in two files:
+
+    - The data file (for example customers.rec): a 16 byte header
+    (magic and generation) followed by slots. Every slot is a 16 byte
+    header (capacity, payload length, sequence number) and capacity
+    bytes holding one record as compact JSON. A slot with a payload
+    length of 0 is free.
+    - The index (for example customers.rec.idx): a JSON sidecar mapping
+    every live record to its slot and the key its key fields form, plus
+    the list of free slots.
+
+The data file is memory-mapped, so a lookup by key costs a dictionary
+lookup and a read of that record's bytes, however large the file is.
+An update that still fits in the slot is written in place, and slots
+are allocated with some spare room so small changes fit. A record that
+outgrows its slot is written to a free slot (first fit) or appended,
+and its old slot joins the free list. Records keep their sequence
+number when they move, so load() returns them in creation order.
+The memory map and the index are guarded by a lock, so reads from a
+thread pool (see src/aio) can run while another thread writes.
+
+The index only changes when records are added, removed or moved, so
+in-place updates never rewrite it. Before the first such change of a
+batch the generation in the data file header is incremented, and the
+index is written with the new generation at the end of the batch. An
+index whose generation does not match the data file (a process died in
+between, or the index was deleted) is rebuilt by scanning the slots; a
+slot that was only partly appended is truncated. In-place updates do
+not change the generation, so a slot that cannot be decoded when read
+(an update torn by a crash) also triggers a scan, which frees it.
+Every batch is fsynced before it returns.
+
+Loads, lookups and batches are reported to the metrics registry (see
+src/metrics) with the bytes of the slots they read and wrote and the
+number of records they read.
+
+Classes:
+    - RecordFileStorage: Offset-indexed record file backend.
+
+Example:
+    Customer.storage = RecordFileStorage("customers.rec", ("name",))
+    Customer.storage.save(JsonFileStorage("customers.json").load())
+
+Author: Alejandra Mendoza Flores
+Date: October 19, 2026
+"""
+import os
+import json
+import mmap
+import bisect
+import struct
+import threading
+
+from src.metrics.metrics import (READ_BYTES, SCANNED_RECORDS,
+                                 STORAGE_SECONDS, WRITTEN_BYTES,
+                                 get_registry)
+from src.storage.storage import (JsonFileStorage, file_signature,
+                                 fsync_directory, matches)
+
+DATA_MAGIC = b"HOTELRS1"
+DATA_HEADER = struct.Struct("<8sQ")
+SLOT_HEADER = struct.Struct("<IIQ")
+SLOT_ALIGNMENT = 16
+
+
+def _encode(record):
+    """
+    Encodes a record as a slot payload.
+
+    Args:
+        record (dict): The record.
+
+    Returns:
+        bytes: The compact JSON encoding.
+    """
+    return json.dumps(record, separators=(",", ":")).encode("utf-8")
+
+
+def _capacity(length):
+    """
+    Returns the slot capacity allocated for a payload.
+
+    A quarter of spare room is added so that records which grow a
+    little can still be updated in place.
+
+    Args:
+        length (int): The payload length.
+
+    Returns:
+        int: The capacity, a multiple of SLOT_ALIGNMENT.
+    """
+    padded = length + length // 4
+    return max(SLOT_ALIGNMENT,
+               -(-padded // SLOT_ALIGNMENT) * SLOT_ALIGNMENT)
+
+
+def _validate(operation):
+    """
+    Checks that an operation is well formed and its values can be
+    stored.
+
+    Args:
+        operation (dict): The operation to check.
+
+    Raises:
+        ValueError: If the operation is not valid.
+    """
+    kind = operation.get("op")
+    required = {"add": ("record",), "remove": ("match",),
+                "update": ("match", "changes")}.get(kind)
+    if required is None:
+        raise ValueError(f"Unknown storage operation: {kind}")
+    for field in required:
+        if not isinstance(operation.get(field), dict):
+            raise ValueError(f"Storage operation {kind} needs a {field}")
+    try:
+        _encode(operation.get("record") or operation.get("changes") or {})
+    except TypeError as error:
+        raise ValueError(f"Cannot store {kind} operation: {error}") \
+            from error
+
+
+class RecordFileStorage(JsonFileStorage):
+    """
+    Stores one record per slot of a memory-mapped file with a sidecar
+    index.
+
+    Operations whose match contains every key field only read the
+    records stored under that key; other matches read every record.
+
+    Attributes:
+        path (str): The path of the data file.
+        key_fields (tuple): The fields forming a record key.
+        index_path (str): The path of the index file.
+    """
+
+    def __init__(self, path, key_fields, index_path=None):
+        super().__init__(path, cache=None)
+        self.key_fields = tuple(key_fields)
+        self.index_path = index_path or f"{path}.idx"
+        self._slots = {}
+        self._keys = {}
+        self._free = []
+        self._end = DATA_HEADER.size
+        self._generation = 0
+        self._next_sequence = 0
+        self._data_inode = None
+        self._index_signature = None
+        self._map = None
+        self._dirty = False
+        self._undo = []
+        self._read_bytes = 0
+        self._read_records = 0
+        self._written_bytes = 0
+        self._state_lock = threading.RLock()
+
+    def _key(self, record):
+        """
+        Returns the key of a record.
+
+        Args:
+            record (dict): The record.
+
+        Returns:
+            tuple: The values of the key fields.
+        """
+        return tuple(record.get(field) for field in self.key_fields)
+
+    def signature(self):
+        return (file_signature(self.path), file_signature(self.index_path))
+
+    def close(self):
+        """
+        Releases the memory map of the data file.
+        """
+        with self._state_lock:
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+
+    def _mapping(self, size):
+        """
+        Returns a memory map covering at least size bytes of the data
+        file, mapping it again if the file has grown.
+
+        Args:
+            size (int): The number of bytes that must be mapped.
+
+        Returns:
+            mmap: The read-only map.
+        """
+        if self._map is None or len(self._map) < size:
+            self.close()
+            with open(self.path, "rb") as file:
+                self._map = mmap.mmap(file.fileno(), 0,
+                                      access=mmap.ACCESS_READ)
+        return self._map
+
+    def _read(self, offset):
+        """
+        Reads the record stored in a slot.
+
+        Args:
+            offset (int): The slot offset.
+
+        Returns:
+            dict: The record, or None if the slot does not hold one (an
+            update torn by a crash).
+        """
+        start = offset + SLOT_HEADER.size
+        _, length, _ = SLOT_HEADER.unpack_from(self._mapping(start), offset)
+        self._read_bytes += SLOT_HEADER.size + length
+        self._read_records += 1
+        try:
+            record = json.loads(
+                self._mapping(start + length)[start:start + length])
+        except ValueError:
+            return None
+        return record if isinstance(record, dict) else None
+
+    def _read_many(self, sequences):
+        """
+        Reads the records of several slots, rebuilding the index first
+        if one of them cannot be decoded.
+
+        Args:
+            sequences (callable): Returns the sequence numbers to read.
+
+        Returns:
+            list: The records, in the order of the sequence numbers.
+        """
+        records = [self._read(self._slots[sequence][0])
+                   for sequence in sequences()]
+        if None in records:
+            self._scan()
+            records = [self._read(self._slots[sequence][0])
+                       for sequence in sequences()]
+        return records
+
+    def _report(self):
+        """
+        Reports the bytes read and written and the records read since
+        the last report to the metrics registry.
+        """
+        registry = get_registry()
+        name = os.path.basename(self.path)
+        registry.observe(SCANNED_RECORDS, self._read_records, file=name)
+        if self._read_bytes:
+            registry.count(READ_BYTES, self._read_bytes, file=name)
+        if self._written_bytes:
+            registry.count(WRITTEN_BYTES, self._written_bytes, file=name)
+        self._read_bytes = self._read_records = self._written_bytes = 0
+
+    def _reset(self):
+        """
+        Forgets the in-memory index.
+        """
+        self._slots = {}
+        self._keys = {}
+        self._free = []
+        self._end = DATA_HEADER.size
+        self._next_sequence = 0
+
+    def _add_slot(self, sequence, offset, capacity, key):
+        """
+        Adds a live slot to the in-memory index.
+        """
+        self._slots[sequence] = [offset, capacity, key]
+        bisect.insort(self._keys.setdefault(key, []), sequence)
+
+    def _drop_slot(self, sequence):
+        """
+        Removes a live slot from the in-memory index.
+
+        Returns:
+            list: The slot's [offset, capacity, key].
+        """
+        slot = self._slots.pop(sequence)
+        sequences = self._keys[slot[2]]
+        sequences.remove(sequence)
+        if not sequences:
+            del self._keys[slot[2]]
+        return slot
+
+    def _refresh(self):
+        """
+        Brings the in-memory index up to date with the files.
+        """
+        data_signature = file_signature(self.path)
+        if data_signature is None:
+            self.close()
+            self._reset()
+            self._data_inode = None
+            return
+        if data_signature[0] != self._data_inode:
+            self.close()
+        elif file_signature(self.index_path) == self._index_signature:
+            magic, generation = DATA_HEADER.unpack_from(
+                self._mapping(DATA_HEADER.size))
+            if magic == DATA_MAGIC and generation == self._generation:
+                return
+        self._data_inode = data_signature[0]
+        self._load_index()
+
+    def _load_index(self):
+        """
+        Reads the index file, or rebuilds it if it does not match the
+        data file.
+
+        Raises:
+            ValueError: If the data file is not a record file.
+        """
+        magic, generation = DATA_HEADER.unpack_from(
+            self._mapping(DATA_HEADER.size))
+        if magic != DATA_MAGIC:
+            raise ValueError(f"{self.path} is not a record file")
+        signature = file_signature(self.index_path)
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as file:
+                index = json.load(file)
+        except (OSError, ValueError):
+            index = None
+        if not isinstance(index, dict) or \
+                index.get("generation") != generation or \
+                index.get("key_fields") != list(self.key_fields):
+            self._scan()
+            return
+        self._reset()
+        for sequence, offset, capacity, key in index["slots"]:
+            self._add_slot(sequence, offset, capacity, tuple(key))
+        self._free = index["free"]
+        self._end = index["end"]
+        self._next_sequence = index["next_sequence"]
+        self._generation = generation
+        self._index_signature = signature
+
+    def _scan(self):
+        """
+        Rebuilds the index from the slots of the data file.
+        """
+        self.close()
+        with open(self.path, "rb") as file:
+            data = file.read()
+        self._read_bytes += len(data)
+        _, self._generation = DATA_HEADER.unpack_from(data)
+        self._reset()
+        live = []
+        offset = DATA_HEADER.size
+        while offset + SLOT_HEADER.size <= len(data):
+            capacity, length, sequence = SLOT_HEADER.unpack_from(data,
+                                                                 offset)
+            start = offset + SLOT_HEADER.size
+            if length > capacity or start + capacity > len(data):
+                break
+            record = None
+            if length:
+                try:
+                    record = json.loads(data[start:start + length])
+                except ValueError:
+                    record = None
+            if isinstance(record, dict):
+                live.append((sequence, offset, capacity, self._key(record)))
+            else:
+                self._free.append([offset, capacity])
+            offset = start + capacity
+        if offset < len(data):
+            os.truncate(self.path, offset)
+        for slot in sorted(live):
+            self._add_slot(*slot)
+        self._end = offset
+        self._next_sequence = max(self._slots, default=-1) + 1
+        self._write_index()
+
+    def _write_index(self):
+        """
+        Atomically replaces the index file with the in-memory index.
+        """
+        index = {"generation": self._generation,
+                 "key_fields": list(self.key_fields),
+                 "next_sequence": self._next_sequence,
+                 "end": self._end,
+                 "slots": [[sequence, offset, capacity, list(key)]
+                           for sequence, (offset, capacity, key)
+                           in self._slots.items()],
+                 "free": self._free}
+        temp_path = f"{self.index_path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(index, file, separators=(",", ":"))
+        os.replace(temp_path, self.index_path)
+        self._index_signature = file_signature(self.index_path)
+
+    def _candidates(self, match):
+        """
+        Returns the sequence numbers of the records that may match.
+
+        Args:
+            match (dict): The field values to look for.
+
+        Returns:
+            list: Sequence numbers in creation order.
+        """
+        if all(field in match for field in self.key_fields):
+            key = tuple(match[field] for field in self.key_fields)
+            return list(self._keys.get(key, ()))
+        return list(self._slots)
+
+    def load(self):
+        with self._state_lock:
+            with get_registry().timer(STORAGE_SECONDS,
+                                      file=os.path.basename(self.path),
+                                      phase="load"):
+                self._refresh()
+                records = self._read_many(lambda: list(self._slots))
+            self._report()
+            return records
+
+    def find(self, match):
+        with self._state_lock:
+            with get_registry().timer(STORAGE_SECONDS,
+                                      file=os.path.basename(self.path),
+                                      phase="scan"):
+                self._refresh()
+                records = self._read_many(lambda: self._candidates(match))
+                records = [record for record in records
+                           if matches(record, match)]
+            self._report()
+            return records
+
+    def save(self, records):
+        with self._state_lock:
+            self._save(records)
+            self._report()
+
+    def _save(self, records):
+        self.close()
+        generation = self._generation + 1
+        self._reset()
+        chunks = [DATA_HEADER.pack(DATA_MAGIC, generation)]
+        offset = DATA_HEADER.size
+        for sequence, record in enumerate(records):
+            payload = _encode(record)
+            capacity = _capacity(len(payload))
+            chunks.append(SLOT_HEADER.pack(capacity, len(payload), sequence))
+            chunks.append(payload.ljust(capacity, b"\0"))
+            self._add_slot(sequence, offset, capacity, self._key(record))
+            offset += SLOT_HEADER.size + capacity
+        data = b"".join(chunks)
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with get_registry().timer(STORAGE_SECONDS,
+                                  file=os.path.basename(self.path),
+                                  phase="write"):
+            with open(temp_path, "wb") as file:
+                file.write(data)
+                file.flush()
+                os.fsync(file.fileno())
+            os.replace(temp_path, self.path)
+            fsync_directory(self.path)
+        self._written_bytes += len(data)
+        self._end = offset
+        self._next_sequence = len(records)
+        self._generation = generation
+        self._data_inode = file_signature(self.path)[0]
+        self._write_index()
+
+    def _write_at(self, file, offset, data):
+        """
+        Writes bytes to the data file, remembering what they replace.
+
+        Args:
+            file (file): The data file, open for writing.
+            offset (int): Where to write.
+            data (bytes): The bytes to write.
+        """
+        file.seek(offset)
+        self._undo.append((offset, file.read(len(data))))
+        file.seek(offset)
+        file.write(data)
+        self._written_bytes += len(data)
+
+    def _rollback(self, file, state):
+        """
+        Restores the data file and the in-memory index after a batch
+        failed part way.
+
+        Args:
+            file (file): The data file, open for writing.
+            state (tuple): The index state saved before the batch.
+        """
+        for offset, data in reversed(self._undo):
+            file.seek(offset)
+            file.write(data)
+        file.truncate(state[3])
+        (self._slots, self._keys, self._free, self._end,
+         self._next_sequence, self._generation) = state
+        self._undo = []
+
+    def _state(self):
+        """
+        Returns a copy of the in-memory index, for _rollback.
+
+        Returns:
+            tuple: Slots, keys, free list, end of file, next sequence
+            number and generation.
+        """
+        return ({sequence: list(slot)
+                 for sequence, slot in self._slots.items()},
+                {key: list(sequences)
+                 for key, sequences in self._keys.items()},
+                [list(slot) for slot in self._free], self._end,
+                self._next_sequence, self._generation)
+
+    def _begin_change(self, file):
+        """
+        Invalidates the index before the first slot is added, freed or
+        moved in a batch.
+
+        Args:
+            file (file): The data file, open for writing.
+        """
+        if not self._dirty:
+            self._dirty = True
+            self._generation += 1
+            self._write_at(file, 0,
+                           DATA_HEADER.pack(DATA_MAGIC, self._generation))
+
+    def _write_slot(self, file, sequence, payload):
+        """
+        Writes a record to a free slot or to the end of the file.
+
+        Args:
+            file (file): The data file, open for writing.
+            sequence (int): The record's sequence number.
+            payload (bytes): The encoded record.
+
+        Returns:
+            tuple: The (offset, capacity) of the slot written.
+        """
+        length = len(payload)
+        for position, (offset, capacity) in enumerate(self._free):
+            if capacity >= length:
+                del self._free[position]
+                break
+        else:
+            offset = self._end
+            capacity = _capacity(length)
+            payload = payload.ljust(capacity, b"\0")
+            self._end += SLOT_HEADER.size + capacity
+        self._write_at(file, offset,
+                       SLOT_HEADER.pack(capacity, length, sequence) + payload)
+        return offset, capacity
+
+    def _free_slot(self, file, offset, capacity):
+        """
+        Marks a slot as free and adds it to the free list.
+
+        Args:
+            file (file): The data file, open for writing.
+            offset (int): The slot offset.
+            capacity (int): The slot capacity.
+        """
+        self._write_at(file, offset, SLOT_HEADER.pack(capacity, 0, 0))
+        self._free.append([offset, capacity])
+
+    def _release(self, file, sequence):
+        """
+        Frees the slot of a record.
+
+        Args:
+            file (file): The data file, open for writing.
+            sequence (int): The record's sequence number.
+        """
+        offset, capacity, _ = self._drop_slot(sequence)
+        self._free_slot(file, offset, capacity)
+
+    def _rewrite(self, file, sequence, record):
+        """
+        Stores an updated record, in place when it still fits.
+
+        A record that no longer fits is written to another slot before
+        its old slot is freed.
+
+        Args:
+            file (file): The data file, open for writing.
+            sequence (int): The record's sequence number.
+            record (dict): The updated record.
+        """
+        slot = self._slots[sequence]
+        offset, capacity, key = slot
+        payload = _encode(record)
+        new_key = self._key(record)
+        if len(payload) > capacity or new_key != key:
+            self._begin_change(file)
+        if len(payload) <= capacity:
+            self._write_at(file, offset, SLOT_HEADER.pack(
+                capacity, len(payload), sequence) + payload)
+        else:
+            slot[:2] = self._write_slot(file, sequence, payload)
+            self._free_slot(file, offset, capacity)
+        if new_key != key:
+            self._keys[key].remove(sequence)
+            if not self._keys[key]:
+                del self._keys[key]
+            bisect.insort(self._keys.setdefault(new_key, []), sequence)
+            slot[2] = new_key
+
+    def _apply_one(self, file, operation):
+        """
+        Applies one validated operation to the data file.
+
+        Returns:
+            int: The number of records affected.
+        """
+        if operation["op"] == "add":
+            record = dict(operation["record"])
+            self._begin_change(file)
+            offset, capacity = self._write_slot(
+                file, self._next_sequence, _encode(record))
+            self._add_slot(self._next_sequence, offset, capacity,
+                           self._key(record))
+            self._next_sequence += 1
+            return 1
+        match = operation["match"]
+        limit = operation.get("limit")
+        count = 0
+        for sequence in self._candidates(match):
+            if limit is not None and count >= limit:
+                break
+            record = self._read(self._slots[sequence][0])
+            if record is None or not matches(record, match):
+                continue
+            count += 1
+            if operation["op"] == "remove":
+                self._begin_change(file)
+                self._release(file, sequence)
+            else:
+                record.update(operation["changes"])
+                self._rewrite(file, sequence, record)
+        return count
+
+    def apply_many(self, operations):
+        """
+        Applies several operations as one batch.
+
+        Every operation is checked before anything is written. If one
+        still fails while the batch is being written, the bytes it
+        overwrote are put back and the file is truncated to its old
+        size, so either the whole batch is stored or none of it is.
+
+        Args:
+            operations (list): The operations to apply, in order.
+
+        Returns:
+            list: The number of records affected by each operation.
+
+        Raises:
+            ValueError: If an operation is malformed or a record cannot
+            be encoded.
+        """
+        for operation in operations:
+            _validate(operation)
+        with self._state_lock:
+            return self._apply_many(operations)
+
+    def _apply_many(self, operations):
+        try:
+            with get_registry().timer(STORAGE_SECONDS,
+                                      file=os.path.basename(self.path),
+                                      phase="write"):
+                return self._apply_batch(operations)
+        finally:
+            self._report()
+
+    def _apply_batch(self, operations):
+        """
+        Applies validated operations as one batch (see apply_many).
+
+        Returns:
+            list: The number of records affected by each operation.
+        """
+        self._refresh()
+        if self._data_inode is None:
+            self._save([])
+        state = self._state()
+        self._dirty = False
+        self._undo = []
+        with open(self.path, "r+b", buffering=0) as file:
+            try:
+                counts = [self._apply_one(file, operation)
+                          for operation in operations]
+            except BaseException:
+                self._rollback(file, state)
+                self._dirty = False
+                raise
+            os.fsync(file.fileno())
+        if self._dirty:
+            self._write_index()
+            self._dirty = False
+        self._undo = []
+        return counts
+
+    def apply(self, operation):
+        return self.apply_many([operation])[0]
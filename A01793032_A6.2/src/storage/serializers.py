@@ -0,0 +1,346 @@
+"""
+serializers.py - Pluggable Record Serialization Formats
+
+This module defines how a list of flat records is turned into the bytes
+of a data file and back. JsonFileStorage takes a serializer, so the
+customers, hotels and reservations files can use any of these formats:
+
+    - json: The original format, json.dump with default separators.
+    This is the default.
+    - compact-json: JSON with minimal separators, written by a
+    streaming encoder so no full-size string is built in memory.
+    - binary: A small struct header followed by a marshal payload in
+    which every repeated string (field names, hotel names, dates) is
+    stored once and referenced afterwards. Only read binary files you
+    wrote yourself: marshal is not meant for untrusted input.
+    - orjson: Compact JSON through the orjson extension, registered
+    only when orjson can be imported.
+
+Reading never depends on the configured serializer: read_records
+detects the binary header and otherwise parses JSON (with orjson when
+available), so a file converted to another format stays readable.
+
+Classes:
+    - JsonSerializer, CompactJsonSerializer, BinarySerializer,
+    OrjsonSerializer: The formats.
+
+Functions:
+    - get_serializer(name): Returns a registered serializer.
+    - read_records(data): Parses the bytes of a data file of any format.
+    - convert(source, target, name): Rewrites a data file in a format.
+    - benchmark(records, repeat): Measures every available format.
+    - main(argv): Command line entry point (convert and bench).
+
+Usage:
+    python -m src.storage.serializers convert reservations.json \
+reservations.bin --to binary
+    python -m src.storage.serializers bench reservations.json
+
+Author: Alejandra Mendoza Flores
+Date: October 19, 2026
+"""
+import os
+import sys
+import json
+import time
+import struct
+import marshal
+import argparse
+import tempfile
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+BINARY_MAGIC = b"HOTELREC"
+BINARY_HEADER = struct.Struct("<8sII")
+BINARY_VERSION = 1
+STREAM_CHUNK_SIZE = 1 << 16
+
+
+class JsonSerializer:
+    """
+    The original JSON format (json.dump with default separators).
+    """
+    name = "json"
+
+    def dumps(self, records):
+        """
+        Encodes records.
+
+        Args:
+            records (list): The records.
+
+        Returns:
+            bytes: The encoded records.
+        """
+        return json.dumps(records).encode("utf-8")
+
+    def loads(self, data):
+        """
+        Decodes records.
+
+        Args:
+            data (bytes): The encoded records.
+
+        Returns:
+            list: The records.
+        """
+        return json.loads(data)
+
+    def write(self, file, records):
+        """
+        Writes records to a binary file object.
+
+        Args:
+            file (file): The open file.
+            records (list): The records.
+        """
+        file.write(self.dumps(records))
+
+
+class CompactJsonSerializer(JsonSerializer):
+    """
+    JSON with minimal separators, written by a streaming encoder.
+    """
+    name = "compact-json"
+
+    def __init__(self):
+        self._encoder = json.JSONEncoder(separators=(",", ":"))
+
+    def dumps(self, records):
+        return self._encoder.encode(records).encode("utf-8")
+
+    def write(self, file, records):
+        buffered = []
+        size = 0
+        for chunk in self._encoder.iterencode(records):
+            buffered.append(chunk)
+            size += len(chunk)
+            if size >= STREAM_CHUNK_SIZE:
+                file.write("".join(buffered).encode("utf-8"))
+                buffered.clear()
+                size = 0
+        file.write("".join(buffered).encode("utf-8"))
+
+
+class OrjsonSerializer(JsonSerializer):
+    """
+    Compact JSON through the orjson extension.
+    """
+    name = "orjson"
+
+    def dumps(self, records):
+        return orjson.dumps(records)
+
+    def loads(self, data):
+        return orjson.loads(data)
+
+
+class BinarySerializer:
+    """
+    A struct header followed by a marshal payload with shared strings.
+
+    Equal strings are replaced by one canonical object before
+    marshalling, so marshal writes each of them once and refers back to
+    it afterwards, which acts as a string table.
+    """
+    name = "binary"
+
+    def dumps(self, records):
+        """
+        Encodes records.
+
+        Args:
+            records (list): The records.
+
+        Returns:
+            bytes: The header and the payload.
+        """
+        strings = {}
+        shared = []
+        for record in records:
+            shared.append({
+                strings.setdefault(field, field):
+                    strings.setdefault(value, value)
+                    if isinstance(value, str) else value
+                for field, value in record.items()})
+        payload = marshal.dumps(shared, 4)
+        return BINARY_HEADER.pack(BINARY_MAGIC, BINARY_VERSION,
+                                  len(shared)) + payload
+
+    def loads(self, data):
+        """
+        Decodes records.
+
+        Args:
+            data (bytes): The header and the payload.
+
+        Returns:
+            list: The records.
+
+        Raises:
+            ValueError: If data is not in this format.
+        """
+        if len(data) < BINARY_HEADER.size:
+            raise ValueError("truncated binary record file")
+        magic, version, count = BINARY_HEADER.unpack_from(data)
+        if magic != BINARY_MAGIC or version != BINARY_VERSION:
+            raise ValueError("not a binary record file")
+        records = marshal.loads(memoryview(data)[BINARY_HEADER.size:])
+        if not isinstance(records, list) or len(records) != count:
+            raise ValueError("corrupt binary record file")
+        return records
+
+    def write(self, file, records):
+        """
+        Writes records to a binary file object.
+
+        Args:
+            file (file): The open file.
+            records (list): The records.
+        """
+        file.write(self.dumps(records))
+
+
+SERIALIZERS = {serializer.name: serializer for serializer in (
+    JsonSerializer(), CompactJsonSerializer(), BinarySerializer())}
+if orjson is not None:
+    SERIALIZERS["orjson"] = OrjsonSerializer()
+
+DEFAULT_SERIALIZER = SERIALIZERS["json"]
+
+
+def get_serializer(name):
+    """
+    Returns a registered serializer.
+
+    Args:
+        name (str): "json", "compact-json", "binary" or "orjson".
+
+    Returns:
+        object: The serializer.
+
+    Raises:
+        ValueError: If no serializer has that name (orjson is only
+        registered when it is installed).
+    """
+    try:
+        return SERIALIZERS[name]
+    except KeyError:
+        raise ValueError(f"Unknown serializer: {name}") from None
+
+
+def read_records(data):
+    """
+    Parses the content of a data file in any registered format.
+
+    Args:
+        data (bytes): The file content.
+
+    Returns:
+        list: The records.
+    """
+    if data[:len(BINARY_MAGIC)] == BINARY_MAGIC:
+        return SERIALIZERS["binary"].loads(data)
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def convert(source, target, name):
+    """
+    Rewrites a data file in another format.
+
+    Args:
+        source (str): The file to read, in any format.
+        target (str): The file to write.
+        name (str): The serializer to write with.
+
+    Returns:
+        int: The number of records converted.
+    """
+    serializer = get_serializer(name)
+    with open(source, "rb") as file:
+        records = read_records(file.read())
+    temp_path = f"{target}.{os.getpid()}.tmp"
+    with open(temp_path, "wb") as file:
+        serializer.write(file, records)
+    os.replace(temp_path, target)
+    return len(records)
+
+
+def benchmark(records, repeat=5):
+    """
+    Measures save and load time and file size of every format.
+
+    Args:
+        records (list): The records to encode.
+        repeat (int, optional): Runs per measurement; the best is kept.
+
+    Returns:
+        dict: Serializer name to bytes, save and load milliseconds and
+        records per second for both.
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        for name, serializer in SERIALIZERS.items():
+            path = os.path.join(directory, name)
+            save = load = float("inf")
+            for _ in range(repeat):
+                start = time.perf_counter()
+                with open(path, "wb") as file:
+                    serializer.write(file, records)
+                save = min(save, time.perf_counter() - start)
+                start = time.perf_counter()
+                with open(path, "rb") as file:
+                    serializer.loads(file.read())
+                load = min(load, time.perf_counter() - start)
+            results[name] = {
+                "bytes": os.path.getsize(path),
+                "save_ms": round(save * 1000, 3),
+                "load_ms": round(load * 1000, 3),
+                "save_records_per_second":
+                    round(len(records) / save) if save else None,
+                "load_records_per_second":
+                    round(len(records) / load) if load else None}
+    return results
+
+
+def main(argv=None):
+    """
+    Converts a data file or benchmarks the formats on it.
+
+    Args:
+        argv (list, optional): Command line arguments.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+    convert_parser = commands.add_parser("convert")
+    convert_parser.add_argument("source")
+    convert_parser.add_argument("target")
+    convert_parser.add_argument("--to", default="json",
+                                choices=sorted(SERIALIZERS))
+    bench_parser = commands.add_parser("bench")
+    bench_parser.add_argument("source")
+    bench_parser.add_argument("--scale", type=int, default=1,
+                              help="repeat the records to this many "
+                                   "copies before measuring")
+    bench_parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    if args.command == "convert":
+        count = convert(args.source, args.target, args.to)
+        print(f"Converted {count} records to {args.to}: {args.target}")
+        return
+    with open(args.source, "rb") as file:
+        records = read_records(file.read()) * args.scale
+    print(json.dumps(benchmark(records, args.repeat), indent=2))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
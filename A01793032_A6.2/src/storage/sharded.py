@@ -0,0 +1,481 @@
+"""
+sharded.py - Reservation Storage Partitioned by Hotel and Month
+
+This module defines ShardedStorage, a storage backend that splits the
+reservation records into one JSON file per (hotel, check-in month)
+instead of keeping all of history in a single reservations.json:
+
+    <root>/manifest.json
+    <root>/shards/2024-05--Sample%20Hotel.json
+    <root>/shards/2024-06--Sample%20Hotel.json
+
+Shard file names are the check-in month ("undated" when the check-in
+date does not start with YYYY-MM) and the URL-quoted hotel name, so the
+partition of a shard can be recovered from its name alone. Records
+without a string hotel name go to a partition of their own, named "%"
+(which quoting never produces), so they never mix with a hotel called
+"None". The manifest
+lists every shard with its record count; it is rewritten (atomically)
+after each batch and its file signature is the signature of the whole
+storage, so caches built on top of the backend notice every write.
+
+A mutation only loads and rewrites the shards it can affect: an add
+touches the shard of the new record, and a remove or update whose match
+names the hotel (and check-in date) only visits that hotel's shards (or
+that single shard). Records whose hotel or check-in month is changed by
+an update are moved to their new shard. query() reads only the shards
+of a hotel and/or a check-in month range.
+
+Within a shard records keep their insertion order; load() returns the
+shards in manifest order.
+
+Every shard is a JsonFileStorage, so its reads and writes reach the
+metrics registry (see src/metrics) under the shard file name. find()
+and mutations also report the records of the shards they visited,
+labelled with the name of the root directory.
+
+Classes:
+    - ShardedStorage: Partitioned backend with the JsonFileStorage
+    interface.
+
+Example:
+    Reservation.storage = ShardedStorage("reservations")
+    Reservation.storage.save(JsonFileStorage("reservations.json").load())
+    Reservation.storage.query("Sample Hotel", "2024-02", "2024-03")
+
+Author: Alejandra Mendoza Flores
+Date: October 19, 2026
+"""
+import os
+import re
+import json
+
+from urllib.parse import quote, unquote
+
+from src.metrics.metrics import SCANNED_RECORDS, get_registry
+
+from src.storage.storage import (JsonFileStorage, apply_operation,
+                                 file_lock, file_signature, matches)
+
+MONTH = re.compile(r"\d{4}-\d{2}")
+UNDATED = "undated"
+NO_HOTEL = None
+NO_HOTEL_FILE = "%"
+
+
+def shard_key(record):
+    """
+    Returns the partition of a reservation record.
+
+    Args:
+        record (dict): The reservation record.
+
+    Returns:
+        tuple: (hotel name or NO_HOTEL, check-in month as "YYYY-MM" or
+        "undated").
+    """
+    check_in = record.get("check_in_date")
+    month = check_in[:7] if isinstance(check_in, str) and \
+        MONTH.match(check_in) else UNDATED
+    hotel = record.get("hotel_name")
+    return hotel if isinstance(hotel, str) else NO_HOTEL, month
+
+
+def shard_name(key):
+    """
+    Returns the file name of a partition.
+
+    Args:
+        key (tuple): (hotel name, month).
+
+    Returns:
+        str: The shard file name.
+    """
+    hotel, month = key
+    if hotel is NO_HOTEL:
+        return f"{month}--{NO_HOTEL_FILE}.json"
+    return f"{month}--{quote(hotel, safe='')}.json"
+
+
+def parse_shard_name(name):
+    """
+    Returns the partition stored in a shard file.
+
+    Args:
+        name (str): The shard file name.
+
+    Returns:
+        tuple: (hotel name, month), or None if name is not a shard.
+    """
+    if not name.endswith(".json") or "--" not in name:
+        return None
+    month, hotel = name[:-len(".json")].split("--", 1)
+    if hotel == NO_HOTEL_FILE:
+        return NO_HOTEL, month
+    return unquote(hotel), month
+
+
+class ShardedStorage:
+    """
+    Stores reservation records in one JSON file per hotel and month.
+
+    Attributes:
+        root (str): The directory holding the manifest and the shards.
+        manifest_path (str): The path of the manifest.
+        lock_path (str): The lock file held while writing any shard.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.manifest_path = os.path.join(root, "manifest.json")
+        self.lock_path = f"{self.manifest_path}.lock"
+        self._shards_dir = os.path.join(root, "shards")
+        self._manifest = None
+        self._manifest_signature = None
+
+    def _shard(self, key):
+        """
+        Returns the JSON backend of one partition.
+
+        Args:
+            key (tuple): (hotel name, month).
+
+        Returns:
+            JsonFileStorage: The shard backend.
+        """
+        return JsonFileStorage(os.path.join(self._shards_dir,
+                                            shard_name(key)),
+                               lock_path=self.lock_path)
+
+    def _name(self):
+        """
+        Returns the label of the sharded backend in the metrics.
+
+        Returns:
+            str: The name of the root directory.
+        """
+        return os.path.basename(os.path.normpath(self.root))
+
+    def _drop(self, key):
+        """
+        Deletes the file of a partition, if it exists.
+
+        Args:
+            key (tuple): (hotel name, month).
+        """
+        try:
+            os.remove(self._shard(key).path)
+        except FileNotFoundError:
+            pass
+
+    def _read_manifest(self):
+        """
+        Returns the record count of every shard, rebuilding the
+        manifest from the shard files if it is missing or unreadable.
+
+        Returns:
+            dict: Partition key to record count.
+        """
+        signature = file_signature(self.manifest_path)
+        if self._manifest is not None and \
+                signature == self._manifest_signature:
+            return self._manifest
+        manifest = None
+        if signature is not None:
+            try:
+                with open(self.manifest_path, "r", encoding="utf-8") as file:
+                    manifest = {(entry["hotel"], entry["month"]):
+                                entry["count"]
+                                for entry in json.load(file)["shards"]}
+            except (OSError, ValueError, KeyError, TypeError):
+                manifest = None
+        if manifest is None:
+            manifest = {}
+            if os.path.isdir(self._shards_dir):
+                for name in sorted(os.listdir(self._shards_dir)):
+                    key = parse_shard_name(name)
+                    if key is not None:
+                        manifest[key] = len(self._shard(key).load())
+        self._manifest = manifest
+        self._manifest_signature = signature
+        return manifest
+
+    def _write_manifest(self, manifest):
+        """
+        Atomically writes the manifest.
+
+        Args:
+            manifest (dict): Partition key to record count.
+        """
+        os.makedirs(self.root, exist_ok=True)
+        data = {"version": 1,
+                "shards": [{"hotel": hotel, "month": month,
+                            "file": shard_name((hotel, month)),
+                            "count": count}
+                           for (hotel, month), count in manifest.items()]}
+        temp_path = f"{self.manifest_path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as file:
+            json.dump(data, file)
+        os.replace(temp_path, self.manifest_path)
+        self._manifest = manifest
+        self._manifest_signature = file_signature(self.manifest_path)
+
+    def _candidates(self, manifest, match):
+        """
+        Lists the shards that may hold records matching the fields.
+
+        Args:
+            manifest (dict): Partition key to record count.
+            match (dict): The field values to look for.
+
+        Returns:
+            list: The partition keys to visit.
+        """
+        if "hotel_name" not in match:
+            return list(manifest)
+        key = shard_key(match)
+        if "check_in_date" in match:
+            return [key] if key in manifest else []
+        return [candidate for candidate in manifest
+                if candidate[0] == key[0]]
+
+    def exists(self):
+        """
+        Tells whether the storage has been created.
+
+        Returns:
+            bool: True if the manifest or a shard exists.
+        """
+        return os.path.exists(self.manifest_path) or \
+            os.path.isdir(self._shards_dir)
+
+    def signature(self):
+        """
+        Returns a value that changes whenever the stored data changes.
+
+        Returns:
+            tuple: The file signature of the manifest.
+        """
+        return file_signature(self.manifest_path)
+
+    def load(self):
+        """
+        Loads every record.
+
+        Returns:
+            list: The records of every shard, in manifest order.
+        """
+        return [record for key in self._read_manifest()
+                for record in self._shard(key).load()]
+
+    def find(self, match):
+        """
+        Returns the records matching the given fields, visiting only
+        the shards that may hold them.
+
+        Args:
+            match (dict): The field values to look for.
+
+        Returns:
+            list: The matching records.
+        """
+        manifest = self._read_manifest()
+        records = [record for key in self._candidates(manifest, match)
+                   for record in self._shard(key).load()]
+        get_registry().observe(SCANNED_RECORDS, len(records),
+                               file=self._name())
+        return [record for record in records if matches(record, match)]
+
+    def query(self, hotel_name=None, first_month=None, last_month=None):
+        """
+        Returns the records of a hotel and/or check-in month range,
+        reading only the matching shards.
+
+        Args:
+            hotel_name (str, optional): The name of the hotel.
+            first_month (str, optional): The first check-in month,
+            "YYYY-MM" (a full date is accepted too).
+            last_month (str, optional): The last check-in month,
+            inclusive.
+
+        Returns:
+            list: The matching records.
+        """
+        first = first_month[:7] if first_month else None
+        last = last_month[:7] if last_month else None
+        keys = [key for key in self._read_manifest()
+                if (hotel_name is None or key[0] == hotel_name) and
+                (first is None or
+                 (key[1] != UNDATED and key[1] >= first)) and
+                (last is None or (key[1] != UNDATED and key[1] <= last))]
+        return [record for key in keys for record in self._shard(key).load()]
+
+    def shards(self):
+        """
+        Returns the record count of every shard.
+
+        Returns:
+            dict: (hotel name, month) to record count.
+        """
+        return dict(self._read_manifest())
+
+    def save(self, records):
+        """
+        Replaces every stored record, repartitioning them.
+
+        Args:
+            records (list): The records to store.
+        """
+        groups = {}
+        for record in records:
+            groups.setdefault(shard_key(record), []).append(record)
+        os.makedirs(self._shards_dir, exist_ok=True)
+        for key in set(self._read_manifest()) - set(groups):
+            self._drop(key)
+        for key, group in groups.items():
+            self._shard(key).save(group)
+        self._write_manifest({key: len(group)
+                              for key, group in groups.items()})
+
+    def apply(self, operation):
+        """
+        Applies one operation, rewriting only the affected shards.
+
+        Args:
+            operation (dict): The operation to apply.
+
+        Returns:
+            int: The number of records affected.
+        """
+        return self.apply_many([operation])[0]
+
+    def apply_many(self, operations):
+        """
+        Applies several operations, loading and rewriting each affected
+        shard once.
+
+        Args:
+            operations (list): The operations to apply, in order.
+
+        Returns:
+            list: The number of records affected by each operation.
+        """
+        with file_lock(self.lock_path):
+            return self._apply_many(operations)
+
+    def exclusive(self):
+        """
+        Returns a context manager that keeps other writers out of every
+        shard while it is held.
+
+        Returns:
+            contextmanager: The held lock.
+        """
+        return file_lock(self.lock_path)
+
+    def _apply_many(self, operations):
+        manifest = dict(self._read_manifest())
+        loaded = {}
+        dirty = set()
+
+        def shard_records(key):
+            if key not in loaded:
+                loaded[key] = self._shard(key).load() \
+                    if key in manifest else []
+            return loaded[key]
+
+        counts = []
+        for operation in operations:
+            if operation["op"] == "add":
+                key = shard_key(operation["record"])
+                counts.append(apply_operation(shard_records(key),
+                                              operation))
+                dirty.add(key)
+                continue
+            limit = operation.get("limit")
+            keys = self._candidates(
+                {**manifest, **dict.fromkeys(loaded)}, operation["match"])
+            count = 0
+            moved = []
+            for key in keys:
+                if limit is not None and count >= limit:
+                    break
+                records = shard_records(key)
+                partial = dict(operation, limit=None if limit is None
+                               else limit - count)
+                affected = apply_operation(records, partial)
+                if affected:
+                    count += affected
+                    dirty.add(key)
+                    moved.extend(record for record in records
+                                 if shard_key(record) != key)
+                    records[:] = [record for record in records
+                                  if shard_key(record) == key]
+            # Moved records join their new shard only once every shard
+            # was visited, so a shard visited later cannot apply the
+            # operation to them a second time.
+            for record in moved:
+                shard_records(shard_key(record)).append(record)
+                dirty.add(shard_key(record))
+            counts.append(count)
+
+        if dirty:
+            os.makedirs(self._shards_dir, exist_ok=True)
+            for key in dirty:
+                records = loaded[key]
+                shard = self._shard(key)
+                if records:
+                    shard.save(records)
+                    manifest[key] = len(records)
+                elif key in manifest:
+                    self._drop(key)
+                    del manifest[key]
+            self._write_manifest(manifest)
+        registry = get_registry()
+        if registry.enabled:
+            registry.observe(SCANNED_RECORDS, sum(
+                len(records) for records in loaded.values()),
+                file=self._name())
+        return counts
+
+    def add(self, record):
+        """
+        Adds a record.
+
+        Args:
+            record (dict): The record to add.
+
+        Returns:
+            int: Always 1.
+        """
+        return self.apply({"op": "add", "record": record})
+
+    def remove(self, match, limit=None):
+        """
+        Removes the records matching the given fields.
+
+        Args:
+            match (dict): The field values to look for.
+            limit (int, optional): The maximum number of records to
+            remove. Defaults to None (all matches).
+
+        Returns:
+            int: The number of records removed.
+        """
+        return self.apply({"op": "remove", "match": match, "limit": limit})
+
+    def update(self, match, changes, limit=1):
+        """
+        Updates the records matching the given fields.
+
+        Args:
+            match (dict): The field values to look for.
+            changes (dict): The fields to set.
+            limit (int, optional): The maximum number of records to
+            update. Defaults to 1.
+
+        Returns:
+            int: The number of records updated.
+        """
+        return self.apply({"op": "update", "match": match,
+                           "changes": changes, "limit": limit})
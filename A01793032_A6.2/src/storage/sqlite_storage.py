@@ -0,0 +1,435 @@
+"""
+sqlite_storage.py - SQLite Storage Engine
+
+This module stores customers, hotels and reservations in one SQLite
+database (stdlib sqlite3) instead of three JSON files. Each table is
+exposed as a storage backend with the same interface as
+JsonFileStorage, so the Customer, Hotel and Reservation classes work
+unchanged once their storage attribute points at it.
+
+The database runs in WAL mode so readers never block the writer. Each
+thread gets its own connection, every statement is parameterized (and
+therefore cached as a prepared statement by sqlite3), and
+apply_many runs a list of operations in a single transaction. A
+":memory:" database lives inside one connection, which every thread
+shares behind a lock.
+
+Tables and indexes:
+    - customers(name, email, phone), indexed on name.
+    - hotels(name, location, rooms), indexed on name.
+    - reservations(customer_name, hotel_name, room_number,
+    check_in_date, check_out_date), indexed on customer_name and on
+    (hotel_name, room_number, check_in_date).
+    - meta(name, version): the write version of each table, which
+    storage signatures are read from.
+
+Loads, lookups and writes are timed in the metrics registry (see
+src/metrics), labelled with the table name, and loads and lookups
+report the rows they return as the records scanned. SQLite does its own
+page I/O, so no read or written bytes are reported.
+
+Classes:
+    - SqliteDatabase: Owns the database file and its connections.
+    - SqliteStorage: Storage backend for one table.
+
+Example:
+    database = SqliteDatabase("hotel.db")
+    Customer.storage = database.storage("customers")
+    Hotel.storage = database.storage("hotels")
+    Reservation.storage = database.storage("reservations")
+
+Author: Alejandra Mendoza Flores
+Date: October 19, 2026
+"""
+import os
+import sqlite3
+import threading
+
+from contextlib import contextmanager, nullcontext
+
+from src.metrics.metrics import SCANNED_RECORDS, STORAGE_SECONDS, get_registry
+
+TABLES = {
+    "customers": ("name", "email", "phone"),
+    "hotels": ("name", "location", "rooms"),
+    "reservations": ("customer_name", "hotel_name", "room_number",
+                     "check_in_date", "check_out_date"),
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS customers (
+    id INTEGER PRIMARY KEY, name TEXT, email TEXT, phone TEXT);
+CREATE INDEX IF NOT EXISTS customers_name ON customers (name);
+CREATE TABLE IF NOT EXISTS hotels (
+    id INTEGER PRIMARY KEY, name TEXT, location TEXT, rooms);
+CREATE INDEX IF NOT EXISTS hotels_name ON hotels (name);
+CREATE TABLE IF NOT EXISTS reservations (
+    id INTEGER PRIMARY KEY, customer_name TEXT, hotel_name TEXT,
+    room_number, check_in_date TEXT, check_out_date TEXT);
+CREATE INDEX IF NOT EXISTS reservations_room
+    ON reservations (hotel_name, room_number, check_in_date);
+CREATE INDEX IF NOT EXISTS reservations_customer
+    ON reservations (customer_name);
+CREATE TABLE IF NOT EXISTS meta (
+    name TEXT PRIMARY KEY, version INTEGER NOT NULL);
+INSERT OR IGNORE INTO meta VALUES
+    ('customers', 0), ('hotels', 0), ('reservations', 0);
+"""
+
+
+@contextmanager
+def _transaction(connection, table):
+    """
+    Runs a block inside an IMMEDIATE transaction that bumps the version
+    of the table it writes.
+
+    Args:
+        connection (sqlite3.Connection): The connection.
+        table (str): The table written by the block.
+
+    Yields:
+        sqlite3.Connection: The same connection.
+    """
+    connection.execute("BEGIN IMMEDIATE")
+    try:
+        yield connection
+        connection.execute(
+            "UPDATE meta SET version = version + 1 WHERE name = ?", [table])
+    except BaseException:
+        connection.execute("ROLLBACK")
+        raise
+    connection.execute("COMMIT")
+
+
+class SqliteDatabase:
+    """
+    A SQLite database holding the hotel system tables.
+
+    Each thread uses its own connection to a database file. A
+    ":memory:" database exists only inside the connection that created
+    it, so every thread shares that one connection and takes turns
+    through a lock.
+
+    Attributes:
+        path (str): The database file path, or ":memory:".
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        self._shared = None
+        self._lock = nullcontext()
+        if path == ":memory:":
+            self._shared = self._open()
+            self._lock = threading.RLock()
+        with self.session() as connection:
+            connection.executescript(SCHEMA)
+
+    def _open(self):
+        """
+        Opens a new connection to the database.
+
+        Returns:
+            sqlite3.Connection: The connection.
+        """
+        connection = sqlite3.connect(self.path, isolation_level=None,
+                                     check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    def connection(self):
+        """
+        Returns the calling thread's connection, opening it if needed.
+
+        Returns:
+            sqlite3.Connection: The connection, shared by every thread
+            for a ":memory:" database.
+        """
+        if self._shared is not None:
+            return self._shared
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = self._local.connection = self._open()
+        return connection
+
+    @contextmanager
+    def session(self):
+        """
+        Holds the calling thread's connection for a block of
+        statements.
+
+        Yields:
+            sqlite3.Connection: The connection, locked against other
+            threads for a ":memory:" database.
+        """
+        with self._lock:
+            yield self.connection()
+
+    def close(self):
+        """
+        Closes the calling thread's connection. Closing a ":memory:"
+        database discards its content.
+        """
+        if self._shared is not None:
+            with self._lock:
+                self._shared.close()
+            return
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def storage(self, table):
+        """
+        Returns a storage backend for one table.
+
+        Args:
+            table (str): "customers", "hotels" or "reservations".
+
+        Returns:
+            SqliteStorage: The backend.
+        """
+        return SqliteStorage(self, table)
+
+
+class SqliteStorage:
+    """
+    Stores the records of one table of a SqliteDatabase.
+
+    Attributes:
+        database (SqliteDatabase): The database holding the table.
+        table (str): The table name.
+        columns (tuple): The record fields stored in the table.
+    """
+
+    def __init__(self, database, table):
+        if table not in TABLES:
+            raise ValueError(f"Unknown table: {table}")
+        self.database = database
+        self.table = table
+        self.columns = TABLES[table]
+        self._select = f"SELECT {', '.join(self.columns)} FROM {table}"
+
+    def _check_fields(self, fields):
+        """
+        Rejects field names that are not columns of the table.
+
+        Args:
+            fields (iterable): The field names.
+
+        Raises:
+            ValueError: If a field is not a column.
+        """
+        unknown = set(fields) - set(self.columns)
+        if unknown:
+            raise ValueError(
+                f"Unknown {self.table} fields: {', '.join(sorted(unknown))}")
+
+    def _where(self, match, limit):
+        """
+        Builds the WHERE clause selecting the matching rows.
+
+        Args:
+            match (dict): The field values to look for.
+            limit (int): The maximum number of rows, or None.
+
+        Returns:
+            tuple: (sql, parameters).
+        """
+        self._check_fields(match)
+        condition = " AND ".join(
+            f"{field} IS NULL" if value is None else f"{field} = ?"
+            for field, value in match.items()) or "1"
+        parameters = [value for value in match.values() if value is not None]
+        if limit is None:
+            return condition, parameters
+        return (f"id IN (SELECT id FROM {self.table} WHERE {condition} "
+                f"ORDER BY id LIMIT ?)", parameters + [limit])
+
+    def _execute(self, connection, operation):
+        """
+        Runs one operation on a connection.
+
+        Args:
+            connection (sqlite3.Connection): The connection.
+            operation (dict): The operation to run.
+
+        Returns:
+            int: The number of rows added, removed or updated.
+        """
+        kind = operation["op"]
+        if kind == "add":
+            record = operation["record"]
+            self._check_fields(record)
+            connection.execute(
+                f"INSERT INTO {self.table} ({', '.join(self.columns)}) "
+                f"VALUES ({', '.join('?' * len(self.columns))})",
+                [record.get(field) for field in self.columns])
+            return 1
+        where, parameters = self._where(operation["match"],
+                                        operation.get("limit"))
+        if kind == "remove":
+            return connection.execute(
+                f"DELETE FROM {self.table} WHERE {where}",
+                parameters).rowcount
+        if kind == "update":
+            changes = operation["changes"]
+            self._check_fields(changes)
+            if not changes:
+                return connection.execute(
+                    f"SELECT COUNT(*) FROM {self.table} WHERE {where}",
+                    parameters).fetchone()[0]
+            assignments = ", ".join(f"{field} = ?" for field in changes)
+            return connection.execute(
+                f"UPDATE {self.table} SET {assignments} WHERE {where}",
+                list(changes.values()) + parameters).rowcount
+        raise ValueError(f"Unknown storage operation: {kind}")
+
+    def exists(self):
+        """
+        Tells whether the database has been created.
+
+        Returns:
+            bool: True if the database file exists.
+        """
+        return self.database.path == ":memory:" or \
+            os.path.exists(self.database.path)
+
+    def signature(self):
+        """
+        Returns a value that changes whenever the table may have changed.
+
+        The version is stored in the database and bumped by every
+        write transaction, so it compares equal across connections and
+        threads only when nothing was written in between.
+
+        Returns:
+            int: The table version.
+        """
+        with self.database.session() as connection:
+            return connection.execute(
+                "SELECT version FROM meta WHERE name = ?",
+                [self.table]).fetchone()[0]
+
+    def load(self):
+        """
+        Loads every record in insertion order.
+
+        Returns:
+            list: The stored records.
+        """
+        registry = get_registry()
+        with registry.timer(STORAGE_SECONDS, file=self.table, phase="load"):
+            with self.database.session() as connection:
+                rows = connection.execute(f"{self._select} ORDER BY id")
+                records = [dict(zip(self.columns, row)) for row in rows]
+        registry.observe(SCANNED_RECORDS, len(records), file=self.table)
+        return records
+
+    def find(self, match):
+        """
+        Returns the records matching the given fields, using the
+        table indexes.
+
+        Args:
+            match (dict): The field values to look for.
+
+        Returns:
+            list: The matching records in insertion order.
+        """
+        where, parameters = self._where(match, None)
+        registry = get_registry()
+        with registry.timer(STORAGE_SECONDS, file=self.table, phase="scan"):
+            with self.database.session() as connection:
+                rows = connection.execute(
+                    f"{self._select} WHERE {where} ORDER BY id", parameters)
+                records = [dict(zip(self.columns, row)) for row in rows]
+        registry.observe(SCANNED_RECORDS, len(records), file=self.table)
+        return records
+
+    def save(self, records):
+        """
+        Replaces every record of the table in one transaction.
+
+        Args:
+            records (list): The records to store.
+        """
+        with get_registry().timer(STORAGE_SECONDS, file=self.table,
+                                  phase="write"), \
+                self.database.session() as connection, \
+                _transaction(connection, self.table):
+            connection.execute(f"DELETE FROM {self.table}")
+            for record in records:
+                self._execute(connection, {"op": "add", "record": record})
+
+    def apply(self, operation):
+        """
+        Applies one operation.
+
+        Args:
+            operation (dict): The operation to apply.
+
+        Returns:
+            int: The number of records affected.
+        """
+        return self.apply_many([operation])[0]
+
+    def apply_many(self, operations):
+        """
+        Applies several operations in a single transaction.
+
+        Args:
+            operations (list): The operations to apply, in order.
+
+        Returns:
+            list: The number of records affected by each operation.
+        """
+        with get_registry().timer(STORAGE_SECONDS, file=self.table,
+                                  phase="write"), \
+                self.database.session() as connection, \
+                _transaction(connection, self.table):
+            return [self._execute(connection, operation)
+                    for operation in operations]
+
+    def add(self, record):
+        """
+        Adds a record.
+
+        Args:
+            record (dict): The record to add.
+
+        Returns:
+            int: Always 1.
+        """
+        return self.apply({"op": "add", "record": record})
+
+    def remove(self, match, limit=None):
+        """
+        Removes the records matching the given fields.
+
+        Args:
+            match (dict): The field values to look for.
+            limit (int, optional): The maximum number of records to
+            remove. Defaults to None (all matches).
+
+        Returns:
+            int: The number of records removed.
+        """
+        return self.apply({"op": "remove", "match": match, "limit": limit})
+
+    def update(self, match, changes, limit=1):
+        """
+        Updates the records matching the given fields.
+
+        Args:
+            match (dict): The field values to look for.
+            changes (dict): The fields to set.
+            limit (int, optional): The maximum number of records to
+            update. Defaults to 1.
+
+        Returns:
+            int: The number of records updated.
+        """
+        return self.apply({"op": "update", "match": match,
+                           "changes": changes, "limit": limit})
@@ -0,0 +1,532 @@
+"""
+storage.py - Record Storage for the Hotel Management System
+
+This module defines how the Customer, Hotel and Reservation classes
+persist their records. A storage backend holds a list of flat
+dictionaries and supports three mutations, expressed as operation
+dictionaries so that every backend can apply, log or replay them the
+same way:
+
+    - {"op": "add", "record": {...}}: Appends a record.
+    - {"op": "remove", "match": {...}, "limit": n}: Removes up to n
+    records (all of them when limit is None) whose fields equal match.
+    - {"op": "update", "match": {...}, "changes": {...}, "limit": n}:
+    Updates up to n matching records with the given changes.
+
+Classes:
+    - JsonFileStorage: Stores the records as a JSON list in one file.
+    This is the original format of customers.json, hotels.json and
+    reservations.json, and the default backend. Other file formats are
+    available through src/storage/serializers.py.
+
+Functions:
+    - matches(record, match): Tells whether a record matches.
+    - apply_operation(records, operation): Applies an operation to an
+    in-memory list of records.
+    - data_path(name): Returns the default location of a data file.
+    - file_signature(path): Returns the identity of a file's content.
+    - fsync_directory(path): Makes a rename in a directory durable.
+    - file_lock(path): Holds an exclusive lock on a lock file.
+    - write_lock(storage): Holds a backend's write lock, if it has one.
+    - normalize_records(entries, fields, required): Turns bulk input
+    into records.
+    - bulk_remove(storage, key_fields, keys_or_predicate): Removes many
+    records in one batch.
+
+Author: Alejandra Mendoza Flores
+Date: October 19, 2026
+"""
+import os
+import threading
+
+from collections.abc import Sequence
+from contextlib import contextmanager, nullcontext
+
+from src.metrics.metrics import (READ_BYTES, SCANNED_RECORDS,
+                                 STORAGE_SECONDS, WRITTEN_BYTES,
+                                 get_registry)
+from src.storage.cache import LOAD_CACHE
+from src.storage.serializers import DEFAULT_SERIALIZER, read_records
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+DATA_DIR_ENV = "HOTEL_DATA_DIR"
+
+_LOCKS = {}
+_LOCKS_GUARD = threading.Lock()
+
+
+def data_path(name):
+    """
+    Returns where a data file is kept by default.
+
+    Args:
+        name (str): The file name, such as "customers.json".
+
+    Returns:
+        str: The name inside the directory named by the HOTEL_DATA_DIR
+        environment variable, or the bare name (the working directory)
+        when it is not set.
+    """
+    return os.path.join(os.environ.get(DATA_DIR_ENV, ""), name)
+
+
+def matches(record, match):
+    """
+    Tells whether every field in match has the same value in record.
+
+    Args:
+        record (dict): The record to test.
+        match (dict): The field values to look for.
+
+    Returns:
+        bool: True if the record matches.
+    """
+    return all(record.get(field) == value for field, value in match.items())
+
+
+def apply_operation(records, operation):
+    """
+    Applies an operation to a list of records in place.
+
+    Args:
+        records (list): The records to modify.
+        operation (dict): The operation to apply.
+
+    Returns:
+        int: The number of records added, removed or updated.
+
+    Raises:
+        ValueError: If the operation type is unknown.
+    """
+    kind = operation["op"]
+    if kind == "add":
+        records.append(dict(operation["record"]))
+        return 1
+
+    match = operation["match"]
+    limit = operation.get("limit")
+    if kind == "remove":
+        kept = []
+        removed = 0
+        for record in records:
+            if (limit is None or removed < limit) and matches(record, match):
+                removed += 1
+            else:
+                kept.append(record)
+        if removed:
+            records[:] = kept
+        return removed
+
+    if kind == "update":
+        updated = 0
+        for record in records:
+            if limit is not None and updated >= limit:
+                break
+            if matches(record, match):
+                record.update(operation["changes"])
+                updated += 1
+        return updated
+
+    raise ValueError(f"Unknown storage operation: {kind}")
+
+
+def file_signature(path):
+    """
+    Returns a value that changes whenever the file is rewritten.
+
+    Args:
+        path (str): The file path.
+
+    Returns:
+        tuple: (inode, size, mtime in nanoseconds), or None if the file
+        does not exist.
+    """
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+
+def fsync_directory(path):
+    """
+    Flushes a directory entry to disk, so that a file created or
+    renamed in it survives a crash.
+
+    Does nothing on platforms that cannot open directories.
+
+    Args:
+        path (str): A file in the directory.
+    """
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    descriptor = os.open(os.path.dirname(os.path.abspath(path)),
+                         os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(descriptor)
+    finally:
+        os.close(descriptor)
+
+
+class _HeldLock:
+    """
+    The state of one lock file within this process.
+
+    Attributes:
+        mutex (threading.RLock): Serializes the threads of the process.
+        depth (int): How many times the owning thread holds the lock.
+        file (file): The locked file while depth is positive.
+    """
+
+    def __init__(self):
+        self.mutex = threading.RLock()
+        self.depth = 0
+        self.file = None
+
+
+@contextmanager
+def file_lock(path):
+    """
+    Holds an exclusive lock on a lock file for the duration of a block.
+
+    The lock excludes the other threads of the process and, where fcntl
+    is available, other processes. A thread that already holds the lock
+    can take it again.
+
+    Args:
+        path (str): The lock file path, or None for no lock.
+
+    Yields:
+        None
+    """
+    if path is None:
+        yield
+        return
+    path = os.path.abspath(path)
+    with _LOCKS_GUARD:
+        held = _LOCKS.setdefault(path, _HeldLock())
+    with held.mutex:
+        if held.depth == 0 and fcntl is not None:
+            # pylint: disable=consider-using-with
+            held.file = open(path, "a", encoding="utf-8")
+            fcntl.flock(held.file, fcntl.LOCK_EX)
+        held.depth += 1
+        try:
+            yield
+        finally:
+            held.depth -= 1
+            if held.depth == 0 and held.file is not None:
+                fcntl.flock(held.file, fcntl.LOCK_UN)
+                held.file.close()
+                held.file = None
+
+
+def write_lock(storage):
+    """
+    Returns the write lock of a storage backend.
+
+    Args:
+        storage (JsonFileStorage): The backend.
+
+    Returns:
+        contextmanager: storage.exclusive(), or a context that does
+        nothing for backends that serialize writes themselves.
+    """
+    exclusive = getattr(storage, "exclusive", None)
+    return exclusive() if exclusive is not None else nullcontext()
+
+
+def normalize_records(entries, fields, required=None):
+    """
+    Turns bulk create input into records.
+
+    Args:
+        entries (iterable): Dictionaries, or sequences (other than
+        strings and bytes) with the values in the order of fields.
+        fields (tuple): The record fields.
+        required (int, optional): How many leading fields are mandatory.
+        Defaults to all of them; the others default to None.
+
+    Returns:
+        list: One record per entry, or None for entries that are
+        missing a mandatory field, have unknown fields or are neither a
+        dictionary nor a sequence.
+    """
+    required = len(fields) if required is None else required
+    records = []
+    for entry in entries:
+        if isinstance(entry, dict):
+            values = entry
+        elif isinstance(entry, Sequence) and \
+                not isinstance(entry, (str, bytes, bytearray)) and \
+                len(entry) <= len(fields):
+            values = dict(zip(fields, entry))
+        else:
+            values = None
+        if values is None or set(values) - set(fields) or \
+                any(field not in values for field in fields[:required]):
+            records.append(None)
+            continue
+        records.append({field: values.get(field) for field in fields})
+    return records
+
+
+def bulk_remove(storage, key_fields, keys_or_predicate, limit=None):
+    """
+    Removes many records with a single storage batch.
+
+    Args:
+        storage (JsonFileStorage): The backend to remove from.
+        key_fields (tuple): The fields forming a record key.
+        keys_or_predicate (iterable or callable): The keys to remove
+        (a value, or a tuple when there are several key fields), or a
+        function taking a record and returning True to remove it.
+        limit (int, optional): The maximum number of records removed per
+        key. Defaults to None (all matches).
+
+    Returns:
+        list: (key, removed count) pairs, one per key. With a predicate,
+        one pair per selected record.
+    """
+    def as_key(values):
+        return values[0] if len(key_fields) == 1 else tuple(values)
+
+    if callable(keys_or_predicate):
+        selected = [record for record in storage.load()
+                    if keys_or_predicate(record)]
+        keys = [as_key([record.get(field) for field in key_fields])
+                for record in selected]
+        operations = [{"op": "remove", "match": record, "limit": 1}
+                      for record in selected]
+    else:
+        keys = list(keys_or_predicate)
+        operations = [{"op": "remove", "limit": limit, "match": dict(
+            zip(key_fields, key if len(key_fields) > 1 else (key,)))}
+            for key in keys]
+    counts = storage.apply_many(operations) if operations else []
+    return list(zip(keys, counts))
+
+
+class JsonFileStorage:
+    """
+    Stores records as a JSON list in a single file.
+
+    Every mutation reads the whole file, applies the operation and
+    rewrites the file. Parsed content is kept in a LoadCache, so
+    loading an unchanged file returns copies of the cached records
+    instead of parsing it again.
+
+    The file is written with the configured serializer but read in
+    whichever format it is in, so switching formats only requires a
+    save.
+
+    Mutations hold the lock file path + ".lock" (see file_lock) from
+    the load to the rename, so concurrent writers in other threads or
+    processes do not lose each other's updates. The new file is
+    fsynced before the rename and the directory after it.
+
+    Reads, parses, scans and writes are reported to the metrics
+    registry (see src/metrics), labelled with the file name.
+
+    Attributes:
+        path (str): The path of the JSON file.
+        cache (LoadCache): The parsed-file cache, or None to always
+        parse. Defaults to the shared LOAD_CACHE.
+        serializer (object): The format used to write the file.
+        Defaults to the original JSON format.
+        lock_path (str): The lock file held while writing. Defaults to
+        the path followed by ".lock".
+    """
+
+    def __init__(self, path, cache=LOAD_CACHE, serializer=None,
+                 lock_path=None):
+        self.path = path
+        self.cache = cache
+        self.serializer = serializer or DEFAULT_SERIALIZER
+        self.lock_path = lock_path or f"{path}.lock"
+
+    def exclusive(self):
+        """
+        Holds the storage's write lock, so that a caller can check the
+        stored records and write without anyone writing in between.
+
+        Returns:
+            contextmanager: The held lock.
+        """
+        return file_lock(self.lock_path)
+
+    def exists(self):
+        """
+        Tells whether the storage has been created.
+
+        Returns:
+            bool: True if the JSON file exists.
+        """
+        return os.path.exists(self.path)
+
+    def signature(self):
+        """
+        Returns a value that changes whenever the stored data changes.
+
+        Returns:
+            tuple: The file signature of the JSON file.
+        """
+        return file_signature(self.path)
+
+    def load(self):
+        """
+        Loads every record.
+
+        Returns:
+            list: The stored records, or an empty list if there are none.
+        """
+        signature = self.signature()
+        if signature is None:
+            return []
+        if self.cache is not None:
+            records = self.cache.get(self.path, signature)
+            if records is not None:
+                return records
+        registry = get_registry()
+        name = os.path.basename(self.path)
+        with registry.timer(STORAGE_SECONDS, file=name, phase="load"):
+            with open(self.path, "rb") as file:
+                data = file.read()
+        registry.count(READ_BYTES, len(data), file=name)
+        with registry.timer(STORAGE_SECONDS, file=name, phase="parse"):
+            records = read_records(data)
+        if self.cache is not None and isinstance(records, list) and \
+                self.signature() == signature:
+            self.cache.put(self.path, signature, records)
+        return records
+
+    def save(self, records):
+        """
+        Replaces every stored record.
+
+        The records are written to a temporary file that is fsynced and
+        then renamed over the JSON file, so readers never see a partial
+        write and a crash leaves either the old or the new file.
+
+        Args:
+            records (list): The records to store.
+        """
+        temp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        registry = get_registry()
+        name = os.path.basename(self.path)
+        with file_lock(self.lock_path):
+            with open(temp_path, "wb") as file:
+                with registry.timer(STORAGE_SECONDS, file=name,
+                                    phase="serialize"):
+                    self.serializer.write(file, records)
+                with registry.timer(STORAGE_SECONDS, file=name,
+                                    phase="write"):
+                    file.flush()
+                    os.fsync(file.fileno())
+                    stat = os.fstat(file.fileno())
+                    os.replace(temp_path, self.path)
+                    fsync_directory(self.path)
+        registry.count(WRITTEN_BYTES, stat.st_size, file=name)
+        if self.cache is not None:
+            self.cache.put(self.path, (stat.st_ino, stat.st_size,
+                                       stat.st_mtime_ns), records)
+
+    def apply(self, operation):
+        """
+        Applies one operation and persists the result.
+
+        Args:
+            operation (dict): The operation to apply.
+
+        Returns:
+            int: The number of records affected.
+        """
+        return self.apply_many([operation])[0]
+
+    def apply_many(self, operations):
+        """
+        Applies several operations with a single load and a single write.
+
+        Args:
+            operations (list): The operations to apply, in order.
+
+        Returns:
+            list: The number of records affected by each operation.
+        """
+        registry = get_registry()
+        name = os.path.basename(self.path)
+        with file_lock(self.lock_path):
+            records = self.load()
+            if registry.enabled:
+                registry.observe(SCANNED_RECORDS, len(records) * sum(
+                    operation["op"] != "add" for operation in operations),
+                    file=name)
+            with registry.timer(STORAGE_SECONDS, file=name, phase="scan"):
+                counts = [apply_operation(records, operation)
+                          for operation in operations]
+            if any(counts):
+                self.save(records)
+        return counts
+
+    def find(self, match):
+        """
+        Returns the records matching the given fields.
+
+        Args:
+            match (dict): The field values to look for.
+
+        Returns:
+            list: The matching records, in storage order.
+        """
+        records = self.load()
+        registry = get_registry()
+        name = os.path.basename(self.path)
+        registry.observe(SCANNED_RECORDS, len(records), file=name)
+        with registry.timer(STORAGE_SECONDS, file=name, phase="scan"):
+            return [record for record in records if matches(record, match)]
+
+    def add(self, record):
+        """
+        Adds a record.
+
+        Args:
+            record (dict): The record to add.
+
+        Returns:
+            int: Always 1.
+        """
+        return self.apply({"op": "add", "record": record})
+
+    def remove(self, match, limit=None):
+        """
+        Removes the records matching the given fields.
+
+        Args:
+            match (dict): The field values to look for.
+            limit (int, optional): The maximum number of records to
+            remove. Defaults to None (all matches).
+
+        Returns:
+            int: The number of records removed.
+        """
+        return self.apply({"op": "remove", "match": match, "limit": limit})
+
+    def update(self, match, changes, limit=1):
+        """
+        Updates the records matching the given fields.
+
+        Args:
+            match (dict): The field values to look for.
+            changes (dict): The fields to set.
+            limit (int, optional): The maximum number of records to
+            update. Defaults to 1.
+
+        Returns:
+            int: The number of records updated.
+        """
+        return self.apply({"op": "update", "match": match,
+                           "changes": changes, "limit": limit})
@@ -0,0 +1,361 @@
+"""
+writer.py - Group-Commit Writer for Storage Backends
+
+This module serializes the mutations of many threads through a single
+writer thread. Callers submit operations and get futures back; the
+writer collects every operation that arrives within a short commit
+interval and applies the whole batch with one apply_many call, i.e. one
+rewrite of the JSON file (or one journal append, or one SQLite
+transaction) for the batch instead of one per caller.
+
+Each batch is written while holding an exclusive lock file (see
+file_lock in storage.py) so writers in other threads and processes
+cannot interleave their read-modify-write cycles, and JsonFileStorage
+replaces its file with an atomic rename, so no update is lost and
+readers never see a partial file.
+
+A caller that must check the stored records before writing (such as a
+booking that must not overlap another one) holds exclusive() around the
+check and the write. Its writes are then applied directly in its own
+thread, while the writer thread waits for the lock.
+
+GroupCommitWriter exposes the storage backend interface itself, so it
+can be plugged into the Customer, Hotel or Reservation classes:
+
+Example:
+    Reservation.storage = GroupCommitWriter(
+        JsonFileStorage("reservations.json"))
+    future = Reservation.storage.submit(
+        {"op": "add", "record": {...}})
+    future.result()
+
+Classes:
+    - GroupCommitWriter: Batches the mutations of a storage backend.
+
+Author: Alejandra Mendoza Flores
+Date: October 19, 2026
+"""
+import queue
+import threading
+import time
+
+from concurrent.futures import Future
+from contextlib import contextmanager
+
+from src.storage.storage import file_lock
+
+
+class GroupCommitWriter:
+    """
+    Applies the mutations submitted by many threads in batches.
+
+    Reads (exists, signature, load and find) go straight to the
+    wrapped backend. The writer thread is started on the first
+    submission and stopped by close().
+
+    Attributes:
+        storage (JsonFileStorage): The wrapped backend.
+        interval (float): Seconds to wait for more operations after the
+        first one of a batch.
+        max_batch (int): The maximum number of operations per batch.
+        lock_path (str): The lock file held while writing, or None.
+        commits (int): The number of batches written so far.
+    """
+
+    def __init__(self, storage, interval=0.002, max_batch=1000,
+                 lock_path=None):
+        self.storage = storage
+        self.interval = interval
+        self.max_batch = max_batch
+        if lock_path is None:
+            lock_path = getattr(storage, "lock_path", None)
+        if lock_path is None and hasattr(storage, "path"):
+            lock_path = f"{storage.path}.lock"
+        self.lock_path = lock_path
+        self.commits = 0
+        self._queue = queue.Queue()
+        self._thread = None
+        self._thread_lock = threading.Lock()
+        self._exclusive = threading.local()
+
+    @contextmanager
+    def exclusive(self):
+        """
+        Holds the write lock, so that a check of the stored records and
+        the writes that depend on it are not interleaved with other
+        writes. Writes made by the holding thread are applied at once.
+
+        Yields:
+            None
+        """
+        with file_lock(self.lock_path):
+            depth = getattr(self._exclusive, "depth", 0)
+            self._exclusive.depth = depth + 1
+            try:
+                yield
+            finally:
+                self._exclusive.depth = depth
+
+    def _start(self):
+        """
+        Starts the writer thread if it is not running.
+        """
+        with self._thread_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="group-commit-writer",
+                    daemon=True)
+                self._thread.start()
+
+    def _next_batch(self):
+        """
+        Waits for a submission, then collects the ones that follow it
+        within the commit interval.
+
+        Returns:
+            tuple: (list of (operations, future, single) submissions,
+            True if close() was called).
+        """
+        item = self._queue.get()
+        if item is None:
+            return [], True
+        batch = [item]
+        size = len(item[0])
+        deadline = time.monotonic() + self.interval
+        while size < self.max_batch:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+            if item is None:
+                return batch, True
+            batch.append(item)
+            size += len(item[0])
+        return batch, False
+
+    def _run(self):
+        """
+        Writer thread loop.
+        """
+        stop = False
+        while not stop:
+            batch, stop = self._next_batch()
+            batch = [item for item in batch
+                     if item[1].set_running_or_notify_cancel()]
+            if batch:
+                self._commit(batch)
+
+    def _commit(self, batch):
+        """
+        Writes one batch and resolves its futures.
+
+        If the batch fails as a whole, each submission is retried on
+        its own so that one bad operation only fails its own future.
+
+        Args:
+            batch (list): (operations, future, single) submissions.
+        """
+        operations = [operation for item in batch for operation in item[0]]
+        with file_lock(self.lock_path):
+            try:
+                counts = self.storage.apply_many(operations)
+            except Exception:  # pylint: disable=broad-except
+                counts = None
+            if counts is None:
+                for item, future, single in batch:
+                    try:
+                        result = self.storage.apply_many(item)
+                    except Exception as error:  # pylint: disable=broad-except
+                        future.set_exception(error)
+                        continue
+                    future.set_result(result[0] if single else result)
+                self.commits += len(batch)
+                return
+        self.commits += 1
+        start = 0
+        for item, future, single in batch:
+            result = counts[start:start + len(item)]
+            future.set_result(result[0] if single else result)
+            start += len(item)
+
+    def _submit(self, operations, single):
+        """
+        Queues a submission for the writer thread.
+
+        Args:
+            operations (list): The operations to apply together.
+            single (bool): Resolve the future to the first count
+            instead of the list of counts.
+
+        Returns:
+            Future: The submission's future.
+        """
+        future = Future()
+        if getattr(self._exclusive, "depth", 0):
+            try:
+                counts = self.storage.apply_many(list(operations))
+            except Exception as error:  # pylint: disable=broad-except
+                future.set_exception(error)
+            else:
+                future.set_result(counts[0] if single else counts)
+            return future
+        self._start()
+        self._queue.put((list(operations), future, single))
+        return future
+
+    def submit_many(self, operations):
+        """
+        Queues operations to be applied together, in order.
+
+        Args:
+            operations (list): The operations to apply.
+
+        Returns:
+            Future: Resolves to the number of records affected by each
+            operation.
+        """
+        return self._submit(operations, False)
+
+    def submit(self, operation):
+        """
+        Queues one operation.
+
+        Args:
+            operation (dict): The operation to apply.
+
+        Returns:
+            Future: Resolves to the number of records affected.
+        """
+        return self._submit([operation], True)
+
+    def close(self):
+        """
+        Writes every pending operation and stops the writer thread.
+        """
+        with self._thread_lock:
+            thread = self._thread
+            self._thread = None
+        if thread is not None:
+            self._queue.put(None)
+            thread.join()
+
+    def exists(self):
+        """
+        Tells whether the wrapped storage has been created.
+
+        Returns:
+            bool: True if it exists.
+        """
+        return self.storage.exists()
+
+    def signature(self):
+        """
+        Returns the signature of the wrapped storage.
+
+        Returns:
+            tuple: The signature.
+        """
+        return self.storage.signature()
+
+    def load(self):
+        """
+        Loads every record of the wrapped storage.
+
+        Returns:
+            list: The stored records.
+        """
+        return self.storage.load()
+
+    def find(self, match):
+        """
+        Returns the records matching the given fields.
+
+        Args:
+            match (dict): The field values to look for.
+
+        Returns:
+            list: The matching records.
+        """
+        return self.storage.find(match)
+
+    def save(self, records):
+        """
+        Replaces every stored record once pending operations are
+        written.
+
+        Args:
+            records (list): The records to store.
+        """
+        self.submit_many([]).result()
+        with file_lock(self.lock_path):
+            self.storage.save(records)
+
+    def apply(self, operation):
+        """
+        Applies one operation and waits for its batch to be written.
+
+        Args:
+            operation (dict): The operation to apply.
+
+        Returns:
+            int: The number of records affected.
+        """
+        return self.submit(operation).result()
+
+    def apply_many(self, operations):
+        """
+        Applies several operations in the same batch and waits for it
+        to be written.
+
+        Args:
+            operations (list): The operations to apply, in order.
+
+        Returns:
+            list: The number of records affected by each operation.
+        """
+        return self.submit_many(operations).result()
+
+    def add(self, record):
+        """
+        Adds a record.
+
+        Args:
+            record (dict): The record to add.
+
+        Returns:
+            int: Always 1.
+        """
+        return self.apply({"op": "add", "record": record})
+
+    def remove(self, match, limit=None):
+        """
+        Removes the records matching the given fields.
+
+        Args:
+            match (dict): The field values to look for.
+            limit (int, optional): The maximum number of records to
+            remove. Defaults to None (all matches).
+
+        Returns:
+            int: The number of records removed.
+        """
+        return self.apply({"op": "remove", "match": match, "limit": limit})
+
+    def update(self, match, changes, limit=1):
+        """
+        Updates the records matching the given fields.
+
+        Args:
+            match (dict): The field values to look for.
+            changes (dict): The fields to set.
+            limit (int, optional): The maximum number of records to
+            update. Defaults to 1.
+
+        Returns:
+            int: The number of records updated.
+        """
+        return self.apply({"op": "update", "match": match,
+                           "changes": changes, "limit": limit})
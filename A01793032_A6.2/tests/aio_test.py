@@ -0,0 +1,170 @@
+"""
+aio_test.py - Unit Tests for the asyncio API
+
+This module contains unit tests for the async counterparts of the
+Customer, Hotel and Reservation methods and for src/aio/offload.py.
+
+Test Cases:
+    - test_async_round_trip: Create, look up and cancel through the
+    async methods.
+    - test_concurrent_bookings_do_not_race: Concurrent bookings of the
+    same room produce exactly one reservation.
+    - test_cancelled_write_still_completes: Cancelling the awaiting
+    task does not abandon a write half way.
+    - test_event_loop_not_blocked: The loop keeps running while a slow
+    call is offloaded.
+    - test_cancelled_call_keeps_its_slot: A cancelled call counts
+    against the concurrency limit until its thread is done.
+    - test_journal_reads_during_writes: Pool reads of a journal backend
+    run safely next to the writer thread.
+
+To run the tests, execute the script using the following command:
+    python3 -m unittest tests/aio_test.py
+
+Author: Alejandra Mendoza Flores
+Date: October 19, 2026
+"""
+import os
+import time
+import asyncio
+import tempfile
+import threading
+import unittest
+# pylint: disable=wrong-import-position, import-error
+from src.aio import offload
+from src.customer.customer import Customer
+from src.hotel.hotel import Hotel
+from src.reservation.reservation import Reservation
+from src.storage.journal import JournalStorage
+from src.storage.storage import JsonFileStorage
+# pylint: enable=wrong-import-position, import-error
+
+
+class AsyncApiTest(unittest.IsolatedAsyncioTestCase):
+    """
+    Unit tests for the asyncio API.
+    """
+    def setUp(self):
+        # pylint: disable=consider-using-with
+        self.directory = tempfile.TemporaryDirectory()
+        self.previous = (Customer.storage, Hotel.storage,
+                         Reservation.storage)
+        Customer.storage = JsonFileStorage(
+            os.path.join(self.directory.name, "customers.json"))
+        Hotel.storage = JsonFileStorage(
+            os.path.join(self.directory.name, "hotels.json"))
+        Reservation.storage = JsonFileStorage(
+            os.path.join(self.directory.name, "reservations.json"))
+
+    def tearDown(self):
+        offload.shutdown()
+        Customer.storage, Hotel.storage, Reservation.storage = self.previous
+        self.directory.cleanup()
+
+    async def test_async_round_trip(self):
+        """
+        Test case for the async create, lookup and cancel methods.
+        """
+        await Customer.acreate_customer("Ana", "ana@example.com", "1")
+        await Hotel.acreate_hotel("Sea", "Coast", 3)
+        reservation = await Reservation.acreate_reservation(
+            "Ana", "Sea", 1, "2024-05-01", "2024-05-03")
+        self.assertEqual(reservation.room_number, 1)
+        self.assertEqual(len(await Customer.aload_customers_data()), 1)
+        self.assertEqual(
+            await Reservation.aavailable_rooms("Sea", "2024-05-02",
+                                               rooms=[1, 2]), [2])
+        self.assertEqual(
+            len(await Reservation.areservations_for_customer("Ana")), 1)
+        await Reservation.acancel_reservation("Ana", "Sea", 1, "2024-05-01")
+        self.assertEqual(await Reservation.aload_reservations_data(), [])
+
+    async def test_concurrent_bookings_do_not_race(self):
+        """
+        Test case verifying that concurrent bookings are serialized.
+        """
+        results = await asyncio.gather(*[
+            Reservation.acreate_reservation(f"Guest {number}", "Sea", 7,
+                                            "2024-06-01", "2024-06-04")
+            for number in range(20)])
+        self.assertEqual(sum(result is not None for result in results), 1)
+        self.assertEqual(len(Reservation.load_reservations_data()), 1)
+
+    async def test_cancelled_write_still_completes(self):
+        """
+        Test case verifying that a cancelled write is not abandoned.
+        """
+        task = asyncio.ensure_future(Customer.acreate_customers(
+            [(f"C{number}", f"c{number}@example.com", str(number))
+             for number in range(50)]))
+        await asyncio.sleep(0)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        offload.shutdown()
+        self.assertEqual(len(Customer.load_customers_data()), 50)
+
+    async def test_event_loop_not_blocked(self):
+        """
+        Test case verifying that offloaded calls leave the loop free.
+        """
+        ticks = []
+
+        async def ticker():
+            for _ in range(5):
+                ticks.append(time.monotonic())
+                await asyncio.sleep(0.01)
+
+        tick_task = asyncio.ensure_future(ticker())
+        await offload.run_blocking(time.sleep, 0.1)
+        self.assertEqual(len(ticks), 5)
+        await tick_task
+
+    async def test_cancelled_call_keeps_its_slot(self):
+        """
+        Test case verifying that the semaphore is released by the
+        thread, not by the cancelled coroutine.
+        """
+        release = threading.Event()
+        started = []
+        offload.set_concurrency(1)
+        try:
+            task = asyncio.ensure_future(
+                offload.run_serialized(release.wait, 5))
+            await asyncio.sleep(0.01)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+            waiting = asyncio.ensure_future(
+                offload.run_blocking(started.append, 1))
+            await asyncio.sleep(0.05)
+            self.assertEqual(started, [])
+            release.set()
+            await waiting
+            self.assertEqual(started, [1])
+        finally:
+            release.set()
+            offload.set_concurrency(offload.MAX_CONCURRENCY)
+
+    async def test_journal_reads_during_writes(self):
+        """
+        Test case for pool reads of a journal backend during writes.
+        """
+        Customer.storage = JournalStorage(
+            os.path.join(self.directory.name, "customers.json"),
+            compact_threshold=7)
+        Customer.storage.save([])
+        calls = []
+        for number in range(40):
+            calls.append(Customer.acreate_customer(
+                f"C{number}", f"c{number}@example.com", str(number)))
+            calls.append(Customer.aload_customers_data())
+        results = await asyncio.gather(*calls)
+        for loaded in results[1::2]:
+            self.assertEqual([record["name"] for record in loaded],
+                             [f"C{number}" for number in range(len(loaded))])
+        self.assertEqual(len(Customer.load_customers_data()), 40)
+
+
+if __name__ == '__main__':
+    unittest.main()
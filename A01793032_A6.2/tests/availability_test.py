@@ -0,0 +1,217 @@
+"""
+availability_test.py - Unit Tests for the Availability Index
+
+This module contains unit tests for the interval index in
+src/reservation/availability.py and for the overlap checks it enables
+in the Reservation class.
+
+Test Cases:
+    - test_room_intervals: Overlap detection on one room's stays.
+    - test_overlapping_intervals: A long stay is found behind shorter
+    stays that start after it.
+    - test_rejects_overlapping_booking: create_reservation refuses a
+    stay that overlaps another booking of the same room.
+    - test_back_to_back_and_other_rooms: Adjacent stays and other
+    rooms are accepted.
+    - test_cancel_frees_room: A canceled stay can be booked again.
+    - test_free_rooms: Rooms free for a whole stay, by default among
+    all the rooms of the hotel record.
+    - test_bulk_create_checks_batch: Entries of the same batch are
+    checked against each other.
+    - test_external_change_rebuilds: A file rewritten elsewhere
+    rebuilds the index.
+    - test_bad_stored_records: Stored stays without a check-out last
+    one night and stays with unreadable dates are skipped.
+
+To run the tests, execute the script using the following command:
+    python3 -m unittest tests/availability_test.py
+
+Author: Alejandra Mendoza Flores
+Date: October 19, 2026
+"""
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+# pylint: disable=wrong-import-position, import-error
+from src.hotel.hotel import Hotel
+from src.reservation.availability import RoomIntervals, stay_interval
+from src.reservation.reservation import Reservation
+from src.storage.memory import MemoryStorage
+from src.storage.storage import JsonFileStorage
+# pylint: enable=wrong-import-position, import-error
+
+
+class AvailabilityTest(unittest.TestCase):
+    """
+    Unit tests for the availability index.
+    """
+    def setUp(self):
+        # pylint: disable=consider-using-with
+        self.directory = tempfile.TemporaryDirectory()
+        self.previous = Reservation.storage
+        Reservation.storage = JsonFileStorage(
+            os.path.join(self.directory.name, "reservations.json"))
+        Reservation.create_reservation("Ana", "Hotel", 101,
+                                       "2024-02-14", "2024-02-18")
+
+    def tearDown(self):
+        Reservation.storage = self.previous
+        self.directory.cleanup()
+
+    def test_room_intervals(self):
+        """
+        Test case for overlap detection on one room.
+        """
+        intervals = RoomIntervals()
+        intervals.add(*stay_interval("2024-01-10", "2024-01-12"))
+        intervals.add(*stay_interval("2024-01-01", "2024-01-03"))
+        self.assertTrue(intervals.overlaps(
+            *stay_interval("2024-01-11", "2024-01-20")))
+        self.assertTrue(intervals.overlaps(
+            *stay_interval("2023-12-30", "2024-01-02")))
+        self.assertFalse(intervals.overlaps(
+            *stay_interval("2024-01-03", "2024-01-10")))
+        self.assertTrue(intervals.remove(stay_interval("2024-01-10")[0]))
+        self.assertEqual(len(intervals), 1)
+
+    def test_overlapping_intervals(self):
+        """
+        Test case for stays that overlap each other.
+        """
+        intervals = RoomIntervals()
+        intervals.add(*stay_interval("2024-01-01", "2024-01-10"))
+        intervals.add(*stay_interval("2024-01-02", "2024-01-03"))
+        self.assertTrue(intervals.overlaps(
+            *stay_interval("2024-01-05", "2024-01-06")))
+        self.assertFalse(intervals.overlaps(
+            *stay_interval("2024-01-10", "2024-01-11")))
+        self.assertTrue(intervals.remove(stay_interval("2024-01-01")[0]))
+        self.assertFalse(intervals.overlaps(
+            *stay_interval("2024-01-05", "2024-01-06")))
+        self.assertEqual(intervals.max_ends,
+                         [stay_interval("2024-01-03")[0]])
+
+    def test_rejects_overlapping_booking(self):
+        """
+        Test case verifying that overlapping bookings are rejected.
+        """
+        with self.assertLogs(level='WARNING') as cm:
+            reservation = Reservation.create_reservation(
+                "Luis", "Hotel", 101, "2024-02-17", "2024-02-20")
+        self.assertIsNone(reservation)
+        self.assertIn("already booked", cm.output[0])
+        with self.assertLogs(level='WARNING'):
+            self.assertIsNone(Reservation.create_reservation(
+                "Luis", "Hotel", 102, "2024-02-20", "2024-02-19"))
+        self.assertEqual(len(Reservation.load_reservations_data()), 1)
+
+    def test_back_to_back_and_other_rooms(self):
+        """
+        Test case verifying that adjacent stays and other rooms are
+        accepted.
+        """
+        self.assertIsNotNone(Reservation.create_reservation(
+            "Luis", "Hotel", 101, "2024-02-18", "2024-02-20"))
+        self.assertIsNotNone(Reservation.create_reservation(
+            "Eva", "Hotel", 102, "2024-02-15", "2024-02-16"))
+        self.assertIsNotNone(Reservation.create_reservation(
+            "Eva", "Other Hotel", 101, "2024-02-15", "2024-02-16"))
+
+    def test_cancel_frees_room(self):
+        """
+        Test case verifying that a canceled stay can be booked again.
+        """
+        Reservation.cancel_reservation("Ana", "Hotel", 101, "2024-02-14")
+        self.assertIsNotNone(Reservation.create_reservation(
+            "Luis", "Hotel", 101, "2024-02-15", "2024-02-16"))
+
+    def test_bad_stored_records(self):
+        """
+        Test case for stored records with missing or invalid dates.
+        """
+        with self.assertRaises(ValueError):
+            stay_interval(None)
+        Reservation.storage.save([
+            {"customer_name": "Ana", "hotel_name": "Hotel",
+             "room_number": 101, "check_in_date": "2024-02-14",
+             "check_out_date": None},
+            {"customer_name": "Eva", "hotel_name": "Hotel",
+             "room_number": 102, "check_in_date": None,
+             "check_out_date": None},
+            {"customer_name": "Bob", "hotel_name": "Hotel",
+             "room_number": 103, "check_in_date": 20240214.0}])
+        self.assertIsNone(Reservation.create_reservation(
+            "Luis", "Hotel", 101, "2024-02-14"))
+        for room in (101, 102, 103):
+            self.assertIsNotNone(Reservation.create_reservation(
+                "Luis", "Hotel", room, "2024-02-15"))
+
+    def test_free_rooms(self):
+        """
+        Test case for listing the rooms free for a whole stay.
+        """
+        Reservation.create_reservation("Luis", "Hotel", 102,
+                                       "2024-02-10", "2024-02-15")
+        self.assertEqual(Reservation.available_rooms(
+            "Hotel", "2024-02-12", "2024-02-14", rooms=[101, 102, 103]),
+            [101, 103])
+        Reservation.create_reservation("Luis", "Hotel", 1,
+                                       "2024-02-14", "2024-02-16")
+        hotels = MemoryStorage([{"name": "Hotel", "location": "City",
+                                 "rooms": 3}])
+        with patch.object(Hotel, "storage", hotels):
+            self.assertEqual(Reservation.available_rooms(
+                "Hotel", "2024-02-15"), [2, 3])
+            self.assertEqual(Reservation.available_rooms(
+                "Hotel", "2024-02-16", "2024-02-18"), [1, 2, 3])
+            self.assertEqual(Reservation.available_rooms(
+                "Nowhere", "2024-02-15"), [])
+
+    def test_bulk_create_checks_batch(self):
+        """
+        Test case verifying that batch entries are checked against
+        each other.
+        """
+        with self.assertLogs(level='WARNING'):
+            created = Reservation.create_reservations([
+                ("Luis", "Hotel", 103, "2024-03-01", "2024-03-05"),
+                ("Eva", "Hotel", 103, "2024-03-04", "2024-03-06"),
+                ("Eva", "Hotel", 101, "2024-02-16")])
+        self.assertIsNotNone(created[0])
+        self.assertIsNone(created[1])
+        self.assertIsNone(created[2])
+        self.assertEqual(len(Reservation.load_reservations_data()), 2)
+
+    def test_external_change_rebuilds(self):
+        """
+        Test case verifying that an external rewrite rebuilds the index.
+        """
+        Reservation.storage.save([])
+        self.assertIsNotNone(Reservation.create_reservation(
+            "Luis", "Hotel", 101, "2024-02-15", "2024-02-16"))
+
+    def test_bad_stored_records(self):
+        """
+        Test case for stored records with missing or invalid dates.
+        """
+        with self.assertRaises(ValueError):
+            stay_interval(None)
+        Reservation.storage.save([
+            {"customer_name": "Ana", "hotel_name": "Hotel",
+             "room_number": 101, "check_in_date": "2024-02-14",
+             "check_out_date": None},
+            {"customer_name": "Eva", "hotel_name": "Hotel",
+             "room_number": 102, "check_in_date": None,
+             "check_out_date": None},
+            {"customer_name": "Bob", "hotel_name": "Hotel",
+             "room_number": 103, "check_in_date": 20240214.0}])
+        self.assertIsNone(Reservation.create_reservation(
+            "Luis", "Hotel", 101, "2024-02-14"))
+        for room in (101, 102, 103):
+            self.assertIsNotNone(Reservation.create_reservation(
+                "Luis", "Hotel", room, "2024-02-15"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+"""
+bench_test.py - Unit Tests for the Benchmark Harness
+
+This module contains unit tests for src/bench/workload.py and
+src/bench/harness.py, run at a small scale.
+
+Test Cases:
+    - test_generated_reservations_do_not_overlap: The synthetic data
+    set has no two stays in the same room on the same night.
+    - test_parse_mix: Operation mixes are parsed and validated.
+    - test_run_workload: A threaded run reports every operation and
+    leaves the data files consistent.
+    - test_run_workload_processes: A run with two processes adds up
+    the operations of both.
+    - test_compare_and_main: The command line writes the report and
+    fails when it regressed against a baseline.
+
+To run the tests, execute the script using the following command:
+    python3 -m unittest tests/bench_test.py
+
+Author: Alejandra Mendoza Flores
+Date: October 19, 2026
+"""
+import io
+import os
+import json
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+from datetime import date
+# pylint: disable=wrong-import-position, import-error
+from src.bench.harness import compare, main, parse_mix, run_workload
+from src.bench.workload import generate, open_storages
+# pylint: enable=wrong-import-position, import-error
+
+SMALL = {"customers": 20, "hotels": 3, "reservations": 200, "rooms": 10,
+         "operations": 20}
+
+
+class BenchTest(unittest.TestCase):
+    """
+    Unit tests for the benchmark harness.
+    """
+    def setUp(self):
+        # pylint: disable=consider-using-with
+        self.directory = tempfile.TemporaryDirectory()
+        self.data_dir = self.directory.name
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_generated_reservations_do_not_overlap(self):
+        """
+        Test case verifying that generated stays never share a night.
+        """
+        dataset = generate(customers=10, hotels=2, reservations=300,
+                           rooms=4)
+        self.assertEqual(len(dataset["reservations"]), 300)
+        nights = set()
+        for record in dataset["reservations"]:
+            check_in = date.fromisoformat(record["check_in_date"])
+            check_out = date.fromisoformat(record["check_out_date"])
+            for night in range(check_in.toordinal(), check_out.toordinal()):
+                key = (record["hotel_name"], record["room_number"], night)
+                self.assertNotIn(key, nights)
+                nights.add(key)
+
+    def test_parse_mix(self):
+        """
+        Test case for parsing and rejecting operation mixes.
+        """
+        self.assertEqual(parse_mix("create=2, lookup"),
+                         {"create": 2.0, "lookup": 1.0})
+        for text in ("delete=1", "create=-1", "create=0", "create=x"):
+            with self.assertRaises(ValueError):
+                parse_mix(text)
+
+    def test_run_workload(self):
+        """
+        Test case for a threaded run on the JSON file backend.
+        """
+        report = run_workload(self.data_dir, threads=3, **SMALL)
+        self.assertEqual(report["operations"], 60)
+        self.assertEqual(sum(stats["count"]
+                             for stats in report["latency"].values()), 60)
+        for stats in report["latency"].values():
+            self.assertLessEqual(stats["p50_ms"], stats["p99_ms"])
+        self.assertIn("reservations.json", report["files"])
+        self.assertGreater(report["operations_per_second"], 0)
+
+        reservations = open_storages(self.data_dir)["reservations"].load()
+        keys = {(record["hotel_name"], record["room_number"],
+                 record["check_in_date"]) for record in reservations}
+        self.assertEqual(len(keys), len(reservations))
+
+    def test_run_workload_processes(self):
+        """
+        Test case for a run split over two processes.
+        """
+        report = run_workload(self.data_dir, threads=2, processes=2,
+                              backend="journal", **SMALL)
+        self.assertEqual(report["operations"], 80)
+        self.assertEqual(report["config"]["processes"], 2)
+
+    def test_compare_and_main(self):
+        """
+        Test case for comparing with a baseline from the command line.
+        """
+        output = os.path.join(self.data_dir, "run.json")
+        arguments = ["--threads", "1", "--mix", "lookup",
+                     "--data-dir", os.path.join(self.data_dir, "data")]
+        for name, value in SMALL.items():
+            arguments += [f"--{name}", str(value)]
+        with redirect_stdout(io.StringIO()):
+            self.assertEqual(main(arguments + ["--output", output]), 0)
+        with open(output, "r", encoding="utf-8") as file:
+            report = json.load(file)
+        self.assertEqual(list(report["latency"]), ["lookup"])
+
+        faster = json.loads(json.dumps(report))
+        for key in ("mean_ms", "p50_ms", "p95_ms", "p99_ms"):
+            faster["latency"]["lookup"][key] = \
+                report["latency"]["lookup"][key] / 10
+        self.assertEqual(compare(report, faster)["regressions"],
+                         ["lookup"])
+        self.assertEqual(compare(report, report)["regressions"], [])
+        with open(output, "w", encoding="utf-8") as file:
+            json.dump(faster, file)
+        with redirect_stdout(io.StringIO()):
+            self.assertEqual(main(arguments + ["--baseline", output]), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,136 @@
+"""
+customer_repository_test.py - Unit Tests for CustomerRepository
+
+This module contains unit tests for the in-memory CustomerRepository
+in src/customer/repository.py.
+
+Test Cases:
+    - test_lookups: Lookups by name, email and phone.
+    - test_reads_served_from_memory: Repeated lookups do not reload
+    the storage.
+    - test_write_through: Creates, modifications and deletes reach the
+    JSON file.
+    - test_unique_fields: Duplicate emails and phones are rejected.
+    - test_external_change_invalidates: A file changed underneath the
+    repository is reloaded.
+    - test_concurrent_writer: A write made elsewhere while the
+    repository writes is not mistaken for its own.
+
+To run the tests, execute the script using the following command:
+    python3 -m unittest tests/customer_repository_test.py
+
+Author: Alejandra Mendoza Flores
+Date: October 19, 2026
+"""
+import os
+import json
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+# pylint: disable=wrong-import-position, import-error
+from src.customer.repository import CustomerRepository
+from src.storage.storage import JsonFileStorage
+# pylint: enable=wrong-import-position, import-error
+
+
+class CustomerRepositoryTest(unittest.TestCase):
+    """
+    Unit tests for the CustomerRepository class.
+    """
+    def setUp(self):
+        # pylint: disable=consider-using-with
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "customers.json")
+        self.storage = JsonFileStorage(self.path)
+        self.repository = CustomerRepository(self.storage)
+        self.repository.create("Alice", "alice@example.com", "5551234567")
+        self.repository.create("Bob", "bob@example.com", "9998887776")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_lookups(self):
+        """
+        Test case for lookups by name, email and phone.
+        """
+        self.assertEqual(self.repository.get("Alice")["phone"],
+                         "5551234567")
+        self.assertEqual(
+            self.repository.find_by_email("bob@example.com")["name"], "Bob")
+        self.assertEqual(
+            self.repository.find_by_phone("5551234567")["name"], "Alice")
+        self.assertIsNone(self.repository.get("Nobody"))
+        self.assertIn("Bob", self.repository)
+        self.assertEqual(len(self.repository), 2)
+
+    def test_reads_served_from_memory(self):
+        """
+        Test case verifying that lookups do not reload the file.
+        """
+        with patch.object(self.storage, "load") as load:
+            for _ in range(100):
+                self.repository.get("Alice")
+        load.assert_not_called()
+
+    def test_write_through(self):
+        """
+        Test case verifying that writes reach the JSON file.
+        """
+        self.assertTrue(self.repository.modify("Alice",
+                                               email="new@example.com"))
+        self.assertTrue(self.repository.delete("Bob"))
+        self.assertFalse(self.repository.delete("Bob"))
+        with open(self.path, "r", encoding="utf-8") as file:
+            self.assertEqual(json.load(file), [
+                {"name": "Alice", "email": "new@example.com",
+                 "phone": "5551234567"}])
+        self.assertIsNone(self.repository.find_by_email("alice@example.com"))
+        self.assertIsNone(self.repository.find_by_email("bob@example.com"))
+
+    def test_unique_fields(self):
+        """
+        Test case verifying that emails and phones stay unique.
+        """
+        with self.assertLogs(level='WARNING'):
+            self.assertIsNone(self.repository.create(
+                "Carol", "alice@example.com", "1112223333"))
+        with self.assertLogs(level='WARNING'):
+            self.assertFalse(self.repository.modify(
+                "Bob", phone="5551234567"))
+        self.assertEqual(len(self.storage.load()), 2)
+
+    def test_external_change_invalidates(self):
+        """
+        Test case verifying that an external rewrite is picked up.
+        """
+        with open(self.path, "w", encoding="utf-8") as file:
+            json.dump([{"name": "Dave", "email": "dave@example.com",
+                        "phone": "1"}], file)
+        self.assertIsNone(self.repository.get("Alice"))
+        self.assertEqual(self.repository.get("Dave")["phone"], "1")
+
+
+    def test_concurrent_writer(self):
+        """
+        Test case for another writer racing a repository write.
+        """
+        other = JsonFileStorage(self.path, cache=None)
+        writer = threading.Thread(target=other.add, args=(
+            {"name": "Eve", "email": "eve@example.com", "phone": "1"},))
+        add = self.storage.add
+
+        def racing_add(record):
+            writer.start()
+            writer.join(0.2)
+            return add(record)
+
+        with patch.object(self.storage, "add", side_effect=racing_add):
+            self.repository.create("Carol", "carol@example.com", "2")
+        writer.join()
+        self.assertIsNotNone(self.repository.get("Eve"))
+        self.assertIsNotNone(self.repository.get("Carol"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -15,10 +15,14 @@ including successful deletion and handling of non-existent customers.
 method to ensure it logs the expected customer information.
 - `test_modify_customer_info`: Tests the modification of customer
 information using the `modify_customer_info` method.
+- `test_create_customers`: Tests the bulk `create_customers` method.
+- `test_delete_customers_many`: Tests bulk deletion by name and
+by predicate.
 
 Test Setup:
-- The `setUp` method clears the content of 'customers.json'
-before each test.
+- The `setUp` method gives the classes empty in-memory storage
+before each test (see src/storage/config.py), so no data file is
+touched and the tests can run in parallel.
 
 Logging Configuration:
 - The `logging.basicConfig` method is used to configure logging
@@ -37,6 +41,7 @@ import unittest
 import logging
 # pylint: disable=wrong-import-position, import-error
 from src.customer.customer import Customer
+from src.storage.config import configure_storage, restore_storage
 logging.basicConfig(level=logging.INFO)
 # pylint: enable=wrong-import-position, import-error
 
@@ -46,9 +51,12 @@ class CustomerTest(unittest.TestCase):
     Unit tests for the Customer class.
     """
     def setUp(self):
-        # Clear the content of customers.json before each test
-        with open("customers.json", "w", encoding="utf-8") as file:
-            file.write("[]")
+        # Start every test from an empty in-memory customer storage
+        self.previous_storage = configure_storage(backend="memory")
+        Customer.storage.save([])
+
+    def tearDown(self):
+        restore_storage(self.previous_storage)
 
     def test_create_customer(self):
         """
@@ -111,6 +119,35 @@ class CustomerTest(unittest.TestCase):
         self.assertEqual(
             Customer.load_customers_data()[0]["phone"], "1112233445")
 
+    def test_create_customers(self):
+        """
+        Test case for creating many customers in one batch.
+        """
+        customers = Customer.create_customers([
+            ("Ana", "ana@example.com", "1"),
+            {"name": "Luis", "email": "luis@example.com", "phone": "2"},
+            ("Broken", "broken@example.com"),
+            "abc", b"abc", 42, None])
+        self.assertEqual(customers[0].name, "Ana")
+        self.assertEqual(customers[1].email, "luis@example.com")
+        self.assertEqual(customers[2:], [None] * 5)
+        self.assertEqual(len(Customer.load_customers_data()), 2)
+
+    def test_delete_customers_many(self):
+        """
+        Test case for deleting many customers by name and by predicate.
+        """
+        Customer.create_customers([("Ana", "ana@example.com", "1"),
+                                   ("Luis", "luis@example.com", "2"),
+                                   ("Eva", "eva@gmail.com", "3")])
+        outcomes = Customer.delete_customers_many(["Ana", "Nobody"])
+        self.assertEqual(outcomes, [("Ana", 1), ("Nobody", 0)])
+        outcomes = Customer.delete_customers_many(
+            lambda customer: customer["email"].endswith("@gmail.com"))
+        self.assertEqual(outcomes, [("Eva", 1)])
+        self.assertEqual([customer["name"] for customer
+                          in Customer.load_customers_data()], ["Luis"])
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -13,10 +13,13 @@ Test Cases:
     - test_reserve_room: Tests the reserve_room method of the Hotel class.
     - test_cancel_reservation: Tests the cancel_reservation
     method of the Hotel class.
+    - test_bulk_create_and_delete: Tests the create_hotels and
+    delete_hotels_many methods of the Hotel class.
 
 Each test case is designed to assert the correct behavior of the Hotel class
 methods under different scenarios. The setUp method ensures a consistent
-starting point for each test by creating a test instance of the Hotel class.
+starting point for each test by giving the classes empty in-memory
+storage and creating a test instance of the Hotel class.
 
 To run the tests, execute the script using the following command:
     python3 -m unittest hotel_test.py
@@ -36,6 +39,7 @@ print(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from src.hotel.hotel import Hotel
 from src.reservation.reservation import Reservation
+from src.storage.config import configure_storage, restore_storage
 
 class HotelTest(unittest.TestCase):
     """
@@ -43,8 +47,12 @@ class HotelTest(unittest.TestCase):
     """
 
     def setUp(self):
+        self.previous_storage = configure_storage(backend="memory")
         self.test_hotel = Hotel("Test Hotel", "Test Location", 10)
 
+    def tearDown(self):
+        restore_storage(self.previous_storage)
+
     def test_create_hotel(self):
         """
         Test case for the create_hotel method.
@@ -120,6 +128,18 @@ class HotelTest(unittest.TestCase):
         self.test_hotel.cancel_reservation(reservation)
         self.assertNotIn(reservation, self.test_hotel.reservations)
 
+    def test_bulk_create_and_delete(self):
+        """
+        Test case for creating and deleting many hotels in one batch.
+        """
+        hotels = Hotel.create_hotels([("Bulk Hotel A", "North", 5),
+                                      {"name": "Bulk Hotel B",
+                                       "location": "South", "rooms": 8}])
+        self.assertEqual([hotel.rooms for hotel in hotels], [5, 8])
+        outcomes = Hotel.delete_hotels_many(
+            lambda hotel: hotel["name"].startswith("Bulk Hotel"))
+        self.assertEqual(outcomes, [("Bulk Hotel A", 1), ("Bulk Hotel B", 1)])
+
 
 if __name__ == '__main__':
     unittest.main()
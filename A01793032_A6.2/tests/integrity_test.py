@@ -0,0 +1,156 @@
+"""
+integrity_test.py - Unit Tests for Reservation Referential Integrity
+
+This module contains unit tests for src/reservation/integrity.py and
+Reservation.set_integrity, run on in-memory storage.
+
+Test Cases:
+    - test_bookings_must_reference_existing_records: Unknown customers
+    and hotels and rooms out of range are rejected.
+    - test_checks_do_not_reload: Bookings and writes through the
+    classes never reload customers or hotels; external writes do.
+    - test_delete_rejected: Customers and hotels with reservations are
+    kept by the "reject" policy.
+    - test_delete_cascades: The "cascade" policy cancels the
+    reservations of deleted customers and hotels.
+    - test_integrity_off: Without integrity nothing is checked.
+
+To run the tests, execute the script using the following command:
+    python3 -m unittest tests/integrity_test.py
+
+Author: Alejandra Mendoza Flores
+Date: October 19, 2026
+"""
+import unittest
+from unittest.mock import patch
+# pylint: disable=wrong-import-position, import-error
+from src.customer.customer import Customer
+from src.hotel.hotel import Hotel
+from src.reservation.reservation import Reservation
+from src.storage.config import configure_storage, restore_storage
+# pylint: enable=wrong-import-position, import-error
+
+
+class IntegrityTest(unittest.TestCase):
+    """
+    Unit tests for the referential integrity checks.
+    """
+    def setUp(self):
+        self.previous_storage = configure_storage(backend="memory")
+        Reservation.set_integrity("reject")
+        Customer.create_customers([("Ana", "ana@example.com", "555-0101"),
+                                   ("Luis", "luis@example.com", "555-0102")])
+        Hotel.create_hotels([("Hotel A", "City", 10),
+                             ("Hotel B", "Beach", 5)])
+
+    def tearDown(self):
+        Reservation.set_integrity(None)
+        restore_storage(self.previous_storage)
+
+    def book(self, customer="Ana", hotel="Hotel A", room=1,
+             check_in="2024-05-01"):
+        """
+        Books a one-night stay and returns the reservation or None.
+        """
+        return Reservation.create_reservation(customer, hotel, room,
+                                              check_in)
+
+    def test_bookings_must_reference_existing_records(self):
+        """
+        Test case for rejecting reservations that refer to nothing.
+        """
+        self.assertIsNotNone(self.book())
+        self.assertIsNotNone(self.book(hotel="Hotel B", room=5))
+        with self.assertLogs(level="WARNING") as logs:
+            self.assertIsNone(self.book(customer="Eva"))
+            self.assertIsNone(self.book(hotel="Hotel C"))
+            for room in (0, 11, "3", True):
+                self.assertIsNone(self.book(room=room))
+        self.assertIn("customer Eva does not exist", logs.output[0])
+        self.assertIn("room 11 is not between 1 and 10", logs.output[3])
+
+        results = Reservation.create_reservations([
+            ("Luis", "Hotel A", 2, "2024-05-01"),
+            ("Luis", "Hotel Z", 2, "2024-05-01"),
+            ("Nobody", "Hotel A", 3, "2024-05-01")])
+        self.assertEqual([result is not None for result in results],
+                         [True, False, False])
+        self.assertEqual(len(Reservation.load_reservations_data()), 3)
+
+    def test_checks_do_not_reload(self):
+        """
+        Test case verifying that checks are served from memory.
+        """
+        self.assertIsNotNone(self.book())
+        with patch.object(Customer.storage, "load",
+                          wraps=Customer.storage.load) as customers, \
+                patch.object(Hotel.storage, "load",
+                             wraps=Hotel.storage.load) as hotels:
+            Customer.create_customer("Eva", "eva@example.com", "555-0103")
+            Hotel.create_hotel("Hotel C", "Lake", 3)
+            for day in range(2, 12):
+                self.assertIsNotNone(self.book(
+                    customer="Eva", hotel="Hotel C",
+                    check_in=f"2024-05-{day:02d}"))
+            Customer.delete_customer("Luis")
+            self.assertIsNone(self.book(customer="Luis"))
+            self.assertEqual(customers.call_count, 0)
+            self.assertEqual(hotels.call_count, 0)
+
+            Customer.storage.save([{"name": "Zoe", "email": None,
+                                    "phone": None}])
+            self.assertIsNotNone(self.book(customer="Zoe", room=2))
+            self.assertIsNone(self.book(customer="Ana", room=3))
+            self.assertEqual(customers.call_count, 1)
+
+    def test_delete_rejected(self):
+        """
+        Test case for the "reject" policy.
+        """
+        self.book()
+        with self.assertLogs(level="WARNING"):
+            Customer.delete_customer("Ana")
+        self.assertEqual([record["name"]
+                          for record in Customer.load_customers_data()],
+                         ["Ana", "Luis"])
+        with self.assertLogs(level="WARNING"):
+            outcomes = Hotel.delete_hotels_many(["Hotel A", "Hotel B"])
+        self.assertEqual(outcomes, [("Hotel A", 0), ("Hotel B", 1)])
+        self.assertEqual(Customer.delete_customers_many(
+            lambda record: True), [("Luis", 1)])
+        self.assertEqual(len(Reservation.load_reservations_data()), 1)
+
+    def test_delete_cascades(self):
+        """
+        Test case for the "cascade" policy.
+        """
+        Reservation.set_integrity("cascade")
+        self.book()
+        self.book(customer="Luis", room=2)
+        self.book(customer="Luis", hotel="Hotel B")
+        Customer.delete_customer("Ana")
+        self.assertEqual(
+            len(Reservation.reservations_for_customer("Ana")), 0)
+        self.assertEqual(Hotel.delete_hotels_many(["Hotel B"]),
+                         [("Hotel B", 1)])
+        self.assertEqual([(record["customer_name"], record["hotel_name"])
+                          for record in Reservation.load_reservations_data()],
+                         [("Luis", "Hotel A")])
+        self.assertIsNone(self.book())
+
+    def test_integrity_off(self):
+        """
+        Test case for bookings and deletes without integrity checks.
+        """
+        with self.assertRaises(ValueError):
+            Reservation.set_integrity("ignore")
+        Reservation.set_integrity(None)
+        self.assertEqual(Customer.delete_guards, [])
+        self.assertEqual(Hotel.delete_guards, [])
+        self.assertIsNotNone(self.book(customer="Eva", room=101))
+        Customer.delete_customer("Ana")
+        self.assertIsNotNone(self.book(customer="Ana", room=2))
+
+
+if __name__ == '__main__':
+    unittest.main()
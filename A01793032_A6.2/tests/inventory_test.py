@@ -0,0 +1,172 @@
+"""
+inventory_test.py - Unit Tests for the Room Inventory Bitmaps
+
+This module contains unit tests for src/hotel/inventory.py and for the
+inventory kept by Hotel.reserve_room and Hotel.cancel_reservation.
+
+Test Cases:
+    - test_nightly_checks: Single-night and whole-stay checks.
+    - test_cancel_frees_nights: Cancelling clears the room's bits.
+    - test_hotel_rejects_double_booking: Hotel.reserve_room refuses a
+    room that is taken for part of the stay.
+    - test_hotel_rejects_bad_dates: Hotel.reserve_room refuses a stay
+    whose dates cannot be parsed.
+    - test_sidecar_round_trip: The bitmaps are rebuilt from
+    reservations.json, persisted, reused and rebuilt after a change to
+    the reservations or the hotels.
+    - test_hotel_loads_inventory: Hotel.load_inventory reads the sidecar
+    next to the reservations.
+
+To run the tests, execute the script using the following command:
+    python3 -m unittest tests/inventory_test.py
+
+Author: Alejandra Mendoza Flores
+Date: October 19, 2026
+"""
+import os
+import json
+import tempfile
+import unittest
+from unittest.mock import patch
+# pylint: disable=wrong-import-position, import-error
+from src.hotel.hotel import Hotel
+from src.hotel.inventory import RoomInventory, load_inventories
+from src.reservation.reservation import Reservation
+from src.storage.config import storage_scope
+from src.storage.storage import JsonFileStorage
+# pylint: enable=wrong-import-position, import-error
+
+
+class InventoryTest(unittest.TestCase):
+    """
+    Unit tests for the RoomInventory class.
+    """
+    def setUp(self):
+        self.inventory = RoomInventory(10)
+        self.inventory.reserve(101, "2024-02-14", "2024-02-18")
+        self.inventory.reserve(102, "2024-02-16")
+
+    def test_nightly_checks(self):
+        """
+        Test case for single-night and whole-stay checks.
+        """
+        self.assertEqual(self.inventory.free_count("2024-02-13"), 10)
+        self.assertEqual(self.inventory.free_count("2024-02-16"), 8)
+        self.assertEqual(self.inventory.free_count("2024-02-18"), 10)
+        self.assertFalse(self.inventory.is_free(101, "2024-02-17"))
+        self.assertTrue(self.inventory.is_free(101, "2024-02-18",
+                                               "2024-02-20"))
+        self.assertTrue(self.inventory.is_free(103, "2024-02-14",
+                                               "2024-02-18"))
+        self.assertEqual(
+            self.inventory.free_rooms("2024-02-10", "2024-02-15",
+                                      rooms=[101, 102, 103]), [102, 103])
+        self.assertFalse(self.inventory.reserve(102, "2024-02-15",
+                                                "2024-02-17"))
+
+    def test_cancel_frees_nights(self):
+        """
+        Test case verifying that cancelling clears the room's bits.
+        """
+        self.inventory.cancel(101, "2024-02-14", "2024-02-18")
+        self.assertTrue(self.inventory.is_free(101, "2024-02-14",
+                                               "2024-02-18"))
+        self.assertEqual(self.inventory.free_count("2024-02-16"), 9)
+        self.assertEqual(len(self.inventory.days), 1)
+
+    def test_hotel_rejects_double_booking(self):
+        """
+        Test case verifying that Hotel keeps its inventory in sync.
+        """
+        hotel = Hotel("Test Hotel", "Test Location", 10)
+        first = Reservation("John Doe", "Test Hotel", 101,
+                            "2024-02-14", "2024-02-18")
+        second = Reservation("Jane Doe", "Test Hotel", 101,
+                             "2024-02-17", "2024-02-19")
+        self.assertTrue(hotel.reserve_room(first))
+        with patch("builtins.print") as printed:
+            self.assertFalse(hotel.reserve_room(second))
+        printed.assert_called_once_with("Room not available.")
+        self.assertEqual(list(hotel.reservations), [first])
+        self.assertEqual(hotel.inventory.free_count("2024-02-15"), 9)
+
+        hotel.cancel_reservation(first)
+        hotel.reserve_room(second)
+        self.assertEqual(list(hotel.reservations), [second])
+        self.assertTrue(hotel.inventory.is_free(101, "2024-02-14",
+                                                "2024-02-17"))
+
+    def test_hotel_rejects_bad_dates(self):
+        """
+        Test case verifying that invalid dates are not reserved.
+        """
+        hotel = Hotel("Test Hotel", "Test Location", 10)
+        for check_in, check_out in (("bad date", None),
+                                    ("2024-02-18", "2024-02-14")):
+            reservation = Reservation("John Doe", "Test Hotel", 101,
+                                      check_in, check_out)
+            with patch("builtins.print") as printed:
+                self.assertFalse(hotel.reserve_room(reservation))
+            printed.assert_called_once_with("Invalid reservation dates.")
+        self.assertEqual(list(hotel.reservations), [])
+
+    def test_sidecar_round_trip(self):
+        """
+        Test case for rebuilding, persisting and reusing the sidecar.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            reservations = JsonFileStorage(
+                os.path.join(directory, "reservations.json"))
+            hotels = JsonFileStorage(os.path.join(directory, "hotels.json"))
+            sidecar = os.path.join(directory, "reservations.inventory.json")
+            hotels.save([{"name": "Sea", "location": "Coast", "rooms": 3}])
+            reservations.save([
+                {"customer_name": "Alice", "hotel_name": "Sea",
+                 "room_number": 1, "check_in_date": "2024-03-01",
+                 "check_out_date": "2024-03-04"},
+                {"customer_name": "Bob", "hotel_name": "Sea",
+                 "room_number": 2, "check_in_date": "bad date",
+                 "check_out_date": None}])
+
+            inventories = load_inventories(reservations, hotels, sidecar)
+            self.assertEqual(inventories["Sea"].free_count("2024-03-02"), 2)
+            with open(sidecar, "r", encoding="utf-8") as file:
+                self.assertIn("Sea", json.load(file)["hotels"])
+
+            with patch.object(reservations, "load") as load:
+                reused = load_inventories(reservations, hotels, sidecar)
+            load.assert_not_called()
+            self.assertFalse(reused["Sea"].is_free(1, "2024-03-03"))
+
+            hotels.save([{"name": "Sea", "location": "Coast", "rooms": 5}])
+            resized = load_inventories(reservations, hotels, sidecar)
+            self.assertEqual(resized["Sea"].free_count("2024-03-02"), 4)
+
+            reservations.remove({"customer_name": "Alice"})
+            rebuilt = load_inventories(reservations, hotels, sidecar)
+            self.assertTrue(rebuilt["Sea"].is_free(1, "2024-03-03"))
+
+    def test_hotel_loads_inventory(self):
+        """
+        Test case for loading a Hotel's inventory from storage.
+        """
+        with tempfile.TemporaryDirectory() as directory, \
+                storage_scope(directory):
+            Hotel.create_hotel("Sea", "Coast", 3)
+            Reservation.create_reservation("Alice", "Sea", 1,
+                                           "2024-03-01", "2024-03-04")
+            hotel = Hotel("Sea", "Coast", 3)
+            inventory = hotel.load_inventory(Reservation.storage)
+            self.assertIs(hotel.inventory, inventory)
+            self.assertEqual(inventory.free_count("2024-03-02"), 2)
+            self.assertTrue(os.path.exists(
+                os.path.join(directory, "reservations.inventory.json")))
+            with patch("builtins.print"):
+                self.assertFalse(hotel.reserve_room(Reservation(
+                    "Bob", "Sea", 1, "2024-03-03")))
+            self.assertEqual(Hotel("Lake", "Hills", 2).load_inventory(
+                Reservation.storage).free_count("2024-03-02"), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
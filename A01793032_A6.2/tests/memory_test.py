@@ -0,0 +1,132 @@
+"""
+memory_test.py - Unit Tests for the In-Memory Storage and Configuration
+
+This module contains unit tests for src/storage/memory.py and
+src/storage/config.py.
+
+Test Cases:
+    - test_memory_storage_operations: Add, update, remove and find work
+    like the JSON file backend, on copies of the records.
+    - test_failed_batch_changes_nothing: A batch with a bad operation
+    leaves the records as they were.
+    - test_reservations_on_memory_storage: Overlaps are rejected and
+    cancellations seen by the indexes.
+    - test_configure_storage: The classes are pointed at a data
+    directory, the HOTEL_DATA_DIR directory or a backend, and back.
+
+To run the tests, execute the script using the following command:
+    python3 -m unittest tests/memory_test.py
+
+Author: Alejandra Mendoza Flores
+Date: October 19, 2026
+"""
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+# pylint: disable=wrong-import-position, import-error
+from src.customer.customer import Customer
+from src.hotel.hotel import Hotel
+from src.reservation.reservation import Reservation
+from src.storage.config import (configure_storage, restore_storage,
+                                storage_scope)
+from src.storage.memory import MemoryStorage
+from src.storage.storage import DATA_DIR_ENV, JsonFileStorage, data_path
+# pylint: enable=wrong-import-position, import-error
+
+
+class MemoryStorageTest(unittest.TestCase):
+    """
+    Unit tests for MemoryStorage and the storage configuration.
+    """
+    def test_memory_storage_operations(self):
+        """
+        Test case for the operations of the in-memory backend.
+        """
+        storage = MemoryStorage()
+        self.assertFalse(storage.exists())
+        self.assertIsNone(storage.signature())
+        self.assertEqual(storage.load(), [])
+        storage.add({"name": "Ana", "email": "ana@example.com"})
+        storage.add({"name": "Luis", "email": "luis@example.com"})
+        signature = storage.signature()
+        self.assertTrue(storage.exists())
+        self.assertEqual(storage.update({"name": "Ana"},
+                                        {"email": "new@example.com"}), 1)
+        self.assertNotEqual(storage.signature(), signature)
+        found = storage.find({"name": "Ana"})
+        self.assertEqual(found, [{"name": "Ana",
+                                  "email": "new@example.com"}])
+        found[0]["email"] = "changed@example.com"
+        storage.load()[0]["name"] = "Changed"
+        self.assertEqual(storage.find({"email": "new@example.com"}),
+                         [{"name": "Ana", "email": "new@example.com"}])
+        self.assertEqual(storage.remove({"name": "Luis"}), 1)
+        self.assertEqual(storage.remove({"name": "Luis"}), 0)
+        self.assertEqual(len(storage.load()), 1)
+        self.assertTrue(MemoryStorage([]).exists())
+
+    def test_failed_batch_changes_nothing(self):
+        """
+        Test case for a batch whose last operation is invalid.
+        """
+        storage = MemoryStorage([{"name": "Ana"}])
+        signature = storage.signature()
+        with self.assertRaises(ValueError):
+            storage.apply_many([{"op": "add", "record": {"name": "Luis"}},
+                                {"op": "remove", "match": {"name": "Ana"}},
+                                {"op": "rename", "match": {}}])
+        self.assertEqual(storage.load(), [{"name": "Ana"}])
+        self.assertEqual(storage.signature(), signature)
+
+    def test_reservations_on_memory_storage(self):
+        """
+        Test case running the Reservation class on in-memory storage.
+        """
+        with storage_scope(backend="memory"):
+            self.assertIsNotNone(Reservation.create_reservation(
+                "Ana", "Hotel A", 1, "2024-05-01", "2024-05-03"))
+            self.assertIsNone(Reservation.create_reservation(
+                "Luis", "Hotel A", 1, "2024-05-02"))
+            Reservation.storage.save([])
+            self.assertIsNotNone(Reservation.create_reservation(
+                "Luis", "Hotel A", 1, "2024-05-02"))
+            self.assertEqual(len(Reservation.load_reservations_data()), 1)
+
+    def test_configure_storage(self):
+        """
+        Test case for pointing the classes at new storage.
+        """
+        originals = (Customer.storage, Hotel.storage, Reservation.storage)
+        with tempfile.TemporaryDirectory() as directory:
+            previous = configure_storage(directory)
+            try:
+                Hotel.create_hotel("Hotel A", "City", 10)
+                self.assertIsInstance(Customer.storage, JsonFileStorage)
+                self.assertTrue(os.path.exists(
+                    os.path.join(directory, "hotels.json")))
+            finally:
+                restore_storage(previous)
+            self.assertEqual(previous, originals)
+
+            with patch.dict(os.environ, {DATA_DIR_ENV: directory}):
+                self.assertEqual(data_path("customers.json"),
+                                 os.path.join(directory, "customers.json"))
+                with storage_scope(backend="journal"):
+                    self.assertEqual(Hotel.storage.path,
+                                     os.path.join(directory, "hotels.json"))
+                    self.assertEqual(len(Hotel.storage.load()), 1)
+        with patch.dict(os.environ, clear=True):
+            self.assertEqual(data_path("customers.json"), "customers.json")
+
+        with storage_scope(backend=lambda path: MemoryStorage([])):
+            self.assertTrue(Customer.storage.exists())
+            self.assertIsNot(Customer.storage, Hotel.storage)
+        self.assertEqual((Customer.storage, Hotel.storage,
+                          Reservation.storage), originals)
+        with self.assertRaises(ValueError):
+            configure_storage(backend="floppy")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,206 @@
+"""
+metrics_test.py - Unit Tests for the Operation Metrics
+
+This module contains unit tests for src/metrics/metrics.py and for the
+instrumentation of the Customer class and the storage backends.
+
+Test Cases:
+    - test_default_registry_does_nothing: Without a registry nothing is
+    collected.
+    - test_operations_and_storage_phases: Customer calls are counted
+    and timed, with the storage phases, bytes and scanned records.
+    - test_other_backends: The journal, WAL, record file, SQLite and
+    sharded backends report their storage metrics too.
+    - test_failed_call_and_hooks: A raising call counts as an error and
+    hooks see every observation.
+    - test_exporters: The Prometheus and JSON exporters write the
+    collected values.
+
+To run the tests, execute the script using the following command:
+    python3 -m unittest tests/metrics_test.py
+
+Author: Alejandra Mendoza Flores
+Date: October 19, 2026
+"""
+import os
+import json
+import tempfile
+import unittest
+# pylint: disable=wrong-import-position, import-error
+from src.customer.customer import Customer
+from src.metrics.metrics import (OPERATION_SECONDS, OPERATIONS_TOTAL,
+                                 READ_BYTES, SCANNED_RECORDS,
+                                 STORAGE_SECONDS, WRITTEN_BYTES,
+                                 JsonExporter, NullRegistry,
+                                 PrometheusExporter, Registry,
+                                 get_registry, set_registry)
+from src.storage.journal import JournalStorage
+from src.storage.records import RecordFileStorage
+from src.storage.sharded import ShardedStorage
+from src.storage.sqlite_storage import SqliteDatabase
+from src.storage.storage import JsonFileStorage
+from src.storage.wal import WalStorage
+# pylint: enable=wrong-import-position, import-error
+
+
+def values(snapshot, kind, name, field="value"):
+    """
+    Returns the values of one metric by label set.
+    """
+    return {tuple(sorted(item["labels"].items())): item[field]
+            for item in snapshot[kind] if item["name"] == name}
+
+
+class MetricsTest(unittest.TestCase):
+    """
+    Unit tests for the metrics registry and exporters.
+    """
+    def setUp(self):
+        # pylint: disable=consider-using-with
+        self.directory = tempfile.TemporaryDirectory()
+        self.previous_storage = Customer.storage
+        Customer.storage = JsonFileStorage(
+            os.path.join(self.directory.name, "customers.json"), cache=None)
+        self.registry = Registry()
+        self.previous_registry = set_registry(self.registry)
+
+    def tearDown(self):
+        set_registry(self.previous_registry)
+        Customer.storage = self.previous_storage
+        self.directory.cleanup()
+
+    def test_default_registry_does_nothing(self):
+        """
+        Test case for the do-nothing default registry.
+        """
+        set_registry(None)
+        self.assertIsInstance(get_registry(), NullRegistry)
+        self.assertFalse(get_registry().enabled)
+        Customer.create_customer("Ana", "ana@example.com", "555-0101")
+        self.assertEqual(self.registry.snapshot(),
+                         {"counters": [], "histograms": []})
+
+    def test_operations_and_storage_phases(self):
+        """
+        Test case for the metrics of customer operations.
+        """
+        Customer.create_customer("Ana", "ana@example.com", "555-0101")
+        Customer.create_customer("Luis", "luis@example.com", "555-0102")
+        Customer.display_customer_info("Luis")
+        snapshot = self.registry.snapshot()
+
+        calls = values(snapshot, "counters", OPERATIONS_TOTAL)
+        self.assertEqual(calls[(("operation", "Customer.create_customer"),
+                                ("outcome", "ok"))], 2)
+        self.assertEqual(values(snapshot, "histograms", OPERATION_SECONDS,
+                                "count"),
+                         {(("operation", "Customer.create_customer"),): 2,
+                          (("operation",
+                            "Customer.display_customer_info"),): 1})
+
+        phases = {dict(labels)["phase"]: count for labels, count in
+                  values(snapshot, "histograms", STORAGE_SECONDS,
+                         "count").items()}
+        self.assertEqual(phases, {"load": 2, "parse": 2, "scan": 3,
+                                  "serialize": 2, "write": 2})
+        size = os.path.getsize(Customer.storage.path)
+        file_label = (("file", "customers.json"),)
+        self.assertGreater(
+            values(snapshot, "counters", READ_BYTES)[file_label], 0)
+        self.assertGreater(
+            values(snapshot, "counters", WRITTEN_BYTES)[file_label], size)
+        self.assertEqual(
+            values(snapshot, "histograms", SCANNED_RECORDS,
+                   "sum")[file_label], 2)
+
+    def test_other_backends(self):
+        """
+        Test case for the metrics of the other storage backends.
+        """
+        def path(name):
+            return os.path.join(self.directory.name, name)
+
+        database = SqliteDatabase(":memory:")
+        self.addCleanup(database.close)
+        os.mkdir(path("shards"))
+        backends = {
+            "journal": lambda: JournalStorage(path("journal.json")),
+            "wal": lambda: WalStorage(path("wal.json")),
+            "records": lambda: RecordFileStorage(path("c.rec"), ("name",)),
+            "sqlite": lambda: database.storage("customers"),
+            "sharded": lambda: ShardedStorage(path("shards")),
+        }
+        for name, backend in backends.items():
+            with self.subTest(backend=name):
+                registry = Registry()
+                set_registry(registry)
+                storage = backend()
+                storage.add({"name": "Ana"})
+                storage.add({"name": "Luis"})
+                reader = backend()
+                self.assertEqual(len(reader.find({"name": "Luis"})), 1)
+                self.assertEqual(len(reader.load()), 2)
+                for other in (storage, reader):
+                    if hasattr(other, "close"):
+                        other.close()
+                snapshot = registry.snapshot()
+                self.assertTrue(values(snapshot, "histograms",
+                                       STORAGE_SECONDS, "count"))
+                self.assertTrue(values(snapshot, "histograms",
+                                       SCANNED_RECORDS, "count"))
+                # The shards are served from the shared load cache and
+                # SQLite reports no bytes.
+                if name not in ("sqlite", "sharded"):
+                    self.assertGreater(sum(values(
+                        snapshot, "counters", READ_BYTES).values()), 0)
+                if name != "sqlite":
+                    self.assertGreater(sum(values(
+                        snapshot, "counters", WRITTEN_BYTES).values()), 0)
+
+    def test_failed_call_and_hooks(self):
+        """
+        Test case for a failing call and for tracing hooks.
+        """
+        seen = []
+        self.registry.add_hook(
+            lambda name, labels, value: seen.append((name, labels)))
+        with self.assertRaises(FileNotFoundError):
+            Customer.delete_customer("Ana")
+        calls = values(self.registry.snapshot(), "counters",
+                       OPERATIONS_TOTAL)
+        self.assertEqual(calls, {(("operation", "Customer.delete_customer"),
+                                  ("outcome", "error")): 1})
+        self.assertEqual(seen, [(OPERATION_SECONDS,
+                                 {"operation": "Customer.delete_customer"})])
+
+    def test_exporters(self):
+        """
+        Test case for the Prometheus text and JSON exporters.
+        """
+        self.registry.count("requests_total", 3, path='/a"b')
+        self.registry.observe("latency_seconds", 0.002)
+        self.registry.observe("latency_seconds", 7)
+        prometheus = os.path.join(self.directory.name, "metrics.prom")
+        PrometheusExporter(prometheus).export(self.registry)
+        with open(prometheus, "r", encoding="utf-8") as file:
+            lines = file.read().splitlines()
+        self.assertIn("# TYPE requests_total counter", lines)
+        self.assertIn('requests_total{path="/a\\"b"} 3', lines)
+        self.assertIn("# TYPE latency_seconds histogram", lines)
+        self.assertIn('latency_seconds_bucket{le="0.001"} 0', lines)
+        self.assertIn('latency_seconds_bucket{le="0.005"} 1', lines)
+        self.assertIn('latency_seconds_bucket{le="5.0"} 1', lines)
+        self.assertIn('latency_seconds_bucket{le="+Inf"} 2', lines)
+        self.assertIn("latency_seconds_count 2", lines)
+
+        path = os.path.join(self.directory.name, "metrics.json")
+        JsonExporter(path).export(self.registry)
+        with open(path, "r", encoding="utf-8") as file:
+            self.assertEqual(json.load(file), self.registry.snapshot())
+        self.registry.reset()
+        self.assertEqual(self.registry.snapshot(),
+                         {"counters": [], "histograms": []})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+"""
+occupancy_test.py - Unit Tests for the Occupancy Reports
+
+This module contains unit tests for src/reservation/occupancy.py.
+
+Test Cases:
+    - test_occupancy_per_night: Stays are counted on each of their
+    nights and clipped to the period.
+    - test_rates_and_summary: Occupancy rates, revenue and peak-night
+    summaries against the hotels' rooms.
+    - test_matches_naive_count: The difference arrays agree with a
+    night-by-night count on generated reservations.
+
+To run the tests, execute the script using the following command:
+    python3 -m unittest tests/occupancy_test.py
+
+Author: Alejandra Mendoza Flores
+Date: October 19, 2026
+"""
+import random
+import unittest
+from datetime import date, timedelta
+# pylint: disable=wrong-import-position, import-error
+from src.reservation.occupancy import (occupancy, occupancy_rates,
+                                      revenue, summarize)
+from src.reservation.table import ReservationTable
+# pylint: enable=wrong-import-position, import-error
+
+
+def _stay(customer, hotel, room, check_in, check_out=None):
+    return {"customer_name": customer, "hotel_name": hotel,
+            "room_number": room, "check_in_date": check_in,
+            "check_out_date": check_out}
+
+
+RECORDS = [
+    _stay("Ana", "Sea", 1, "2024-04-29", "2024-05-03"),
+    _stay("Luis", "Sea", 2, "2024-05-02"),
+    _stay("Eva", "Sea", 3, "2024-05-02", "2024-05-10"),
+    _stay("Ana", "Lake", 1, "2024-05-04", "2024-05-05"),
+]
+
+
+class OccupancyTest(unittest.TestCase):
+    """
+    Unit tests for the occupancy reports.
+    """
+    def test_occupancy_per_night(self):
+        """
+        Test case for the occupied rooms per night.
+        """
+        counts = occupancy(RECORDS, "2024-05-01", days=5)
+        self.assertEqual(counts, {"Sea": [1, 3, 1, 1, 1],
+                                  "Lake": [0, 0, 0, 1, 0]})
+        self.assertEqual(occupancy(RECORDS, "2024-05-01", 5,
+                                   hotels=["Lake", "Nowhere"]),
+                         {"Lake": [0, 0, 0, 1, 0],
+                          "Nowhere": [0, 0, 0, 0, 0]})
+
+    def test_rates_and_summary(self):
+        """
+        Test case for rates, revenue and summaries.
+        """
+        counts = occupancy(ReservationTable.from_records(RECORDS),
+                           "2024-05-01", days=5)
+        rooms = {"Sea": 3}
+        rates = occupancy_rates(counts, rooms)
+        self.assertEqual(rates["Sea"][1], 1.0)
+        self.assertIsNone(rates["Lake"])
+        self.assertEqual(revenue(counts, {"Sea": 100})["Sea"][1], 300)
+        summary = summarize(counts, rooms, "2024-05-01")
+        self.assertEqual(summary["Sea"]["peak_night"], "2024-05-02")
+        self.assertEqual(summary["Sea"]["full_nights"], 1)
+        self.assertAlmostEqual(summary["Sea"]["mean_rate"], 7 / 15)
+        self.assertIsNone(summary["Lake"]["peak_rate"])
+
+    def test_matches_naive_count(self):
+        """
+        Test case comparing with a night-by-night count.
+        """
+        generator = random.Random(7)
+        first = date(2024, 1, 1)
+        records = []
+        for number in range(300):
+            check_in = first + timedelta(days=generator.randrange(-20, 60))
+            nights = generator.randrange(0, 9)
+            records.append(_stay(
+                f"C{number}", f"H{number % 4}", number, check_in.isoformat(),
+                (check_in + timedelta(days=nights)).isoformat()
+                if nights else None))
+        counts = occupancy(records, first.isoformat(), days=45)
+        for hotel, nightly in counts.items():
+            for offset, count in enumerate(nightly):
+                night = first + timedelta(days=offset)
+                expected = sum(
+                    1 for record in records if record["hotel_name"] == hotel
+                    and date.fromisoformat(record["check_in_date"]) <= night
+                    < (date.fromisoformat(record["check_out_date"])
+                       if record["check_out_date"] else
+                       date.fromisoformat(record["check_in_date"]) +
+                       timedelta(days=1)))
+                self.assertEqual(count, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
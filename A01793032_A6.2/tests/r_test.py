@@ -12,8 +12,8 @@ Test Cases:
 3. test_load_reservations_data: Verifies the loading of reservations data.
 
 Note:
-- Ensure the 'reservations.json' file is present and writable
-for successful testing.
+- Every test runs on empty in-memory storage (see
+src/storage/config.py), so no data file is touched.
 
 Author: Alejandra Mendoza Flores
 Date: February 13, 2024
@@ -22,6 +22,7 @@ import unittest
 from unittest.mock import patch
 # pylint: disable=wrong-import-position, import-error
 from src.reservation.reservation import Reservation
+from src.storage.config import configure_storage, restore_storage
 # pylint: enable=wrong-import-position, import-error
 
 
@@ -30,12 +31,12 @@ class ReservationTest(unittest.TestCase):
     Test case for the Reservation class.
     """
     def setUp(self):
-        with open("reservations.json", "w", encoding="utf-8") as file:
-            file.write("[]")
+        self.previous_storage = configure_storage(backend="memory")
+        Reservation.storage.save([])
 
     def tearDown(self):
         # Limpiar cualquier dato creado durante las pruebas
-        pass
+        restore_storage(self.previous_storage)
 
     def test_create_reservation(self):
         """
@@ -0,0 +1,214 @@
+"""
+records_test.py - Unit Tests for the Offset-Indexed Record Storage
+
+This module contains unit tests for src/storage/records.py.
+
+Test Cases:
+    - test_round_trip: Records survive reopening the files, in creation
+    order.
+    - test_point_lookup_reads_one_record: A lookup by key reads only
+    the matching record.
+    - test_updates_in_place_and_relocated: Updates that fit stay in
+    their slot; larger ones move and their slot is reused.
+    - test_failed_batch_leaves_no_trace: A batch that fails part way
+    is rolled back, so retrying its operations does not apply them
+    twice.
+    - test_index_rebuilt: A missing or stale index is rebuilt from the
+    data file and a partly appended slot is dropped.
+    - test_torn_update: A slot whose in-place update was cut short is
+    dropped by a rescan instead of failing every read, and batches are
+    fsynced.
+    - test_customer_class_uses_records: Customer works unchanged on
+    top of the record file.
+
+To run the tests, execute the script using the following command:
+    python3 -m unittest tests/records_test.py
+
+Author: Alejandra Mendoza Flores
+Date: October 19, 2026
+"""
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+# pylint: disable=wrong-import-position, import-error
+from src.customer.customer import Customer
+from src.storage.records import RecordFileStorage
+from src.storage.writer import GroupCommitWriter
+# pylint: enable=wrong-import-position, import-error
+
+
+class RecordFileStorageTest(unittest.TestCase):
+    """
+    Unit tests for the RecordFileStorage class.
+    """
+    def setUp(self):
+        # pylint: disable=consider-using-with
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "customers.rec")
+        self.storage = RecordFileStorage(self.path, ("name",))
+
+    def tearDown(self):
+        self.storage.close()
+        self.directory.cleanup()
+
+    def reopen(self):
+        """
+        Returns a new storage object over the same files.
+        """
+        self.storage.close()
+        self.storage = RecordFileStorage(self.path, ("name",))
+        return self.storage
+
+    def test_round_trip(self):
+        """
+        Test case for storing and reopening records.
+        """
+        self.assertEqual(self.storage.load(), [])
+        self.storage.apply_many([
+            {"op": "add", "record": {"name": f"C{number}", "phone": "1"}}
+            for number in range(5)])
+        self.storage.remove({"name": "C1"})
+        self.assertEqual([record["name"] for record in self.reopen().load()],
+                         ["C0", "C2", "C3", "C4"])
+        self.assertEqual(self.storage.find({"phone": "1", "name": "C3"}),
+                         [{"name": "C3", "phone": "1"}])
+        with self.assertRaises(ValueError):
+            self.storage.apply({"op": "rename", "match": {}})
+
+    def test_point_lookup_reads_one_record(self):
+        """
+        Test case verifying that a lookup by key reads one record.
+        """
+        self.storage.save([{"name": f"C{number}", "phone": str(number)}
+                           for number in range(200)])
+        storage = self.reopen()
+        with patch.object(storage, "_read", wraps=storage._read) as read:
+            self.assertEqual(storage.find({"name": "C150"}),
+                             [{"name": "C150", "phone": "150"}])
+            self.assertEqual(storage.find({"name": "Nobody"}), [])
+            self.assertEqual(storage.update({"name": "C7"}, {"phone": "x"}),
+                             1)
+        self.assertEqual(read.call_count, 2)
+
+    def test_updates_in_place_and_relocated(self):
+        """
+        Test case for in-place updates, relocation and the free list.
+        """
+        self.storage.add({"name": "Ana", "email": "a@example.com"})
+        self.storage.add({"name": "Luis", "email": "l@example.com"})
+        size = os.path.getsize(self.path)
+        index = self.storage.signature()[1]
+
+        self.storage.update({"name": "Ana"}, {"email": "b@example.com"})
+        self.assertEqual(os.path.getsize(self.path), size)
+        self.assertEqual(self.storage.signature()[1], index)
+
+        self.storage.update({"name": "Ana"}, {"email": "x" * 100})
+        grown = os.path.getsize(self.path)
+        self.assertGreater(grown, size)
+        self.storage.add({"name": "Eva", "email": "e@example.com"})
+        self.assertEqual(os.path.getsize(self.path), grown)
+        self.assertEqual([record["name"] for record in self.reopen().load()],
+                         ["Ana", "Luis", "Eva"])
+        self.assertEqual(self.storage.find({"name": "Ana"})[0]["email"],
+                         "x" * 100)
+
+    def test_failed_batch_leaves_no_trace(self):
+        """
+        Test case verifying that a failed batch is rolled back.
+        """
+        self.storage.add({"name": "Ana", "email": "a@example.com"})
+        self.storage.add({"name": "Luis", "email": "l@example.com"})
+        before = self.storage.load()
+        size = os.path.getsize(self.path)
+        signature = self.storage.signature()[1]
+        batch = [{"op": "add", "record": {"name": "Eva"}},
+                 {"op": "update", "match": {"name": "Ana"},
+                  "changes": {"email": "x" * 100}},
+                 {"op": "remove", "match": {"name": "Luis"}}]
+        with patch.object(self.storage, "_release",
+                          side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                self.storage.apply_many(batch)
+        self.assertEqual(self.storage.load(), before)
+        self.assertEqual(self.reopen().load(), before)
+        self.assertEqual(os.path.getsize(self.path), size)
+        self.assertEqual(self.storage.signature()[1], signature)
+        with self.assertRaises(ValueError):
+            self.storage.apply_many([{"op": "add", "record": {"n": "A"}},
+                                     {"op": "add", "record": {"n": {1}}}])
+        self.assertEqual(self.storage.load(), before)
+
+        writer = GroupCommitWriter(self.storage, interval=0.05)
+        try:
+            good = writer.submit({"op": "add", "record": {"name": "Eva"}})
+            bad = writer.submit({"op": "update", "match": {"name": "Ana"}})
+            self.assertEqual(good.result(), 1)
+            with self.assertRaises(ValueError):
+                bad.result()
+        finally:
+            writer.close()
+        self.assertEqual([record["name"] for record in self.storage.load()],
+                         ["Ana", "Luis", "Eva"])
+
+    def test_index_rebuilt(self):
+        """
+        Test case for rebuilding a missing or stale index.
+        """
+        self.storage.add({"name": "Ana"})
+        self.storage.add({"name": "Luis"})
+        os.remove(self.storage.index_path)
+        self.assertEqual(len(self.reopen().load()), 2)
+        self.assertTrue(os.path.exists(self.storage.index_path))
+
+        size = os.path.getsize(self.path)
+        with open(self.path, "ab") as file:
+            file.write(b"\x40\x00\x00\x00\x05\x00\x00\x00partial")
+        with open(self.path, "r+b") as file:
+            file.seek(8)
+            file.write((99).to_bytes(8, "little"))
+        self.assertEqual(self.reopen().find({"name": "Luis"}),
+                         [{"name": "Luis"}])
+        self.assertEqual(os.path.getsize(self.path), size)
+        self.storage.add({"name": "Eva"})
+        self.assertEqual(len(self.reopen().load()), 3)
+
+    def test_torn_update(self):
+        """
+        Test case for a slot that no longer holds a record.
+        """
+        self.storage.add({"name": "Ana"})
+        with patch("os.fsync", wraps=os.fsync) as fsync:
+            self.storage.add({"name": "Luis"})
+        self.assertTrue(fsync.called)
+        with open(self.path, "r+b") as file:
+            data = file.read()
+            file.seek(data.index(b'{"name":"Ana"}'))
+            file.write(b'{"name":"Eva","ph')
+        storage = self.reopen()
+        self.assertEqual(storage.load(), [{"name": "Luis"}])
+        self.assertEqual(storage.find({"name": "Ana"}), [])
+        storage.add({"name": "Ana"})
+        self.assertEqual(self.reopen().load(),
+                         [{"name": "Luis"}, {"name": "Ana"}])
+
+    def test_customer_class_uses_records(self):
+        """
+        Test case running Customer on top of the record file.
+        """
+        previous = Customer.storage
+        Customer.storage = self.storage
+        try:
+            Customer.create_customer("Ana", "ana@example.com", "1")
+            Customer.create_customer("Luis", "luis@example.com", "2")
+            Customer.modify_customer_info("Ana", phone="3")
+            Customer.delete_customer("Luis")
+            self.assertEqual(Customer.load_customers_data(), [
+                {"name": "Ana", "email": "ana@example.com", "phone": "3"}])
+        finally:
+            Customer.storage = previous
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -19,16 +19,18 @@ Usage:
 - Execute this module to run the unit tests for the Reservation class.
 
 Note:
-- Ensure that the 'reservations.json' file is present and writable
-for successful execution of tests involving data loading.
+- Every test runs on empty in-memory storage (see
+src/storage/config.py), so no data file is touched.
 
 Author: Alejandra Mendoza Flores
 Date: February 13, 2024
 
 """
 import unittest
+from unittest.mock import patch
 # pylint: disable=wrong-import-position, import-error
 from src.reservation.reservation import Reservation
+from src.storage.config import configure_storage, restore_storage
 # pylint: enable=wrong-import-position, import-error
 
 
@@ -37,8 +39,11 @@ class ReservationTest(unittest.TestCase):
     Test case for the Reservation class.
     """
     def setUp(self):
-        with open("reservations.json", "w", encoding="utf-8") as file:
-            file.write("[]")
+        self.previous_storage = configure_storage(backend="memory")
+        Reservation.storage.save([])
+
+    def tearDown(self):
+        restore_storage(self.previous_storage)
 
     def test_create_reservation(self):
         """
@@ -100,6 +105,64 @@ class ReservationTest(unittest.TestCase):
         self.assertEqual(reservations_data[0]["check_in_date"], "2024-04-01")
         self.assertEqual(reservations_data[0]["check_out_date"], "2024-04-05")
 
+    def test_bulk_create_and_cancel(self):
+        """
+        Test case for the create_reservations and
+        cancel_reservations_many methods.
+
+        It creates three reservations in one batch, cancels two of them
+        by key and checks the per-key outcomes and the remaining data.
+        """
+        reservations = Reservation.create_reservations([
+            ("Ana", "Hotel A", 1, "2024-05-01", "2024-05-03"),
+            ("Luis", "Hotel A", 2, "2024-05-01"),
+            {"customer_name": "Eva", "hotel_name": "Hotel B",
+             "room_number": 3, "check_in_date": "2024-05-02"}])
+        self.assertEqual(len(reservations), 3)
+        self.assertIsNone(reservations[1].check_out_date)
+        outcomes = Reservation.cancel_reservations_many([
+            ("Ana", "Hotel A", 1, "2024-05-01"),
+            ("Eva", "Hotel B", 3, "2024-05-02"),
+            ("Nobody", "Hotel B", 3, "2024-05-02")])
+        self.assertEqual([count for _, count in outcomes], [1, 1, 0])
+        reservations_data = Reservation.load_reservations_data()
+        self.assertEqual(len(reservations_data), 1)
+        self.assertEqual(reservations_data[0]["customer_name"], "Luis")
+
+    def test_indexed_lookup(self):
+        """
+        Test case for the find_reservation, reservations_for_customer
+        and reservations_for_hotel methods.
+
+        It checks that the indexes follow creations and cancellations,
+        and that canceling an unknown reservation does not write the
+        reservations file.
+        """
+        Reservation.create_reservations([
+            ("Ana", "Hotel A", 1, "2024-05-01", "2024-05-03"),
+            ("Ana", "Hotel B", 2, "2024-05-01"),
+            ("Luis", "Hotel A", 2, "2024-05-01")])
+        self.assertEqual(Reservation.find_reservation(
+            "Ana", "Hotel A", 1, "2024-05-01")["check_out_date"],
+            "2024-05-03")
+        self.assertEqual([record["hotel_name"] for record in
+                          Reservation.reservations_for_customer("Ana")],
+                         ["Hotel A", "Hotel B"])
+        self.assertEqual([record["customer_name"] for record in
+                          Reservation.reservations_for_hotel("Hotel A")],
+                         ["Ana", "Luis"])
+
+        Reservation.cancel_reservation("Ana", "Hotel A", 1, "2024-05-01")
+        self.assertIsNone(Reservation.find_reservation(
+            "Ana", "Hotel A", 1, "2024-05-01"))
+        self.assertEqual(len(Reservation.reservations_for_customer("Ana")),
+                         1)
+        with patch.object(Reservation.storage, "remove") as remove:
+            with self.assertLogs(level='WARNING'):
+                Reservation.cancel_reservation("Ana", "Hotel A", 1,
+                                               "2024-05-01")
+        remove.assert_not_called()
+
 
 if __name__ == '__main__':
     unittest.main()
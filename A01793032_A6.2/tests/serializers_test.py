@@ -0,0 +1,127 @@
+"""
+serializers_test.py - Unit Tests for the Record Serialization Formats
+
+This module contains unit tests for src/storage/serializers.py and for
+JsonFileStorage configured with a serializer.
+
+Test Cases:
+    - test_round_trip: Every registered format reads back what it wrote.
+    - test_default_matches_json_dump: The default format writes exactly
+    what json.dump wrote before.
+    - test_format_detection: read_records parses any format.
+    - test_binary_rejects_garbage: Truncated or foreign data is refused.
+    - test_storage_with_binary_serializer: JsonFileStorage works on a
+    binary file and reads back a file converted to another format.
+    - test_benchmark: The benchmark reports every format.
+
+To run the tests, execute the script using the following command:
+    python3 -m unittest tests/serializers_test.py
+
+Author: Alejandra Mendoza Flores
+Date: October 19, 2026
+"""
+import os
+import io
+import json
+import tempfile
+import unittest
+# pylint: disable=wrong-import-position, import-error
+from src.storage.serializers import (SERIALIZERS, benchmark, convert,
+                                     get_serializer, read_records)
+from src.storage.storage import JsonFileStorage
+# pylint: enable=wrong-import-position, import-error
+
+RECORDS = [
+    {"customer_name": "Ana", "hotel_name": "Sea", "room_number": 1,
+     "check_in_date": "2024-05-01", "check_out_date": "2024-05-04"},
+    {"customer_name": "Luis", "hotel_name": "Sea", "room_number": 2,
+     "check_in_date": "2024-05-02", "check_out_date": None},
+    {"customer_name": "Ñandú", "hotel_name": "Lake", "room_number": 7,
+     "check_in_date": "2024-06-10", "check_out_date": "2024-06-12"},
+]
+
+
+class SerializersTest(unittest.TestCase):
+    """
+    Unit tests for the serializers.
+    """
+    def setUp(self):
+        # pylint: disable=consider-using-with
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_round_trip(self):
+        """
+        Test case for writing and reading every format.
+        """
+        for name, serializer in SERIALIZERS.items():
+            with self.subTest(serializer=name):
+                file = io.BytesIO()
+                serializer.write(file, RECORDS)
+                self.assertEqual(file.getvalue(), serializer.dumps(RECORDS))
+                self.assertEqual(serializer.loads(file.getvalue()), RECORDS)
+                self.assertEqual(serializer.loads(serializer.dumps([])), [])
+
+    def test_default_matches_json_dump(self):
+        """
+        Test case verifying that the default format is unchanged.
+        """
+        self.assertEqual(get_serializer("json").dumps(RECORDS),
+                         json.dumps(RECORDS).encode("utf-8"))
+        self.assertLess(len(get_serializer("compact-json").dumps(RECORDS)),
+                        len(get_serializer("json").dumps(RECORDS)))
+        with self.assertRaises(ValueError):
+            get_serializer("xml")
+
+    def test_format_detection(self):
+        """
+        Test case for reading a file without knowing its format.
+        """
+        for name, serializer in SERIALIZERS.items():
+            with self.subTest(serializer=name):
+                self.assertEqual(read_records(serializer.dumps(RECORDS)),
+                                 RECORDS)
+
+    def test_binary_rejects_garbage(self):
+        """
+        Test case for data that is not a valid binary record file.
+        """
+        binary = get_serializer("binary")
+        data = binary.dumps(RECORDS)
+        for garbage in (data[:10], b"x" * 40, data[:-5]):
+            with self.assertRaises((ValueError, EOFError)):
+                binary.loads(garbage)
+
+    def test_storage_with_binary_serializer(self):
+        """
+        Test case for JsonFileStorage with the binary format.
+        """
+        path = os.path.join(self.directory.name, "reservations.bin")
+        storage = JsonFileStorage(path, cache=None,
+                                  serializer=get_serializer("binary"))
+        for record in RECORDS:
+            storage.add(record)
+        storage.remove({"customer_name": "Luis"})
+        self.assertEqual(storage.load(), [RECORDS[0], RECORDS[2]])
+        with open(path, "rb") as file:
+            self.assertEqual(file.read(8), b"HOTELREC")
+
+        json_path = os.path.join(self.directory.name, "reservations.json")
+        self.assertEqual(convert(path, json_path, "json"), 2)
+        self.assertEqual(JsonFileStorage(json_path, cache=None).load(),
+                         [RECORDS[0], RECORDS[2]])
+
+    def test_benchmark(self):
+        """
+        Test case for the benchmark report.
+        """
+        results = benchmark(RECORDS * 10, repeat=1)
+        self.assertEqual(set(results), set(SERIALIZERS))
+        self.assertLess(results["binary"]["bytes"],
+                        results["json"]["bytes"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,215 @@
+"""
+service_test.py - Unit Tests for the Local HTTP Service
+
+This module contains unit tests for src/service/server.py and
+src/service/benchmark.py. Every test starts a server on a free port
+over a temporary data directory.
+
+Test Cases:
+    - test_booking_cycle: Customer, hotel and reservation endpoints on
+    one kept-alive connection.
+    - test_errors: Unknown resources, conflicts and invalid bodies.
+    - test_malformed_requests: Bad dates, names, field types and
+    Content-Length headers get a 400 response.
+    - test_guarded_deletes: Customers and hotels kept by a delete guard
+    get a 409 response and stay available.
+    - test_close_writes_json_files: Stopping the service folds the
+    journals into the JSON files and restores the class backends.
+    - test_benchmark_summary: The benchmark client runs its cycles.
+
+To run the tests, execute the script using the following command:
+    python3 -m unittest tests/service_test.py
+
+Author: Alejandra Mendoza Flores
+Date: October 19, 2026
+"""
+import os
+import json
+import tempfile
+import threading
+import unittest
+import http.client
+# pylint: disable=wrong-import-position, import-error
+from src.customer.customer import Customer
+from src.service.benchmark import run_benchmark, summarize
+from src.reservation.reservation import Reservation
+from src.service.server import make_server
+# pylint: enable=wrong-import-position, import-error
+
+
+class ServiceTest(unittest.TestCase):
+    """
+    Unit tests for the HTTP service.
+    """
+    def setUp(self):
+        # pylint: disable=consider-using-with
+        self.directory = tempfile.TemporaryDirectory()
+        self.previous_storage = Customer.storage
+        self.server = make_server(self.directory.name, port=0)
+        self.closed = False
+        threading.Thread(target=self.server.serve_forever,
+                         daemon=True).start()
+        self.port = self.server.server_address[1]
+        self.connection = http.client.HTTPConnection("127.0.0.1",
+                                                     self.port)
+
+    def tearDown(self):
+        self.connection.close()
+        self.server.shutdown()
+        self.server.server_close()
+        if not self.closed:
+            self.server.service.close()
+        self.directory.cleanup()
+
+    def request(self, method, path, body=None):
+        """
+        Sends a request on the shared connection.
+
+        Returns:
+            tuple: (HTTP status, decoded JSON payload or None).
+        """
+        data = None if body is None else json.dumps(body)
+        self.connection.request(method, path, body=data)
+        response = self.connection.getresponse()
+        payload = response.read()
+        return response.status, json.loads(payload) if payload else None
+
+    def test_booking_cycle(self):
+        """
+        Test case for a full booking cycle over one connection.
+        """
+        self.assertEqual(self.request("POST", "/hotels", {
+            "name": "Sea View", "location": "Coast", "rooms": 3})[0], 201)
+        self.assertEqual(self.request("POST", "/customers", {
+            "name": "Ana", "email": "ana@example.com", "phone": "1"})[0],
+            201)
+        self.assertEqual(self.request("GET", "/customers/Ana")[1]["email"],
+                         "ana@example.com")
+        status, _ = self.request("POST", "/reservations", {
+            "customer_name": "Ana", "hotel_name": "Sea View",
+            "room_number": 2, "check_in_date": "2024-05-01",
+            "check_out_date": "2024-05-03"})
+        self.assertEqual(status, 201)
+        self.assertEqual(self.request(
+            "GET", "/hotels/Sea%20View/rooms?check_in=2024-05-02")[1],
+            [1, 3])
+        self.assertEqual(len(self.request(
+            "GET", "/reservations?customer=Ana")[1]), 1)
+        self.assertEqual(self.request(
+            "DELETE", "/reservations?customer=Ana&hotel=Sea+View&room=2"
+            "&check_in=2024-05-01")[0], 204)
+        self.assertEqual(self.request(
+            "GET", "/reservations?hotel=Sea+View")[1], [])
+        self.assertEqual(self.request("PATCH", "/customers/Ana",
+                                      {"phone": "2"})[1]["phone"], "2")
+        self.assertEqual(self.request("DELETE", "/customers/Ana")[0], 204)
+
+    def test_errors(self):
+        """
+        Test case for error responses.
+        """
+        self.assertEqual(self.request("GET", "/rooms")[0], 404)
+        self.assertEqual(self.request("GET", "/customers/Nobody")[0], 404)
+        self.assertEqual(self.request("POST", "/reservations",
+                                      {"customer_name": "Ana"})[0], 400)
+        booking = {"customer_name": "Ana", "hotel_name": "H",
+                   "room_number": 1, "check_in_date": "2024-05-01"}
+        self.assertEqual(self.request("POST", "/reservations",
+                                      booking)[0], 201)
+        self.assertEqual(self.request("POST", "/reservations",
+                                      booking)[0], 409)
+        self.connection.request("POST", "/customers", body="not json")
+        response = self.connection.getresponse()
+        response.read()
+        self.assertEqual(response.status, 400)
+
+    def test_malformed_requests(self):
+        """
+        Test case for requests the service must reject with 400.
+        """
+        for check_in, check_out in (("May 1st", None),
+                                    ("2024-05-03", "2024-05-01"),
+                                    (20240501, None)):
+            self.assertEqual(self.request("POST", "/reservations", {
+                "customer_name": "Ana", "hotel_name": "H",
+                "room_number": 1, "check_in_date": check_in,
+                "check_out_date": check_out}), (400, {
+                    "error": "invalid dates"}))
+        self.assertEqual(self.request("POST", "/reservations", {
+            "customer_name": 7, "hotel_name": "H", "room_number": 1,
+            "check_in_date": "2024-05-01"})[0], 400)
+        self.assertEqual(self.request("POST", "/customers",
+                                      {"name": 42})[0], 400)
+        self.assertEqual(self.request("POST", "/hotels",
+                                      {"name": ["Sea"]})[0], 400)
+        self.request("POST", "/customers", {
+            "name": "Ana", "email": "ana@example.com", "phone": "1"})
+        self.assertEqual(self.request("PATCH", "/customers/Ana",
+                                      {"email": ["a", "b"]})[0], 400)
+        self.assertEqual(self.request("GET", "/customers/Ana")[0], 200)
+
+        for length in ("abc", "-5"):
+            connection = http.client.HTTPConnection("127.0.0.1", self.port)
+            try:
+                connection.putrequest("POST", "/customers")
+                connection.putheader("Content-Length", length)
+                connection.endheaders()
+                response = connection.getresponse()
+                self.assertEqual(response.status, 400)
+                self.assertEqual(json.loads(response.read()),
+                                 {"error": "invalid Content-Length"})
+            finally:
+                connection.close()
+
+    def test_guarded_deletes(self):
+        """
+        Test case for deletes refused by the integrity checks.
+        """
+        Reservation.set_integrity("reject")
+        self.addCleanup(Reservation.set_integrity, None)
+        self.request("POST", "/hotels", {"name": "Sea", "rooms": 2})
+        self.request("POST", "/customers", {"name": "Ana"})
+        self.assertEqual(self.request("POST", "/reservations", {
+            "customer_name": "Ana", "hotel_name": "Sea",
+            "room_number": 1, "check_in_date": "2024-05-01"})[0], 201)
+        with self.assertLogs(level="WARNING"):
+            self.assertEqual(self.request("DELETE", "/hotels/Sea")[0], 409)
+            self.assertEqual(self.request("DELETE", "/customers/Ana")[0],
+                             409)
+        self.assertEqual(self.request("GET", "/hotels/Sea")[0], 200)
+        self.assertEqual(self.request("GET", "/customers/Ana")[0], 200)
+        self.request("DELETE", "/reservations?customer=Ana&hotel=Sea"
+                     "&room=1&check_in=2024-05-01")
+        for path in ("/hotels/Sea", "/customers/Ana"):
+            self.assertEqual(self.request("DELETE", path)[0], 204)
+            self.assertEqual(self.request("DELETE", path)[0], 404)
+
+    def test_close_writes_json_files(self):
+        """
+        Test case verifying that close() writes the JSON files.
+        """
+        self.request("POST", "/customers", {
+            "name": "Ana", "email": "ana@example.com", "phone": "1"})
+        self.server.service.close()
+        self.closed = True
+        self.assertIs(Customer.storage, self.previous_storage)
+        path = os.path.join(self.directory.name, "customers.json")
+        with open(path, "r", encoding="utf-8") as file:
+            self.assertEqual(json.load(file), [
+                {"name": "Ana", "email": "ana@example.com", "phone": "1"}])
+
+    def test_benchmark_summary(self):
+        """
+        Test case for the benchmark client.
+        """
+        self.request("POST", "/hotels", {"name": "Bench Hotel",
+                                         "location": "Test", "rooms": 10})
+        latencies, elapsed = run_benchmark("127.0.0.1", self.port,
+                                           cycles=5, concurrency=2)
+        summary = summarize(latencies, elapsed)
+        self.assertEqual(summary["requests"], 50)
+        self.assertEqual(summary["POST /reservations"]["count"], 10)
+
+
+if __name__ == '__main__':
+    unittest.main()
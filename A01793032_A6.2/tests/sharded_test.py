@@ -0,0 +1,179 @@
+"""
+sharded_test.py - Unit Tests for the Sharded Reservation Storage
+
+This module contains unit tests for src/storage/sharded.py.
+
+Test Cases:
+    - test_partitions: Records are split by hotel and check-in month
+    and load back unchanged.
+    - test_mutations_touch_only_their_shard: Adds and keyed removes
+    rewrite a single shard.
+    - test_update_moves_records: Changing the check-in month moves the
+    record to its new shard.
+    - test_moved_records_updated_once: Records moved into a shard
+    visited later are not updated twice.
+    - test_missing_hotel_partition: Records without a hotel name do not
+    share a shard with a hotel called "None".
+    - test_query_and_manifest_recovery: Scoped queries and rebuilding
+    a lost manifest from the shard files.
+    - test_reservation_class_on_shards: Reservation works unchanged on
+    top of the sharded backend.
+
+To run the tests, execute the script using the following command:
+    python3 -m unittest tests/sharded_test.py
+
+Author: Alejandra Mendoza Flores
+Date: October 19, 2026
+"""
+import os
+import tempfile
+import unittest
+# pylint: disable=wrong-import-position, import-error
+from src.reservation.reservation import Reservation
+from src.storage.sharded import ShardedStorage
+# pylint: enable=wrong-import-position, import-error
+
+
+def _stay(customer, hotel, room, check_in, check_out=None):
+    return {"customer_name": customer, "hotel_name": hotel,
+            "room_number": room, "check_in_date": check_in,
+            "check_out_date": check_out}
+
+
+RECORDS = [
+    _stay("Ana", "Sea View", 1, "2024-05-01", "2024-05-03"),
+    _stay("Luis", "Sea View", 2, "2024-05-20"),
+    _stay("Eva", "Sea View", 1, "2024-06-02"),
+    _stay("Ana", "Lake/Side", 7, "2024-05-04", "2024-05-05"),
+]
+
+
+class ShardedStorageTest(unittest.TestCase):
+    """
+    Unit tests for the ShardedStorage class.
+    """
+    def setUp(self):
+        # pylint: disable=consider-using-with
+        self.directory = tempfile.TemporaryDirectory()
+        self.storage = ShardedStorage(self.directory.name)
+        self.storage.save(RECORDS)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def shard_signatures(self):
+        """
+        Returns the inode of every shard file, which changes whenever
+        the shard is rewritten.
+        """
+        shards = os.path.join(self.directory.name, "shards")
+        return {name: os.stat(os.path.join(shards, name)).st_ino
+                for name in os.listdir(shards)}
+
+    def test_partitions(self):
+        """
+        Test case for the partition layout.
+        """
+        self.assertEqual(self.storage.shards(), {
+            ("Sea View", "2024-05"): 2, ("Sea View", "2024-06"): 1,
+            ("Lake/Side", "2024-05"): 1})
+        self.assertEqual(sorted(os.listdir(
+            os.path.join(self.directory.name, "shards"))), [
+                "2024-05--Lake%2FSide.json", "2024-05--Sea%20View.json",
+                "2024-06--Sea%20View.json"])
+        self.assertCountEqual(self.storage.load(), RECORDS)
+
+    def test_mutations_touch_only_their_shard(self):
+        """
+        Test case verifying that mutations rewrite a single shard.
+        """
+        before = self.shard_signatures()
+        self.storage.add(_stay("Bob", "Sea View", 3, "2024-06-09"))
+        self.assertEqual(self.storage.remove(
+            {"customer_name": "Eva", "hotel_name": "Sea View",
+             "room_number": 1, "check_in_date": "2024-06-02"}, limit=1), 1)
+        after = self.shard_signatures()
+        changed = [name for name in before if before[name] != after[name]]
+        self.assertEqual(changed, ["2024-06--Sea%20View.json"])
+        self.assertEqual(self.storage.shards()[("Sea View", "2024-06")], 1)
+
+        self.storage.remove({"customer_name": "Ana",
+                             "hotel_name": "Lake/Side"})
+        self.assertNotIn(("Lake/Side", "2024-05"), self.storage.shards())
+        self.assertEqual(len(self.shard_signatures()), 2)
+
+    def test_update_moves_records(self):
+        """
+        Test case for updates that change the partition.
+        """
+        self.assertEqual(self.storage.update(
+            {"customer_name": "Luis"}, {"check_in_date": "2024-07-01"}), 1)
+        self.assertEqual(self.storage.shards()[("Sea View", "2024-05")], 1)
+        self.assertEqual(self.storage.query("Sea View", "2024-07"),
+                         [_stay("Luis", "Sea View", 2, "2024-07-01")])
+
+    def test_moved_records_updated_once(self):
+        """
+        Test case for an update moving records into a later shard.
+        """
+        self.assertEqual(self.storage.update(
+            {"customer_name": "Ana"}, {"check_in_date": "2024-06-15"},
+            limit=None), 2)
+        self.assertEqual(self.storage.shards(), {
+            ("Sea View", "2024-05"): 1, ("Sea View", "2024-06"): 2,
+            ("Lake/Side", "2024-06"): 1})
+        self.assertEqual(len(self.storage.find(
+            {"hotel_name": "Sea View", "check_in_date": "2024-06-15"})), 1)
+
+    def test_missing_hotel_partition(self):
+        """
+        Test case for records without a hotel name.
+        """
+        self.storage.add(_stay("Bob", None, 1, "2024-05-02"))
+        self.storage.add(_stay("Eva", "None", 1, "2024-05-02"))
+        self.assertEqual(self.storage.shards()[(None, "2024-05")], 1)
+        self.assertEqual(self.storage.shards()[("None", "2024-05")], 1)
+        self.assertEqual([record["customer_name"] for record in
+                          self.storage.find({"hotel_name": None})], ["Bob"])
+        os.remove(self.storage.manifest_path)
+        recovered = ShardedStorage(self.directory.name)
+        self.assertEqual(recovered.shards(), self.storage.shards())
+        self.assertEqual(recovered.remove({"hotel_name": None}), 1)
+        self.assertNotIn((None, "2024-05"), recovered.shards())
+
+    def test_query_and_manifest_recovery(self):
+        """
+        Test case for scoped queries and manifest recovery.
+        """
+        self.assertEqual(len(self.storage.query("Sea View")), 3)
+        self.assertEqual(len(self.storage.query(
+            first_month="2024-05", last_month="2024-05-31")), 3)
+        self.assertEqual(len(self.storage.find({"hotel_name": "Sea View",
+                                                "room_number": 1})), 2)
+        os.remove(self.storage.manifest_path)
+        recovered = ShardedStorage(self.directory.name)
+        self.assertEqual(recovered.shards(), self.storage.shards())
+
+    def test_reservation_class_on_shards(self):
+        """
+        Test case running Reservation on top of the sharded backend.
+        """
+        previous = Reservation.storage
+        Reservation.storage = self.storage
+        try:
+            self.assertIsNone(Reservation.create_reservation(
+                "Bob", "Sea View", 1, "2024-05-02"))
+            Reservation.create_reservation("Bob", "Sea View", 1,
+                                           "2024-05-03", "2024-05-05")
+            Reservation.cancel_reservation("Ana", "Sea View", 1,
+                                           "2024-05-01")
+            self.assertEqual(
+                [record["customer_name"] for record in
+                 Reservation.reservations_for_hotel("Sea View")],
+                ["Luis", "Eva", "Bob"])
+        finally:
+            Reservation.storage = previous
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,175 @@
+"""
+sqlite_storage_test.py - Unit Tests for the SQLite Storage Engine
+
+This module contains unit tests for src/storage/sqlite_storage.py,
+running the Customer, Hotel and Reservation classes on top of a SQLite
+database instead of the JSON files.
+
+Test Cases:
+    - test_customer_operations: Create, modify, display and delete
+    customers through the unchanged static methods.
+    - test_hotel_and_reservation_operations: Create and delete hotels,
+    create and cancel reservations.
+    - test_transaction_rollback: A failing operation in apply_many
+    leaves the table untouched.
+    - test_lookups_use_indexes: Name and room lookups are served by
+    the table indexes.
+    - test_memory_database_across_threads: A ":memory:" database is
+    the same database in every thread.
+    - test_signature_across_connections: Every connection sees the
+    same signature, which changes on writes from any of them.
+
+To run the tests, execute the script using the following command:
+    python3 -m unittest tests/sqlite_storage_test.py
+
+Author: Alejandra Mendoza Flores
+Date: October 19, 2026
+"""
+import os
+import tempfile
+import unittest
+
+from concurrent.futures import ThreadPoolExecutor
+# pylint: disable=wrong-import-position, import-error
+from src.customer.customer import Customer
+from src.hotel.hotel import Hotel
+from src.reservation.reservation import Reservation
+from src.storage.sqlite_storage import SqliteDatabase
+# pylint: enable=wrong-import-position, import-error
+
+
+class SqliteStorageTest(unittest.TestCase):
+    """
+    Unit tests for the SQLite storage backend.
+    """
+    def setUp(self):
+        # pylint: disable=consider-using-with
+        self.directory = tempfile.TemporaryDirectory()
+        self.database = SqliteDatabase(
+            os.path.join(self.directory.name, "hotel.db"))
+        self.previous = (Customer.storage, Hotel.storage,
+                         Reservation.storage)
+        Customer.storage = self.database.storage("customers")
+        Hotel.storage = self.database.storage("hotels")
+        Reservation.storage = self.database.storage("reservations")
+
+    def tearDown(self):
+        Customer.storage, Hotel.storage, Reservation.storage = self.previous
+        self.database.close()
+        self.directory.cleanup()
+
+    def test_customer_operations(self):
+        """
+        Test case for the customer static methods on SQLite.
+        """
+        Customer.create_customer("Bob", "bob@example.com", "9998887776")
+        Customer.modify_customer_info("Bob", email="newbob@example.com")
+        self.assertEqual(Customer.load_customers_data(), [
+            {"name": "Bob", "email": "newbob@example.com",
+             "phone": "9998887776"}])
+        with self.assertLogs(level='INFO') as cm:
+            Customer.display_customer_info("Bob")
+        self.assertIn("Customer Name: Bob", cm.output[0])
+        with self.assertLogs(level='INFO') as cm:
+            Customer.delete_customer("Bob")
+        self.assertIn("deleted successfully", cm.output[0])
+        self.assertEqual(Customer.load_customers_data(), [])
+
+    def test_hotel_and_reservation_operations(self):
+        """
+        Test case for the hotel and reservation methods on SQLite.
+        """
+        Hotel.create_hotel("New Hotel", "New Location", 20)
+        self.assertEqual(Hotel.storage.load()[0]["rooms"], 20)
+        with self.assertLogs(level='INFO') as cm:
+            Hotel.delete_hotel("New Hotel")
+        self.assertIn("deleted successfully", cm.output[0])
+
+        Reservation.create_reservation(
+            "Alice", "Another Hotel", 102, "2024-03-01", "2024-03-10")
+        self.assertEqual(Reservation.load_reservations_data()[0],
+                         {"customer_name": "Alice",
+                          "hotel_name": "Another Hotel",
+                          "room_number": 102,
+                          "check_in_date": "2024-03-01",
+                          "check_out_date": "2024-03-10"})
+        Reservation.cancel_reservation(
+            "Alice", "Another Hotel", 102, "2024-03-01")
+        self.assertEqual(Reservation.load_reservations_data(), [])
+        with self.assertLogs(level='WARNING'):
+            Reservation.cancel_reservation(
+                "Alice", "Another Hotel", 102, "2024-03-01")
+
+    def test_transaction_rollback(self):
+        """
+        Test case verifying that apply_many is all or nothing.
+        """
+        storage = Customer.storage
+        with self.assertRaises(ValueError):
+            storage.apply_many([
+                {"op": "add", "record": {"name": "Ana"}},
+                {"op": "add", "record": {"name": "Luis", "age": 3}}])
+        self.assertEqual(storage.load(), [])
+        self.assertEqual(storage.apply_many([
+            {"op": "add", "record": {"name": "Ana"}},
+            {"op": "remove", "match": {"name": "Ana"}, "limit": None}]),
+            [1, 1])
+
+    def test_lookups_use_indexes(self):
+        """
+        Test case verifying that lookups are served by indexes.
+        """
+        connection = self.database.connection()
+        plan = " ".join(str(row) for row in connection.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM customers WHERE name = ?",
+            ["Bob"]))
+        self.assertIn("customers_name", plan)
+        plan = " ".join(str(row) for row in connection.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM reservations WHERE "
+            "hotel_name = ? AND room_number = ? AND check_in_date = ?",
+            ["Hotel", 1, "2024-01-01"]))
+        self.assertIn("reservations_room", plan)
+
+    def test_memory_database_across_threads(self):
+        """
+        Test case for reading and writing ":memory:" from threads.
+        """
+        database = SqliteDatabase(":memory:")
+        storage = database.storage("customers")
+        storage.add({"name": "Ana"})
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            self.assertEqual(executor.submit(storage.load).result(),
+                             [{"name": "Ana", "email": None,
+                               "phone": None}])
+            list(executor.map(
+                lambda number: storage.apply_many(
+                    [{"op": "add", "record": {"name": f"C{number}"}}] * 5),
+                range(8)))
+        self.assertEqual(len(storage.load()), 41)
+        self.assertEqual(len(storage.find({"name": "C3"})), 5)
+        database.close()
+
+    def test_signature_across_connections(self):
+        """
+        Test case for signatures read from other threads and databases.
+        """
+        storage = Reservation.storage
+        self.assertIsNotNone(Reservation.create_reservation(
+            "Ana", "Hotel", 1, "2024-05-01"))
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            self.assertEqual(executor.submit(storage.signature).result(),
+                             storage.signature())
+            other = SqliteDatabase(self.database.path)
+            other.storage("reservations").add({
+                "customer_name": "Luis", "hotel_name": "Hotel",
+                "room_number": 1, "check_in_date": "2024-05-02",
+                "check_out_date": "2024-05-04"})
+            other.close()
+            self.assertIsNone(executor.submit(
+                Reservation.create_reservation, "Eva", "Hotel", 1,
+                "2024-05-03").result())
+        self.assertEqual(len(storage.load()), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,220 @@
+"""
+storage_test.py - Unit Tests for the Storage Backends
+
+This module contains unit tests for the record storage backends in
+src/storage: the JSON file backend used by default and the append-only
+journal backend.
+
+Test Cases:
+    - test_json_file_operations: Add, update and remove on a JSON file.
+    - test_journal_appends_without_rewriting: Creates only append to
+    the journal and leave the snapshot untouched.
+    - test_journal_persists_across_instances: A new backend replays the
+    journal on top of the snapshot.
+    - test_journal_compaction: The journal is folded into the snapshot
+    once the threshold is reached.
+    - test_journal_ignores_torn_line: A partially written line is
+    ignored and overwritten by the next append.
+    - test_journal_ignores_stale_journal: A snapshot rewritten by
+    someone else supersedes the journal.
+    - test_journal_binary_snapshot: The snapshot is written with the
+    configured serializer and read back in any format.
+    - test_journal_rejected_write: A record that cannot be encoded
+    leaves neither the journal nor the in-memory records changed.
+    - test_load_cache: Unchanged files are served from the parsed-file
+    cache, external rewrites are not.
+    - test_json_file_concurrent_adds: Adds from many threads are all
+    kept and every save is fsynced.
+
+To run the tests, execute the script using the following command:
+    python3 -m unittest tests/storage_test.py
+
+Author: Alejandra Mendoza Flores
+Date: October 19, 2026
+"""
+import os
+import json
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+# pylint: disable=wrong-import-position, import-error
+from src.storage.cache import LoadCache
+from src.storage.storage import JsonFileStorage
+from src.storage.journal import JournalStorage
+from src.storage.serializers import BINARY_MAGIC, SERIALIZERS
+# pylint: enable=wrong-import-position, import-error
+
+
+class StorageTest(unittest.TestCase):
+    """
+    Unit tests for the storage backends.
+    """
+    def setUp(self):
+        # pylint: disable=consider-using-with
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "customers.json")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_json_file_operations(self):
+        """
+        Test case for add, update and remove on the JSON file backend.
+        """
+        storage = JsonFileStorage(self.path)
+        self.assertFalse(storage.exists())
+        self.assertEqual(storage.load(), [])
+        storage.add({"name": "Ana", "email": "ana@example.com"})
+        storage.add({"name": "Luis", "email": "luis@example.com"})
+        self.assertEqual(storage.update({"name": "Ana"},
+                                        {"email": "new@example.com"}), 1)
+        self.assertEqual(storage.remove({"name": "Luis"}), 1)
+        self.assertEqual(storage.remove({"name": "Luis"}), 0)
+        with open(self.path, "r", encoding="utf-8") as file:
+            self.assertEqual(json.load(file),
+                             [{"name": "Ana", "email": "new@example.com"}])
+
+    def test_journal_appends_without_rewriting(self):
+        """
+        Test case verifying that creates only append to the journal.
+        """
+        storage = JournalStorage(self.path)
+        for number in range(5):
+            storage.add({"name": f"Customer {number}"})
+        self.assertFalse(os.path.exists(self.path))
+        with open(storage.journal_path, "r", encoding="utf-8") as file:
+            self.assertEqual(len(file.readlines()), 6)
+        self.assertEqual(len(storage.load()), 5)
+
+    def test_journal_persists_across_instances(self):
+        """
+        Test case verifying that a new backend replays the journal.
+        """
+        storage = JournalStorage(self.path)
+        storage.add({"name": "Ana", "phone": "1"})
+        storage.add({"name": "Luis", "phone": "2"})
+        storage.update({"name": "Ana"}, {"phone": "3"})
+        storage.remove({"name": "Luis"})
+        self.assertEqual(JournalStorage(self.path).load(),
+                         [{"name": "Ana", "phone": "3"}])
+
+    def test_journal_compaction(self):
+        """
+        Test case verifying that the journal is folded into a snapshot.
+        """
+        storage = JournalStorage(self.path, compact_threshold=3)
+        for number in range(4):
+            storage.add({"name": f"Customer {number}"})
+        with open(self.path, "r", encoding="utf-8") as file:
+            self.assertEqual(len(json.load(file)), 3)
+        self.assertEqual(len(JournalStorage(self.path).load()), 4)
+
+    def test_journal_ignores_torn_line(self):
+        """
+        Test case verifying that a partially written line is ignored.
+        """
+        storage = JournalStorage(self.path)
+        storage.add({"name": "Ana"})
+        with open(storage.journal_path, "a", encoding="utf-8") as file:
+            file.write('{"op": "add", "rec')
+        recovered = JournalStorage(self.path)
+        self.assertEqual(recovered.load(), [{"name": "Ana"}])
+        recovered.add({"name": "Luis"})
+        self.assertEqual(JournalStorage(self.path).load(),
+                         [{"name": "Ana"}, {"name": "Luis"}])
+
+    def test_journal_ignores_stale_journal(self):
+        """
+        Test case verifying that an external snapshot rewrite wins.
+        """
+        storage = JournalStorage(self.path)
+        storage.add({"name": "Ana"})
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write("[]")
+        self.assertEqual(storage.load(), [])
+        storage.add({"name": "Luis"})
+        self.assertEqual(JournalStorage(self.path).load(),
+                         [{"name": "Luis"}])
+
+    def test_journal_binary_snapshot(self):
+        """
+        Test case for a journal whose snapshot uses the binary format.
+        """
+        binary = SERIALIZERS["binary"]
+        storage = JournalStorage(self.path, compact_threshold=3,
+                                 serializer=binary)
+        for number in range(4):
+            storage.add({"name": f"Customer {number}"})
+        with open(self.path, "rb") as file:
+            data = file.read()
+        self.assertTrue(data.startswith(BINARY_MAGIC))
+        self.assertEqual(len(binary.loads(data)), 3)
+        self.assertEqual(JournalStorage(self.path).load(),
+                         storage.load())
+
+        JsonFileStorage(self.path, serializer=binary).save(
+            [{"name": "Ana"}])
+        self.assertEqual(JournalStorage(self.path).load(),
+                         [{"name": "Ana"}])
+
+    def test_journal_rejected_write(self):
+        """
+        Test case for an operation whose journal line cannot be encoded.
+        """
+        storage = JournalStorage(self.path)
+        storage.add({"name": "Ana"})
+        with self.assertRaises(TypeError):
+            storage.apply_many([{"op": "add", "record": {"name": "Luis"}},
+                                {"op": "add", "record": {"x": {1, 2}}}])
+        self.assertEqual(storage.load(), [{"name": "Ana"}])
+        storage.compact()
+        self.assertEqual(JournalStorage(self.path).load(),
+                         [{"name": "Ana"}])
+
+    def test_load_cache(self):
+        """
+        Test case for the parsed-file cache of the JSON file backend.
+        """
+        cache = LoadCache()
+        storage = JsonFileStorage(self.path, cache=cache)
+        storage.add({"name": "Ana"})
+        first = storage.load()
+        first[0]["name"] = "Changed"
+        self.assertEqual(storage.load(), [{"name": "Ana"}])
+        self.assertEqual(cache.stats()["hits"], 2)
+
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write('[{"name": "Luis"}]')
+        misses = cache.misses
+        self.assertEqual(storage.load(), [{"name": "Luis"}])
+        self.assertEqual(cache.misses, misses + 1)
+        self.assertEqual(storage.load(), [{"name": "Luis"}])
+        self.assertEqual(cache.misses, misses + 1)
+
+
+    def test_json_file_concurrent_adds(self):
+        """
+        Test case adding records from 16 threads to one JSON file.
+        """
+        storage = JsonFileStorage(self.path)
+        barrier = threading.Barrier(16)
+
+        def add(number):
+            barrier.wait()
+            storage.add({"name": f"C{number}"})
+
+        threads = [threading.Thread(target=add, args=(number,))
+                   for number in range(16)]
+        with patch("os.fsync", wraps=os.fsync) as fsync:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(sorted(record["name"] for record in storage.load()),
+                         sorted(f"C{number}" for number in range(16)))
+        self.assertGreaterEqual(fsync.call_count, 32)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+"""
+table_test.py - Unit Tests for the Compact Reservation Models
+
+This module contains unit tests for the columnar ReservationTable in
+src/reservation/table.py and for the __slots__ models.
+
+Test Cases:
+    - test_round_trip: Records convert to columns and back unchanged.
+    - test_columns: Names are interned, dates are ordinals and the
+    columns take 20 bytes per reservation.
+    - test_invalid_records: Non-string names, non-integer rooms and
+    bad dates are rejected without touching the columns.
+    - test_models_use_slots: Customer, Hotel and Reservation instances
+    have no per-instance __dict__.
+
+To run the tests, execute the script using the following command:
+    python3 -m unittest tests/table_test.py
+
+Author: Alejandra Mendoza Flores
+Date: October 19, 2026
+"""
+import unittest
+from datetime import date
+# pylint: disable=wrong-import-position, import-error
+from src.customer.customer import Customer
+from src.hotel.hotel import Hotel
+from src.reservation.reservation import Reservation
+from src.reservation.table import ReservationTable
+# pylint: enable=wrong-import-position, import-error
+
+RECORDS = [
+    {"customer_name": "Ana", "hotel_name": "Sea", "room_number": 1,
+     "check_in_date": "2024-05-01", "check_out_date": "2024-05-04"},
+    {"customer_name": "Luis", "hotel_name": "Sea", "room_number": 2,
+     "check_in_date": "2024-05-02", "check_out_date": None},
+    {"customer_name": "Ana", "hotel_name": "Lake", "room_number": 7,
+     "check_in_date": "2024-06-10", "check_out_date": "2024-06-12"},
+]
+
+
+class ReservationTableTest(unittest.TestCase):
+    """
+    Unit tests for the ReservationTable class.
+    """
+    def setUp(self):
+        self.table = ReservationTable.from_records(RECORDS)
+
+    def test_round_trip(self):
+        """
+        Test case for converting records to columns and back.
+        """
+        self.assertEqual(len(self.table), 3)
+        self.assertEqual(self.table.to_records(), RECORDS)
+        self.assertEqual(self.table[1], RECORDS[1])
+        self.assertEqual(
+            ReservationTable.from_records(self.table).to_records(), RECORDS)
+
+    def test_columns(self):
+        """
+        Test case for the column layout.
+        """
+        self.assertEqual(self.table.names, ["Ana", "Sea", "Luis", "Lake"])
+        self.assertEqual(list(self.table.customer_ids), [0, 2, 0])
+        self.assertEqual(self.table.check_ins[0],
+                         date(2024, 5, 1).toordinal())
+        self.assertEqual(self.table.check_outs[1], 0)
+        self.assertEqual(self.table.rows_for_hotel("Sea"), [0, 1])
+        self.assertEqual(self.table.rows_for_hotel("Nowhere"), [])
+        self.assertEqual([self.table.nights(row) for row in range(3)],
+                         [3, 1, 2])
+        self.assertEqual(self.table.nbytes(), 3 * 5 * 4)
+
+    def test_invalid_records(self):
+        """
+        Test case for records that cannot be stored.
+        """
+        with self.assertRaises(ValueError):
+            self.table.append(dict(RECORDS[0], room_number="101"))
+        with self.assertRaises(ValueError):
+            self.table.append(dict(RECORDS[0], check_in_date="May 1st"))
+        for field in ("customer_name", "hotel_name"):
+            with self.assertRaises(ValueError):
+                self.table.append(dict(RECORDS[0], **{field: None}))
+        with self.assertRaises(ValueError):
+            self.table.append(dict(RECORDS[0], customer_name="Eva",
+                                   room_number=2 ** 40))
+        with self.assertRaises(KeyError):
+            self.table.append({"customer_name": "Eva"})
+        with self.assertRaises(TypeError):
+            self.table.name_id(None)
+        self.assertEqual(len(self.table), 3)
+        self.assertEqual(
+            [len(self.table.customer_ids), len(self.table.hotel_ids)],
+            [3, 3])
+        self.assertEqual(self.table.names, ["Ana", "Sea", "Luis", "Lake"])
+        self.assertIsNone(self.table.find_name_id(None))
+        self.table.append(RECORDS[1])
+        self.assertEqual(self.table[3], RECORDS[1])
+
+    def test_models_use_slots(self):
+        """
+        Test case verifying that the models have no instance __dict__.
+        """
+        for instance in (Customer("Ana", "ana@example.com", "1"),
+                         Hotel("Sea", "Coast", 3),
+                         Reservation(**RECORDS[0])):
+            self.assertFalse(hasattr(instance, "__dict__"))
+        self.assertEqual(Reservation(**RECORDS[1]).to_dict(), RECORDS[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,179 @@
+"""
+wal_test.py - Crash-Injection Tests for the Write-Ahead Log Storage
+
+This module contains unit tests for src/storage/wal.py. Crashes are
+injected by cutting or damaging the log, by failing a checkpoint half
+way, and by killing a writing process.
+
+Test Cases:
+    - test_torn_log_recovers_complete_entries: Cutting the log at any
+    byte keeps exactly the entries written before the cut.
+    - test_damaged_entry_is_dropped: An entry with a bad checksum ends
+    the replay and is overwritten by the next append.
+    - test_batched_fsync: The log is fsynced by count and by interval.
+    - test_crash_during_checkpoint: A checkpoint interrupted before or
+    after the snapshot rename loses and duplicates nothing.
+    - test_killed_writer_loses_no_acknowledged_write: Every write a
+    killed process acknowledged is recovered.
+
+To run the tests, execute the script using the following command:
+    python3 -m unittest tests/wal_test.py
+
+Author: Alejandra Mendoza Flores
+Date: October 19, 2026
+"""
+import os
+import sys
+import signal
+import tempfile
+import unittest
+import subprocess
+from unittest.mock import patch
+# pylint: disable=wrong-import-position, import-error
+from src.storage.wal import WalStorage
+# pylint: enable=wrong-import-position, import-error
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+WRITER = """
+import sys
+from src.storage.wal import WalStorage
+storage = WalStorage(sys.argv[1], compact_threshold=40)
+number = 0
+while True:
+    storage.add({"name": f"C{number}"})
+    print(number, flush=True)
+    number += 1
+"""
+
+
+class SimulatedCrash(Exception):
+    """
+    Raised to stop a write at an injected crash point.
+    """
+
+
+class WalStorageTest(unittest.TestCase):
+    """
+    Unit tests for the WalStorage class.
+    """
+    def setUp(self):
+        # pylint: disable=consider-using-with
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "customers.json")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def names(self):
+        """
+        Returns the names recovered by a fresh storage object.
+        """
+        return [record["name"] for record in WalStorage(self.path).load()]
+
+    def test_torn_log_recovers_complete_entries(self):
+        """
+        Test case for cutting the log at every byte of its last entries.
+        """
+        storage = WalStorage(self.path)
+        ends = []
+        for number in range(3):
+            storage.add({"name": f"C{number}"})
+            ends.append(os.path.getsize(storage.journal_path))
+        with open(storage.journal_path, "rb") as file:
+            data = file.read()
+        for cut in range(ends[0], len(data) + 1):
+            with open(storage.journal_path, "wb") as file:
+                file.write(data[:cut])
+            kept = sum(end <= cut for end in ends)
+            self.assertEqual(self.names(),
+                             [f"C{number}" for number in range(kept)])
+
+    def test_damaged_entry_is_dropped(self):
+        """
+        Test case for an entry whose checksum does not match.
+        """
+        storage = WalStorage(self.path)
+        storage.add({"name": "Ana"})
+        storage.add({"name": "Luis"})
+        with open(storage.journal_path, "r+b") as file:
+            file.seek(-4, os.SEEK_END)
+            file.write(b"X")
+        with self.assertLogs(level="WARNING"):
+            recovered = WalStorage(self.path)
+            self.assertEqual(len(recovered.load()), 1)
+        recovered.add({"name": "Eva"})
+        self.assertEqual(self.names(), ["Ana", "Eva"])
+
+    def test_batched_fsync(self):
+        """
+        Test case for syncing the log by count and by interval.
+        """
+        storage = WalStorage(self.path, sync_every=10)
+        storage.add({"name": "First"})
+        with patch("os.fsync", wraps=os.fsync) as fsync:
+            for number in range(25):
+                storage.add({"name": f"C{number}"})
+            self.assertEqual(fsync.call_count, 2)
+            storage.close()
+            self.assertEqual(fsync.call_count, 3)
+            storage.close()
+            self.assertEqual(fsync.call_count, 3)
+
+        timed = WalStorage(self.path, sync_every=1000, sync_interval=0.05)
+        timed.add({"name": "Timed"})
+        syncs = timed.syncs
+        timed.add({"name": "Timed again"})
+        timer = timed._timer  # pylint: disable=protected-access
+        self.assertEqual(timed.syncs, syncs)
+        timer.join()
+        self.assertEqual(timed.syncs, syncs + 1)
+
+    def test_crash_during_checkpoint(self):
+        """
+        Test case for a crash before and after the snapshot rename.
+        """
+        storage = WalStorage(self.path, compact_threshold=1000)
+        for number in range(5):
+            storage.add({"name": f"C{number}"})
+        with patch("os.replace", side_effect=SimulatedCrash):
+            with self.assertRaises(SimulatedCrash):
+                storage.checkpoint()
+        self.assertEqual(self.names(), [f"C{number}" for number in range(5)])
+
+        storage = WalStorage(self.path)
+        with patch.object(WalStorage, "_start_journal",
+                          side_effect=SimulatedCrash):
+            with self.assertRaises(SimulatedCrash):
+                storage.checkpoint()
+        self.assertEqual(self.names(), [f"C{number}" for number in range(5)])
+        recovered = WalStorage(self.path)
+        recovered.add({"name": "C5"})
+        self.assertEqual(self.names(), [f"C{number}" for number in range(6)])
+
+    def test_killed_writer_loses_no_acknowledged_write(self):
+        """
+        Test case killing a process while it writes and checkpoints.
+        """
+        # pylint: disable=consider-using-with
+        process = subprocess.Popen([sys.executable, "-c", WRITER, self.path],
+                                   cwd=ROOT, stdout=subprocess.PIPE,
+                                   text=True)
+        acknowledged = []
+        try:
+            while len(acknowledged) < 150:
+                acknowledged.append(int(process.stdout.readline()))
+        finally:
+            process.send_signal(signal.SIGKILL)
+            process.wait()
+            process.stdout.close()
+        storage = WalStorage(self.path, compact_threshold=40)
+        names = [record["name"] for record in storage.load()]
+        self.assertEqual(names[:len(acknowledged)],
+                         [f"C{number}" for number in acknowledged])
+        self.assertEqual(len(names), len(set(names)))
+        self.assertLess(storage._entries, 40)  # pylint: disable=W0212
+
+
+if __name__ == '__main__':
+    unittest.main()
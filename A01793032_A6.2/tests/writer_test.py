@@ -0,0 +1,130 @@
+"""
+writer_test.py - Unit Tests for the Group-Commit Writer
+
+This module contains unit tests for src/storage/writer.py.
+
+Test Cases:
+    - test_concurrent_adds_are_batched: Adds from many threads all
+    reach the JSON file, in fewer writes than adds.
+    - test_bad_operation_fails_alone: An invalid operation fails its
+    own future without losing the rest of its batch.
+    - test_reservation_class_uses_writer: Reservation works unchanged
+    on top of the writer.
+    - test_concurrent_same_room_bookings: Only one of many threads
+    booking the same room at once succeeds.
+
+To run the tests, execute the script using the following command:
+    python3 -m unittest tests/writer_test.py
+
+Author: Alejandra Mendoza Flores
+Date: October 19, 2026
+"""
+import os
+import tempfile
+import threading
+import unittest
+# pylint: disable=wrong-import-position, import-error
+from src.reservation.reservation import Reservation
+from src.storage.storage import JsonFileStorage
+from src.storage.writer import GroupCommitWriter
+# pylint: enable=wrong-import-position, import-error
+
+
+class GroupCommitWriterTest(unittest.TestCase):
+    """
+    Unit tests for the GroupCommitWriter class.
+    """
+    def setUp(self):
+        # pylint: disable=consider-using-with
+        self.directory = tempfile.TemporaryDirectory()
+        self.storage = JsonFileStorage(
+            os.path.join(self.directory.name, "reservations.json"))
+        self.writer = GroupCommitWriter(self.storage, interval=0.01)
+
+    def tearDown(self):
+        self.writer.close()
+        self.directory.cleanup()
+
+    def test_concurrent_adds_are_batched(self):
+        """
+        Test case verifying that concurrent adds are not lost.
+        """
+        def add_many(worker):
+            for number in range(20):
+                self.writer.add({"worker": worker, "number": number})
+
+        threads = [threading.Thread(target=add_many, args=(worker,))
+                   for worker in range(10)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        records = self.storage.load()
+        self.assertEqual(len(records), 200)
+        self.assertEqual(len({(record["worker"], record["number"])
+                              for record in records}), 200)
+        self.assertLess(self.writer.commits, 200)
+        self.assertEqual(
+            [name for name in os.listdir(self.directory.name)
+             if name.endswith(".tmp")], [])
+
+    def test_bad_operation_fails_alone(self):
+        """
+        Test case verifying that an invalid operation only fails its
+        own submission.
+        """
+        good = self.writer.submit({"op": "add", "record": {"name": "Ana"}})
+        bad = self.writer.submit({"op": "rename", "match": {}})
+        self.assertEqual(good.result(), 1)
+        with self.assertRaises(ValueError):
+            bad.result()
+        self.assertEqual(self.writer.find({"name": "Ana"}),
+                         [{"name": "Ana"}])
+
+    def test_reservation_class_uses_writer(self):
+        """
+        Test case running Reservation on top of the writer.
+        """
+        previous = Reservation.storage
+        Reservation.storage = self.writer
+        try:
+            Reservation.create_reservation("Ana", "Hotel A", 1,
+                                           "2024-05-01", "2024-05-03")
+            self.assertIsNone(Reservation.create_reservation(
+                "Luis", "Hotel A", 1, "2024-05-02"))
+            Reservation.cancel_reservation("Ana", "Hotel A", 1,
+                                           "2024-05-01")
+        finally:
+            Reservation.storage = previous
+        self.assertEqual(self.storage.load(), [])
+
+    def test_concurrent_same_room_bookings(self):
+        """
+        Test case booking one room from 16 threads at the same time.
+        """
+        previous = Reservation.storage
+        Reservation.storage = self.writer
+        barrier = threading.Barrier(16)
+        results = []
+
+        def book(number):
+            barrier.wait()
+            results.append(Reservation.create_reservation(
+                f"Customer {number}", "Hotel A", 1,
+                "2024-05-01", "2024-05-03"))
+
+        threads = [threading.Thread(target=book, args=(number,))
+                   for number in range(16)]
+        try:
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            Reservation.storage = previous
+        self.assertEqual(sum(result is not None for result in results), 1)
+        self.assertEqual(len(self.storage.load()), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()